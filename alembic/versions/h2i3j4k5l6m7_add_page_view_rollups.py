@@ -0,0 +1,73 @@
+"""add page view rollup tables
+
+Revision ID: h2i3j4k5l6m7
+Revises: g1h2i3j4k5l6
+Create Date: 2026-10-18 10:00:00.000000
+
+관리자 이용현황 통계용 사전 집계 — services/page_view_rollup.py 스케줄러 잡이 채운다.
+- page_view_hourly / page_view_daily: 시간·일 × path 호출/오류/latency 히스토그램/고유 사용자 HLL
+- page_view_user_daily: 일 × 사용자 × path 호출 수 + 마지막 접속
+기존 page_views 행은 첫 잡 실행 시 전체 backfill.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h2i3j4k5l6m7'
+down_revision: Union[str, Sequence[str], None] = 'g1h2i3j4k5l6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _path_rollup_columns() -> list:
+    return [
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('calls', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.Integer(), nullable=False),
+        sa.Column('server_errors', sa.Integer(), nullable=False),
+        sa.Column('duration_sum', sa.Float(), nullable=False),
+        sa.Column('duration_max', sa.Float(), nullable=False),
+        sa.Column('latency_hist', sa.JSON(), nullable=False),
+        sa.Column('users_hll', sa.LargeBinary(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'page_view_hourly',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('hour', sa.String(length=13), nullable=False),
+        *_path_rollup_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('hour', 'path', name='uq_page_view_hourly'),
+    )
+    op.create_table(
+        'page_view_daily',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('date', sa.String(length=10), nullable=False),
+        *_path_rollup_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('date', 'path', name='uq_page_view_daily'),
+    )
+    op.create_table(
+        'page_view_user_daily',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('date', sa.String(length=10), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('calls', sa.Integer(), nullable=False),
+        sa.Column('last_at', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('date', 'user_id', 'path', name='uq_page_view_user_daily'),
+    )
+    op.create_index('idx_page_view_user_daily_user', 'page_view_user_daily', ['user_id', 'date'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_page_view_user_daily_user', table_name='page_view_user_daily')
+    op.drop_table('page_view_user_daily')
+    op.drop_table('page_view_daily')
+    op.drop_table('page_view_hourly')
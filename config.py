@@ -35,16 +35,107 @@ ADVISOR_CACHE_TTL_HOURS = float(os.getenv("ADVISOR_CACHE_TTL_HOURS", "0.5"))
 # ── KRX 인증 (스크리너용, 선택) ──────────────────────────────────────────────
 KRX_ID = os.getenv("KRX_ID", "")
 KRX_PASSWORD = os.getenv("KRX_PASSWORD", "")
+# 전종목 일별 스냅샷 컬럼 저장소 (screener/history.py). 거래일별 디렉터리 + 컬럼별 .npy.
+SCREENER_HISTORY_DIR = os.getenv(
+    "SCREENER_HISTORY_DIR", os.path.join(os.path.expanduser("~"), "stock-watchlist", "screener_history")
+)
+
+# ── OHLCV 영구 저장소 (stock/ohlcv_store.py) ───────────────────────────────────
+# (interval, 시장, 종목)별 디렉터리 + 컬럼별 .npy. 미확인 앞/뒤 구간만 yfinance 보충.
+OHLCV_STORE_DIR = os.getenv(
+    "OHLCV_STORE_DIR", os.path.join(os.path.expanduser("~"), "stock-watchlist", "ohlcv_store")
+)
+# 당일까지 확인된 종목도 이 시간(초)이 지나면 마지막 봉을 다시 확인 (장중 부분 봉 갱신)
+OHLCV_STORE_TOPUP_TTL_SEC = int(os.getenv("OHLCV_STORE_TOPUP_TTL_SEC", "600"))
+# 봉이 하나도 없던 종목(상장폐지·미상 코드)은 이 시간(초) 동안 같은 구간을 다시 조회하지 않음
+OHLCV_STORE_EMPTY_TTL_SEC = int(os.getenv("OHLCV_STORE_EMPTY_TTL_SEC", "43200"))
+
+# ── DART 상장법인 마스터 인덱스 (stock/dart_corp.py) ──────────────────────────────
+# corpCode.xml 1회 다운로드 → SQLite (stock_code PK). 경과 일수 초과 시 다음 조회가 재구축.
+DART_CORP_DB_PATH = os.getenv(
+    "DART_CORP_DB_PATH", os.path.join(os.path.expanduser("~"), "stock-watchlist", "dart_corp.db")
+)
+DART_CORP_REFRESH_DAYS = int(os.getenv("DART_CORP_REFRESH_DAYS", "30"))
+
+# ── DART 재무제표 동시 조회 / 웨어하우스 (stock/dart_fin.py, stock/dart_warehouse.py) ──
+# 보고서 계정 행 영구 보관 — 마감 기간 만료 없음. 진행 중 회계연도 보고서만 재확인 주기 적용.
+DART_WAREHOUSE_DB_PATH = os.getenv(
+    "DART_WAREHOUSE_DB_PATH", os.path.join(os.path.expanduser("~"), "stock-watchlist", "dart_fin.db")
+)
+DART_OPEN_PERIOD_REVALIDATE_HOURS = int(os.getenv("DART_OPEN_PERIOD_REVALIDATE_HOURS", "168"))
+DART_PENDING_RECHECK_HOURS = int(os.getenv("DART_PENDING_RECHECK_HOURS", "12"))
+# DART 오류 응답 후 재호출 보류 (초) — 보고서 단위. 한도 초과(020)·키 오류 등 계정 단위 오류는 전체 보류
+DART_ERROR_BACKOFF_SEC = int(os.getenv("DART_ERROR_BACKOFF_SEC", "600"))
+DART_QUOTA_BACKOFF_SEC = int(os.getenv("DART_QUOTA_BACKOFF_SEC", "3600"))
+# 동시 조회 워커 수 + 전체 합산 초당 호출 상한
+DART_FETCH_WORKERS = int(os.getenv("DART_FETCH_WORKERS", "6"))
+DART_RATE_PER_SEC = float(os.getenv("DART_RATE_PER_SEC", "8"))
 
 # ── KIS WS 체결통보 ────────────────────────────────────────────────────────
 KIS_HTS_ID = os.getenv("KIS_HTS_ID", "")
 
+# ── 실시간 분봉 지표 (services/quote_indicators.py) ─────────────────────────────
+# /ws/quote/{symbol}/indicators 지원 분봉 간격(분, 콤마 구분). 1/15/60 중 선택.
+QUOTE_INDICATOR_INTERVALS = os.getenv("QUOTE_INDICATOR_INTERVALS", "1,15,60")
+
+# ── 실시간 시세 fan-out (services/quote_fanout.py) ───────────────────────────────
+# /ws/quote 심볼별 병합 창(ms). 창 내 같은 type 메시지는 최신만, 직렬화 1회 후 구독자 공유.
+QUOTE_FANOUT_WINDOW_MS = int(os.getenv("QUOTE_FANOUT_WINDOW_MS", "100"))
+
+# ── KIS REST 시세 폴백 (services/quote_rest_poller.py) ───────────────────────────
+# KIS WS 끊김 시 현재가 폴링. 초당 요청 상한은 계정 한도(실전 초당 20건) 이하로 —
+# 동일 키를 쓰는 자동매매 시스템 몫을 남긴다. 동시 요청 수, 사이클 최소 간격(초).
+QUOTE_FALLBACK_RATE_PER_SEC = float(os.getenv("QUOTE_FALLBACK_RATE_PER_SEC", "10"))
+QUOTE_FALLBACK_CONCURRENCY = int(os.getenv("QUOTE_FALLBACK_CONCURRENCY", "4"))
+QUOTE_FALLBACK_CYCLE_SEC = float(os.getenv("QUOTE_FALLBACK_CYCLE_SEC", "1.0"))
+
 # ── 사용자별 KIS 자격증명 암호화 (Phase 4 D.1) ─────────────────────────────
 # 32-byte urlsafe-base64 마스터 키. 미설정 시 사용자별 KIS 기능 비활성화.
 # 발급: python -c "import base64,secrets; print(base64.urlsafe_b64encode(secrets.token_bytes(32)).decode())"
 KIS_ENCRYPTION_KEY = os.getenv("KIS_ENCRYPTION_KEY", "")
 KIS_VALIDATION_TTL_HOURS = float(os.getenv("KIS_VALIDATION_TTL_HOURS", "24"))
 
+# ── stock/cache.py L1 LRU / L2 SQLite 상한 ────────────────────────────────────
+# 프로세스 내 L1 상한. 항목 수 또는 직렬화 바이트 합 초과 시 LRU 축출. 0 = L1 비활성.
+CACHE_L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", "2048"))
+CACHE_L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", str(32 * 1024 * 1024)))
+# L2(cache.db) 용량 상한. 스윕 잡이 만료 행 삭제 후 초과분을 LRU 순으로 축출. 0 = 무제한.
+CACHE_L2_MAX_ROWS = int(os.getenv("CACHE_L2_MAX_ROWS", "200000"))
+CACHE_L2_MAX_BYTES = int(os.getenv("CACHE_L2_MAX_BYTES", str(512 * 1024 * 1024)))
+# 만료 후에도 스윕이 보존하는 시간 — cache.get_or_compute stale-while-revalidate 상한.
+CACHE_STALE_GRACE_HOURS = float(os.getenv("CACHE_STALE_GRACE_HOURS", "24"))
+# 쓰기 코덱 ("pickle" | "json"). 읽기는 행 태그로 자동 판별 → 변경해도 기존 행 호환.
+CACHE_CODEC = os.getenv("CACHE_CODEC", "pickle")
+# payload가 이 크기(bytes) 이상이면 L2에 zlib 압축 저장. 0 = 압축 비활성.
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", str(16 * 1024)))
+
+# ── 로컬 백테스트 파라미터 스윕 / 유니버스 / 워크포워드 / 몬테카를로 ─────────────────
+# 파라미터 스윕(services/local_backtest/sweep.py) 프로세스 풀 크기. 0 = CPU 수 - 1 (최소 1). 1 = 순차 실행.
+LOCAL_BACKTEST_SWEEP_WORKERS = int(os.getenv("LOCAL_BACKTEST_SWEEP_WORKERS", "0"))
+# 스윕 1건당 최대 실행 조합 수 (그리드 곱/랜덤 샘플 수 상한).
+LOCAL_BACKTEST_SWEEP_MAX_RUNS = int(os.getenv("LOCAL_BACKTEST_SWEEP_MAX_RUNS", "500"))
+# 유니버스 백테스트 (services/local_backtest/universe.py) — 종목 수 상한 / 적재 청크·동시 fetch 수.
+LOCAL_BACKTEST_UNIVERSE_MAX_SYMBOLS = int(os.getenv("LOCAL_BACKTEST_UNIVERSE_MAX_SYMBOLS", "3000"))
+LOCAL_BACKTEST_UNIVERSE_LOAD_CHUNK = int(os.getenv("LOCAL_BACKTEST_UNIVERSE_LOAD_CHUNK", "64"))
+LOCAL_BACKTEST_UNIVERSE_LOAD_WORKERS = int(os.getenv("LOCAL_BACKTEST_UNIVERSE_LOAD_WORKERS", "8"))
+# 워크포워드 (services/local_backtest/walkforward.py) 창 수 상한 — 창마다 조합 전부를 학습 구간에서 실행.
+LOCAL_BACKTEST_WALKFORWARD_MAX_WINDOWS = int(os.getenv("LOCAL_BACKTEST_WALKFORWARD_MAX_WINDOWS", "40"))
+# 몬테카를로 부트스트랩 (services/local_backtest/montecarlo.py) 경로 수 — 모든 로컬 백테스트 응답에 포함. 0 = 비활성.
+LOCAL_BACKTEST_MC_PATHS = int(os.getenv("LOCAL_BACKTEST_MC_PATHS", "10000"))
+# 파산 기준 — 평가액이 초기 자본 × 이 비율 이하로 한 번이라도 떨어진 경로를 파산으로 집계.
+LOCAL_BACKTEST_MC_RUIN_LEVEL = float(os.getenv("LOCAL_BACKTEST_MC_RUIN_LEVEL", "0.5"))
+
+# ── 페이지뷰 기록 버퍼 / rollup (services/page_view_buffer.py, page_view_rollup.py) ──
+# 미들웨어는 메모리 버퍼에 넣기만 하고 백그라운드 스레드가 일괄 INSERT.
+# 버퍼 상한(행, 초과 시 드롭 + 카운트), 배치 행 수, 최대 flush 간격(ms).
+PAGE_VIEW_BUFFER_CAPACITY = int(os.getenv("PAGE_VIEW_BUFFER_CAPACITY", "10000"))
+PAGE_VIEW_BATCH_SIZE = int(os.getenv("PAGE_VIEW_BATCH_SIZE", "500"))
+PAGE_VIEW_FLUSH_MS = int(os.getenv("PAGE_VIEW_FLUSH_MS", "1000"))
+# rollup 잡(services/page_view_rollup.py) 주기(분), raw 행 / 시간 rollup 보존 일수 (일 rollup은 영구).
+PAGE_VIEW_ROLLUP_INTERVAL_MIN = int(os.getenv("PAGE_VIEW_ROLLUP_INTERVAL_MIN", "10"))
+PAGE_VIEW_RAW_RETENTION_DAYS = int(os.getenv("PAGE_VIEW_RAW_RETENTION_DAYS", "30"))
+PAGE_VIEW_HOURLY_RETENTION_DAYS = int(os.getenv("PAGE_VIEW_HOURLY_RETENTION_DAYS", "90"))
+
 # ── Database ──────────────────────────────────────────────────────────────
 from pathlib import Path  # noqa: E402
 DATABASE_URL = os.getenv(
@@ -13,13 +13,16 @@ from .tax import TaxCalculation, TaxFifoLot, TaxTransaction
 from .admin import AiUsageLog, AiLimit, AuditLog
 from .analyst import AnalystReport
 from .user_kis import UserKisCredentials
-from .page_view import PageView
+from .page_view import PageView, PageViewDaily, PageViewHourly, PageViewUserDaily
 from .semiconductor import IndicatorValue, Signal, SemiconductorThreshold
 
 __all__ = [
     "User",
     "UserKisCredentials",
     "PageView",
+    "PageViewHourly",
+    "PageViewDaily",
+    "PageViewUserDaily",
     "Watchlist",
     "WatchlistOrder",
     "Order",
@@ -1,10 +1,15 @@
 """PageView 모델 — Phase 4 단계 5.
 
-FastAPI 미들웨어(`main.py`)에서 비동기 INSERT. 페이지별 이용현황 통계용.
-경로별 호출 횟수 + latency + 일별 시계열 집계를 위한 raw 로그 테이블.
+FastAPI 미들웨어(`main.py`)에서 버퍼 경유 일괄 INSERT. 페이지별 이용현황 통계용 raw 로그 테이블.
+
+Rollup (services/page_view_rollup.py 스케줄러 잡이 유지):
+- `PageViewHourly` / `PageViewDaily`: 시간·일 × path 호출/오류 수, latency 합·최대·히스토그램,
+  고유 사용자 HLL 스케치 — 관리자 경로별 통계는 이 테이블만 조회.
+- `PageViewUserDaily`: 일 × 사용자 × path 호출 수 + 마지막 접속 — 사용자별 접속 이력/누계.
+raw 행은 rollup 후 보존기간(`PAGE_VIEW_RAW_RETENTION_DAYS`) 경과 시 삭제.
 """
 
-from sqlalchemy import Column, Float, Index, Integer, String
+from sqlalchemy import JSON, Column, Float, Index, Integer, LargeBinary, String, UniqueConstraint
 
 from db.base import Base
 
@@ -24,3 +29,57 @@ class PageView(Base):
         Index("idx_page_views_path_created", "path", "created_at"),
         Index("idx_page_views_created", "created_at"),
     )
+
+
+class PageViewHourly(Base):
+    __tablename__ = "page_view_hourly"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    hour = Column(String(13), nullable=False)  # KST 'YYYY-MM-DDTHH'
+    path = Column(String, nullable=False)
+    calls = Column(Integer, nullable=False, default=0)
+    errors = Column(Integer, nullable=False, default=0)  # status >= 400
+    server_errors = Column(Integer, nullable=False, default=0)  # status >= 500
+    duration_sum = Column(Float, nullable=False, default=0.0)
+    duration_max = Column(Float, nullable=False, default=0.0)
+    latency_hist = Column(JSON, nullable=False)  # services/_sketches.LATENCY_BOUNDS_MS 구간별 건수
+    users_hll = Column(LargeBinary, nullable=True)  # 인증 사용자 HLL 레지스터 (없으면 NULL)
+
+    __table_args__ = (
+        UniqueConstraint("hour", "path", name="uq_page_view_hourly"),
+    )
+
+
+class PageViewDaily(Base):
+    __tablename__ = "page_view_daily"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(String(10), nullable=False)  # KST 'YYYY-MM-DD'
+    path = Column(String, nullable=False)
+    calls = Column(Integer, nullable=False, default=0)
+    errors = Column(Integer, nullable=False, default=0)
+    server_errors = Column(Integer, nullable=False, default=0)
+    duration_sum = Column(Float, nullable=False, default=0.0)
+    duration_max = Column(Float, nullable=False, default=0.0)
+    latency_hist = Column(JSON, nullable=False)
+    users_hll = Column(LargeBinary, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("date", "path", name="uq_page_view_daily"),
+    )
+
+
+class PageViewUserDaily(Base):
+    __tablename__ = "page_view_user_daily"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(String(10), nullable=False)
+    user_id = Column(Integer, nullable=False)
+    path = Column(String, nullable=False)
+    calls = Column(Integer, nullable=False, default=0)
+    last_at = Column(String, nullable=False)  # 해당 일·path 마지막 created_at
+
+    __table_args__ = (
+        UniqueConstraint("date", "user_id", "path", name="uq_page_view_user_daily"),
+        Index("idx_page_view_user_daily_user", "user_id", "date"),
+    )
@@ -117,6 +117,15 @@ class BacktestRepository:
         job.result_json = result_json
         return True
 
+    def update_job_progress(self, job_id: str, result_json: dict) -> bool:
+        """실행 중 중간 결과 갱신 (status=running 유지 — 파라미터 스윕 순위 스트리밍)."""
+        job = self.db.query(BacktestJob).filter_by(job_id=job_id).first()
+        if not job:
+            return False
+        job.status = "running"
+        job.result_json = result_json
+        return True
+
     def update_job_status(self, job_id: str, status: str) -> bool:
         job = self.db.query(BacktestJob).filter_by(job_id=job_id).first()
         if not job:
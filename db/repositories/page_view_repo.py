@@ -1,14 +1,14 @@
 """PageViewRepository — 경로별 이용현황 집계.
 
-raw 로그(record)는 FastAPI 미들웨어에서 비동기 INSERT.
-대시보드 쿼리는 aggregate_by_path / daily_timeseries 사용.
+raw 로그는 FastAPI 미들웨어 → services/page_view_buffer.py 버퍼 → record_many 일괄 INSERT.
+아래 집계 메서드는 raw 직접 조회 — 관리자 화면은 rollup(page_view_rollup_repo.py)을 읽는다.
 """
 
 from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import case, func
+from sqlalchemy import case, func, insert
 from sqlalchemy.orm import Session
 
 from db.models.page_view import PageView
@@ -38,6 +38,13 @@ class PageViewRepository:
         self.db.add(row)
         self.db.flush()
 
+    def record_many(self, rows: list[dict]) -> int:
+        """여러 행 일괄 INSERT (executemany 1회). rows: record 인자 + created_at(KST ISO, 요청 시각)."""
+        if not rows:
+            return 0
+        self.db.execute(insert(PageView), rows)
+        return len(rows)
+
     def aggregate_by_path(self, date_from: str, date_to: str, top: int = 20) -> list[dict]:
         """경로별 집계: 호출수 + 평균 latency + 유저 수.
 
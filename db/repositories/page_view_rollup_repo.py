@@ -0,0 +1,176 @@
+"""PageViewRollupRepository — 페이지뷰 사전 집계(rollup) 저장 + 관리자 통계 조회.
+
+관리자 화면(`routers/admin_stats.py`, `routers/admin_users.py`)은 raw `page_views` 대신 이 저장소만
+조회한다 — 비용이 원본 행 수가 아니라 기간 일수 × path 수에 비례.
+rollup 갱신은 services/page_view_rollup.py (스케줄러 잡).
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import delete, func, insert
+from sqlalchemy.orm import Session
+
+from db.models.page_view import PageView, PageViewDaily, PageViewHourly, PageViewUserDaily
+from services._sketches import hist_merge, hist_percentile, hll_count, hll_merge
+
+
+class PageViewRollupRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── 갱신 (rollup 잡 전용) ────────────────────────────────────────────
+
+    def last_hour(self) -> Optional[str]:
+        """가장 최근 rollup 시간 버킷 ('YYYY-MM-DDTHH') 또는 None."""
+        return self.db.query(func.max(PageViewHourly.hour)).scalar()
+
+    def first_raw_date(self) -> Optional[str]:
+        first = self.db.query(func.min(PageView.created_at)).scalar()
+        return first[:10] if first else None
+
+    def replace_day(self, date: str, hourly: list[dict], daily: list[dict], users: list[dict]) -> None:
+        """해당 일자 rollup 행 전체 교체 (delete + executemany insert) — 재실행해도 같은 결과."""
+        self.db.execute(delete(PageViewHourly).where(PageViewHourly.hour.like(f"{date}T%")))
+        self.db.execute(delete(PageViewDaily).where(PageViewDaily.date == date))
+        self.db.execute(delete(PageViewUserDaily).where(PageViewUserDaily.date == date))
+        for model, rows in ((PageViewHourly, hourly), (PageViewDaily, daily), (PageViewUserDaily, users)):
+            if rows:
+                self.db.execute(insert(model), rows)
+
+    def delete_raw_before(self, date: str) -> int:
+        """created_at < date(KST 'YYYY-MM-DD') raw 행 삭제."""
+        return self.db.execute(delete(PageView).where(PageView.created_at < date)).rowcount or 0
+
+    def delete_hourly_before(self, date: str) -> int:
+        return self.db.execute(delete(PageViewHourly).where(PageViewHourly.hour < date)).rowcount or 0
+
+    # ── 관리자 조회 (rollup만 사용) ───────────────────────────────────────
+
+    def _top_paths(self, date_from: str, date_to: str, top: int):
+        calls = func.sum(PageViewDaily.calls)
+        return (
+            self.db.query(
+                PageViewDaily.path.label("path"),
+                calls.label("calls"),
+                func.sum(PageViewDaily.errors).label("errors"),
+                func.sum(PageViewDaily.server_errors).label("server_errors"),
+                func.sum(PageViewDaily.duration_sum).label("duration_sum"),
+                func.max(PageViewDaily.duration_max).label("max_ms"),
+            )
+            .filter(PageViewDaily.date >= date_from, PageViewDaily.date <= date_to)
+            .group_by(PageViewDaily.path)
+            .order_by(calls.desc(), PageViewDaily.path)
+            .limit(top)
+            .all()
+        )
+
+    def aggregate_by_path(self, date_from: str, date_to: str, top: int = 20) -> list[dict]:
+        """경로별 집계: 호출수 + 평균/최대/p50/p95/p99 latency + 오류 수 + 유저 수(HLL 추정).
+
+        Args:
+            date_from: YYYY-MM-DD (KST 포함)
+            date_to: YYYY-MM-DD (포함)
+            top: 상위 N path
+        """
+        totals = self._top_paths(date_from, date_to, top)
+        if not totals:
+            return []
+        hists: dict[str, list] = {r.path: [] for r in totals}
+        sketches: dict[str, list] = {r.path: [] for r in totals}
+        for path, hist, hll in (
+            self.db.query(PageViewDaily.path, PageViewDaily.latency_hist, PageViewDaily.users_hll)
+            .filter(PageViewDaily.date >= date_from, PageViewDaily.date <= date_to)
+            .filter(PageViewDaily.path.in_(list(hists)))
+        ):
+            hists[path].append(hist)
+            sketches[path].append(hll)
+
+        result = []
+        for r in totals:
+            calls = int(r.calls or 0)
+            max_ms = float(r.max_ms or 0)
+            hist = hist_merge(hists[r.path])
+            result.append({
+                "path": r.path,
+                "calls": calls,
+                "avg_ms": round(float(r.duration_sum or 0) / calls, 1) if calls else 0.0,
+                "max_ms": round(max_ms, 1),
+                "p50_ms": hist_percentile(hist, 0.50, max_ms),
+                "p95_ms": hist_percentile(hist, 0.95, max_ms),
+                "p99_ms": hist_percentile(hist, 0.99, max_ms),
+                "errors": int(r.errors or 0),
+                "server_errors": int(r.server_errors or 0),
+                "unique_users": hll_count(hll_merge(sketches[r.path])),
+            })
+        return result
+
+    def daily_timeseries(self, date_from: str, date_to: str, top: int = 5) -> list[dict]:
+        """일별 path별 호출 수 시계열 (상위 top path만)."""
+        top_paths = [r.path for r in self._top_paths(date_from, date_to, top)]
+        if not top_paths:
+            return []
+        rows = (
+            self.db.query(PageViewDaily.date, PageViewDaily.path, PageViewDaily.calls)
+            .filter(PageViewDaily.path.in_(top_paths))
+            .filter(PageViewDaily.date >= date_from, PageViewDaily.date <= date_to)
+            .order_by(PageViewDaily.date.asc(), PageViewDaily.path)
+            .all()
+        )
+        return [{"date": r.date, "path": r.path, "calls": int(r.calls or 0)} for r in rows]
+
+    def count_by_user(self, user_ids: list[int]) -> dict[int, int]:
+        """사용자별 누적 방문 카운트 (rollup 전체 누계 — raw 보존기간과 무관). 없는 사용자는 0."""
+        if not user_ids:
+            return {}
+        rows = (
+            self.db.query(PageViewUserDaily.user_id, func.sum(PageViewUserDaily.calls).label("cnt"))
+            .filter(PageViewUserDaily.user_id.in_(user_ids))
+            .group_by(PageViewUserDaily.user_id)
+            .all()
+        )
+        counts = {int(r.user_id): int(r.cnt or 0) for r in rows}
+        return {uid: counts.get(uid, 0) for uid in user_ids}
+
+    def user_daily_timeseries(self, user_id: int, date_from: str, date_to: str) -> list[dict]:
+        """사용자별 일별 PV + 고유 path 수. 데이터 없는 날은 제외(라우터에서 padding)."""
+        rows = (
+            self.db.query(
+                PageViewUserDaily.date.label("date"),
+                func.sum(PageViewUserDaily.calls).label("views"),
+                func.count(PageViewUserDaily.path).label("unique_paths"),
+            )
+            .filter(PageViewUserDaily.user_id == user_id)
+            .filter(PageViewUserDaily.date >= date_from, PageViewUserDaily.date <= date_to)
+            .group_by(PageViewUserDaily.date)
+            .order_by(PageViewUserDaily.date.asc())
+            .all()
+        )
+        return [
+            {"date": r.date, "views": int(r.views or 0), "unique_paths": int(r.unique_paths or 0)}
+            for r in rows
+        ]
+
+    def user_top_paths(self, user_id: int, date_from: str, date_to: str, top: int = 5) -> list[dict]:
+        """사용자의 상위 N개 경로 (views desc)."""
+        views = func.sum(PageViewUserDaily.calls)
+        rows = (
+            self.db.query(PageViewUserDaily.path.label("path"), views.label("views"))
+            .filter(PageViewUserDaily.user_id == user_id)
+            .filter(PageViewUserDaily.date >= date_from, PageViewUserDaily.date <= date_to)
+            .group_by(PageViewUserDaily.path)
+            .order_by(views.desc(), PageViewUserDaily.path)
+            .limit(top)
+            .all()
+        )
+        return [{"path": r.path, "views": int(r.views or 0)} for r in rows]
+
+    def user_last_seen_at(self, user_id: int) -> Optional[str]:
+        """사용자의 마지막 접속 created_at (KST ISO) 또는 None."""
+        result = (
+            self.db.query(func.max(PageViewUserDaily.last_at))
+            .filter(PageViewUserDaily.user_id == user_id)
+            .scalar()
+        )
+        return result if result else None
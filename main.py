@@ -108,8 +108,19 @@ async def lifespan(app: FastAPI):
         _flush_interval = int(os.environ.get("TELEMETRY_FLUSH_SEC", "300"))
         _tel.start_periodic_flush(interval_sec=_flush_interval)
 
+    # 페이지뷰 일괄 기록 writer 스레드 (services/page_view_buffer.py)
+    # 테스트에서도 시작 — 미들웨어는 항상 offer()하므로 writer 없이는 행이 기록되지 않고 쌓이기만 한다.
+    from services.page_view_buffer import get_page_view_buffer
+    get_page_view_buffer().start()
+
     yield
 
+    # 버퍼에 남은 페이지뷰 최종 flush
+    try:
+        get_page_view_buffer().stop()
+    except Exception:
+        pass
+
     if not _testing:
         # Phase 3: telemetry 정리 (final flush 포함)
         try:
@@ -194,7 +205,7 @@ async def generic_exception_handler(request: Request, exc: Exception):
 
 # ── Phase 4 단계 5 (C): 페이지뷰 통계 미들웨어 ─────────────────────────────
 # /api/health, /assets/*, /static/*, /ws/*, /api/admin/page-stats(자기참조)는 제외.
-# asyncio.create_task로 비동기 INSERT (latency 영향 ≈ 0).
+# 메모리 버퍼에 넣고 writer 스레드가 일괄 INSERT (services/page_view_buffer.py).
 _PAGE_VIEW_EXCLUDE_PREFIXES = (
     "/api/health",
     "/assets/",
@@ -240,25 +251,17 @@ async def record_page_view_middleware(request: Request, call_next):
     # 인증된 요청이면 user_id 기록, 아니면 anonymous(NULL).
     user_id = _extract_user_id_from_jwt(request)
 
-    async def _record():
-        try:
-            from db.session import get_session
-            from db.repositories.page_view_repo import PageViewRepository
-            with get_session() as db:
-                PageViewRepository(db).record(
-                    user_id=user_id,
-                    path=path,
-                    method=request.method,
-                    status_code=response.status_code,
-                    duration_ms=elapsed_ms,
-                )
-        except Exception:
-            # 로그 기록 실패는 응답에 영향 X
-            pass
-
     try:
-        asyncio.create_task(_record())
+        from services.page_view_buffer import get_page_view_buffer
+        get_page_view_buffer().offer(
+            user_id=user_id,
+            path=path,
+            method=request.method,
+            status_code=response.status_code,
+            duration_ms=elapsed_ms,
+        )
     except Exception:
+        # 로그 기록 실패는 응답에 영향 X
         pass
 
     return response
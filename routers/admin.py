@@ -188,7 +188,8 @@ def get_quote_status(_user: dict = Depends(require_admin)):
     """KIS 실시간 시세 매니저 상태 진단 (admin only).
 
     호가창 빈 화면 결함의 단일 점 결함 진단용 — start() 실패 사유 / WS 연결 여부 /
-    fallback 모드 / 구독자 수 / approval_key 발급 후 경과시간 / 연속 실패 카운터.
+    fallback 모드 / 구독자 수 / approval_key 발급 후 경과시간 / 연속 실패 카운터 /
+    심볼별 fan-out(병합·직렬화·전달·드롭) 지표 / REST 폴백 폴러 지표·종목별 시세 경과.
     """
     from services.quote_service import get_manager, get_overseas_manager
 
@@ -210,6 +211,8 @@ def get_quote_status(_user: dict = Depends(require_admin)):
             "approval_key_age_sec": approval_key_age,
             "consecutive_connect_failures": m._consecutive_connect_failures,
             "start_failed_reason": m._start_failed_reason,
+            "fanout": m._fanout.stats(),
+            "fallback": m._poller.stats(),
         },
         "overseas_manager": {
             "running": getattr(om, "_running", None),
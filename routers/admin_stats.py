@@ -7,10 +7,11 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 
-from db.repositories.page_view_repo import PageViewRepository
+from db.repositories.page_view_rollup_repo import PageViewRollupRepository
 from db.session import get_session
 from db.utils import KST
 from services.auth_deps import require_admin
+from services.page_view_buffer import get_page_view_buffer
 
 router = APIRouter(prefix="/api/admin/page-stats", tags=["admin-stats"])
 
@@ -30,15 +31,19 @@ def get_page_stats(
     top: int = Query(20, ge=1, le=200),
     _admin: dict = Depends(require_admin),
 ):
-    """경로별 호출 횟수 + 평균/p95 latency + 일별 시계열 + 유저 수.
+    """경로별 호출 횟수 + 평균/p50/p95/p99 latency + 오류 수 + 일별 시계열 + 유저 수.
+
+    rollup 테이블만 조회 (services/page_view_rollup.py, 최대 PAGE_VIEW_ROLLUP_INTERVAL_MIN분 지연).
 
     Args:
         from: YYYY-MM-DD
         to:   YYYY-MM-DD
         top:  상위 N path
+
+    ingest: 페이지뷰 기록 버퍼 지표 (pending/dropped/written/failed/batches).
     """
     with get_session() as db:
-        repo = PageViewRepository(db)
+        repo = PageViewRollupRepository(db)
         summary = repo.aggregate_by_path(date_from, date_to, top=top)
         timeseries = repo.daily_timeseries(date_from, date_to, top=top)
 
@@ -48,4 +53,5 @@ def get_page_stats(
         "top": top,
         "summary": summary,
         "timeseries": timeseries,
+        "ingest": get_page_view_buffer().stats(),
     }
@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 
 from db.repositories.admin_repo import AdminRepository
-from db.repositories.page_view_repo import PageViewRepository
+from db.repositories.page_view_rollup_repo import PageViewRollupRepository
 from db.repositories.user_kis_repo import UserKisRepository
 from db.repositories.user_repo import UserRepository
 from db.session import get_session
@@ -34,7 +34,8 @@ def list_users(
 ):
     """사용자 목록 (검색 + 페이지네이션). has_kis + visit_count 포함.
 
-    R4 (2026-05-04): visit_count는 PageViewRepository.count_by_user로 1쿼리(N+1 방지).
+    R4 (2026-05-04): visit_count는 count_by_user로 1쿼리(N+1 방지).
+    visit_count는 rollup 테이블(PageViewRollupRepository)에서 조회한다.
     """
     with get_session() as db:
         urepo = UserRepository(db)
@@ -42,7 +43,7 @@ def list_users(
         total = urepo.count_users(q=q)
 
         kis_repo = UserKisRepository(db)
-        pv_repo = PageViewRepository(db)
+        pv_repo = PageViewRollupRepository(db)
         ids = [item["id"] for item in items]
         visits = pv_repo.count_by_user(ids)
         for item in items:
@@ -61,7 +62,7 @@ def get_user(user_id: int, _admin: dict = Depends(require_admin)):
         if not user:
             raise NotFoundError(f"user_id={user_id} 사용자를 찾을 수 없습니다.")
         user["has_kis"] = UserKisRepository(db).is_valid(user_id)
-        user["visit_count"] = PageViewRepository(db).count_by_user([user_id]).get(user_id, 0)
+        user["visit_count"] = PageViewRollupRepository(db).count_by_user([user_id]).get(user_id, 0)
     return user
 
 
@@ -95,7 +96,7 @@ def get_user_access_history(
         if not user:
             raise NotFoundError(f"user_id={user_id} 사용자를 찾을 수 없습니다.")
 
-        pv_repo = PageViewRepository(db)
+        pv_repo = PageViewRollupRepository(db)
         daily_rows = pv_repo.user_daily_timeseries(user_id, date_from, date_to)
         top_paths_rows = pv_repo.user_top_paths(user_id, date_from, date_to, top_paths)
         last_seen_at = pv_repo.user_last_seen_at(user_id)
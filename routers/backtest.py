@@ -6,7 +6,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 
-from config import KIS_MCP_ENABLED
+from config import KIS_MCP_ENABLED, LOCAL_BACKTEST_SWEEP_MAX_RUNS
 from services.auth_deps import get_current_user
 from services import backtest_service
 from services.exceptions import NotFoundError
@@ -73,6 +73,64 @@ class LocalBacktestBody(BaseModel):
     params: Optional[dict] = None
 
 
+class LocalSweepBody(BaseModel):
+    """로컬 프리셋 파라미터 스윕 입력 — param_grid(곱집합) 또는 samples(랜덤) 중 하나 이상."""
+
+    preset: str
+    symbols: list[str] = Field(min_length=1, max_length=10)
+    market: str = "KR"
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    initial_capital: float = Field(default=10_000_000.0, ge=100_000.0)
+    commission_rate: float = Field(default=0.0015, ge=0.0, le=0.1)
+    tax_rate: float = Field(default=0.0023, ge=0.0, le=0.1)
+    slippage: float = Field(default=0.001, ge=0.0, le=0.1)
+    param_grid: Optional[dict[str, list]] = None
+    samples: Optional[int] = Field(default=None, ge=1, le=LOCAL_BACKTEST_SWEEP_MAX_RUNS)
+    seed: Optional[int] = None
+    rank_by: str = "sharpe_ratio"
+    top_n: int = Field(default=20, ge=1, le=200)
+
+
+class LocalWalkForwardBody(BaseModel):
+    """로컬 프리셋 워크포워드 입력 — 창 길이는 달력일, 학습 구간 최적화 조합은 스윕과 동일 형식."""
+
+    preset: str
+    symbols: list[str] = Field(min_length=1, max_length=10)
+    market: str = "KR"
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    initial_capital: float = Field(default=10_000_000.0, ge=100_000.0)
+    commission_rate: float = Field(default=0.0015, ge=0.0, le=0.1)
+    tax_rate: float = Field(default=0.0023, ge=0.0, le=0.1)
+    slippage: float = Field(default=0.001, ge=0.0, le=0.1)
+    train_days: int = Field(default=365, ge=30, le=3650)
+    test_days: int = Field(default=90, ge=5, le=1825)
+    anchored: bool = False
+    param_grid: Optional[dict[str, list]] = None
+    samples: Optional[int] = Field(default=None, ge=1, le=LOCAL_BACKTEST_SWEEP_MAX_RUNS)
+    seed: Optional[int] = None
+    rank_by: str = "sharpe_ratio"
+
+
+class LocalUniverseBody(BaseModel):
+    """유니버스 규모 로컬 백테스트 입력 — 종목 수 상한은 서비스(LOCAL_BACKTEST_UNIVERSE_MAX_SYMBOLS)."""
+
+    preset: str
+    symbols: list[str] = Field(min_length=1)
+    market: str = "KR"
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    initial_capital: float = Field(default=100_000_000.0, ge=100_000.0)
+    max_slots: int = Field(default=20, ge=1, le=500)
+    rank_by: str = "turnover"
+    allocation: str = "slots"
+    commission_rate: float = Field(default=0.0015, ge=0.0, le=0.1)
+    tax_rate: float = Field(default=0.0023, ge=0.0, le=0.1)
+    slippage: float = Field(default=0.001, ge=0.0, le=0.1)
+    params: Optional[dict] = None
+
+
 # ── 엔드포인트 ────────────────────────────────────────────────────────────────
 
 @router.get("/status")
@@ -218,6 +276,91 @@ def run_local(body: LocalBacktestBody, user: dict = Depends(get_current_user)):
     return out
 
 
+@router.post("/run/local/sweep")
+def run_local_sweep(body: LocalSweepBody, user: dict = Depends(get_current_user)):
+    """로컬 프리셋 파라미터 스윕 (fire-and-poll). 즉시 {job_id, status:"running", total_runs}.
+
+    진행 중 순위는 GET /result/{job_id}의 result_json.ranking 으로 갱신된다.
+    """
+    logger.info(
+        "[backtest.sweep.router_entry] preset=%s symbols_n=%d grid_keys=%s samples=%s user_id=%s",
+        body.preset, len(body.symbols), list((body.param_grid or {}).keys()), body.samples, user["id"],
+    )
+    return backtest_service.run_local_sweep(
+        preset=body.preset,
+        symbols=body.symbols,
+        market=body.market,
+        start_date=body.start_date,
+        end_date=body.end_date,
+        initial_capital=body.initial_capital,
+        commission_rate=body.commission_rate,
+        tax_rate=body.tax_rate,
+        slippage=body.slippage,
+        param_grid=body.param_grid,
+        samples=body.samples,
+        seed=body.seed,
+        rank_by=body.rank_by,
+        top_n=body.top_n,
+        user_id=user["id"],
+    )
+
+
+@router.post("/run/local/walkforward")
+def run_local_walkforward(body: LocalWalkForwardBody, user: dict = Depends(get_current_user)):
+    """로컬 프리셋 워크포워드 평가 (fire-and-poll). 즉시 {job_id, status:"running", total_windows}.
+
+    완료된 창의 학습/검증 메트릭은 GET /result/{job_id}의 result_json.windows 로 갱신된다.
+    """
+    logger.info(
+        "[backtest.walkforward.router_entry] preset=%s symbols_n=%d train=%d test=%d user_id=%s",
+        body.preset, len(body.symbols), body.train_days, body.test_days, user["id"],
+    )
+    return backtest_service.run_local_walkforward(
+        preset=body.preset,
+        symbols=body.symbols,
+        market=body.market,
+        start_date=body.start_date,
+        end_date=body.end_date,
+        initial_capital=body.initial_capital,
+        commission_rate=body.commission_rate,
+        tax_rate=body.tax_rate,
+        slippage=body.slippage,
+        train_days=body.train_days,
+        test_days=body.test_days,
+        anchored=body.anchored,
+        param_grid=body.param_grid,
+        samples=body.samples,
+        seed=body.seed,
+        rank_by=body.rank_by,
+        user_id=user["id"],
+    )
+
+
+@router.post("/run/local/universe")
+def run_local_universe(body: LocalUniverseBody, user: dict = Depends(get_current_user)):
+    """유니버스 규모(수백~수천 종목) 로컬 백테스트 (fire-and-poll). 결과는 GET /result/{job_id}."""
+    logger.info(
+        "[backtest.universe.router_entry] preset=%s symbols_n=%d slots=%d rank_by=%s user_id=%s",
+        body.preset, len(body.symbols), body.max_slots, body.rank_by, user["id"],
+    )
+    return backtest_service.run_local_universe_backtest(
+        preset=body.preset,
+        symbols=body.symbols,
+        market=body.market,
+        start_date=body.start_date,
+        end_date=body.end_date,
+        initial_capital=body.initial_capital,
+        max_slots=body.max_slots,
+        rank_by=body.rank_by,
+        allocation=body.allocation,
+        commission_rate=body.commission_rate,
+        tax_rate=body.tax_rate,
+        slippage=body.slippage,
+        params=body.params,
+        user_id=user["id"],
+    )
+
+
 @router.get("/result/{job_id}")
 def get_result(job_id: str, user: dict = Depends(get_current_user)):
     """백테스트 결과 조회 — fire-and-poll lazy MCP 폴링 트리거.
@@ -1,6 +1,7 @@
 """
 실시간 호가 WebSocket 엔드포인트.
-국내(KR): KIS WS 브릿지 (100ms 메시지 병합), 해외(US): OverseasQuoteManager pub/sub.
+국내(KR): KIS WS 브릿지 (심볼 단위 100ms 병합·직렬화 공유), 해외(US): OverseasQuoteManager pub/sub.
+국내(KR) 분봉 지표: /ws/quote/{symbol}/indicators — 체결 틱 증분 지표 스냅샷 push.
 
 REQ-ROUTER-06: 미국 10단계 호가 + 현재가 상세 REST 엔드포인트 추가
 (WS 차단/초기 로딩용 폴백).
@@ -89,46 +90,104 @@ async def quote_ws(websocket: WebSocket, symbol: str, market: str = "", exchange
 async def _stream_domestic(websocket: WebSocket, symbol: str, exchange: str = "auto"):
     """KIS WebSocket → FastAPI WebSocket 브릿지 (국내주식).
 
-    100ms 창 내 메시지를 병합하여 최신 price/orderbook만 전송.
     exchange: 'auto'(기본) / 'UN' / 'KRX' / 'NXT' — KISQuoteManager가 시계 기반 분기.
     """
+    await _stream_frames(websocket, symbol, is_fno=False, exchange=exchange)
+
+
+async def _stream_fno(websocket: WebSocket, symbol: str):
+    """KIS WebSocket → FastAPI WebSocket 브릿지 (선물옵션)."""
+    await _stream_frames(websocket, symbol, is_fno=True)
+
+
+async def _stream_frames(websocket: WebSocket, symbol: str, *, is_fno: bool, exchange: str = "auto"):
+    """KISQuoteManager 프레임 구독 → 텍스트 그대로 전송.
+
+    100ms 병합(같은 type은 최신만)과 JSON 직렬화는 매니저가 심볼 단위로 1회 수행하고
+    같은 종목 구독자끼리 인코딩 결과를 공유한다 (services/quote_fanout.py).
+    """
     manager = get_manager()
     queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-    await manager.subscribe(symbol, queue, exchange=exchange)
+    if is_fno:
+        await manager.subscribe_frames(symbol, queue, is_fno=True)
+    else:
+        await manager.subscribe_frames(symbol, queue, exchange=exchange)
     try:
         while True:
             try:
-                msg = await asyncio.wait_for(queue.get(), timeout=30.0)
+                frame = await asyncio.wait_for(queue.get(), timeout=30.0)
             except asyncio.TimeoutError:
                 # 연결 유지용 ping
                 await websocket.send_json({"type": "ping"})
                 continue
+            await websocket.send_text(frame)
+    finally:
+        manager.unsubscribe_frames(symbol, queue)
 
-            # 100ms 창 내 추가 메시지 수집 → 같은 type은 최신만 유지
-            latest = {msg["type"]: msg}
-            deadline = asyncio.get_event_loop().time() + 0.1
-            while True:
-                remaining = deadline - asyncio.get_event_loop().time()
-                if remaining <= 0:
-                    break
-                try:
-                    extra = await asyncio.wait_for(queue.get(), timeout=remaining)
-                    latest[extra["type"]] = extra
-                except asyncio.TimeoutError:
-                    break
 
-            # 병합된 최신 메시지만 전송
-            for m in latest.values():
-                await websocket.send_json(m)
+async def _stream_overseas(websocket: WebSocket, symbol: str):
+    """OverseasQuoteManager pub/sub → FastAPI WebSocket (해외주식)."""
+    manager = get_overseas_manager()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+    await manager.subscribe(symbol, queue)
+    try:
+        while True:
+            try:
+                msg = await asyncio.wait_for(queue.get(), timeout=30.0)
+                await websocket.send_json(msg)
+            except asyncio.TimeoutError:
+                await websocket.send_json({"type": "ping"})
     finally:
         manager.unsubscribe(symbol, queue)
 
 
-async def _stream_fno(websocket: WebSocket, symbol: str):
-    """KIS WebSocket → FastAPI WebSocket 브릿지 (선물옵션). 100ms 메시지 병합."""
+@router.websocket("/ws/quote/{symbol}/indicators")
+async def quote_indicators_ws(websocket: WebSocket, symbol: str, intervals: str = "", exchange: str = "auto"):
+    """KR 실시간 분봉 지표 WebSocket (services/quote_indicators.py).
+
+    Query params:
+        token: JWT (인증)
+        intervals: 분봉 간격(분) 콤마 구분 — 예: "1,15". 생략 시 설정된 전체 간격.
+        exchange: "auto"(기본) / "UN" / "KRX" / "NXT"
+
+    메시지: {"type": "indicators", "symbol", "interval", "bar", "closed_bars", macd, rsi, stoch, bb, ma, atr}
+    + {"type": "price"} (체결가) + {"type": "ping"}. 간격별로 100ms 창 내 최신 스냅샷만 전송.
+    """
+    from services.quote_indicators import allowed_intervals
+
+    token = websocket.query_params.get("token")
+    if not token:
+        await websocket.close(code=1008)
+        return
+    try:
+        from services.auth_service import verify_token
+        verify_token(token)
+    except Exception:
+        await websocket.close(code=1008)
+        return
+
+    symbol = symbol.upper()
+    allowed = allowed_intervals()
+    if intervals:
+        try:
+            wanted = sorted({int(tok) for tok in intervals.split(",") if tok.strip()})
+        except ValueError:
+            wanted = []
+    else:
+        wanted = list(allowed)
+    await websocket.accept()
+    if not is_domestic(symbol) or not wanted or any(m not in allowed for m in wanted):
+        await websocket.send_json({
+            "type": "error",
+            "message": f"국내 종목·지원 간격({','.join(map(str, allowed))}분)만 가능합니다",
+        })
+        await websocket.close(code=1008)
+        return
+
     manager = get_manager()
+    exchange = (exchange or "auto").upper() if exchange.lower() != "auto" else "auto"
     queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-    await manager.subscribe(symbol, queue, is_fno=True)
+    await manager.subscribe_indicators(symbol, queue, wanted, exchange=exchange)
     try:
         while True:
             try:
@@ -137,38 +196,27 @@ async def _stream_fno(websocket: WebSocket, symbol: str):
                 await websocket.send_json({"type": "ping"})
                 continue
 
-            latest = {msg["type"]: msg}
+            # 100ms 창 병합 — 지표는 간격별 최신, 그 외는 type별 최신. 호가는 전달하지 않음.
+            latest: dict = {}
             deadline = asyncio.get_event_loop().time() + 0.1
             while True:
+                if msg.get("type") != "orderbook":
+                    latest[(msg.get("type"), msg.get("interval"))] = msg
                 remaining = deadline - asyncio.get_event_loop().time()
                 if remaining <= 0:
                     break
                 try:
-                    extra = await asyncio.wait_for(queue.get(), timeout=remaining)
-                    latest[extra["type"]] = extra
+                    msg = await asyncio.wait_for(queue.get(), timeout=remaining)
                 except asyncio.TimeoutError:
                     break
-
             for m in latest.values():
                 await websocket.send_json(m)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error("[QuoteIndicatorsWS] %s: %s", symbol, e)
     finally:
-        manager.unsubscribe(symbol, queue)
-
-
-async def _stream_overseas(websocket: WebSocket, symbol: str):
-    """OverseasQuoteManager pub/sub → FastAPI WebSocket (해외주식)."""
-    manager = get_overseas_manager()
-    queue: asyncio.Queue = asyncio.Queue(maxsize=50)
-    await manager.subscribe(symbol, queue)
-    try:
-        while True:
-            try:
-                msg = await asyncio.wait_for(queue.get(), timeout=30.0)
-                await websocket.send_json(msg)
-            except asyncio.TimeoutError:
-                await websocket.send_json({"type": "ping"})
-    finally:
-        manager.unsubscribe(symbol, queue)
+        manager.unsubscribe_indicators(symbol, queue)
 
 
 @router.get("/api/quote/us/{symbol}/orderbook")
@@ -8,16 +8,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from services.auth_deps import get_current_user
 from services.exceptions import ExternalAPIError
 from screener.dart import fetch_filings
-from screener.krx import get_all_stocks
+from screener.frame import ScreenerFrame
 from screener.service import (
     ScreenerValidationError,
-    apply_filters,
-    enrich_seo_scores,
     get_preset_filters,
     normalize_date,
     parse_sort_spec,
     sort_by_greenblatt_rank,
-    sort_stocks,
 )
 from stock.market import fetch_market_metrics, fetch_period_returns, fetch_price
 
@@ -220,9 +217,9 @@ def get_stocks(
     else:
         sort_specs = [("mktcap", True)]
 
-    # ── 1단계: KRX 데이터 수집 + 기본 필터 ──
+    # ── 1단계: KRX 데이터 수집 + 기본 필터 (컬럼형, 거래일별 1회 적재) ──
     try:
-        stocks, actual_date = get_all_stocks(target_date)
+        frame, actual_date = ScreenerFrame.load(target_date)
     except RuntimeError as e:
         raise ExternalAPIError(str(e))
 
@@ -231,21 +228,21 @@ def get_stocks(
             filings = fetch_filings(target_date, target_date)
         except RuntimeError as e:
             raise ExternalAPIError(str(e))
-        filing_codes = {f["stock_code"] for f in filings}
-        stocks = [s for s in stocks if s["code"] in filing_codes]
+        frame = frame.where_codes({f["stock_code"] for f in filings})
 
-    stocks = apply_filters(
-        stocks, market=market, per_min=per_min, per_max=per_max,
-        pbr_max=pbr_max, roe_min=roe_min, include_negative=include_negative,
+    # 서준식 점수는 KRX 데이터만으로 전 종목 벡터 계산 → 정렬 키로도 사용 가능
+    frame = (
+        frame.filter(
+            market=market, per_min=per_min, per_max=per_max,
+            pbr_max=pbr_max, roe_min=roe_min, include_negative=include_negative,
+        )
+        .with_seo()
+        .sort(sort_specs)
     )
 
-    # 서준식 점수 즉시 계산 (KRX 데이터만)
-    stocks = enrich_seo_scores(stocks)
-
-    stocks = sort_stocks(stocks, sort_specs)
-
     if top is not None and top > 0:
-        stocks = stocks[:top]
+        frame = frame.head(top)
+    stocks = frame.to_records()
 
     # ── 2단계: yfinance enrichment (기존) ──
     if stocks:
@@ -15,7 +15,7 @@ def search_stocks(
     _user: dict = Depends(get_current_user),
 ):
     """
-    KR: 종목명/코드 부분 검색 → 최대 10건 자동완성 목록
+    KR: 종목명/코드 접두사/초성 검색 → 최대 10건 자동완성 목록 (완전 > 접두사 > 중간일치, 시총순)
     US: 티커 유효성 검증 → 유효하면 [단일 항목], 무효면 []
     FNO: 선물옵션 종목명/코드 부분 검색 → 최대 10건 목록
     """
@@ -40,10 +40,11 @@ def search_stocks(
         if len(q) < 2:
             return []
 
-        results = symbol_map.name_to_results(q)
+        # 코드 접두사 / 초성(ㅅㅅㅈㅈ) / 이름 부분일치 — 상주 인덱스, 시가총액순
+        results = symbol_map.search(q, limit=10)
         return [
             {"code": c, "name": n, "market": m}
-            for c, n, m in results[:10]
+            for c, n, m in results
         ]
 
     if market == "US":
@@ -10,13 +10,11 @@ from .display import (
     print_earnings_table,
     print_screen_table,
 )
-from .krx import get_all_stocks
+from .frame import ScreenerFrame
 from .service import (
     ScreenerValidationError,
-    apply_filters,
     normalize_date,
     parse_sort_spec,
-    sort_stocks,
 )
 
 
@@ -123,14 +121,14 @@ def screen(
     # KRX 데이터 수집
     console.print(f"[cyan]{formatted}[/cyan] 전종목 데이터를 수집합니다...")
     try:
-        stocks, actual_date = get_all_stocks(target_date)
+        frame, actual_date = ScreenerFrame.load(target_date)
     except RuntimeError as e:
         console.print(f"[red]오류:[/red] {e}")
         raise SystemExit(1)
 
     if actual_date != target_date:
         console.print(f"  [yellow]→ 거래일 자동 소급: {target_date} → {actual_date}[/yellow]")
-    console.print(f"  전종목 {len(stocks)}개 로드 완료")
+    console.print(f"  전종목 {len(frame)}개 로드 완료")
 
     # 당일 실적발표 종목 필터
     title = ""
@@ -142,16 +140,14 @@ def screen(
             console.print(f"[red]오류:[/red] {e}")
             raise SystemExit(1)
 
-        filing_codes = {f["stock_code"] for f in filings}
-        stocks = [s for s in stocks if s["code"] in filing_codes]
-        console.print(f"  실적발표 종목 {len(stocks)}개로 필터링됨")
+        frame = frame.where_codes({f["stock_code"] for f in filings})
+        console.print(f"  실적발표 종목 {len(frame)}개로 필터링됨")
         title = f"당일 실적발표 종목 스크리닝 ({formatted})"
 
     # 필터 적용 (per_range 튜플을 per_min/per_max로 변환)
     per_min = per_range[0] if per_range is not None else None
     per_max = per_range[1] if per_range is not None else None
-    stocks = apply_filters(
-        stocks,
+    frame = frame.filter(
         market=market,
         per_min=per_min,
         per_max=per_max,
@@ -160,12 +156,11 @@ def screen(
         include_negative=include_negative,
     )
 
-    # 정렬
-    stocks = sort_stocks(stocks, sort_specs)
-
-    # 상위 N개 제한
+    # 정렬 (np.lexsort) + 상위 N개 제한 → 출력 대상만 dict로 변환
+    frame = frame.sort(sort_specs)
     if top_n is not None and top_n > 0:
-        stocks = stocks[:top_n]
+        frame = frame.head(top_n)
+    stocks = frame.to_records()
 
     if not stocks:
         console.print("\n조건에 맞는 종목이 없습니다.")
@@ -0,0 +1,293 @@
+"""컬럼형 스크리너 엔진 — 전종목 dict 리스트 대신 NumPy 컬럼 배열로 필터/정렬.
+
+`get_all_stocks()` 결과(~2,700 dict)를 거래일별 1회만 컬럼 배열로 적재하고,
+필터는 불리언 마스크, 다중 기준 정렬은 `np.lexsort`로 처리한다.
+행 dict는 최종 상위 N개만 `to_records()`에서 만든다.
+
+구조
+----
+- `_Columns`: 거래일 단위 공유 원본 (레코드 리스트 + 컬럼 캐시). 읽기 전용.
+- `ScreenerFrame`: `_Columns` + 선택 행 인덱스(`idx`). 필터/정렬은 새 프레임 반환.
+- 파생 컬럼(`seo_return`, `seo_score`)은 원본 단위로 1회 계산 후 재사용.
+
+의미 보존
+---------
+`apply_filters` / `sort_stocks` / `sort_by_greenblatt_rank` 기존 루프 구현과 결과(순서 포함)가
+동일하다 — None(NaN)은 항상 마지막, 동률은 입력 순서 유지(안정 정렬).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Iterable, Optional
+
+import numpy as np
+
+# 거래일별 프레임 메모 (요청 날짜 → 거래일 해석은 10분 유지)
+_MEMO_MAX_DATES = 4
+_RESOLVE_TTL_SEC = 600
+
+
+def _to_float(values: Iterable) -> np.ndarray:
+    """None/비숫자 → NaN float64 배열."""
+    values = list(values)
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.full(len(values), np.nan)
+        for i, v in enumerate(values):
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                out[i] = v
+        return out
+
+
+def _seo_columns(roe: np.ndarray, pbr: np.ndarray, per: np.ndarray, dy: np.ndarray):
+    """`calc_seo_expected_return` 벡터화 — (expected_return, seo_score)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roe_pbr = ~np.isnan(roe) & (pbr > 0)
+        per_div = ~roe_pbr & (per > 0)
+        expected = np.where(
+            roe_pbr, roe / pbr,
+            np.where(per_div, 100.0 / per + np.nan_to_num(dy), np.nan),
+        )
+    score = np.select(
+        [expected > 12, expected > 8, expected > 5], [4, 3, 2], default=1,
+    )
+    return expected, score
+
+
+class _Columns:
+    """레코드 리스트 + 필드별 float 컬럼 캐시 (지연 생성)."""
+
+    __slots__ = ("records", "codes", "markets", "_cols", "_lock")
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+        self.codes = np.array([r.get("code") or "" for r in records], dtype=object)
+        self.markets = np.array([r.get("market") or "" for r in records], dtype=object)
+        self._cols: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def col(self, field: str) -> np.ndarray:
+        arr = self._cols.get(field)
+        if arr is not None:
+            return arr
+        with self._lock:
+            arr = self._cols.get(field)
+            if arr is None:
+                if field in ("seo_return", "seo_score", "_seo_raw"):
+                    self._build_seo()
+                    return self._cols[field]
+                arr = _to_float(r.get(field) for r in self.records)
+                arr.flags.writeable = False
+                self._cols[field] = arr
+        return arr
+
+    def _build_seo(self) -> None:
+        # 호출자가 _lock 보유
+        raw = {
+            f: self._cols.get(f)
+            if self._cols.get(f) is not None
+            else _to_float(r.get(f) for r in self.records)
+            for f in ("roe", "pbr", "per", "dividend_yield")
+        }
+        expected, score = _seo_columns(raw["roe"], raw["pbr"], raw["per"], raw["dividend_yield"])
+        # 정렬 키는 반환값과 같은 2자리 반올림 값 (출력은 _seo_raw에서 round()로 기존과 동일 값)
+        rounded = np.round(expected, 2)
+        cols = (*raw.items(), ("_seo_raw", expected), ("seo_return", rounded), ("seo_score", score))
+        for f, arr in cols:
+            arr.flags.writeable = False
+            self._cols[f] = arr
+
+
+class ScreenerFrame:
+    """선택 행 인덱스 + 공유 컬럼. 모든 연산은 새 프레임을 반환한다 (원본 불변)."""
+
+    __slots__ = ("_base", "idx", "_extra")
+
+    def __init__(self, base: _Columns, idx: Optional[np.ndarray] = None,
+                 extra: Optional[tuple[str, ...]] = None):
+        self._base = base
+        self.idx = np.arange(len(base), dtype=np.intp) if idx is None else idx
+        self._extra = extra or ()
+
+    # ── 생성 ────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "ScreenerFrame":
+        return cls(_Columns(records))
+
+    @classmethod
+    def load(cls, date_str: str) -> tuple["ScreenerFrame", str]:
+        """`get_all_stocks(date_str)` 결과를 거래일별 1회만 컬럼 적재.
+
+        Returns:
+            (frame, actual_date)
+
+        Raises:
+            RuntimeError: KRX 미인증/조회 실패 (get_all_stocks 그대로 전파).
+        """
+        now = time.monotonic()
+        with _memo_lock:
+            hit = _resolved.get(date_str)
+            if hit and hit[1] > now and hit[0] in _frames:
+                actual = hit[0]
+                return cls(_frames[actual]), actual
+
+        from .krx import get_all_stocks
+
+        stocks, actual = get_all_stocks(date_str)
+        with _memo_lock:
+            base = _frames.get(actual)
+            if base is None:
+                base = _Columns(stocks)
+                _frames[actual] = base
+                while len(_frames) > _MEMO_MAX_DATES:
+                    _frames.pop(next(iter(_frames)))
+            _resolved[date_str] = (actual, now + _RESOLVE_TTL_SEC)
+        return cls(base), actual
+
+    # ── 기본 연산 ───────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.idx)
+
+    def col(self, field: str) -> np.ndarray:
+        """선택 행 기준 float 컬럼 (None → NaN)."""
+        return self._base.col(field)[self.idx]
+
+    def _take(self, idx: np.ndarray, extra: Optional[tuple[str, ...]] = None) -> "ScreenerFrame":
+        return ScreenerFrame(self._base, idx, self._extra if extra is None else extra)
+
+    def head(self, n: Optional[int]) -> "ScreenerFrame":
+        if n is None or n <= 0:
+            return self
+        return self._take(self.idx[:n])
+
+    def where_codes(self, codes: Iterable[str]) -> "ScreenerFrame":
+        """종목코드 집합에 포함된 행만 (당일 실적발표 필터 등)."""
+        codes = list(codes)
+        mask = np.isin(self._base.codes[self.idx], np.array(codes, dtype=object))
+        return self._take(self.idx[mask])
+
+    def filter(
+        self,
+        *,
+        market: str | None = None,
+        per_min: float | None = None,
+        per_max: float | None = None,
+        pbr_max: float | None = None,
+        roe_min: float | None = None,
+        include_negative: bool = False,
+    ) -> "ScreenerFrame":
+        """`apply_filters`와 동일 조건의 벡터 마스크 필터. NaN은 범위 조건에서 탈락."""
+        mask = np.ones(len(self.idx), dtype=bool)
+        if market:
+            mask &= self._base.markets[self.idx] == market.upper()
+
+        per = self.col("per")
+        if not include_negative:
+            mask &= ~(per < 0)
+        if per_min is not None or per_max is not None:
+            mask &= ~np.isnan(per)
+            if per_min is not None:
+                mask &= per >= per_min
+            if per_max is not None:
+                mask &= per <= per_max
+        if pbr_max is not None:
+            mask &= self.col("pbr") <= pbr_max
+        if roe_min is not None:
+            mask &= self.col("roe") >= roe_min
+        return self._take(self.idx[mask])
+
+    def sort(self, sort_specs: list[tuple[str, bool]]) -> "ScreenerFrame":
+        """다중 기준 안정 정렬 (`np.lexsort`). NaN은 방향과 무관하게 항상 마지막."""
+        if not sort_specs or len(self.idx) == 0:
+            return self
+        keys = []
+        # lexsort는 마지막 키가 1순위 → 역순으로 (값, NaN여부) 쌍을 쌓는다
+        for field, descending in reversed(sort_specs):
+            v = self.col(field)
+            nan = np.isnan(v)
+            keys.append(np.where(nan, 0.0, -v if descending else v))
+            keys.append(nan)
+        order = np.lexsort(keys)
+        return self._take(self.idx[order])
+
+    # ── 파생 점수 ───────────────────────────────────────────────────────────
+
+    def with_seo(self) -> "ScreenerFrame":
+        """서준식 기대수익률/점수 컬럼을 출력 레코드에 포함 (전 종목 1회 벡터 계산)."""
+        self._base.col("seo_return")
+        extra = tuple(dict.fromkeys((*self._extra, "seo_return", "seo_score")))
+        return self._take(self.idx, extra)
+
+    def source_records(self) -> list[dict]:
+        """선택 행의 원본 dict 객체 그대로 (리스트 API 호환 래퍼용)."""
+        records = self._base.records
+        return [records[i] for i in self.idx]
+
+    def to_records(self) -> list[dict]:
+        """선택 행을 새 dict로 반환 (공유 원본 레코드는 변경하지 않음)."""
+        records = self._base.records
+        if not self._extra:
+            return [{**records[i]} for i in self.idx]
+        extra_cols = [
+            (f, self._base.col("_seo_raw" if f == "seo_return" else f)) for f in self._extra
+        ]
+        out = []
+        for i in self.idx:
+            row = {**records[i]}
+            for f, arr in extra_cols:
+                v = arr[i]
+                if f == "seo_score":
+                    row[f] = int(v)
+                elif f == "seo_return":
+                    row[f] = None if np.isnan(v) else round(float(v), 2)
+                else:
+                    row[f] = None if np.isnan(v) else float(v)
+            out.append(row)
+        return out
+
+
+def greenblatt_order(roic: np.ndarray, ey: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Greenblatt Combined Rank — ROIC 순위 + EY 순위 합산, 1패스 벡터 계산.
+
+    기존 리스트 구현(ROIC 정렬 → 그 순서에서 EY 정렬 → 합산 정렬, 모두 안정 정렬)과
+    동률 처리까지 동일하다. None/0 값은 -999로 취급.
+
+    Returns:
+        (order, rank): 정렬 순서 인덱스, 입력 순서 기준 combined rank 배열
+    """
+    n = len(roic)
+    roic = np.where(np.isnan(roic) | (roic == 0), -999.0, roic)
+    ey = np.where(np.isnan(ey) | (ey == 0), -999.0, ey)
+    ranks = np.arange(1, n + 1)
+
+    o1 = np.argsort(-roic, kind="stable")
+    roic_rank = np.empty(n, dtype=np.int64)
+    roic_rank[o1] = ranks
+
+    o2 = o1[np.argsort(-ey[o1], kind="stable")]
+    ey_rank = np.empty(n, dtype=np.int64)
+    ey_rank[o2] = ranks
+
+    combined = roic_rank + ey_rank
+    order = o2[np.argsort(combined[o2], kind="stable")]
+    return order, combined
+
+
+_memo_lock = threading.Lock()
+_frames: dict[str, _Columns] = {}
+_resolved: dict[str, tuple[str, float]] = {}
+
+
+def clear_memo() -> None:
+    """거래일별 프레임 메모 초기화 (테스트/캐시 무효화용)."""
+    with _memo_lock:
+        _frames.clear()
+        _resolved.clear()
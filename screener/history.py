@@ -0,0 +1,218 @@
+"""전종목 일별 스냅샷 컬럼 저장소 — 거래일 파티션 + 컬럼별 .npy (memory-mapped 읽기).
+
+`screener_cache.db`의 `stocks_merged:{date}`는 날짜별 JSON 1건이라 기간 질의
+("90일간 PER 30% 하락 종목")가 불가능했다. 이 저장소는 거래일마다 전종목 스냅샷을
+컬럼 단위로 추가하고, 기간을 하나의 DataFrame으로 적재해 과거 스크리닝/팩터 백테스트를
+KRX 호출 없이 로컬에서 수행하게 한다.
+
+디렉터리 구조
+-------------
+    {SCREENER_HISTORY_DIR}/{YYYY}/{YYYYMMDD}/
+        code.npy  market.npy          — <U6 고정폭 문자열
+        close.npy mktcap.npy per.npy pbr.npy eps.npy bps.npy roe.npy div.npy  — float64, 결측 NaN
+        _meta.json                    — {"date", "rows", "columns", "written_at"}
+
+- **불변 파티션**: 거래일 디렉터리는 임시 디렉터리에 모두 쓴 뒤 rename 1회로 공개 →
+  부분 기록된 파티션이 읽히지 않는다. 기존 파티션은 `overwrite=True`일 때만 교체.
+  `_meta.json`의 written_at(타임존 포함)으로 장중 기록 여부를 판단한다 (`written_at()`).
+- **읽기**: `np.load(mmap_mode="r")` — 필요한 컬럼만 페이지 단위로 읽는다.
+- pyarrow/Parquet 의존성 없이 NumPy 포맷만 사용 (requirements 변경 없음).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import SCREENER_HISTORY_DIR
+
+logger = logging.getLogger(__name__)
+
+_ROOT = Path(SCREENER_HISTORY_DIR)
+
+# 컬럼 스키마 (이름 → dtype). 순서 = load_range 출력 컬럼 순서.
+SCHEMA: dict[str, str] = {
+    "code": "<U6",
+    "market": "<U6",
+    "close": "float64",
+    "mktcap": "float64",
+    "per": "float64",
+    "pbr": "float64",
+    "eps": "float64",
+    "bps": "float64",
+    "roe": "float64",
+    "div": "float64",
+}
+_META = "_meta.json"
+
+
+def _partition(trading_date: str) -> Path:
+    return _ROOT / trading_date[:4] / trading_date
+
+
+def has_date(trading_date: str) -> bool:
+    """해당 거래일 파티션 존재 여부."""
+    return (_partition(trading_date) / _META).exists()
+
+
+def written_at(trading_date: str) -> Optional[datetime]:
+    """파티션 기록 시각 (timezone-aware). 파티션 없음/메타 손상 시 None.
+
+    타임존 없는 이전 메타는 서버 로컬 시각으로 간주한다.
+    """
+    try:
+        meta = json.loads((_partition(trading_date) / _META).read_text(encoding="utf-8"))
+        return datetime.fromisoformat(meta["written_at"]).astimezone()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def available_dates(start: Optional[str] = None, end: Optional[str] = None) -> list[str]:
+    """저장된 거래일 목록 (YYYYMMDD 오름차순). start/end는 포함 경계."""
+    if not _ROOT.exists():
+        return []
+    dates = []
+    for year_dir in _ROOT.iterdir():
+        if not (year_dir.is_dir() and year_dir.name.isdigit()):
+            continue
+        if start and year_dir.name < start[:4] or end and year_dir.name > end[:4]:
+            continue
+        for part in year_dir.iterdir():
+            d = part.name
+            if len(d) != 8 or not d.isdigit() or not (part / _META).exists():
+                continue
+            if (start and d < start) or (end and d > end):
+                continue
+            dates.append(d)
+    return sorted(dates)
+
+
+def append_snapshot(
+    trading_date: str, columns: dict[str, Iterable], *, overwrite: bool = False
+) -> bool:
+    """거래일 스냅샷 1건 추가. 이미 있으면 overwrite=False일 때 건너뜀.
+
+    Args:
+        columns: SCHEMA 컬럼명 → 길이가 같은 배열. 누락 컬럼은 NaN(문자열은 "")으로 채움.
+
+    Returns:
+        True면 새로 기록.
+
+    Raises:
+        ValueError: 컬럼 길이 불일치 또는 code 누락.
+    """
+    if "code" not in columns:
+        raise ValueError("snapshot: code 컬럼 필수")
+    codes = np.asarray(columns["code"], dtype=SCHEMA["code"])
+    n = len(codes)
+
+    arrays: dict[str, np.ndarray] = {}
+    for name, dtype in SCHEMA.items():
+        if name in columns:
+            arr = np.asarray(columns[name], dtype=dtype)
+            if arr.shape != (n,):
+                raise ValueError(f"snapshot: {name} 길이 {arr.shape} ≠ {n}")
+        elif dtype.startswith("<U"):
+            arr = np.full(n, "", dtype=dtype)
+        else:
+            arr = np.full(n, np.nan, dtype=dtype)
+        arrays[name] = arr
+
+    final = _partition(trading_date)
+    if final.exists() and not overwrite:
+        return False
+    final.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = Path(tempfile.mkdtemp(prefix=f".{trading_date}.", dir=final.parent))
+    try:
+        for name, arr in arrays.items():
+            np.save(tmp / f"{name}.npy", arr, allow_pickle=False)
+        meta = {
+            "date": trading_date,
+            "rows": n,
+            "columns": list(arrays),
+            "written_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+        }
+        (tmp / _META).write_text(json.dumps(meta), encoding="utf-8")
+        if final.exists():
+            old = final.with_name(f".{trading_date}.old")
+            shutil.rmtree(old, ignore_errors=True)
+            os.replace(final, old)
+            os.replace(tmp, final)
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            try:
+                os.replace(tmp, final)
+            except OSError:
+                # 동시 기록 경합 — 먼저 공개된 파티션 유지
+                return False
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
+    return True
+
+
+def append_records(trading_date: str, records: list[dict], *, overwrite: bool = False) -> bool:
+    """`get_all_stocks()` 형식 dict 리스트 → 스냅샷 추가 (없는 필드는 결측)."""
+    columns: dict[str, list] = {}
+    for name, dtype in SCHEMA.items():
+        if dtype.startswith("<U"):
+            columns[name] = [r.get(name) or "" for r in records]
+        else:
+            columns[name] = [np.nan if r.get(name) is None else r[name] for r in records]
+    return append_snapshot(trading_date, columns, overwrite=overwrite)
+
+
+def load_date(trading_date: str, fields: Optional[Iterable[str]] = None) -> dict[str, np.ndarray]:
+    """거래일 1건 → {컬럼: 읽기 전용 memmap 배열}. 없으면 KeyError."""
+    part = _partition(trading_date)
+    if not (part / _META).exists():
+        raise KeyError(trading_date)
+    names = list(fields) if fields is not None else list(SCHEMA)
+    if "code" not in names:
+        names.insert(0, "code")
+    out = {}
+    for name in names:
+        if name not in SCHEMA:
+            raise KeyError(f"snapshot: 알 수 없는 컬럼 {name}")
+        out[name] = np.load(part / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+    return out
+
+
+def load_range(
+    start: str, end: str, fields: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """기간(포함) 스냅샷을 long 포맷 DataFrame 하나로 적재.
+
+    Returns:
+        columns = ["date", "code", *fields] (fields 미지정 시 전체 스키마).
+        저장된 거래일이 없으면 빈 DataFrame.
+    """
+    names = [f for f in (fields if fields is not None else SCHEMA) if f != "code"]
+    frames = []
+    for d in available_dates(start, end):
+        cols = load_date(d, names)
+        n = len(cols["code"])
+        data = {"date": np.full(n, d), "code": np.asarray(cols["code"])}
+        data.update({f: np.asarray(cols[f]) for f in names})
+        frames.append(pd.DataFrame(data))
+    if not frames:
+        return pd.DataFrame(columns=["date", "code", *names])
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_panel(start: str, end: str, field: str) -> pd.DataFrame:
+    """단일 지표 wide 패널 (index=date, columns=code). 상장/폐지 종목은 NaN."""
+    long = load_range(start, end, [field])
+    if long.empty:
+        return pd.DataFrame()
+    return long.pivot(index="date", columns="code", values=field)
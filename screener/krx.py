@@ -2,6 +2,8 @@
 
 pykrx 라이브러리를 사용하여 전종목 시세, 시가총액, PER/PBR/EPS/BPS를 수집한다.
 ROE는 EPS/BPS로 산출한다.
+전종목 단위 호출(종목 목록/펀더멘털/시가총액/종목명)은 병렬로 1회씩만 실행하고
+종목코드 인덱스 조인으로 병합한다.
 
 인증:
     2026-02-27부터 KRX 서버가 로그인 필수로 전환됨.
@@ -9,13 +11,23 @@ ROE는 EPS/BPS로 산출한다.
     미설정 시 스크리닝 불가 (친절한 안내 메시지 반환).
 """
 
-from datetime import datetime, timedelta
+import logging
+import threading
+import time as _time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from typing import Optional
 
+import pandas as pd
 from pykrx import stock
 
+from db.utils import KST, now_kst
+
 from .cache import get_cached, set_cached
 from .krx_auth import ensure_krx_session, force_relogin, is_krx_configured
 
+logger = logging.getLogger(__name__)
+
 
 _KRX_NO_AUTH_MSG = (
     "KRX 로그인 정보가 설정되지 않았습니다.\n"
@@ -31,13 +43,45 @@ _KRX_LOGIN_FAIL_MSG = (
 )
 
 
+# 거래일 해석 메모: {요청일: (해석한 KST 달력일, 거래일, 만료 monotonic 시각|None)}
+# — 같은 KST 달력일 안에서만 재사용. 오늘 이후 요청이 이전 거래일로 소급된 결과(개장 전·당일 데이터
+# 미생성)는 잠정값이라 `_PROVISIONAL_MEMO_SEC`마다 다시 확인한다.
+_trading_day_memo: dict[str, tuple[date, str, Optional[float]]] = {}
+_trading_day_lock = threading.Lock()
+_PROVISIONAL_MEMO_SEC = 600
+
+# 종목명 개별 조회 fallback 동시성 (일괄 조회 실패 시에만)
+_NAME_WORKERS = 8
+
+# 일별 스냅샷 확정 시각 (KST) — 장 마감 + KRX 집계 확정 후. 스케줄러 스냅샷 잡(평일 16:40)과 동일.
+# 이 시각 이전 조회분은 장중 값이라 history 파티션으로 기록하지 않는다.
+_SNAPSHOT_FINAL_TIME = time(16, 40)
+
+
+def _is_final(trading_date: str, at: Optional[datetime] = None) -> bool:
+    """`at`(기본: 현재) 시점에 거래일 종가 스냅샷이 확정됐는지 여부."""
+    final_at = datetime.combine(datetime.strptime(trading_date, "%Y%m%d").date(), _SNAPSHOT_FINAL_TIME, KST)
+    return (at or now_kst()) >= final_at
+
+
 def _find_latest_trading_day(date_str: str) -> str:
     """주어진 날짜 이전의 가장 최근 거래일(데이터 있는 날)을 반환.
 
     1단계: 주말(토·일)은 API 없이 즉시 건너뜀.
     2단계: 공휴일은 pykrx API로 확인 (데이터 없으면 하루씩 소급).
     API가 모두 실패하면 주말만 제거한 날짜를 fallback으로 반환.
+
+    API로 확인된 결과는 KST 달력일 단위로 메모 → 같은 날 재호출 시 pykrx 탐색 0회.
+    단, 오늘 이후 요청이 이전 거래일로 소급된 결과는 잠정값 — `_PROVISIONAL_MEMO_SEC` 후 재확인
+    (개장 전에 한 번 해석됐다고 그날 내내 전 거래일에 고정되지 않도록).
+    (fallback 결과는 메모하지 않음 — 다음 호출에서 재확인)
     """
+    today = now_kst().date()
+    with _trading_day_lock:
+        hit = _trading_day_memo.get(date_str)
+    if hit is not None and hit[0] == today and (hit[2] is None or _time.monotonic() < hit[2]):
+        return hit[1]
+
     dt = datetime.strptime(date_str, "%Y%m%d")
 
     # 1단계: 주말 스킵 (API 불필요)
@@ -55,6 +99,10 @@ def _find_latest_trading_day(date_str: str) -> str:
         try:
             tickers = stock.get_market_ticker_list(candidate, market="KOSPI")
             if tickers:
+                provisional = candidate != date_str and date_str >= today.strftime("%Y%m%d")
+                expires = _time.monotonic() + _PROVISIONAL_MEMO_SEC if provisional else None
+                with _trading_day_lock:
+                    _trading_day_memo[date_str] = (today, candidate, expires)
                 return candidate
         except Exception:
             pass
@@ -93,85 +141,231 @@ def get_all_stocks(date_str: str) -> tuple[list[dict], str]:
     if cached is not None:
         return cached, trading_date
 
-    # 시장별 종목코드 집합 (빈 응답 시 세션 갱신 후 1회 재시도)
+    # 펀더멘털/시가총액/종목명 일괄 조회는 종목 목록과 병렬 실행 (모두 전종목 1회 호출)
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        fund_fut, cap_fut, names_fut = _submit_bulk(ex, trading_date)
+        kospi_tickers, kosdaq_tickers, relogged = _fetch_ticker_sets(ex, trading_date)
+        if relogged:
+            # 만료 세션으로 나간 일괄 조회는 버리고 재로그인 세션으로 재요청
+            fund_fut, cap_fut, names_fut = _submit_bulk(ex, trading_date)
+
+        try:
+            fund_df = fund_fut.result()
+        except Exception as e:
+            raise RuntimeError(f"KRX 펀더멘탈 데이터 조회 실패: {e}") from e
+
+        try:
+            cap_df = cap_fut.result()
+        except Exception as e:
+            raise RuntimeError(f"KRX 시가총액 데이터 조회 실패: {e}") from e
+
+        ticker_names = names_fut.result()
+
+    all_tickers = sorted(kospi_tickers | kosdaq_tickers)
+    missing = [t for t in all_tickers if t not in ticker_names]
+    if missing:
+        ticker_names.update(_fetch_ticker_names_each(missing))
+
+    joined = _join_frames(all_tickers, fund_df, cap_df)
+    stocks = _merge_snapshot(all_tickers, kospi_tickers, ticker_names, joined)
+    set_cached(cache_key, stocks)
+    if _is_final(trading_date):  # 장중 조회분은 스케줄러 잡이 마감 후 기록
+        _record_history(trading_date, all_tickers, kospi_tickers, joined)
+    return stocks, trading_date
+
+
+def _submit_bulk(ex: ThreadPoolExecutor, trading_date: str):
+    """전종목 펀더멘털 / 시가총액 / 종목명 일괄 조회 제출 → (fund, cap, names) future."""
+    return (
+        ex.submit(stock.get_market_fundamental, trading_date, market="ALL"),
+        ex.submit(stock.get_market_cap, trading_date, market="ALL"),
+        ex.submit(_fetch_ticker_names_bulk, trading_date),
+    )
+
+
+def _fetch_ticker_sets(
+    ex: ThreadPoolExecutor, trading_date: str
+) -> tuple[set[str], set[str], bool]:
+    """KOSPI/KOSDAQ 종목코드 집합 병렬 조회 (빈 응답 시 세션 갱신 후 1회 재시도).
+
+    Returns:
+        (kospi, kosdaq, relogged) — relogged=True면 재로그인이 일어남.
+    """
     for attempt in range(2):
         try:
-            kospi_tickers = set(stock.get_market_ticker_list(trading_date, market="KOSPI"))
-            kosdaq_tickers = set(stock.get_market_ticker_list(trading_date, market="KOSDAQ"))
+            kospi_fut = ex.submit(stock.get_market_ticker_list, trading_date, market="KOSPI")
+            kosdaq_fut = ex.submit(stock.get_market_ticker_list, trading_date, market="KOSDAQ")
+            kospi_tickers = set(kospi_fut.result())
+            kosdaq_tickers = set(kosdaq_fut.result())
         except Exception as e:
             if attempt == 0 and force_relogin():
                 continue
             raise RuntimeError(f"KRX 종목 목록 조회 실패: {e}") from e
 
         if kospi_tickers or kosdaq_tickers:
-            break
+            return kospi_tickers, kosdaq_tickers, attempt > 0
 
         if attempt == 0:
             # 빈 응답 → 세션 만료 가능성, 강제 재로그인 후 재시도
             if not force_relogin():
                 raise RuntimeError("KRX에서 종목 목록을 가져올 수 없습니다. 로그인 세션을 확인해주세요.")
-    else:
-        raise RuntimeError("KRX에서 종목 목록을 가져올 수 없습니다. 재로그인 후에도 데이터가 없습니다.")
+    raise RuntimeError("KRX에서 종목 목록을 가져올 수 없습니다. 재로그인 후에도 데이터가 없습니다.")
 
-    # 펀더멘털 데이터 (PER, PBR, EPS, BPS)
-    try:
-        fund_df = stock.get_market_fundamental(trading_date, market="ALL")
-    except Exception as e:
-        raise RuntimeError(f"KRX 펀더멘탈 데이터 조회 실패: {e}") from e
 
-    # 시가총액 데이터
+def _fetch_ticker_names_bulk(trading_date: str) -> dict[str, str]:
+    """전종목 종목명 1회 조회 (등락률 표의 `종목명` 컬럼). 실패 시 빈 dict → 개별 조회 fallback."""
     try:
-        cap_df = stock.get_market_cap(trading_date, market="ALL")
-    except Exception as e:
-        raise RuntimeError(f"KRX 시가총액 데이터 조회 실패: {e}") from e
+        df = stock.get_market_price_change(trading_date, trading_date, market="ALL")
+        names = df["종목명"]
+    except Exception:
+        return {}
+    return {str(t): str(n) for t, n in names.items() if isinstance(n, str) and n}
+
 
-    # 종목명 조회
-    all_tickers = kospi_tickers | kosdaq_tickers
-    ticker_names: dict[str, str] = {}
-    for t in all_tickers:
+def _fetch_ticker_names_each(tickers: list[str]) -> dict[str, str]:
+    """종목별 `get_market_ticker_name` 병렬 조회 (일괄 조회에서 누락된 종목만)."""
+    def _one(t: str) -> str:
         try:
-            ticker_names[t] = stock.get_market_ticker_name(t)
+            return stock.get_market_ticker_name(t) or ""
         except Exception:
-            ticker_names[t] = ""
+            return ""
 
-    stocks = []
-    for ticker in all_tickers:
-        name = ticker_names.get(ticker, "")
-        market_name = "KOSPI" if ticker in kospi_tickers else "KOSDAQ"
-
-        # 펀더멘털
-        per = None
-        pbr = None
-        roe = None
-        if ticker in fund_df.index:
-            row = fund_df.loc[ticker]
-            per_val = float(row.get("PER", 0))
-            pbr_val = float(row.get("PBR", 0))
-            eps_val = float(row.get("EPS", 0))
-            bps_val = float(row.get("BPS", 0))
-
-            per = per_val if per_val != 0.0 else None
-            pbr = pbr_val if pbr_val != 0.0 else None
-
-            if bps_val != 0.0:
-                roe = round(eps_val / bps_val * 100, 2)
-
-        # 시가총액
-        mktcap = 0
-        if ticker in cap_df.index:
-            mktcap = int(cap_df.loc[ticker, "시가총액"])
+    with ThreadPoolExecutor(max_workers=min(_NAME_WORKERS, len(tickers))) as ex:
+        return dict(zip(tickers, ex.map(_one, tickers)))
+
+
+def _join_frames(all_tickers: list[str], fund_df: pd.DataFrame, cap_df: pd.DataFrame) -> pd.DataFrame:
+    """종목 목록 기준 펀더멘털/시가총액 인덱스 조인 (index=ticker).
+
+    columns: per/pbr(0 → NaN), eps/bps/div(펀더멘털 없음 → NaN), roe(EPS/BPS*100, BPS=0 → NaN),
+    close(NaN), mktcap(없음 → 0).
+    """
+    index = pd.Index(all_tickers, name="ticker")
+    fund = (
+        fund_df[~fund_df.index.duplicated()]
+        .reindex(index=index, columns=["PER", "PBR", "EPS", "BPS", "DIV"])
+        .astype(float)
+    )
+    cap = cap_df[~cap_df.index.duplicated()].reindex(index=index, columns=["종가", "시가총액"])
+
+    per = fund["PER"].fillna(0.0)
+    pbr = fund["PBR"].fillna(0.0)
+    eps = fund["EPS"].fillna(0.0)
+    bps = fund["BPS"].fillna(0.0)
+    return pd.DataFrame(
+        {
+            "per": per.where(per != 0.0),
+            "pbr": pbr.where(pbr != 0.0),
+            "eps": fund["EPS"],
+            "bps": fund["BPS"],
+            "roe": eps / bps.where(bps != 0.0) * 100,
+            "div": fund["DIV"],
+            "close": cap["종가"].astype(float),
+            "mktcap": cap["시가총액"].astype(float).fillna(0),
+        },
+        index=index,
+    )
+
+
+def _merge_snapshot(
+    all_tickers: list[str],
+    kospi_tickers: set[str],
+    ticker_names: dict[str, str],
+    joined: pd.DataFrame,
+) -> list[dict]:
+    """조인 결과 → 종목 dict 리스트 (`stocks_merged` 캐시/응답 형식).
+
+    PER/PBR 0 → None, ROE = EPS/BPS*100 (BPS=0 또는 펀더멘털 없음 → None), 시가총액 없음 → 0.
+    """
+    def _opt(v):
+        return None if pd.isna(v) else float(v)
 
+    stocks = []
+    for ticker, p, b, r, cap in zip(
+        all_tickers,
+        joined["per"].tolist(), joined["pbr"].tolist(),
+        joined["roe"].tolist(), joined["mktcap"].tolist(),
+    ):
         stocks.append(
             {
                 "code": ticker,
-                "name": name,
-                "market": market_name,
-                "per": per,
-                "pbr": pbr,
-                "roe": roe,
-                "mktcap": mktcap,
+                "name": ticker_names.get(ticker, ""),
+                "market": "KOSPI" if ticker in kospi_tickers else "KOSDAQ",
+                "per": _opt(p),
+                "pbr": _opt(b),
+                "roe": None if pd.isna(r) else round(r, 2),
+                "mktcap": int(cap),
             }
         )
+    return stocks
 
-    set_cached(cache_key, stocks)
-    return stocks, trading_date
+
+def _record_history(
+    trading_date: str,
+    all_tickers: list[str],
+    kospi_tickers: set[str],
+    joined: pd.DataFrame,
+    overwrite: bool = False,
+) -> bool:
+    """일별 스냅샷 저장소(screener/history.py)에 추가. 실패는 로그만 (스크리닝 응답 무관)."""
+    from . import history
+
+    try:
+        return history.append_snapshot(
+            trading_date,
+            {
+                "code": all_tickers,
+                "market": ["KOSPI" if t in kospi_tickers else "KOSDAQ" for t in all_tickers],
+                **{c: joined[c].to_numpy(dtype=float) for c in
+                   ("close", "mktcap", "per", "pbr", "eps", "bps", "roe", "div")},
+            },
+            overwrite=overwrite,
+        )
+    except Exception as e:
+        logger.warning("스냅샷 저장 실패 %s: %s", trading_date, e)
+        return False
+
+
+def record_history(date_str: str) -> Optional[str]:
+    """거래일 스냅샷이 저장소에 없으면 KRX에서 수집해 추가 (스케줄러 잡용).
+
+    `stocks_merged` 캐시 적중으로 저장 경로를 타지 않은 거래일도 채운다.
+    확정 시각(`_SNAPSHOT_FINAL_TIME`) 이전에 기록된 파티션은 장중 값으로 보고 덮어쓴다.
+    종목명은 스냅샷 스키마에 없어 조회하지 않는다.
+
+    Returns:
+        새로 기록한 거래일(YYYYMMDD). 확정 파티션이 이미 있거나, 아직 확정 전이거나,
+        기록 실패 시 None.
+
+    Raises:
+        RuntimeError: KRX 미인증/조회 실패.
+    """
+    from . import history
+
+    if not is_krx_configured():
+        raise RuntimeError(_KRX_NO_AUTH_MSG)
+    if not ensure_krx_session():
+        raise RuntimeError(_KRX_LOGIN_FAIL_MSG)
+
+    trading_date = _find_latest_trading_day(date_str)
+    if not _is_final(trading_date):
+        return None
+    written = history.written_at(trading_date) if history.has_date(trading_date) else None
+    if written is not None and _is_final(trading_date, written):
+        return None
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        fund_fut = ex.submit(stock.get_market_fundamental, trading_date, market="ALL")
+        cap_fut = ex.submit(stock.get_market_cap, trading_date, market="ALL")
+        kospi_tickers, kosdaq_tickers, _ = _fetch_ticker_sets(ex, trading_date)
+        try:
+            fund_df, cap_df = fund_fut.result(), cap_fut.result()
+        except Exception as e:
+            raise RuntimeError(f"KRX 스냅샷 조회 실패: {e}") from e
+
+    all_tickers = sorted(kospi_tickers | kosdaq_tickers)
+    joined = _join_frames(all_tickers, fund_df, cap_df)
+    recorded = _record_history(
+        trading_date, all_tickers, kospi_tickers, joined, overwrite=history.has_date(trading_date),
+    )
+    return trading_date if recorded else None
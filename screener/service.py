@@ -9,10 +9,9 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional
 
-from services.guru_formulas import (
-    calc_seo_expected_return,
-    REGIME_GURU_PARAMS,
-)
+from services.guru_formulas import REGIME_GURU_PARAMS
+
+from .frame import ScreenerFrame, greenblatt_order
 
 
 class ScreenerValidationError(Exception):
@@ -103,68 +102,22 @@ def apply_filters(
     """필터 조건 적용.
 
     per_range 튜플 대신 per_min/per_max 개별 파라미터를 사용한다.
+    리스트 API 호환 래퍼 — 내부는 `ScreenerFrame.filter` 벡터 마스크, 원본 dict 그대로 반환.
     """
-    filtered = []
-    for s in stocks:
-        # 시장 필터
-        if market and s["market"] != market.upper():
-            continue
-
-        per = s["per"]
-        pbr = s["pbr"]
-        roe = s["roe"]
-
-        # 적자기업 필터 (PER 음수)
-        if not include_negative and per is not None and per < 0:
-            continue
-
-        # PER 범위 필터
-        if per_min is not None or per_max is not None:
-            if per is None:
-                continue
-            if per_min is not None and per < per_min:
-                continue
-            if per_max is not None and per > per_max:
-                continue
-
-        # PBR 최대값 필터
-        if pbr_max is not None:
-            if pbr is None:
-                continue
-            if pbr > pbr_max:
-                continue
-
-        # ROE 최소값 필터
-        if roe_min is not None:
-            if roe is None:
-                continue
-            if roe < roe_min:
-                continue
-
-        filtered.append(s)
-
-    return filtered
+    frame = ScreenerFrame.from_records(stocks).filter(
+        market=market, per_min=per_min, per_max=per_max,
+        pbr_max=pbr_max, roe_min=roe_min, include_negative=include_negative,
+    )
+    return frame.source_records()
 
 
 def sort_stocks(
     stocks: list[dict], sort_specs: list[tuple[str, bool]]
 ) -> list[dict]:
-    """다중 기준 정렬. None 값은 마지막으로 밀어낸다."""
+    """다중 기준 정렬. None 값은 마지막으로 밀어낸다 (`ScreenerFrame.sort` — np.lexsort)."""
     if not sort_specs:
         return stocks
-
-    def sort_key(stock: dict):
-        keys = []
-        for field, descending in sort_specs:
-            val = stock.get(field)
-            if val is None:
-                # None은 항상 마지막
-                keys.append((1, 0))
-            else:
-                keys.append((0, -val if descending else val))
-        return keys
-
-    return sorted(stocks, key=sort_key)
+    return ScreenerFrame.from_records(stocks).sort(sort_specs).source_records()
 
 
 # ── 구루 확장 함수 ───────────────────────────────────────────────
@@ -173,40 +126,42 @@ def enrich_seo_scores(stocks: list[dict]) -> list[dict]:
     """KRX 기본 데이터(PER/PBR/ROE)로 서준식 기대수익률 일괄 계산.
 
     DART 호출 불필요 → 1차 필터 단계에서 즉시 실행.
+    `services.guru_formulas.calc_seo_expected_return`과 동일한 식을 컬럼 단위로 1회 계산한다.
     """
-    for s in stocks:
-        seo = calc_seo_expected_return(
-            roe=s.get("roe"),
-            pbr=s.get("pbr"),
-            per=s.get("per"),
-            dividend_yield=s.get("dividend_yield"),
-        )
-        s["seo_return"] = seo["expected_return"]
-        s["seo_score"] = seo["seo_score"]
+    frame = ScreenerFrame.from_records(stocks)
+    expected = frame.col("_seo_raw")
+    scores = frame.col("seo_score")
+    for s, er, sc in zip(stocks, expected.tolist(), scores.tolist()):
+        s["seo_return"] = None if er != er else round(er, 2)
+        s["seo_score"] = sc
     return stocks
 
 
+def _greenblatt_metric(s: dict, key: str):
+    return (((s.get("guru_scores") or {}).get("greenblatt") or {}).get(key))
+
+
 def sort_by_greenblatt_rank(stocks: list[dict]) -> list[dict]:
-    """Greenblatt Combined Rank(ROIC순위+EY순위 합산)로 정렬."""
-    # ROIC 순위 (높을수록 좋음 → 내림차순 순위)
-    calculable = [
-        s for s in stocks
-        if s.get("guru_scores") and (s["guru_scores"].get("greenblatt") or {}).get("calculable")
-    ]
-    not_calculable = [s for s in stocks if s not in calculable]
-
-    calculable.sort(key=lambda s: s["guru_scores"]["greenblatt"].get("roic") or -999, reverse=True)
-    for i, s in enumerate(calculable):
-        s["_roic_rank"] = i + 1
-
-    calculable.sort(key=lambda s: s["guru_scores"]["greenblatt"].get("earnings_yield") or -999, reverse=True)
-    for i, s in enumerate(calculable):
-        s["_ey_rank"] = i + 1
-
-    for s in calculable:
-        s["greenblatt_rank"] = s.pop("_roic_rank") + s.pop("_ey_rank")
-
-    calculable.sort(key=lambda s: s["greenblatt_rank"])
+    """Greenblatt Combined Rank(ROIC순위+EY순위 합산)로 정렬.
+
+    계산 불가 종목은 입력 순서대로 뒤에 붙는다 (greenblatt_rank=None).
+    """
+    calculable, not_calculable = [], []
+    for s in stocks:
+        if s.get("guru_scores") and _greenblatt_metric(s, "calculable"):
+            calculable.append(s)
+        else:
+            not_calculable.append(s)
+
+    if calculable:
+        frame = ScreenerFrame.from_records([
+            {"roic": _greenblatt_metric(s, "roic"), "ey": _greenblatt_metric(s, "earnings_yield")}
+            for s in calculable
+        ])
+        order, combined = greenblatt_order(frame.col("roic"), frame.col("ey"))
+        for s, rank in zip(calculable, combined.tolist()):
+            s["greenblatt_rank"] = rank
+        calculable = [calculable[i] for i in order]
 
     for s in not_calculable:
         s["greenblatt_rank"] = None
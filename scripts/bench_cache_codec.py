@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""stock/cache_codec 인코딩/디코딩 비용 벤치마크.
+
+Usage:
+    python scripts/bench_cache_codec.py [--top 5] [--repeat 20]
+
+~/stock-watchlist/cache.db에서 value 크기 상위 N개 실제 키(symbol_map:*, stocks_merged:*,
+market:valuation_hist:* 등)를 읽어 코덱별 비용을 비교한다. cache.db가 없거나 비어 있으면
+동일 형태의 합성 payload(KRX 전 종목 코드맵 / 10년 월별 밸류에이션)로 대체한다.
+
+비교 대상:
+- legacy : json.dumps(_sanitize(v)) / _sanitize(json.loads(s))  — 코덱 도입 전 경로
+- json   : normalize 1회 + JSON bytes (읽기 시 정제 없음)
+- pickle : normalize 1회 + pickle protocol 5 (SafeUnpickler)
+각 코덱은 비압축(L1 경로)과 zlib 압축(L2 경로, 임계 크기 이상) 모두 측정.
+"""
+
+import argparse
+import json
+import math
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stock import cache, cache_codec
+
+
+def _legacy_sanitize(obj):
+    if isinstance(obj, float):
+        return None if (math.isnan(obj) or math.isinf(obj)) else obj
+    if isinstance(obj, dict):
+        return {k: _legacy_sanitize(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_legacy_sanitize(v) for v in obj]
+    return obj
+
+
+def _load_real(top: int) -> list[tuple[str, object]]:
+    path = cache._DB_PATH
+    if not path.exists():
+        return []
+    con = sqlite3.connect(path)
+    try:
+        rows = con.execute(
+            "SELECT key, value FROM cache ORDER BY length(value) DESC LIMIT ?", (top,)
+        ).fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        con.close()
+    out = []
+    for key, stored in rows:
+        try:
+            out.append((key, cache_codec.decode(cache_codec.decompress(stored))))
+        except Exception:
+            continue
+    return out
+
+
+def _synthetic() -> list[tuple[str, object]]:
+    rnd = random.Random(0)
+    symbol_map = {
+        f"{i:06d}": {"name": f"종목{i}", "market": rnd.choice(["KOSPI", "KOSDAQ"])}
+        for i in range(2700)
+    }
+    valuation = [
+        {"date": f"{2015 + m // 12}-{m % 12 + 1:02d}", "per": rnd.uniform(3, 40),
+         "pbr": rnd.uniform(0.3, 5), "close": rnd.uniform(1e3, 1e6)}
+        for m in range(120)
+    ]
+    merged = [
+        {"code": f"{i:06d}", "name": f"종목{i}", "market": "KOSPI", "per": rnd.uniform(1, 50),
+         "pbr": rnd.uniform(0.1, 8), "eps": rnd.randint(-5000, 50000),
+         "bps": rnd.randint(1000, 500000), "mktcap": rnd.randint(10**9, 10**14),
+         "roe": float("nan") if i % 17 == 0 else rnd.uniform(-20, 40)}
+        for i in range(2700)
+    ]
+    return [
+        ("symbol_map:v1 (synthetic)", symbol_map),
+        ("stocks_merged:* (synthetic)", merged),
+        ("market:valuation_hist:* (synthetic)", valuation),
+    ]
+
+
+def _timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def _bench(key: str, value, repeat: int) -> None:
+    print(f"\n== {key}")
+    print(f"{'codec':<14}{'bytes':>10}{'encode ms':>12}{'decode ms':>12}")
+
+    legacy_text = json.dumps(_legacy_sanitize(value), ensure_ascii=False)
+    enc = _timeit(lambda: json.dumps(_legacy_sanitize(value), ensure_ascii=False), repeat)
+    dec = _timeit(lambda: _legacy_sanitize(json.loads(legacy_text)), repeat)
+    print(f"{'legacy':<14}{len(legacy_text.encode()):>10}{enc:>12.2f}{dec:>12.2f}")
+
+    for name in cache_codec.CODECS:
+        payload = cache_codec.encode(cache_codec.normalize(value), name)
+        enc = _timeit(lambda: cache_codec.encode(cache_codec.normalize(value), name), repeat)
+        dec = _timeit(lambda: cache_codec.decode(payload), repeat)
+        print(f"{name:<14}{len(payload):>10}{enc:>12.2f}{dec:>12.2f}")
+
+        stored = cache_codec.compress(payload, min_bytes=1)
+        enc = _timeit(
+            lambda: cache_codec.compress(
+                cache_codec.encode(cache_codec.normalize(value), name), min_bytes=1
+            ),
+            repeat,
+        )
+        dec = _timeit(lambda: cache_codec.decode(cache_codec.decompress(stored)), repeat)
+        print(f"{name + '+zlib':<14}{len(stored):>10}{enc:>12.2f}{dec:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=5, help="실제 키 상위 N개 (크기순)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 (최솟값 채택)")
+    args = parser.parse_args()
+
+    samples = _load_real(args.top) or _synthetic()
+    for key, value in samples:
+        _bench(key, value, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""DART corpCode 조회 벤치마크 — 캐시된 JSON 맵 역직렬화 vs 로컬 SQLite 인덱스.
+
+Usage:
+    python scripts/bench_dart_corp.py [--corps 100000] [--listed 3900] [--lookups 2000]
+
+합성 corpCode.xml ZIP(전체 N개 법인 중 상장 L개)으로
+  - 구축: 기존 `ET.parse` 2회(corp_code 맵 + corp_name 맵) vs `iterparse` 1회 + SQLite 적재
+  - 조회: 기존 `_fetch_corp_code` miss 경로(캐시 payload에서 전체 맵 decode 후 get) vs 인덱스 PK 조회
+를 측정한다.
+"""
+
+import argparse
+import io
+import random
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stock import cache_codec, dart_corp
+
+
+def _make_zip(corps: int, listed: int) -> tuple[bytes, list[str]]:
+    rng = random.Random(0)
+    listed_idx = set(rng.sample(range(corps), listed))
+    codes, parts = [], []
+    for i in range(corps):
+        sc = f"{100000 + i:06d}" if i in listed_idx else " "
+        if i in listed_idx:
+            codes.append(sc)
+        parts.append(
+            f"<list><corp_code>{i:08d}</corp_code><corp_name>법인{i}</corp_name>"
+            f"<corp_eng_name>Corp {i}</corp_eng_name><stock_code>{sc}</stock_code>"
+            f"<modify_date>20260901</modify_date></list>"
+        )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("CORPCODE.xml", f'<?xml version="1.0" encoding="UTF-8"?><result>{"".join(parts)}</result>')
+    return buf.getvalue(), codes
+
+
+def _legacy_map(zip_bytes: bytes, field: str) -> dict[str, str]:
+    out = {}
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
+        with z.open(z.namelist()[0]) as f:
+            for child in ET.parse(f).getroot():
+                sc = (child.findtext("stock_code") or "").strip()
+                val = (child.findtext(field) or "").strip()
+                if sc and val:
+                    out[sc] = val
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--corps", type=int, default=100_000)
+    ap.add_argument("--listed", type=int, default=3_900)
+    ap.add_argument("--lookups", type=int, default=2_000)
+    args = ap.parse_args()
+
+    zip_bytes, codes = _make_zip(args.corps, args.listed)
+    rng = random.Random(1)
+    probe = [rng.choice(codes) for _ in range(args.lookups)]
+    print(f"corps={args.corps} listed={args.listed} zip={len(zip_bytes) / 1e6:.1f}MB")
+
+    t0 = time.perf_counter()
+    corp_map = _legacy_map(zip_bytes, "corp_code")
+    _legacy_map(zip_bytes, "corp_name")
+    t_legacy_build = time.perf_counter() - t0
+    stored = cache_codec.compress(cache_codec.encode(corp_map))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dart_corp._DB_PATH = Path(tmp) / "dart_corp.db"
+        t0 = time.perf_counter()
+        dart_corp.rebuild(zip_bytes)
+        t_index_build = time.perf_counter() - t0
+        print(f"  구축  ET.parse x2 {t_legacy_build * 1e3:7.1f}ms  iterparse+SQLite {t_index_build * 1e3:7.1f}ms")
+
+        n = min(args.lookups, 200)
+        t0 = time.perf_counter()
+        for code in probe[:n]:
+            cache_codec.decode(cache_codec.decompress(stored)).get(code)
+        t_legacy = (time.perf_counter() - t0) / n
+        t0 = time.perf_counter()
+        for code in probe:
+            dart_corp.corp_code(code)
+        t_index = (time.perf_counter() - t0) / len(probe)
+        print(f"  조회  맵 decode {t_legacy * 1e6:9.1f}µs  인덱스 {t_index * 1e6:6.1f}µs  ({t_legacy / t_index:6.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
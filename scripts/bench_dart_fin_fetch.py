@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""DART 다연도 재무 조회 벤치마크 — 순차 호출 vs 연도 동시 조회 vs 영구 저장소 재조회.
+
+Usage:
+    python scripts/bench_dart_fin_fetch.py [--years 10] [--latency 0.4] [--workers 6] [--rate 8]
+
+fnlttSinglAcntAll을 고정 지연(--latency초) 가짜 응답으로 바꾸고 `fetch_financials_multi_year` 콜드 호출을
+워커 1개(순차 실행)와 --workers개(`--rate`회/초 제한 공유)로 측정한다.
+연결(CFS) 기업 / 별도(OFS) 전용 기업 각각, 이어서 결과 캐시 만료 후 재조회(웨어하우스 적중)도 측정.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stock import dart_fin, dart_warehouse
+
+
+def _items(year: int, fs_div: str) -> list[dict]:
+    """실제 응답 규모(보고서당 약 200행)의 가짜 계정 행."""
+    head = [
+        {"sj_div": "IS", "account_nm": nm, "thstrm_amount": str(year * scale), "rcept_no": f"{year}{fs_div}"}
+        for nm, scale in (("매출액", 10), ("영업이익", 2), ("당기순이익", 1))
+    ]
+    filler = [
+        {"sj_div": "BS", "account_id": "-표준계정코드 미사용-", "account_nm": f"기타계정{i}",
+         "thstrm_amount": str(i * 1000), "frmtrm_amount": str(i * 900), "rcept_no": f"{year}{fs_div}"}
+        for i in range(200)
+    ]
+    return head + filler
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--years", type=int, default=10)
+    ap.add_argument("--latency", type=float, default=0.4)
+    ap.add_argument("--workers", type=int, default=6)
+    ap.add_argument("--rate", type=float, default=8.0)
+    args = ap.parse_args()
+
+    latest = date.today().year - 1
+    filed = {"CFS": {"CFS", "OFS"}, "OFS": {"OFS"}}
+    calls = [0]
+
+    def fake_call(corp_code, bsns_year, fs_div, reprt_code=dart_fin._REPRT_CODE):
+        dart_fin._limiter.wait()
+        calls[0] += 1
+        time.sleep(args.latency)
+        # 최신 연도는 미공시 (1~3월 상황)
+        return _items(bsns_year, fs_div) if bsns_year < latest and fs_div in filed[corp_code[:3]] else []
+
+    dart_fin._call_fin_api = fake_call
+    dart_fin.get_cached = lambda key: None
+    dart_fin.set_cached = lambda *a, **k: None
+    dart_fin._limiter = dart_fin._RateLimiter(args.rate)
+
+    print(f"years={args.years} latency={args.latency * 1e3:.0f}ms rate={args.rate}/s")
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in ("CFS", "OFS"):
+            timings = {}
+            for label, workers in (("순차", 1), ("동시", args.workers)):
+                dart_warehouse._DB_PATH = Path(tmp) / f"{kind}-{workers}.db"
+                dart_fin.DART_FETCH_WORKERS = workers
+                dart_fin._fetch_corp_code = lambda code, kind=kind: f"{kind}{code}"
+                calls[0] = 0
+                t0 = time.perf_counter()
+                rows = dart_fin.fetch_financials_multi_year("000001", years=args.years)
+                timings[label] = (time.perf_counter() - t0, calls[0], len(rows))
+            calls[0] = 0
+            t0 = time.perf_counter()
+            dart_fin.fetch_financials_multi_year("000001", years=args.years)
+            warm = (time.perf_counter() - t0, calls[0])
+            (ts, cs, n), (tc, cc, _) = timings["순차"], timings["동시"]
+            print(f"  {kind} 기업 ({n}년)  순차 {ts:5.2f}s/{cs}회  동시 {tc:5.2f}s/{cc}회 ({ts / tc:4.1f}x)"
+                  f"  재조회 {warm[0] * 1e3:6.1f}ms/{warm[1]}회")
+
+
+if __name__ == "__main__":
+    main()
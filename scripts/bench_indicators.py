@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""stock/indicators 기술지표 백엔드 벤치마크 (합성 15분봉, 네트워크 없음).
+
+Usage:
+    python scripts/bench_indicators.py [--bars 3000] [--repeat 20]
+
+순수 Python(backend="python") 대비 NumPy 백엔드(기본) 1회 호출 시간과 배율을 출력한다.
+두 결과가 같은지도 함께 확인한다.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stock.indicators import calc_technical_indicators
+
+
+def _synthetic(n: int) -> list[dict]:
+    rng = np.random.default_rng(0)
+    close = 70000 * np.cumprod(1 + rng.normal(0, 0.004, n))
+    open_ = close * (1 + rng.normal(0, 0.001, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, n)))
+    vol = rng.integers(1_000, 500_000, n)
+    return [
+        {"time": f"t{i}", "open": round(float(o)), "high": round(float(h)),
+         "low": round(float(lo)), "close": round(float(c)), "volume": int(v)}
+        for i, (o, h, lo, c, v) in enumerate(zip(open_, high, low, close, vol))
+    ]
+
+
+def _timeit(fn, repeat: int) -> float:
+    fn()  # warm-up (지연 import 포함)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--bars", type=int, default=3000)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    bars = _synthetic(args.bars)
+    py = _timeit(lambda: calc_technical_indicators(bars, backend="python"), args.repeat)
+    vec = _timeit(lambda: calc_technical_indicators(bars), args.repeat)
+    same = calc_technical_indicators(bars) == calc_technical_indicators(bars, backend="python")
+    print(f"bars={args.bars} repeat={args.repeat}")
+    print(f"  python  {py * 1000:7.2f} ms")
+    print(f"  numpy   {vec * 1000:7.2f} ms  ({py / vec:.1f}x)  identical={same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""services/local_backtest/universe 유니버스 백테스트 벤치마크 (합성 일봉, 네트워크 없음).
+
+Usage:
+    python scripts/bench_local_backtest_universe.py [--symbols 500] [--years 5] [--slots 30]
+
+목표: 5년 × 500종목 단일 코어 수 초 이내 (적재 제외 — `data=` 주입).
+4개 전략 각각 적재(precompute 포함)+시뮬레이션 시간, 거래 수, 자본곡선 길이를 출력한다.
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.local_backtest.strategies import STRATEGY_REGISTRY
+from services.local_backtest.universe import simulate_universe
+
+
+def _synthetic(seed: int, n: int, start: str) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    r = rng.normal(0.0005, 0.03, n)
+    r[rng.random(n) < 0.01] = 0.295
+    close = np.round(10000.0 * np.cumprod(1 + r))
+    open_ = np.round(close * (1 + rng.normal(0, 0.01, n)))
+    high = np.round(np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.02, n))))
+    low = np.round(np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.02, n))))
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close,
+         "volume": rng.integers(1_000, 1_000_000, n).astype(float)},
+        index=pd.bdate_range(start, periods=n),
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--symbols", type=int, default=500)
+    ap.add_argument("--years", type=int, default=5)
+    ap.add_argument("--slots", type=int, default=30)
+    ap.add_argument("--rank-by", default="turnover")
+    args = ap.parse_args()
+
+    start, end = date(2020, 1, 2), date(2020 + args.years - 1, 12, 30)
+    n = int(args.years * 252) + 120
+    data = {f"{i:06d}": _synthetic(i, n, "2019-07-01") for i in range(args.symbols)}
+    print(f"universe={args.symbols} symbols × {n} bars, {start}~{end}, slots={args.slots}, "
+          f"rank_by={args.rank_by}")
+
+    for sid in sorted(STRATEGY_REGISTRY):
+        t0 = time.perf_counter()
+        res = simulate_universe(
+            list(data), sid, "KR", start, end, 1_000_000_000.0,
+            max_slots=args.slots, rank_by=args.rank_by, data=data,
+        )
+        dt = time.perf_counter() - t0
+        closed = sum(1 for t in res.trades if t.get("exit_date"))
+        print(f"  {sid:<22} {dt:6.2f}s  closed_trades={closed:<6} days={len(res.equity_curve)}")
+
+
+if __name__ == "__main__":
+    main()
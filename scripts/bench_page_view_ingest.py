@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""페이지뷰 기록 벤치마크 — 요청당 INSERT+commit vs PageViewBuffer 일괄 INSERT.
+
+Usage:
+    python scripts/bench_page_view_ingest.py [--requests 2000] [--batch 500]
+
+임시 SQLite 파일(WAL, 운영 기본 DB와 같은 PRAGMA)에 N건을 기록한다.
+"요청 경로" 시간은 미들웨어가 요청마다 이벤트 루프에서 쓰던 시간(기존) /
+`offer()` 호출 시간(버퍼)이고, "총 기록"은 마지막 행이 커밋될 때까지의 시간이다.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from db.base import Base
+from db.models.page_view import PageView
+from db.repositories.page_view_repo import PageViewRepository
+from services.page_view_buffer import PageViewBuffer
+
+
+def _engine(path: Path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _pragma(dbapi_conn, _):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA busy_timeout=10000")
+        cur.close()
+
+    Base.metadata.create_all(engine, tables=[PageView.__table__])
+    return engine
+
+
+def _row(i: int) -> dict:
+    return {"user_id": i % 7 or None, "path": f"/api/p{i % 30}", "method": "GET",
+            "status_code": 200, "duration_ms": 12.5}
+
+
+def _legacy(Session, n: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(n):
+        with Session() as db:
+            PageViewRepository(db).record(**_row(i))
+            db.commit()
+    return time.perf_counter() - t0
+
+
+def _buffered(Session, n: int, batch: int) -> tuple[float, float]:
+    def writer(rows):
+        with Session() as db:
+            PageViewRepository(db).record_many(rows)
+            db.commit()
+
+    buf = PageViewBuffer(capacity=n + 1, batch_size=batch, flush_interval=1.0, writer=writer)
+    buf.start()
+    t0 = time.perf_counter()
+    for i in range(n):
+        buf.offer(**_row(i))
+    hot = time.perf_counter() - t0
+    buf.stop()
+    return hot, time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--batch", type=int, default=500)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine(Path(tmp) / "pv.db")
+        Session = sessionmaker(bind=engine)
+        legacy = _legacy(Session, args.requests)
+        hot, total = _buffered(Session, args.requests, args.batch)
+        with Session() as db:
+            rows = db.execute(select(func.count(PageView.id))).scalar()
+        engine.dispose()
+
+    n = args.requests
+    print(f"requests={n} batch={args.batch} rows={rows}")
+    print(f"  legacy    요청 경로 {legacy / n * 1e6:8.1f} µs/req  총 기록 {legacy:6.2f}s")
+    print(f"  buffered  요청 경로 {hot / n * 1e6:8.1f} µs/req  총 기록 {total:6.2f}s"
+          f"  ({legacy / hot:.0f}x / {legacy / total:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""관리자 이용현황 통계 벤치마크 — raw page_views 집계 vs rollup 조회.
+
+Usage:
+    python scripts/bench_page_view_rollup.py [--rows 500000] [--days 180] [--paths 60] [--users 40]
+
+임시 SQLite 파일에 N행(기간 D일, 균등 분포)을 넣고 rollup을 만든 뒤,
+`/api/admin/page-stats`가 호출하는 aggregate_by_path + daily_timeseries를 30/90/180일 창으로
+raw 쿼리(PageViewRepository)와 rollup 쿼리(PageViewRollupRepository)로 각각 측정한다.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from db.base import Base
+from db.models.page_view import PageView, PageViewDaily, PageViewHourly, PageViewUserDaily
+from db.repositories.page_view_repo import PageViewRepository
+from db.repositories.page_view_rollup_repo import PageViewRollupRepository
+from db.utils import KST
+from services.page_view_rollup import rollup
+
+
+def _seed(Session, rows: int, days: int, paths: int, users: int, end: datetime) -> None:
+    rng = random.Random(0)
+    start = end - timedelta(days=days)
+    span = int((end - start).total_seconds())
+    names = [f"/api/p{i}" for i in range(paths)]
+    batch = []
+    with Session() as db:
+        for _ in range(rows):
+            ts = start + timedelta(seconds=rng.randrange(span))
+            batch.append({
+                "user_id": rng.randrange(1, users + 1) if rng.random() < 0.8 else None,
+                "path": names[min(int(rng.expovariate(0.15)), paths - 1)],
+                "method": "GET",
+                "status_code": 200 if rng.random() < 0.97 else 500,
+                "duration_ms": rng.lognormvariate(3.5, 1.0),
+                "created_at": ts.isoformat(timespec="seconds"),
+            })
+            if len(batch) == 20000:
+                db.execute(insert(PageView), batch)
+                batch.clear()
+        if batch:
+            db.execute(insert(PageView), batch)
+        db.commit()
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=500_000)
+    ap.add_argument("--days", type=int, default=180)
+    ap.add_argument("--paths", type=int, default=60)
+    ap.add_argument("--users", type=int, default=40)
+    args = ap.parse_args()
+
+    end = datetime.now(KST).replace(microsecond=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'pv.db'}")
+        Base.metadata.create_all(engine, tables=[m.__table__ for m in
+                                                 (PageView, PageViewHourly, PageViewDaily, PageViewUserDaily)])
+        Session = sessionmaker(bind=engine)
+        _seed(Session, args.rows, args.days, args.paths, args.users, end)
+        with Session() as db:
+            t0 = time.perf_counter()
+            result = rollup(db, now=end)
+            backfill = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            rollup(db, now=end)
+            incremental = time.perf_counter() - t0
+        print(f"rows={args.rows} days={args.days} paths={args.paths}")
+        print(f"  rollup backfill {backfill:6.2f}s ({result['days']}일)  증분 재실행 {incremental * 1e3:6.1f}ms")
+
+        to = end.strftime("%Y-%m-%d")
+        with Session() as db:
+            raw, rolled = PageViewRepository(db), PageViewRollupRepository(db)
+            for window in (30, 90, 180):
+                frm = (end - timedelta(days=window - 1)).strftime("%Y-%m-%d")
+                t_raw = _time(lambda: (raw.aggregate_by_path(frm, to), raw.daily_timeseries(frm, to)))
+                t_roll = _time(lambda: (rolled.aggregate_by_path(frm, to), rolled.daily_timeseries(frm, to)))
+                print(f"  {window:3d}일  raw {t_raw * 1e3:8.1f}ms  rollup {t_roll * 1e3:7.1f}ms  ({t_raw / t_roll:5.1f}x)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""KIS REST 시세 폴백 벤치마크 (로컬 스텁 HTTP 서버, 실제 KIS 호출 없음).
+
+Usage:
+    python scripts/bench_quote_fallback.py [--symbols 50] [--latency 0.08] [--rate 10] [--concurrency 4]
+
+종목 N개 1사이클 소요와 같은 종목 재조회 간격(= 시세 최대 경과)을
+기존 순차 루프(executor 1건씩 + 종목 간 0.1초 + 사이클 후 3초)와 RestFallbackPoller로 비교한다.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import QUOTE_FALLBACK_CYCLE_SEC
+from services.quote_rest_poller import RestFallbackPoller
+
+_BODY = json.dumps({"output": {"stck_prpr": "71000", "prdy_vrss": "500",
+                               "prdy_vrss_sign": "2", "prdy_ctrt": "0.71"}}).encode()
+
+
+def _serve(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(_BODY)))
+            self.end_headers()
+            self.wfile.write(_BODY)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _legacy_cycle(url: str, symbols: list[str]) -> float:
+    """변경 전 `_rest_fallback_loop` 1사이클 (requests.get executor + 종목 간 0.1초)."""
+    loop = asyncio.get_event_loop()
+    t0 = time.perf_counter()
+    for s in symbols:
+        await loop.run_in_executor(None, lambda: requests.get(
+            f"{url}/uapi/domestic-stock/v1/quotations/inquire-price",
+            params={"fid_cond_mrkt_div_code": "J", "fid_input_iscd": s}, timeout=5).json())
+        await asyncio.sleep(0.1)
+    return time.perf_counter() - t0
+
+
+async def _poller_cycle(url: str, symbols: list[str], rate: float, concurrency: int) -> float:
+    poller = RestFallbackPoller(base_url=url, app_key="k", app_secret="s", rate=rate,
+                                concurrency=concurrency, token_provider=lambda: "tok",
+                                on_unauthorized=lambda: None)
+
+    async def publish(symbol, msg):
+        pass
+
+    t0 = time.perf_counter()
+    await poller.poll([(s, None) for s in symbols], publish)
+    dt = time.perf_counter() - t0
+    await poller.aclose()
+    return dt
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--symbols", type=int, default=50)
+    ap.add_argument("--latency", type=float, default=0.08, help="스텁 응답 지연(초)")
+    ap.add_argument("--rate", type=float, default=10)
+    ap.add_argument("--concurrency", type=int, default=4)
+    args = ap.parse_args()
+
+    server = _serve(args.latency)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    symbols = [f"{i:06d}" for i in range(args.symbols)]
+    print(f"symbols={args.symbols} latency={args.latency}s rate={args.rate}/s concurrency={args.concurrency}")
+    try:
+        legacy = asyncio.run(_legacy_cycle(url, symbols))
+        print(f"  legacy  cycle={legacy:6.2f}s  refresh≈{legacy + 3:6.2f}s")
+        new = asyncio.run(_poller_cycle(url, symbols, args.rate, args.concurrency))
+        print(f"  poller  cycle={new:6.2f}s  refresh≈{max(new, QUOTE_FALLBACK_CYCLE_SEC):6.2f}s"
+              f"  ({(legacy + 3) / max(new, QUOTE_FALLBACK_CYCLE_SEC):.1f}x)")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""KISQuoteManager → /ws/quote fan-out 벤치마크 (가짜 WebSocket, 네트워크 없음).
+
+Usage:
+    python scripts/bench_quote_fanout.py [--subscribers 50] [--rate 500] [--seconds 2]
+
+한 종목에 구독자 N명, 초당 rate건(체결:호가 = 1:1) KIS 메시지를 흘려 보내고
+구독자별 병합 + send_json(기존) 대비 심볼 단위 병합 + 인코딩 공유(FanoutHub)의
+프로세스 CPU 시간과 직렬화 횟수를 비교한다.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import quote_fanout
+from services.quote_fanout import FanoutHub, put_latest
+
+
+class _FakeWS:
+    """Starlette WebSocket send_json/send_text 흉내 — 직렬화 횟수만 센다."""
+
+    encodes = 0
+
+    async def send_json(self, data):
+        _FakeWS.encodes += 1
+        await self.send_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    async def send_text(self, text):
+        pass
+
+
+def _orderbook(i: int) -> dict:
+    return {"type": "orderbook", "symbol": "005930",
+            "asks": [{"price": 71000 + 100 * k, "volume": 1000 + i} for k in range(10)],
+            "bids": [{"price": 70900 - 100 * k, "volume": 900 + i} for k in range(10)],
+            "total_ask_volume": 12345, "total_bid_volume": 23456}
+
+
+def _price(i: int) -> dict:
+    return {"type": "price", "symbol": "005930", "price": 71000.0 + i % 7 * 100,
+            "change": 100.0, "change_rate": 0.14, "sign": "2"}
+
+
+async def _produce(publish, rate: int, seconds: float):
+    step = 2 / rate  # 체결+호가 1쌍
+    end = time.perf_counter() + seconds
+    i = 0
+    while time.perf_counter() < end:
+        publish(_price(i))
+        publish(_orderbook(i))
+        i += 1
+        await asyncio.sleep(step)
+
+
+async def _legacy(n: int, rate: int, seconds: float):
+    """구독자마다 큐 + 100ms 병합 창 + send_json (변경 전 라우트)."""
+    queues = [asyncio.Queue(maxsize=100) for _ in range(n)]
+
+    async def consume(q):
+        ws = _FakeWS()
+        while True:
+            msg = await q.get()
+            latest = {msg["type"]: msg}
+            deadline = asyncio.get_event_loop().time() + 0.1
+            while True:
+                remaining = deadline - asyncio.get_event_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    extra = await asyncio.wait_for(q.get(), timeout=remaining)
+                    latest[extra["type"]] = extra
+                except asyncio.TimeoutError:
+                    break
+            for m in latest.values():
+                await ws.send_json(m)
+
+    def publish(msg):
+        for q in queues:
+            put_latest(q, msg)
+
+    tasks = [asyncio.create_task(consume(q)) for q in queues]
+    await _produce(publish, rate, seconds)
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _fanout(n: int, rate: int, seconds: float) -> dict:
+    """심볼 단위 병합 + 인코딩 공유 (FanoutHub) + send_text."""
+    hub = FanoutHub(window=0.1)
+    queues = [asyncio.Queue(maxsize=100) for _ in range(n)]
+    for q in queues:
+        hub.add("005930", q)
+
+    async def consume(q):
+        ws = _FakeWS()
+        while True:
+            await ws.send_text(await q.get())
+
+    tasks = [asyncio.create_task(consume(q)) for q in queues]
+    await _produce(lambda m: hub.publish("005930", m), rate, seconds)
+    await asyncio.sleep(0.15)
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    hub.close()
+    return hub.stats()["005930"]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--subscribers", type=int, default=50)
+    ap.add_argument("--rate", type=int, default=500, help="초당 KIS 메시지 수")
+    ap.add_argument("--seconds", type=float, default=2.0)
+    args = ap.parse_args()
+    print(f"subscribers={args.subscribers} rate={args.rate}/s seconds={args.seconds}")
+
+    _FakeWS.encodes = 0
+    t0 = time.process_time()
+    asyncio.run(_legacy(args.subscribers, args.rate, args.seconds))
+    legacy_cpu = time.process_time() - t0
+    print(f"  per-subscriber  cpu={legacy_cpu:6.3f}s  json.dumps={_FakeWS.encodes}")
+
+    calls = [0]
+    real = quote_fanout.encode
+
+    def counting(m):
+        calls[0] += 1
+        return real(m)
+
+    quote_fanout.encode = counting
+    t0 = time.process_time()
+    stats = asyncio.run(_fanout(args.subscribers, args.rate, args.seconds))
+    fan_cpu = time.process_time() - t0
+    quote_fanout.encode = real
+    print(f"  fanout          cpu={fan_cpu:6.3f}s  json.dumps={calls[0]}  "
+          f"({legacy_cpu / fan_cpu:.1f}x)  {stats}")
+
+
+if __name__ == "__main__":
+    main()
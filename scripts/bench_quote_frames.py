@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""KIS 실시간 WS 프레임 파싱 마이크로 벤치마크 (네트워크 없음).
+
+Usage:
+    python scripts/bench_quote_frames.py [--frames capture.txt] [--count 200000] [--symbols 40]
+
+--frames: 녹화한 KIS 원문 프레임 파일 (한 줄에 프레임 1개, `0|TR_ID|건수|...`).
+생략 시 KIS 필드 배치(H0STCNT0 46필드 / H0STASP0 59필드, 10%는 2~3건 다건 프레임)대로
+만든 샘플 프레임을 사용한다. 변경 전 `_handle_message` 파싱 경로(split + `_sf` + dict 병합)와
+`services/quote_frames` 레이아웃 파서의 프레임당 시간을 비교한다 (3회 반복 중 최솟값).
+"table (lazy)"는 프레임 구독자만 있는 경우 — dict 생성은 fan-out flush로 미뤄진다.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.quote_frames import parse_records
+from services.quote_kis import _FRAME_LAYOUTS
+
+
+# ── 변경 전 파서 (비교 기준) ───────────────────────────────────────────────
+
+def _sf(v) -> float:
+    try:
+        return float(v)
+    except Exception:
+        return 0.0
+
+
+def _legacy_execution(raw: str):
+    t = raw.split('^')
+    if len(t) < 6:
+        return None
+    result = {"symbol": t[0], "price": _sf(t[2]), "sign": t[3], "change": _sf(t[4]), "change_rate": _sf(t[5])}
+    if len(t) > 9:
+        result["open"] = _sf(t[7])
+        result["high"] = _sf(t[8])
+        result["low"] = _sf(t[9])
+    if len(t) > 12:
+        result["tick_time"] = t[1]
+        result["tick_volume"] = _sf(t[12])
+    return result
+
+
+def _legacy_orderbook(raw: str):
+    t = raw.split('^')
+    if len(t) < 45:
+        return None
+    asks = [{"price": _sf(t[3 + i]), "volume": _sf(t[23 + i])} for i in range(10)]
+    bids = [{"price": _sf(t[13 + i]), "volume": _sf(t[33 + i])} for i in range(10)]
+    return {"symbol": t[0], "asks": asks, "bids": bids,
+            "total_ask_volume": _sf(t[43]), "total_bid_volume": _sf(t[44])}
+
+
+def _legacy(data: str) -> list:
+    tokens = data.split('|')
+    if tokens[1].endswith("CNT0"):
+        parsed = _legacy_execution(tokens[3])
+        return [{"type": "price", **parsed}] if parsed else []
+    parsed = _legacy_orderbook(tokens[3])
+    return [{"type": "orderbook", **parsed}] if parsed else []
+
+
+def _new(data: str, wanted) -> list:
+    tokens = data.split('|', 3)
+    layout = _FRAME_LAYOUTS[tokens[1]]
+    return [rec.message() for rec in parse_records(tokens[3], tokens[2], layout, wanted)]
+
+
+def _lazy(data: str) -> list:
+    tokens = data.split('|', 3)
+    return parse_records(tokens[3], tokens[2], _FRAME_LAYOUTS[tokens[1]])
+
+
+# ── 샘플 프레임 ───────────────────────────────────────────────────────────
+
+def _exec_fields(rng: random.Random, symbol: str) -> list[str]:
+    px = rng.randrange(5_000, 900_000, 10)
+    t = [symbol, f"09{rng.randrange(60):02d}{rng.randrange(60):02d}", str(px), rng.choice("235"),
+         str(rng.randrange(-5000, 5000, 10)), f"{rng.uniform(-5, 5):.2f}"]
+    t += [str(px + rng.randrange(-1000, 1000, 10)) for _ in range(6)]
+    t += [str(rng.randrange(1, 5000))]
+    return t + [str(rng.randrange(0, 10**7)) for _ in range(46 - len(t))]
+
+
+def _book_fields(rng: random.Random, symbol: str) -> list[str]:
+    px = rng.randrange(5_000, 900_000, 10)
+    t = [symbol, f"09{rng.randrange(60):02d}{rng.randrange(60):02d}", "0"]
+    t += [str(px + 10 * (i + 1)) for i in range(10)] + [str(px - 10 * i) for i in range(10)]
+    t += [str(rng.randrange(1, 10**5)) for _ in range(22)]
+    return t + ["0"] * (59 - len(t))
+
+
+def _samples(n: int, n_symbols: int) -> list[str]:
+    rng = random.Random(0)
+    symbols = [f"{rng.randrange(10**6):06d}" for _ in range(n_symbols)]
+    frames = []
+    for _ in range(n):
+        is_exec = rng.random() < 0.6
+        count = rng.choice((2, 3)) if is_exec and rng.random() < 0.1 else 1
+        sym = rng.choice(symbols)
+        fields = []
+        for _ in range(count):
+            fields += _exec_fields(rng, sym) if is_exec else _book_fields(rng, sym)
+        tr = "H0UNCNT0" if is_exec else "H0UNASP0"
+        frames.append(f"0|{tr}|{count:03d}|" + "^".join(fields))
+    return frames
+
+
+def _timeit(fn, frames, repeat: int = 3) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n = 0
+        for f in frames:
+            n += len(fn(f))
+        best = min(best, time.perf_counter() - t0)
+    return best / len(frames), n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--frames", type=Path, default=None)
+    ap.add_argument("--count", type=int, default=200_000)
+    ap.add_argument("--symbols", type=int, default=40)
+    args = ap.parse_args()
+
+    if args.frames:
+        frames = [ln.strip() for ln in args.frames.read_text().splitlines()
+                  if ln[:1] in ("0", "1") and ln.split("|", 2)[1] in _FRAME_LAYOUTS]
+    else:
+        frames = _samples(args.count, args.symbols)
+    symbols = {f.split("|", 3)[3].split("^", 1)[0] for f in frames}
+    half = set(sorted(symbols)[: len(symbols) // 2])
+    print(f"frames={len(frames)} symbols={len(symbols)} source={args.frames or 'synthetic'}")
+
+    legacy, n_old = _timeit(_legacy, frames)
+    new, n_new = _timeit(lambda f: _new(f, None), frames)
+    lazy, n_lazy = _timeit(_lazy, frames)
+    sub, n_sub = _timeit(lambda f: _new(f, half), frames)
+    print(f"  legacy        {legacy * 1e6:6.2f} µs/frame  records={n_old} (다건 프레임은 첫 건만)")
+    print(f"  table         {new * 1e6:6.2f} µs/frame  records={n_new}  ({legacy / new:.1f}x)")
+    print(f"  table (lazy)  {lazy * 1e6:6.2f} µs/frame  records={n_lazy}  ({legacy / lazy:.1f}x, dict는 flush 시)")
+    print(f"  table+filter  {sub * 1e6:6.2f} µs/frame  records={n_sub}  (구독 종목 절반)")
+
+
+if __name__ == "__main__":
+    main()
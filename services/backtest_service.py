@@ -37,7 +37,7 @@ MCP 비활성화(KIS_MCP_ENABLED=false) 시:
 import json
 import logging
 import uuid
-from typing import Optional
+from typing import Callable, Optional
 
 from config import KIS_MCP_ENABLED
 from db.utils import now_kst_iso
@@ -644,38 +644,23 @@ def list_local_presets() -> list[dict]:
     return out
 
 
-def run_local_backtest(
+def _validate_local_request(
     preset: str,
     symbols: list[str],
-    market: str = "KR",
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    initial_capital: float = 10_000_000,
-    commission_rate: float = 0.0015,
-    tax_rate: float = 0.0023,
-    slippage: float = 0.001,
-    params: Optional[dict] = None,
-    user_id: int = 1,
-) -> dict:
-    """로컬 4개 전략 + 균등 배분 포트폴리오 일봉 백테스트.
-
-    plan ai-sleepy-pancake.md — 일봉 단순화. 외부 MCP 미사용. KR market만 지원(MVP).
-
-    검증:
-      - 1 ≤ len(symbols) ≤ 10 (Pydantic도 검증하지만 서비스 레이어 방어적 가드)
-      - 동일 코드 중복 제거 (입력 순서 보존)
-      - market == "KR"
-      - 시작일/종료일 형식
-
-    저장:
-      - BacktestJob (strategy_type="local", symbol=symbols[0], symbols=전체 list)
-      - result_json: {equity_curve, trades, per_symbol_contribution, params, failures}
+    market: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    max_symbols: int = 10,
+):
+    """로컬 백테스트/스윕 공통 입력 검증 → (deduped, preset_meta, start, end).
+
+    - 1 ≤ len(symbols) ≤ max_symbols (Pydantic도 검증하지만 서비스 레이어 방어적 가드)
+    - 동일 코드 중복 제거 (입력 순서 보존)
+    - market == "KR"
+    - 시작일/종료일 형식 (기본: 시작=1년전, 종료=오늘)
     """
-    from datetime import date as _date_cls
-    from services.local_backtest import simulate as _simulate
     from services.local_backtest.presets import get_preset
 
-    # ── 검증 ──────────────────────────────────────────────────────────
     if not symbols:
         raise ServiceError("symbols 비어있음")
     # 중복 제거 (입력 순서 보존)
@@ -691,8 +676,8 @@ def run_local_backtest(
         deduped.append(s_clean)
     if not deduped:
         raise ServiceError("symbols에 유효한 종목 코드가 없습니다")
-    if len(deduped) > 10:
-        raise ServiceError("로컬 백테스트는 최대 10종목까지 지원합니다")
+    if len(deduped) > max_symbols:
+        raise ServiceError(f"로컬 백테스트는 최대 {max_symbols}종목까지 지원합니다")
     if (market or "").upper() != "KR":
         raise ServiceError("로컬 백테스트는 KR market만 지원합니다 (MVP)")
 
@@ -712,6 +697,59 @@ def run_local_backtest(
     if sd >= ed:
         raise ServiceError("start_date는 end_date보다 이전이어야 합니다")
 
+    return deduped, preset_meta, sd, ed
+
+
+def _local_monte_carlo(equity_curve: list[dict], trades: list[dict], initial_capital: float) -> Optional[dict]:
+    """로컬 백테스트 응답용 몬테카를로 요약 (`LOCAL_BACKTEST_MC_PATHS` 경로). 실패해도 결과 저장은 계속."""
+    import time as _t
+
+    from services.local_backtest.montecarlo import monte_carlo
+
+    t0 = _t.perf_counter()
+    try:
+        out = monte_carlo(equity_curve, trades, float(initial_capital))
+    except Exception as e:
+        logger.warning("몬테카를로 부트스트랩 실패: %s", e, exc_info=True)
+        _tel.record_event("backtest.local.montecarlo.fail")
+        return None
+    _tel.observe("backtest.local.montecarlo_ms", (_t.perf_counter() - t0) * 1000.0)
+    return out
+
+
+def run_local_backtest(
+    preset: str,
+    symbols: list[str],
+    market: str = "KR",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    initial_capital: float = 10_000_000,
+    commission_rate: float = 0.0015,
+    tax_rate: float = 0.0023,
+    slippage: float = 0.001,
+    params: Optional[dict] = None,
+    user_id: int = 1,
+) -> dict:
+    """로컬 4개 전략 + 균등 배분 포트폴리오 일봉 백테스트.
+
+    plan ai-sleepy-pancake.md — 일봉 단순화. 외부 MCP 미사용. KR market만 지원(MVP).
+
+    검증:
+      - 1 ≤ len(symbols) ≤ 10 (Pydantic도 검증하지만 서비스 레이어 방어적 가드)
+      - 동일 코드 중복 제거 (입력 순서 보존)
+      - market == "KR"
+      - 시작일/종료일 형식
+
+    저장:
+      - BacktestJob (strategy_type="local", symbol=symbols[0], symbols=전체 list)
+      - result_json: {equity_curve, trades, per_symbol_contribution, params, failures, monte_carlo}
+    """
+    from services.local_backtest import simulate as _simulate
+
+    deduped, preset_meta, sd, ed = _validate_local_request(
+        preset, symbols, market, start_date, end_date,
+    )
+
     job_id = str(uuid.uuid4())
 
     # REQ-FIX-06: entry 로그
@@ -780,6 +818,7 @@ def run_local_backtest(
         "trades": sim.trades,
         "per_symbol_contribution": sim.per_symbol_contribution,
         "failures": sim.failures,
+        "monte_carlo": _local_monte_carlo(sim.equity_curve, sim.trades, initial_capital),
         "result": {
             "metrics": {
                 "basic": {
@@ -827,3 +866,403 @@ def run_local_backtest(
         job_id, _duration_ms, len(sim.trades) if sim.trades else 0,
     )
     return {"job_id": job_id, "status": "completed", "result": result_json}
+
+
+def _start_local_job(
+    kind: str,
+    label: str,
+    job_id: str,
+    user_id: int,
+    preset: str,
+    symbols: list[str],
+    params: dict,
+    display_name: str,
+    compute: Callable[[], tuple[dict, dict, str]],
+    summary: dict,
+    background: bool = True,
+) -> dict:
+    """로컬 fire-and-poll 작업 공통 골격 (스윕/워크포워드/유니버스).
+
+    BacktestJob(strategy_type=f"local_{kind}") 등록 → running 전환 후 `compute()`를 데몬 스레드
+    (background=False면 호출 스레드)에서 실행한다. compute는 (metrics, result_json, exit 로그 상세)를
+    반환하고, 결과는 `_to_jsonable` 변환 후 completed 저장. 예외는 job failed + telemetry
+    `backtest.{kind}.fail.*`.
+
+    Returns:
+        background: {job_id, status:"running", **summary}
+        동기: {job_id, status, **summary, result}
+
+    Raises:
+        ServiceError: 작업 등록(DB) 실패.
+    """
+    import threading
+    import time as _t
+
+    from services.local_backtest.engine import _to_jsonable
+
+    try:
+        strategy_store.save_backtest_job(
+            user_id=user_id,
+            job_id=job_id,
+            strategy_name=preset,
+            symbol=symbols[0],
+            symbols=symbols,
+            market="KR",
+            strategy_type=f"local_{kind}",
+            submitted_at=now_kst_iso(),
+            params=params,
+            strategy_display_name=display_name,
+        )
+        strategy_store.update_job_status(job_id, "running")
+    except Exception as e:
+        logger.error("%s save_backtest_job 실패: %s", kind, e, exc_info=True)
+        _tel.record_event(f"backtest.{kind}.fail.db")
+        raise ServiceError(f"{label} 작업 등록 실패: {e}")
+
+    def _work() -> None:
+        t0 = _t.perf_counter()
+        try:
+            metrics, result_json, detail = compute()
+            strategy_store.save_backtest_result(
+                job_id=job_id,
+                metrics=_to_jsonable(metrics),
+                result_json=_to_jsonable(result_json),
+                completed_at=now_kst_iso(),
+            )
+            duration_ms = (_t.perf_counter() - t0) * 1000.0
+            _tel.record_event(f"backtest.{kind}.success")
+            _tel.observe(f"backtest.{kind}.duration_ms", duration_ms)
+            logger.info("[backtest.%s.exit] job_id=%s %s duration_ms=%.1f", kind, job_id, detail, duration_ms)
+        except Exception as e:
+            logger.error("%s 실패 job_id=%s: %s", label, job_id, e, exc_info=True)
+            _tel.record_event(f"backtest.{kind}.fail.{_classify_local_failure(e)}")
+            strategy_store.update_job_failed(job_id, f"{label} 실패: {e}")
+
+    if background:
+        threading.Thread(target=_work, daemon=True, name=f"local-{kind}-{job_id[:8]}").start()
+        return {"job_id": job_id, "status": "running", **summary}
+    _work()
+    job = strategy_store.get_job(job_id) or {}
+    return {"job_id": job_id, "status": job.get("status", "completed"), **summary,
+            "result": job.get("result_json")}
+
+
+# 스윕 중간 순위 DB 반영 최소 간격 (초) — 조합 수백 개여도 쓰기 폭주 방지
+_SWEEP_PROGRESS_INTERVAL_SEC = 1.0
+
+
+def run_local_sweep(
+    preset: str,
+    symbols: list[str],
+    market: str = "KR",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    initial_capital: float = 10_000_000,
+    commission_rate: float = 0.0015,
+    tax_rate: float = 0.0023,
+    slippage: float = 0.001,
+    param_grid: Optional[dict] = None,
+    samples: Optional[int] = None,
+    seed: Optional[int] = None,
+    rank_by: str = "sharpe_ratio",
+    top_n: int = 20,
+    user_id: int = 1,
+    background: bool = True,
+) -> dict:
+    """로컬 프리셋 파라미터 스윕 (그리드/랜덤 샘플) — fire-and-poll.
+
+    OHLCV 1회 적재 후 조합별 시뮬레이션을 프로세스 풀로 병렬 실행한다.
+    완료되는 대로 상위 `top_n` 순위를 job result_json에 반영(status=running 유지)하고,
+    종료 시 1위 조합 메트릭으로 completed 저장. 클라이언트는 GET /result/{job_id}로 폴링.
+
+    저장:
+      - BacktestJob (strategy_type="local_sweep", params={param_grid, samples, seed, rank_by})
+      - result_json: {preset, symbols, rank_by, total_runs, completed_runs, ranking[], errors, failures}
+
+    Raises:
+        ServiceError: 입력 검증 실패 (심볼/프리셋/날짜/파라미터 스키마/조합 수/rank_by).
+    """
+    import time as _t
+
+    from services.local_backtest import sweep as _sweep
+    from services.local_backtest.engine import _to_jsonable
+
+    deduped, preset_meta, sd, ed = _validate_local_request(
+        preset, symbols, market, start_date, end_date,
+    )
+    if rank_by not in _sweep.RANK_METRICS:
+        raise ServiceError(f"rank_by 미지원: {rank_by}")
+    try:
+        param_sets = _sweep.build_param_sets(preset, param_grid, samples, seed)
+    except ValueError as e:
+        raise ServiceError(str(e))
+    top_n = max(1, int(top_n or 1))
+
+    job_id = str(uuid.uuid4())
+    logger.info(
+        "[backtest.sweep.entry] preset=%s symbols=%s runs=%d rank_by=%s user_id=%s job_id=%s",
+        preset, deduped, len(param_sets), rank_by, user_id, job_id,
+    )
+    base = {
+        "preset": preset,
+        "symbols": deduped,
+        "market": "KR",
+        "start_date": sd.isoformat(),
+        "end_date": ed.isoformat(),
+        "mode": "grid" if param_grid and not samples else "random",
+        "rank_by": rank_by,
+        "total_runs": len(param_sets),
+    }
+    last_write = [0.0]
+
+    def _on_progress(ranking: list[dict], done: int, total: int) -> None:
+        now = _t.monotonic()
+        if done < total and now - last_write[0] < _SWEEP_PROGRESS_INTERVAL_SEC:
+            return
+        last_write[0] = now
+        strategy_store.update_job_progress(job_id, _to_jsonable({
+            **base, "completed_runs": done, "ranking": ranking[:top_n],
+        }))
+
+    def _compute() -> tuple[dict, dict, str]:
+        res = _sweep.run_sweep(
+            symbols=deduped,
+            strategy_id=preset,
+            market="KR",
+            start=sd,
+            end=ed,
+            param_sets=param_sets,
+            initial_capital=float(initial_capital),
+            commission_rate=float(commission_rate),
+            tax_rate=float(tax_rate),
+            slippage=float(slippage),
+            rank_by=rank_by,
+            on_progress=_on_progress,
+        )
+        result_json = {
+            **base,
+            "completed_runs": len(res.ranking) + len(res.errors),
+            "ranking": res.ranking[:top_n],
+            "errors": res.errors,
+            "failures": res.failures,
+        }
+        best = res.ranking[0]["metrics"] if res.ranking else {}
+        return best, result_json, f"runs={len(param_sets)} errors={len(res.errors)}"
+
+    return _start_local_job(
+        "sweep", "파라미터 스윕", job_id, user_id, preset, deduped,
+        params={"param_grid": param_grid, "samples": samples, "seed": seed, "rank_by": rank_by},
+        display_name=f"{preset_meta.get('name')} 파라미터 스윕",
+        compute=_compute,
+        summary={"total_runs": len(param_sets)},
+        background=background,
+    )
+
+
+def run_local_walkforward(
+    preset: str,
+    symbols: list[str],
+    market: str = "KR",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    initial_capital: float = 10_000_000,
+    commission_rate: float = 0.0015,
+    tax_rate: float = 0.0023,
+    slippage: float = 0.001,
+    train_days: int = 365,
+    test_days: int = 90,
+    anchored: bool = False,
+    param_grid: Optional[dict] = None,
+    samples: Optional[int] = None,
+    seed: Optional[int] = None,
+    rank_by: str = "sharpe_ratio",
+    user_id: int = 1,
+    background: bool = True,
+) -> dict:
+    """로컬 프리셋 워크포워드(롤링 표본 외) 평가 — fire-and-poll.
+
+    [start, end]를 학습/검증 창으로 나눠 창마다 학습 구간 1위 조합으로 검증 구간을 실행하고,
+    검증 자본곡선을 연결한 표본 외 성과를 저장한다. 창은 프로세스 풀로 병렬 실행되며,
+    완료된 창의 메트릭은 job result_json.windows에 즉시 반영된다(status=running 유지).
+
+    저장:
+      - BacktestJob (strategy_type="local_walkforward",
+        params={train_days, test_days, anchored, param_grid, samples, seed, rank_by})
+      - result_json: {..., windows[{train/test 구간, best_params, train_metrics, test_metrics}],
+        equity_curve(연결), trades, metrics(연결 곡선 기준), summary, errors, failures}
+
+    Raises:
+        ServiceError: 입력 검증 실패 (심볼/프리셋/날짜/파라미터/창 분할/rank_by).
+    """
+    from services.local_backtest import sweep as _sweep
+    from services.local_backtest import walkforward as _wf
+    from services.local_backtest.engine import _to_jsonable
+
+    deduped, preset_meta, sd, ed = _validate_local_request(
+        preset, symbols, market, start_date, end_date,
+    )
+    if rank_by not in _sweep.RANK_METRICS:
+        raise ServiceError(f"rank_by 미지원: {rank_by}")
+    try:
+        param_sets = _sweep.build_param_sets(preset, param_grid, samples, seed)
+        windows = _wf.split_windows(sd, ed, int(train_days), int(test_days), bool(anchored))
+    except ValueError as e:
+        raise ServiceError(str(e))
+
+    job_id = str(uuid.uuid4())
+    logger.info(
+        "[backtest.walkforward.entry] preset=%s symbols=%s windows=%d runs=%d user_id=%s job_id=%s",
+        preset, deduped, len(windows), len(param_sets), user_id, job_id,
+    )
+    base = {
+        "preset": preset,
+        "symbols": deduped,
+        "market": "KR",
+        "start_date": sd.isoformat(),
+        "end_date": ed.isoformat(),
+        "train_days": int(train_days),
+        "test_days": int(test_days),
+        "anchored": bool(anchored),
+        "rank_by": rank_by,
+        "runs_per_window": len(param_sets),
+        "total_windows": len(windows),
+    }
+
+    def _on_progress(done_windows: list[dict], done: int, total: int) -> None:
+        strategy_store.update_job_progress(job_id, _to_jsonable({
+            **base, "completed_windows": done, "windows": done_windows,
+        }))
+
+    def _compute() -> tuple[dict, dict, str]:
+        res = _wf.run_walkforward(
+            symbols=deduped,
+            strategy_id=preset,
+            market="KR",
+            start=sd,
+            end=ed,
+            param_sets=param_sets,
+            initial_capital=float(initial_capital),
+            train_days=int(train_days),
+            test_days=int(test_days),
+            anchored=bool(anchored),
+            commission_rate=float(commission_rate),
+            tax_rate=float(tax_rate),
+            slippage=float(slippage),
+            rank_by=rank_by,
+            on_progress=_on_progress,
+        )
+        result_json = {
+            **base,
+            "completed_windows": len(res.windows),
+            "windows": res.windows,
+            "equity_curve": res.equity_curve,
+            "trades": res.trades,
+            "metrics": res.metrics,
+            "monte_carlo": _local_monte_carlo(res.equity_curve, res.trades, initial_capital),
+            "summary": res.summary,
+            "errors": res.errors,
+            "failures": res.failures,
+        }
+        return res.metrics, result_json, f"windows={len(windows)} errors={len(res.errors)}"
+
+    return _start_local_job(
+        "walkforward", "워크포워드", job_id, user_id, preset, deduped,
+        params={"train_days": train_days, "test_days": test_days, "anchored": anchored,
+                "param_grid": param_grid, "samples": samples, "seed": seed, "rank_by": rank_by},
+        display_name=f"{preset_meta.get('name')} 워크포워드",
+        compute=_compute,
+        summary={"total_windows": len(windows)},
+        background=background,
+    )
+
+
+def run_local_universe_backtest(
+    preset: str,
+    symbols: list[str],
+    market: str = "KR",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    initial_capital: float = 100_000_000,
+    max_slots: int = 20,
+    rank_by: str = "turnover",
+    allocation: str = "slots",
+    commission_rate: float = 0.0015,
+    tax_rate: float = 0.0023,
+    slippage: float = 0.001,
+    params: Optional[dict] = None,
+    user_id: int = 1,
+    background: bool = True,
+) -> dict:
+    """유니버스 규모(최대 `LOCAL_BACKTEST_UNIVERSE_MAX_SYMBOLS`) 로컬 백테스트 — fire-and-poll.
+
+    수백 종목 OHLCV 적재는 수 분이 걸릴 수 있어 백그라운드 스레드로 실행하고
+    즉시 {job_id, status:"running"}을 반환한다. 결과 형식은 `run_local_backtest`와 동일
+    (+ max_slots/rank_by/allocation, per_symbol_contribution은 거래 발생 종목만).
+
+    Raises:
+        ServiceError: 입력 검증 실패 (심볼 수/프리셋/날짜/max_slots/rank_by/allocation).
+    """
+    from config import LOCAL_BACKTEST_UNIVERSE_MAX_SYMBOLS
+    from services.local_backtest import universe as _universe
+
+    deduped, preset_meta, sd, ed = _validate_local_request(
+        preset, symbols, market, start_date, end_date,
+        max_symbols=LOCAL_BACKTEST_UNIVERSE_MAX_SYMBOLS,
+    )
+    if rank_by not in _universe.RANK_KEYS:
+        raise ServiceError(f"rank_by 미지원: {rank_by} (가능: {', '.join(_universe.RANK_KEYS)})")
+    if allocation not in _universe.ALLOCATIONS:
+        raise ServiceError(f"allocation 미지원: {allocation}")
+    if int(max_slots) < 1:
+        raise ServiceError("max_slots는 1 이상이어야 합니다")
+
+    job_id = str(uuid.uuid4())
+    logger.info(
+        "[backtest.universe.entry] preset=%s symbols_n=%d slots=%d rank_by=%s user_id=%s job_id=%s",
+        preset, len(deduped), max_slots, rank_by, user_id, job_id,
+    )
+
+    def _compute() -> tuple[dict, dict, str]:
+        sim = _universe.simulate_universe(
+            symbols=deduped,
+            strategy_id=preset,
+            market="KR",
+            start=sd,
+            end=ed,
+            initial_capital=float(initial_capital),
+            max_slots=int(max_slots),
+            rank_by=rank_by,
+            allocation=allocation,
+            commission_rate=float(commission_rate),
+            tax_rate=float(tax_rate),
+            slippage=float(slippage),
+            params=params,
+        )
+        result_json = {
+            "preset": preset,
+            "symbols_count": len(deduped),
+            "market": "KR",
+            "start_date": sd.isoformat(),
+            "end_date": ed.isoformat(),
+            "max_slots": int(max_slots),
+            "rank_by": rank_by,
+            "allocation": allocation,
+            "params": sim.params,
+            "metrics": sim.metrics,
+            "equity_curve": sim.equity_curve,
+            "trades": sim.trades,
+            "per_symbol_contribution": sim.per_symbol_contribution,
+            "failures": sim.failures,
+            "monte_carlo": _local_monte_carlo(sim.equity_curve, sim.trades, initial_capital),
+        }
+        detail = f"loaded={len(deduped) - len(sim.failures)} failures={len(sim.failures)}"
+        return sim.metrics, result_json, detail
+
+    return _start_local_job(
+        "universe", "유니버스 백테스트", job_id, user_id, preset, deduped,
+        params={**(params or {}), "max_slots": max_slots, "rank_by": rank_by, "allocation": allocation},
+        display_name=f"{preset_meta.get('name')} 유니버스",
+        compute=_compute,
+        summary={"symbols_count": len(deduped)},
+        background=background,
+    )
@@ -1,4 +1,4 @@
-"""yfinance 일봉 fetch + 단일 백테스트 내 캐시 (KR 전용 MVP).
+"""일봉 fetch (stock/ohlcv_store 경유) + 단일 백테스트 내 캐시 (KR 전용 MVP).
 
 REQ-FIX-02 (2026-05-09):
 - yfinance None/empty 영구 캐시 버그 수정 → 미저장 + 다음 호출 재시도 가능
@@ -50,45 +50,18 @@ def fetch_daily_ohlcv(
     if market.upper() != "KR":
         raise ValueError(f"local_backtest MVP는 KR만 지원: {market}")
 
-    ticker_str = _resolve_kr_ticker(code)
-    if not ticker_str:
-        return None
+    # required_history_days를 위해 시작일 이전 데이터도 필요함 → 호출자가 start를 충분히 빼서 전달
+    # stock/ohlcv_store: 저장된 구간은 로컬 memmap, 미확인 앞/뒤 구간만 yfinance 보충
+    from stock import ohlcv_store
 
     try:
-        # required_history_days를 위해 시작일 이전 데이터도 필요함 → 호출자가 start를 충분히 빼서 전달
-        from stock.yf_client import _ticker
-
-        tk = _ticker(ticker_str)
-        # yfinance.history는 end exclusive — +1일
-        hist = tk.history(
-            start=start.isoformat(),
-            end=(end + timedelta(days=1)).isoformat(),
-            interval="1d",
-            auto_adjust=False,
-            actions=False,
-        )
+        df = ohlcv_store.get_bars(code, start, end, market="KR", interval="1d")
     except Exception as e:
-        logger.warning("yf history 실패 code=%s err=%s", code, e)
+        logger.warning("ohlcv_store 조회 실패 code=%s err=%s", code, e)
         return None
-
-    if hist is None or hist.empty:
+    if df is None or df.empty:
         return None
-
-    df = hist.rename(
-        columns={
-            "Open": "open",
-            "High": "high",
-            "Low": "low",
-            "Close": "close",
-            "Volume": "volume",
-        }
-    )[["open", "high", "low", "close", "volume"]].copy()
-    # tz 제거 (날짜 비교 용이)
-    if df.index.tz is not None:
-        df.index = df.index.tz_localize(None)
-    df = df.dropna(subset=["open", "high", "low", "close"])
-    df = df.sort_index()
-    return df
+    return df[["open", "high", "low", "close", "volume"]]
 
 
 class DataLoader:
@@ -97,8 +70,10 @@ class DataLoader:
     REQ-FIX-02: None 영구화 버그 수정 + 재시도 + TTL.
     """
 
-    def __init__(self, market: str = "KR") -> None:
+    def __init__(self, market: str = "KR", cache: bool = True) -> None:
         self.market = market.upper()
+        # cache=False: 유니버스 백테스트처럼 종목별 1회만 읽고 버리는 경우 (메모리 상한)
+        self.use_cache = cache
         # value: (df, ts) — ts 는 캐시 저장 시각 (`time.time()`)
         self._cache: dict[str, tuple[Optional[pd.DataFrame], float]] = {}
 
@@ -148,5 +123,6 @@ class DataLoader:
             return None
 
         # 정상 데이터만 캐시에 저장 (TS 동봉)
-        self._cache[key] = (df, time.time())
+        if self.use_cache:
+            self._cache[key] = (df, time.time())
         return df
@@ -1,5 +1,9 @@
 """포트폴리오 일봉 시뮬레이터 — 4 전략 공통 엔진.
 
+사전 계산: 종목별 `strategy.precompute(df, params)` 1회 → 매수 신호/청산용 배열.
+정렬: `panel.align_panel` — 전 종목을 공통 거래일 축 (S, T) 배열로 1회 정렬.
+루프는 정수 인덱싱만 한다 (행마다 rolling 윈도 재계산·날짜 검색 없음).
+
 루프 (매 거래일 t):
   a) 보유 포지션 exit 평가 (손절 우선)
      - 청산 시 자본 풀에 회수 (수수료 + 세금 + 슬리피지 차감)
@@ -17,16 +21,19 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from services.local_backtest.data_loader import DataLoader
 from services.local_backtest.metrics import compute_metrics
+from services.local_backtest.panel import align_panel
 from services.local_backtest.portfolio import PortfolioState
 from services.local_backtest.strategies import get_strategy
 from services.local_backtest.strategies._base import (
     EntrySignal,
     ExitSignal,
     Position,
+    Precomputed,
     Strategy,
 )
 
@@ -57,6 +64,102 @@ def _apply_sell_costs(
     return target_price * (1.0 - slippage)
 
 
+def _close_trade(
+    pos: Position,
+    exit_sig: ExitSignal,
+    d: date,
+    slippage: float,
+    commission_rate: float,
+    tax_rate: float,
+    trades: list[dict],
+    contrib: dict[str, dict],
+) -> tuple[float, float]:
+    """청산 체결 — 매도 단가·순매도대금 계산, trades 기록, 종목별 기여도 누적.
+
+    Returns:
+        (sell_unit, net_proceeds) — 호출측이 현금/포지션 상태에 반영.
+    """
+    sell_unit = _apply_sell_costs(exit_sig.price, slippage)
+    gross_proceeds = sell_unit * pos.qty
+    commission = gross_proceeds * commission_rate
+    tax = gross_proceeds * tax_rate
+    net_proceeds = gross_proceeds - commission - tax
+    entry_cost_unit = pos.entry_price  # buy_unit (slippage 이미 반영된 단가)
+    pnl = net_proceeds - entry_cost_unit * pos.qty
+    pnl_pct = (
+        (sell_unit - entry_cost_unit) / entry_cost_unit * 100.0
+        if entry_cost_unit > 0
+        else 0.0
+    )
+    sym = pos.symbol
+    trades.append(
+        {
+            "symbol": sym,
+            "entry_date": pos.entry_date.isoformat(),
+            "entry_price": entry_cost_unit,
+            "exit_date": d.isoformat(),
+            "exit_price": sell_unit,
+            "qty": pos.qty,
+            "pnl": pnl,
+            "pnl_pct": pnl_pct,
+            "exit_reason": exit_sig.reason,
+        }
+    )
+    agg = contrib.setdefault(sym, {"symbol": sym, "trades": 0, "realized_pnl": 0.0,
+                                   "wins": 0, "losses": 0})
+    agg["trades"] += 1
+    agg["realized_pnl"] += pnl
+    if pnl > 0:
+        agg["wins"] += 1
+    elif pnl < 0:
+        agg["losses"] += 1
+    return sell_unit, net_proceeds
+
+
+def _open_position(
+    sym: str,
+    entry_sig: EntrySignal,
+    d: date,
+    budget: float,
+    cash: float,
+    slippage: float,
+    commission_rate: float,
+    trades: list[dict],
+) -> Optional[tuple[Position, float]]:
+    """매수 체결 — budget 안에서 수수료 포함 가능 수량 산정, 현금 확인, trades 기록.
+
+    Returns:
+        (Position, total_cost) 또는 None (단가/수량 0 · 현금 부족).
+    """
+    buy_unit = _apply_buy_costs(entry_sig.price, slippage, commission_rate)
+    if buy_unit <= 0:
+        return None
+    # 수수료를 고려한 종목당 가능 수량 = budget / (buy_unit × (1+commission))
+    qty = math.floor(budget / (buy_unit * (1.0 + commission_rate)))
+    if qty <= 0:
+        return None
+    cost = buy_unit * qty
+    commission = cost * commission_rate
+    total_cost = cost + commission
+    if total_cost > cash + 1e-6:
+        return None
+    trades.append(
+        {
+            "symbol": sym,
+            "entry_date": d.isoformat(),
+            "entry_price": buy_unit,
+            "exit_date": None,
+            "exit_price": None,
+            "qty": qty,
+            "pnl": None,
+            "pnl_pct": None,
+            "exit_reason": None,
+            "side": "buy",
+        }
+    )
+    return Position(symbol=sym, entry_date=d, entry_price=buy_unit, qty=qty, extra={}), total_cost
+
+
 def _to_jsonable(obj: Any) -> Any:
     """numpy/pandas 타입을 Python native 로 재귀 변환.
 
@@ -121,6 +224,52 @@ def _date_of(idx: int, df: pd.DataFrame) -> date:
     return ts
 
 
+def load_symbol_data(
+    symbols: list[str],
+    strategy: Strategy,
+    market: str,
+    start: date,
+    end: date,
+) -> tuple[dict[str, pd.DataFrame], list[str]]:
+    """종목별 OHLCV 적재 + 인덱스 정규화. 파라미터 스윕은 1회 적재 후 `simulate(data=...)`로 재사용.
+
+    Returns:
+        (symbol_data, failures) — 입력 순서 보존, 데이터 없는 종목은 failures.
+    """
+    loader = DataLoader(market=market)
+    failures: list[str] = []
+    symbol_data: dict[str, pd.DataFrame] = {}
+    history_buffer = max(strategy.required_history_days() + 20, 80)
+    for sym in symbols:
+        df = loader.load(sym, start, end, history_buffer_days=history_buffer)
+        if df is None or df.empty:
+            failures.append(sym)
+            continue
+        symbol_data[sym] = normalize_index(df, sym)
+    return symbol_data, failures
+
+
+def normalize_index(df: pd.DataFrame, sym: str = "") -> pd.DataFrame:
+    """REQ-FIX-03: tz/시간 컴포넌트 정규화 — 모든 인덱스를 naive midnight 으로 통일.
+
+    외부 mock/직접 주입 데이터(시간 포함, tz-aware) 들어와도 거래일 축에 안전하게 정렬.
+    거래일 축 정렬(get_indexer) 전제: 오름차순 + 날짜 중복 없음 (동일 일자는 마지막 봉).
+    """
+    try:
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.DatetimeIndex(df.index)
+        if df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+        df.index = df.index.normalize()
+    except Exception as e:
+        logger.debug("[REQ-FIX-03] index normalize 실패 sym=%s err=%s", sym, e)
+    if not df.index.is_unique:
+        df = df[~df.index.duplicated(keep="last")]
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
+
+
 def simulate(
     symbols: list[str],
     strategy_id: str,
@@ -132,11 +281,14 @@ def simulate(
     tax_rate: float = 0.0023,
     slippage: float = 0.001,
     params: Optional[dict] = None,
+    data: Optional[dict[str, pd.DataFrame]] = None,
 ) -> SimulationResult:
     """4개 전략 + 포트폴리오 균등 배분 일봉 시뮬레이션.
 
     매수: target × (1+slippage), 수수료=매수액×commission_rate
     매도: target × (1-slippage), 수수료=매도액×commission_rate, 세금=매도액×tax_rate
+
+    data: `load_symbol_data()` 결과를 재사용할 때 전달 (없는 종목은 failures).
     """
     if not symbols:
         raise ValueError("symbols 비어있음")
@@ -151,24 +303,11 @@ def simulate(
         eff_params.update({k: v for k, v in params.items() if v is not None})
 
     # 1. 종목별 OHLCV fetch
-    loader = DataLoader(market=market)
-    failures: list[str] = []
-    symbol_data: dict[str, pd.DataFrame] = {}
-    history_buffer = max(strategy.required_history_days() + 20, 80)
-    for sym in symbols:
-        df = loader.load(sym, start, end, history_buffer_days=history_buffer)
-        if df is None or df.empty:
-            failures.append(sym)
-            continue
-        # REQ-FIX-03: tz/시간 컴포넌트 정규화 — 모든 인덱스를 naive midnight 으로 통일.
-        # 외부 mock/직접 주입 데이터(시간 포함, tz-aware) 들어와도 _idx_for() 가 안전하게 매칭.
-        try:
-            if df.index.tz is not None:
-                df.index = df.index.tz_localize(None)
-            df.index = df.index.normalize()
-        except Exception as e:
-            logger.debug("[REQ-FIX-03] index normalize 실패 sym=%s err=%s", sym, e)
-        symbol_data[sym] = df
+    if data is None:
+        symbol_data, failures = load_symbol_data(symbols, strategy, market, start, end)
+    else:
+        symbol_data = {sym: data[sym] for sym in symbols if sym in data}
+        failures = [sym for sym in symbols if sym not in data]
 
     if not symbol_data:
         return SimulationResult(
@@ -180,15 +319,14 @@ def simulate(
             failures=failures,
         )
 
-    # 2. 거래일 = start ≤ d ≤ end 인 모든 종목 합집합
-    all_dates: set[date] = set()
-    for df in symbol_data.values():
-        for ts in df.index:
-            d = ts.date() if hasattr(ts, "date") else ts
-            if start <= d <= end:
-                all_dates.add(d)
-    trading_days = sorted(all_dates)
-    if not trading_days:
+    # 1-1. 종목별 신호/청산 배열 사전 계산 (전 구간 벡터 연산 1회)
+    signals: dict[str, Precomputed] = {
+        sym: strategy.precompute(df, eff_params) for sym, df in symbol_data.items()
+    }
+
+    # 2. 거래일 = start ≤ d ≤ end 인 모든 종목 합집합 → (종목, 거래일) dense 배열
+    panel = align_panel(symbol_data, start, end)
+    if not panel.days:
         return SimulationResult(
             equity_curve=[],
             trades=[],
@@ -214,30 +352,27 @@ def simulate(
         for s in symbol_data.keys()
     }
 
-    # 종목별 idx 추적 (trading day → df 행 매핑)
-    # REQ-FIX-03: pd.Timestamp(d).normalize() 로 검색 + None 반환 시 debug 로그 (silent skip 가시화)
-    def _idx_for(df: pd.DataFrame, d: date) -> Optional[int]:
-        try:
-            ts = pd.Timestamp(d).normalize()
-            if ts in df.index:
-                return df.index.get_loc(ts)
-        except Exception as e:
-            logger.debug("[REQ-FIX-03] _idx_for 예외 d=%s err=%s", d, e)
-            return None
-        logger.debug("[REQ-FIX-03] _idx_for 매칭 실패 d=%s (skip)", d)
-        return None
+    # REQ-FIX-03: 거래일 축에 봉이 없는 날은 해당 종목 평가 skip — 종목별 1회 debug 로그
+    for sym, n_missing in zip(panel.symbols, (~panel.valid).sum(axis=1)):
+        if n_missing:
+            logger.debug("[REQ-FIX-03] 거래일 봉 누락 sym=%s days=%d (skip)", sym, n_missing)
 
-    for d in trading_days:
+    # 종목 → 패널 행, 거래일 축 매수 신호 (S, T)
+    sym_row = {sym: k for k, sym in enumerate(panel.symbols)}
+    rows = panel.rows
+    entry_grid = panel.gather([signals[sym].entry for sym in panel.symbols], False)
+
+    for t, d in enumerate(panel.days):
         # ── (a) Exit 평가 ──────────────────────────────────────────────
         to_close: list[tuple[str, ExitSignal]] = []
         for sym, pos in list(state.positions.items()):
-            df = symbol_data.get(sym)
-            if df is None:
+            k = sym_row.get(sym)
+            if k is None:
                 continue
-            i = _idx_for(df, d)
-            if i is None:
+            i = int(rows[k, t])
+            if i < 0:
                 continue
-            exit_sig = strategy.check_exit(df, i, pos, eff_params)
+            exit_sig = strategy.exit_at(signals[sym], i, pos, eff_params)
             if exit_sig is not None:
                 to_close.append((sym, exit_sig))
 
@@ -245,51 +380,18 @@ def simulate(
             pos = state.get_position(sym)
             if pos is None:
                 continue
-            sell_unit = _apply_sell_costs(exit_sig.price, slippage)
-            gross_proceeds = sell_unit * pos.qty
-            commission = gross_proceeds * commission_rate
-            tax = gross_proceeds * tax_rate
-            net_proceeds = gross_proceeds - commission - tax
-            entry_cost_unit = pos.entry_price  # buy_unit (slippage 이미 반영된 단가)
-            pnl = net_proceeds - entry_cost_unit * pos.qty
-            pnl_pct = (
-                (sell_unit - entry_cost_unit) / entry_cost_unit * 100.0
-                if entry_cost_unit > 0
-                else 0.0
+            sell_unit, net_proceeds = _close_trade(
+                pos, exit_sig, d, slippage, commission_rate, tax_rate, trades, per_symbol_contribution,
             )
             state.close_position(sym, exit_date=d, exit_price=sell_unit, proceeds=net_proceeds)
-            trades.append(
-                {
-                    "symbol": sym,
-                    "entry_date": pos.entry_date.isoformat(),
-                    "entry_price": entry_cost_unit,
-                    "exit_date": d.isoformat(),
-                    "exit_price": sell_unit,
-                    "qty": pos.qty,
-                    "pnl": pnl,
-                    "pnl_pct": pnl_pct,
-                    "exit_reason": exit_sig.reason,
-                }
-            )
-            agg = per_symbol_contribution.setdefault(sym, {"symbol": sym, "trades": 0,
-                                                            "realized_pnl": 0.0,
-                                                            "wins": 0, "losses": 0})
-            agg["trades"] += 1
-            agg["realized_pnl"] += pnl
-            if pnl > 0:
-                agg["wins"] += 1
-            elif pnl < 0:
-                agg["losses"] += 1
 
         # ── (b) Entry 후보 수집 ────────────────────────────────────────
         candidates: list[tuple[str, EntrySignal]] = []
-        for sym, df in symbol_data.items():
+        for k in np.flatnonzero(entry_grid[:, t]):
+            sym = panel.symbols[k]
             if state.has_position(sym):
                 continue
-            i = _idx_for(df, d)
-            if i is None:
-                continue
-            sig = strategy.check_entry(df, i, eff_params)
+            sig = signals[sym].entry_at(int(rows[k, t]))
             if sig is not None:
                 candidates.append((sym, sig))
 
@@ -303,50 +405,19 @@ def simulate(
                 # 종목당 자금 = 현재 cash / 매수할 종목 수 (균등 배분)
                 per_symbol_budget = state.cash / num_to_buy if num_to_buy > 0 else 0.0
                 for sym, entry_sig in buy_targets:
-                    buy_unit = _apply_buy_costs(entry_sig.price, slippage, commission_rate)
-                    if buy_unit <= 0:
-                        continue
-                    # 수수료를 고려한 종목당 가능 수량 = budget / (buy_unit × (1+commission))
-                    qty = math.floor(
-                        per_symbol_budget / (buy_unit * (1.0 + commission_rate))
-                    )
-                    if qty <= 0:
-                        continue
-                    cost = buy_unit * qty
-                    commission = cost * commission_rate
-                    total_cost = cost + commission
-                    if total_cost > state.cash + 1e-6:
-                        continue
-                    pos = Position(
-                        symbol=sym,
-                        entry_date=d,
-                        entry_price=buy_unit,
-                        qty=qty,
-                        extra={},
-                    )
-                    state.open_position(pos, cost=total_cost)
-                    trades.append(
-                        {
-                            "symbol": sym,
-                            "entry_date": d.isoformat(),
-                            "entry_price": buy_unit,
-                            "exit_date": None,
-                            "exit_price": None,
-                            "qty": qty,
-                            "pnl": None,
-                            "pnl_pct": None,
-                            "exit_reason": None,
-                            "side": "buy",
-                        }
+                    opened = _open_position(
+                        sym, entry_sig, d, per_symbol_budget, state.cash,
+                        slippage, commission_rate, trades,
                     )
+                    if opened is not None:
+                        state.open_position(opened[0], cost=opened[1])
 
         # ── (d) MTM 평가 ──────────────────────────────────────────────
         mtm: dict[str, float] = {}
         for sym, pos in state.positions.items():
-            df = symbol_data.get(sym)
-            i = _idx_for(df, d) if df is not None else None
-            if i is not None:
-                mtm[sym] = float(df["close"].iloc[i])
+            k = sym_row.get(sym)
+            if k is not None and panel.valid[k, t]:
+                mtm[sym] = float(panel.close[k, t])
             else:
                 mtm[sym] = pos.entry_price
         eq = state.equity(mtm)
@@ -0,0 +1,213 @@
+"""몬테카를로 부트스트랩 — 일별 수익률·청산 거래 재표본으로 메트릭 분포/신뢰구간 + 파산 확률.
+
+`metrics.compute_metrics`는 실현된 경로 1개의 점추정만 준다. 여기서는 같은 결과를
+복원 추출로 `n_paths`번 재구성해 CAGR/MDD/Sharpe 분포를 만든다.
+
+  - daily:  일별 수익률 N개를 복원 추출해 길이 N 경로 생성 (순서·군집 정보는 버림)
+  - trades: 청산 거래 M개의 자본 대비 수익률(pnl / 진입일 평가액)을 복원 추출해 순차 복리
+
+경로 행렬 (P, N)은 청크 단위로 만들어 메모리를 `_CHUNK_CELLS` 셀 이내로 묶는다.
+모든 계산은 로그 누적합(`log1p` → `cumsum`) 기반 NumPy 벡터 연산 — 10,000 경로 × 5년 일봉 1초 미만.
+
+단위는 `compute_metrics`와 동일: cagr/total_return_pct/max_drawdown은 %(MDD는 음수), sharpe는 연환산(252).
+risk_of_ruin: 경로 중 평가액이 한 번이라도 `ruin_level × 초기 자본` 이하로 떨어진 비율.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+from config import LOCAL_BACKTEST_MC_PATHS, LOCAL_BACKTEST_MC_RUIN_LEVEL
+
+# 청크당 경로 행렬 셀 수 상한 (float64 기준 ~16MB)
+_CHUNK_CELLS = 2_000_000
+_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _years(equity_curve: list[dict]) -> Optional[float]:
+    """compute_metrics CAGR과 같은 기간 (첫~마지막 평가일 달력일 / 365.25)."""
+    try:
+        first = date.fromisoformat(str(equity_curve[0]["date"])[:10])
+        last = date.fromisoformat(str(equity_curve[-1]["date"])[:10])
+    except (KeyError, IndexError, ValueError):
+        return None
+    days = (last - first).days
+    return days / 365.25 if days > 0 else None
+
+
+def _dist(x: np.ndarray, confidence: float) -> Optional[dict]:
+    """표본 → {mean, std, p5..p95, ci_low, ci_high}. 유한값 없으면 None."""
+    x = x[np.isfinite(x)]
+    if not len(x):
+        return None
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    q = np.percentile(x, [*_PERCENTILES, tail, 100.0 - tail])
+    out = {"mean": float(x.mean()), "std": float(x.std())}
+    out.update({f"p{p}": float(v) for p, v in zip(_PERCENTILES, q)})
+    out["ci_low"], out["ci_high"] = float(q[-2]), float(q[-1])
+    return out
+
+
+def _simulate_paths(
+    returns: np.ndarray,
+    start_ratio: float,
+    years: Optional[float],
+    n_paths: int,
+    rng: np.random.Generator,
+    ruin_log: float,
+    with_sharpe: bool,
+) -> dict[str, np.ndarray]:
+    """수익률 복원 추출 경로 → 경로별 (cagr, total_return, mdd, sharpe, ruin) 배열.
+
+    start_ratio: 경로 시작 평가액 / 초기 자본. ruin_log: log(파산 평가액 / 시작 평가액).
+    """
+    n = len(returns)
+    log_r = np.log1p(returns)
+    # 분산은 전체 평균으로 중심화한 값의 합·제곱합으로 (상쇄 오차 억제)
+    mu = float(returns.mean())
+    centered = returns - mu
+    final = np.empty(n_paths)
+    mdd = np.empty(n_paths)
+    sharpe = np.full(n_paths, np.nan)
+    ruin = np.zeros(n_paths, dtype=bool)
+
+    chunk = max(1, _CHUNK_CELLS // n)
+    for lo in range(0, n_paths, chunk):
+        hi = min(lo + chunk, n_paths)
+        idx = rng.integers(0, n, size=(hi - lo, n), dtype=np.int32)
+        cum = np.cumsum(log_r[idx], axis=1)
+        final[lo:hi] = cum[:, -1]
+        ruin[lo:hi] = np.minimum(cum.min(axis=1), 0.0) <= ruin_log
+        peak = np.maximum.accumulate(cum, axis=1)
+        np.maximum(peak, 0.0, out=peak)
+        np.subtract(cum, peak, out=peak)
+        mdd[lo:hi] = np.minimum(peak.min(axis=1), 0.0)
+        if with_sharpe and n > 1:
+            # 표본 평균/분산을 합·제곱합으로 (std 2-pass 대비 절반 시간)
+            s = centered[idx]
+            mean = s.sum(axis=1) / n
+            var = (np.einsum("ij,ij->i", s, s) - n * mean * mean) / (n - 1)
+            std = np.sqrt(np.maximum(var, 0.0))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sharpe[lo:hi] = np.where(std > 1e-12, (mean + mu) / std * math.sqrt(252), np.nan)
+
+    growth = start_ratio * np.exp(final)
+    if years:
+        cagr = (growth ** (1.0 / years) - 1.0) * 100.0
+    else:
+        cagr = np.full(n_paths, np.nan)
+    return {
+        "cagr": cagr,
+        "total_return_pct": (growth - 1.0) * 100.0,
+        "max_drawdown": np.expm1(mdd) * 100.0,
+        "sharpe_ratio": sharpe,
+        "ruin": ruin,
+    }
+
+
+def _ruin_log(initial_capital: float, start_equity: float, ruin_level: float) -> float:
+    level = ruin_level * initial_capital
+    if level <= 0 or start_equity <= 0:
+        return -math.inf
+    return math.log(level / start_equity)
+
+
+def bootstrap_daily(
+    equity_curve: list[dict],
+    initial_capital: float,
+    n_paths: int = LOCAL_BACKTEST_MC_PATHS,
+    seed: Optional[int] = None,
+    confidence: float = 0.95,
+    ruin_level: float = LOCAL_BACKTEST_MC_RUIN_LEVEL,
+) -> Optional[dict]:
+    """일별 수익률 부트스트랩 → {cagr, max_drawdown, sharpe_ratio, total_return_pct: 분포, risk_of_ruin, days}.
+
+    수익률이 2개 미만이면 None.
+    """
+    eq = np.asarray([float(p["equity"]) for p in equity_curve], dtype=np.float64)
+    if len(eq) < 3 or initial_capital <= 0 or (eq <= 0).any():
+        return None
+    returns = eq[1:] / eq[:-1] - 1.0
+    paths = _simulate_paths(
+        returns, eq[0] / initial_capital, _years(equity_curve), n_paths,
+        np.random.default_rng(seed), _ruin_log(initial_capital, eq[0], ruin_level), True,
+    )
+    return {
+        "days": int(len(returns)),
+        "cagr": _dist(paths["cagr"], confidence),
+        "total_return_pct": _dist(paths["total_return_pct"], confidence),
+        "max_drawdown": _dist(paths["max_drawdown"], confidence),
+        "sharpe_ratio": _dist(paths["sharpe_ratio"], confidence),
+        "risk_of_ruin": float(paths["ruin"].mean()),
+    }
+
+
+def trade_returns(trades: list[dict], equity_curve: list[dict], initial_capital: float) -> np.ndarray:
+    """청산 거래 → 자본 대비 수익률 (pnl / 진입일 평가액, 평가액 없으면 초기 자본)."""
+    equity_by_date = {str(p["date"])[:10]: float(p["equity"]) for p in equity_curve}
+    out = []
+    for t in trades:
+        if not t.get("exit_date") or t.get("pnl") is None:
+            continue
+        base = equity_by_date.get(str(t.get("entry_date"))[:10]) or initial_capital
+        out.append(float(t["pnl"]) / base)
+    return np.asarray(out, dtype=np.float64)
+
+
+def bootstrap_trades(
+    trades: list[dict],
+    equity_curve: list[dict],
+    initial_capital: float,
+    n_paths: int = LOCAL_BACKTEST_MC_PATHS,
+    seed: Optional[int] = None,
+    confidence: float = 0.95,
+    ruin_level: float = LOCAL_BACKTEST_MC_RUIN_LEVEL,
+) -> Optional[dict]:
+    """청산 거래 순서 재표본 → {cagr, total_return_pct, max_drawdown: 분포, risk_of_ruin, trades}.
+
+    거래 순서가 바뀌면 최종 수익은 같아도 낙폭/파산 위험이 달라진다 (복원 추출이라 최종 수익도 분포).
+    청산 거래가 2건 미만이거나 -100% 이하 거래가 있으면 None.
+    """
+    r = trade_returns(trades, equity_curve, initial_capital)
+    if len(r) < 2 or initial_capital <= 0 or (r <= -1.0).any():
+        return None
+    paths = _simulate_paths(
+        r, 1.0, _years(equity_curve) if equity_curve else None, n_paths,
+        np.random.default_rng(seed), _ruin_log(initial_capital, initial_capital, ruin_level), False,
+    )
+    return {
+        "trades": int(len(r)),
+        "cagr": _dist(paths["cagr"], confidence),
+        "total_return_pct": _dist(paths["total_return_pct"], confidence),
+        "max_drawdown": _dist(paths["max_drawdown"], confidence),
+        "risk_of_ruin": float(paths["ruin"].mean()),
+    }
+
+
+def monte_carlo(
+    equity_curve: list[dict],
+    trades: list[dict],
+    initial_capital: float,
+    n_paths: int = LOCAL_BACKTEST_MC_PATHS,
+    seed: Optional[int] = None,
+    confidence: float = 0.95,
+    ruin_level: float = LOCAL_BACKTEST_MC_RUIN_LEVEL,
+) -> Optional[dict]:
+    """SimulationResult(equity_curve, trades) → 일별/거래 부트스트랩 요약. n_paths ≤ 0이면 None (비활성)."""
+    if n_paths <= 0:
+        return None
+    rng = np.random.default_rng(seed)
+    daily_seed, trade_seed = (int(s) for s in rng.integers(0, 2**63 - 1, size=2))
+    return {
+        "n_paths": int(n_paths),
+        "confidence": confidence,
+        "ruin_level": ruin_level,
+        "daily": bootstrap_daily(equity_curve, initial_capital, n_paths, daily_seed,
+                                 confidence, ruin_level),
+        "trades": bootstrap_trades(trades, equity_curve, initial_capital, n_paths, trade_seed,
+                                   confidence, ruin_level),
+    }
@@ -0,0 +1,93 @@
+"""종목별 일봉 → 공통 거래일 축 정렬 패널 (dense NumPy 배열 + 유효 마스크).
+
+엔진 일 루프에서 종목×거래일마다 `pd.Timestamp` 생성 + `df.index.get_loc` 하던
+날짜→행 매핑을 시작 시 1회 `get_indexer`로 끝낸다. 루프는 정수 인덱싱만 한다.
+
+배열 모양은 모두 (종목 S, 거래일 T):
+  - rows:  종목 df의 행 번호 (해당 거래일 봉 없음 = -1)
+  - valid: rows >= 0
+  - open/high/low/close/volume: float64, 봉 없음 = NaN
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class AlignedPanel:
+    symbols: list[str]
+    days: list[date]
+    rows: np.ndarray
+    valid: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def gather(self, per_symbol: list[np.ndarray], fill) -> np.ndarray:
+        """종목별 행 배열(df 행 기준) → (S, T) 거래일 축 배열. 봉 없는 칸은 fill."""
+        first = per_symbol[0] if per_symbol else np.empty(0)
+        out = np.full(self.rows.shape, fill, dtype=np.result_type(first, np.asarray(fill)))
+        for k, arr in enumerate(per_symbol):
+            r = self.rows[k]
+            m = self.valid[k]
+            out[k, m] = arr[r[m]]
+        return out
+
+
+def align_panel(
+    symbol_data: dict[str, pd.DataFrame], start: date, end: date
+) -> AlignedPanel:
+    """start ≤ d ≤ end 거래일 합집합 축으로 정렬.
+
+    인덱스는 naive 자정(`normalize`) + 오름차순·중복 없음 전제 (엔진 적재 단계에서 보장).
+    """
+    symbols = list(symbol_data)
+    axis, rows = align_indexes([df.index for df in symbol_data.values()], start, end)
+
+    s, t = rows.shape
+    dense = {f: np.full((s, t), np.nan) for f in _FIELDS}
+    for k, df in enumerate(symbol_data.values()):
+        r = rows[k]
+        m = r >= 0
+        for f in _FIELDS:
+            if f in df.columns:
+                dense[f][k, m] = df[f].to_numpy(dtype=np.float64)[r[m]]
+    return AlignedPanel(
+        symbols=symbols,
+        days=[ts.date() for ts in axis],
+        rows=rows,
+        valid=rows >= 0,
+        **dense,
+    )
+
+
+def align_indexes(
+    indexes: list, start: date, end: date
+) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    """종목별 인덱스 → (start ≤ d ≤ end 합집합 축, (S, T) 행 번호 배열; 봉 없음 -1).
+
+    OHLCV 없이 인덱스만 받으므로 DataFrame을 버린 뒤(유니버스 적재)에도 사용할 수 있다.
+    """
+    lo, hi = pd.Timestamp(start), pd.Timestamp(end)
+    if indexes:
+        stamps = np.unique(np.concatenate([pd.DatetimeIndex(ix).values for ix in indexes]))
+    else:
+        stamps = np.empty(0, dtype="datetime64[ns]")
+    axis = pd.DatetimeIndex(stamps)
+    axis = axis[(axis >= lo) & (axis <= hi)]
+    rows = np.full((len(indexes), len(axis)), -1, dtype=np.int64)
+    for k, ix in enumerate(indexes):
+        rows[k] = pd.DatetimeIndex(ix).get_indexer(axis)
+    return axis, rows
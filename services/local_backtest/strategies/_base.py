@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -37,6 +38,49 @@ class Position:
     extra: dict = field(default_factory=dict)  # 전략별 메타(예: long_tail의 +29% 도달 여부)
 
 
+@dataclass
+class Precomputed:
+    """종목 1개 전 구간 사전 계산 결과 — 엔진 루프는 이 배열만 읽는다.
+
+    - entry / entry_price: 행별 매수 신호(bool) / 체결가(신호 없으면 NaN)
+    - cols: 청산 평가용 행 배열 (open/high/low/close + 전략별 채널·전일값 등)
+    - dates: 행별 `date` (진입봉 판별용)
+    """
+
+    df: pd.DataFrame
+    entry: np.ndarray
+    entry_price: np.ndarray
+    entry_reason: str
+    cols: dict[str, np.ndarray]
+    dates: list[date]
+
+    def entry_at(self, idx: int) -> Optional[EntrySignal]:
+        if 0 <= idx < len(self.entry) and self.entry[idx]:
+            return EntrySignal(price=float(self.entry_price[idx]), reason=self.entry_reason)
+        return None
+
+
+def ohlcv_arrays(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """open/high/low/close(+volume) float64 배열 + prev_close(첫 행 NaN)."""
+    cols = {
+        c: df[c].to_numpy(dtype=np.float64)
+        for c in ("open", "high", "low", "close", "volume")
+        if c in df.columns
+    }
+    prev_close = np.empty_like(cols["close"])
+    prev_close[:1] = np.nan
+    prev_close[1:] = cols["close"][:-1]
+    cols["prev_close"] = prev_close
+    return cols
+
+
+def row_dates(df: pd.DataFrame) -> list[date]:
+    if isinstance(df.index, pd.DatetimeIndex):
+        # Timestamp 개별 생성 없이 일괄 변환 (유니버스 수백 종목 적재 시 지배 비용)
+        return df.index.date.tolist()
+    return [ts.date() if hasattr(ts, "date") else ts for ts in df.index]
+
+
 class Strategy(ABC):
     """전략 추상 베이스.
 
@@ -46,6 +90,12 @@ class Strategy(ABC):
       - required_history_days(): 시그널 계산에 필요한 최소 과거 일수
       - check_entry(df, idx, params): idx일 매수 여부
       - check_exit(df, idx, position, params): idx일 청산 여부 (손절 우선)
+
+    엔진 경로 (벡터화):
+      - precompute(df, params): 전 구간 매수 신호 + 청산용 배열 1회 계산
+      - exit_at(pre, idx, position, params): 배열만 읽는 O(1) 청산 평가
+    check_entry/check_exit는 단일 행 평가(기준 구현)이며 precompute와 결과가 동일해야 한다.
+    기본 precompute/exit_at은 행 API로 위임하므로 신규 전략은 행 API만 구현해도 동작한다.
     """
 
     id: str = ""
@@ -65,3 +115,23 @@ class Strategy(ABC):
         self, df: pd.DataFrame, idx: int, position: Position, params: dict
     ) -> Optional[ExitSignal]:
         """idx일 청산 평가. 손절가 도달 시 손절가 우선 체결."""
+
+    def precompute(self, df: pd.DataFrame, params: dict) -> Precomputed:
+        """전 구간 매수 신호 사전 계산. 기본 구현은 check_entry 행 루프 (벡터화 전략은 재정의)."""
+        n = len(df)
+        entry = np.zeros(n, dtype=bool)
+        entry_price = np.full(n, np.nan)
+        reason = "entry"
+        for i in range(n):
+            sig = self.check_entry(df, i, params)
+            if sig is not None:
+                entry[i] = True
+                entry_price[i] = sig.price
+                reason = sig.reason
+        return Precomputed(df, entry, entry_price, reason, ohlcv_arrays(df), row_dates(df))
+
+    def exit_at(
+        self, pre: Precomputed, idx: int, position: Position, params: dict
+    ) -> Optional[ExitSignal]:
+        """사전 계산 배열 기반 청산 평가. 기본 구현은 check_exit 위임."""
+        return self.check_exit(pre.df, idx, position, params)
@@ -15,13 +15,17 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from services.local_backtest.strategies._base import (
     EntrySignal,
     ExitSignal,
     Position,
+    Precomputed,
     Strategy,
+    ohlcv_arrays,
+    row_dates,
 )
 
 
@@ -119,3 +123,55 @@ class DonchianSwingStrategy(Strategy):
         if today_close <= prev_low_min:
             return ExitSignal(price=today_close, reason="channel_break")
         return None
+
+    # ── 벡터화 경로 ─────────────────────────────────────────────────────────
+
+    def precompute(self, df: pd.DataFrame, params: dict) -> Precomputed:
+        ch = params.get("channel_period", 20)
+        ema_p = params.get("ema_period", 60)
+        ema_w = params.get("ema_change_window", 5)
+        vol_f = params.get("volume_factor", 1.5)
+        gap_max = params.get("gap_max", 0.03)
+
+        cols = ohlcv_arrays(df)
+        n = len(df)
+        close, open_, prev_close = cols["close"], cols["open"], cols["prev_close"]
+
+        # 직전 ch일(idx-ch ~ idx-1) 채널 / 평균 거래량 → rolling 후 1봉 shift
+        channel_high = pd.Series(cols["high"]).rolling(ch).max().shift(1).to_numpy()
+        channel_low = pd.Series(cols["low"]).rolling(ch).min().shift(1).to_numpy()
+        avg_volume = pd.Series(cols["volume"]).rolling(ch).mean().shift(1).to_numpy()
+        cols["channel_low"] = channel_low
+
+        ema = _ema(df["close"].astype(float), ema_p).to_numpy()
+        ema_prev = np.full(n, np.nan)
+        if ema_w < n:
+            ema_prev[ema_w:] = ema[:n - ema_w]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gap_block = (prev_close > 0) & ((open_ - prev_close) / prev_close >= gap_max)
+            entry = (
+                (np.arange(n) >= max(ch, ema_p) + ema_w)
+                & (close > channel_high)
+                & (ema_prev > 0)
+                & ((ema - ema_prev) / ema_prev >= 0)
+                & (avg_volume > 0)
+                & (cols["volume"] >= avg_volume * vol_f)
+                & ~gap_block
+            )
+        return Precomputed(
+            df, entry, np.where(entry, close, np.nan), "donchian_breakout", cols, row_dates(df)
+        )
+
+    def exit_at(
+        self, pre: Precomputed, idx: int, position: Position, params: dict
+    ) -> Optional[ExitSignal]:
+        if idx < params.get("channel_period", 20) or idx >= len(pre.entry):
+            return None
+        today_close = float(pre.cols["close"][idx])
+        stop_price = position.entry_price * params.get("stop_loss_pct", 0.93)
+        if today_close <= stop_price:
+            return ExitSignal(price=today_close, reason="stop_loss")
+        if today_close <= pre.cols["channel_low"][idx]:
+            return ExitSignal(price=today_close, reason="channel_break")
+        return None
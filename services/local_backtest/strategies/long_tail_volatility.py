@@ -15,15 +15,22 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from services.local_backtest.strategies._base import (
     EntrySignal,
     ExitSignal,
     Position,
+    Precomputed,
     Strategy,
+    ohlcv_arrays,
+    row_dates,
+)
+from services.local_backtest.strategies.volatility_breakout import (
+    _compute_target,
+    _compute_targets,
 )
-from services.local_backtest.strategies.volatility_breakout import _compute_target
 
 
 class LongTailVolatilityStrategy(Strategy):
@@ -108,3 +115,47 @@ class LongTailVolatilityStrategy(Strategy):
             if today_low <= stop_price:
                 return ExitSignal(price=stop_price, reason="stop_loss_next_day")
             return ExitSignal(price=today_close, reason="close_next_day")
+
+    # ── 벡터화 경로 ─────────────────────────────────────────────────────────
+
+    def precompute(self, df: pd.DataFrame, params: dict) -> Precomputed:
+        cols = ohlcv_arrays(df)
+        target = _compute_targets(cols, params.get("k_window", 20))
+        close, prev_close = cols["close"], cols["prev_close"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rise = (close - prev_close) / prev_close
+            entry = (
+                (cols["high"] >= target)
+                & (prev_close > 0)
+                & (rise >= params.get("rise_filter", 0.03))
+            )
+        return Precomputed(
+            df, entry, np.where(entry, target, np.nan), "long_tail_breakout", cols, row_dates(df)
+        )
+
+    def exit_at(
+        self, pre: Precomputed, idx: int, position: Position, params: dict
+    ) -> Optional[ExitSignal]:
+        if idx < 0 or idx >= len(pre.entry):
+            return None
+        cols = pre.cols
+        today_low = float(cols["low"][idx])
+
+        if position.entry_date == pre.dates[idx]:
+            stop_price = position.entry_price * params.get("stop_loss_same_day", 0.97)
+            if today_low <= stop_price:
+                return ExitSignal(price=stop_price, reason="stop_loss")
+            prev_close = cols["prev_close"][idx]
+            if idx >= 1 and prev_close > 0 and cols["high"][idx] >= prev_close * (
+                1 + params.get("spike_threshold", 0.29)
+            ):
+                position.extra["spike_today"] = True
+                return None
+            return ExitSignal(price=float(cols["close"][idx]), reason="close_same_day")
+
+        stop_price = position.entry_price * params.get("stop_loss_next_day", 0.95)
+        if today_low <= stop_price:
+            return ExitSignal(price=stop_price, reason="stop_loss_next_day")
+        if position.extra.get("spike_today"):
+            return ExitSignal(price=float(cols["open"][idx]), reason="next_open_after_spike")
+        return ExitSignal(price=float(cols["close"][idx]), reason="close_next_day")
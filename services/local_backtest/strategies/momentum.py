@@ -12,13 +12,17 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from services.local_backtest.strategies._base import (
     EntrySignal,
     ExitSignal,
     Position,
+    Precomputed,
     Strategy,
+    ohlcv_arrays,
+    row_dates,
 )
 
 
@@ -69,3 +73,27 @@ class MomentumStrategy(Strategy):
             return ExitSignal(price=stop_price, reason="stop_loss")
         # 그 외 익일 시가 매도
         return ExitSignal(price=next_open, reason="next_open")
+
+    # ── 벡터화 경로 ─────────────────────────────────────────────────────────
+
+    def precompute(self, df: pd.DataFrame, params: dict) -> Precomputed:
+        cols = ohlcv_arrays(df)
+        close, prev_close = cols["close"], cols["prev_close"]
+        rise_thr = params.get("rise_threshold", 0.29)
+        limit_thr = params.get("limit_up_threshold", 0.30)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rise = (close - prev_close) / prev_close
+            entry = (prev_close > 0) & (rise >= rise_thr) & (close < prev_close * (1 + limit_thr))
+        return Precomputed(
+            df, entry, np.where(entry, close, np.nan), "rise_29pct", cols, row_dates(df)
+        )
+
+    def exit_at(
+        self, pre: Precomputed, idx: int, position: Position, params: dict
+    ) -> Optional[ExitSignal]:
+        if idx < 0 or idx >= len(pre.entry):
+            return None
+        stop_price = position.entry_price * params.get("stop_loss_pct", 0.925)
+        if pre.cols["low"][idx] <= stop_price:
+            return ExitSignal(price=stop_price, reason="stop_loss")
+        return ExitSignal(price=float(pre.cols["open"][idx]), reason="next_open")
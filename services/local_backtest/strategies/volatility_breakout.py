@@ -18,13 +18,17 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from services.local_backtest.strategies._base import (
     EntrySignal,
     ExitSignal,
     Position,
+    Precomputed,
     Strategy,
+    ohlcv_arrays,
+    row_dates,
 )
 
 
@@ -64,6 +68,39 @@ def _compute_target(df: pd.DataFrame, idx: int, k_window: int = 20) -> Optional[
     return target
 
 
+def _compute_targets(cols: dict[str, np.ndarray], k_window: int = 20) -> np.ndarray:
+    """`_compute_target` 전 구간 벡터판 — 행별 타겟가 (계산 불가 행은 NaN).
+
+    K20 합산은 윈도 내 오프셋 순서대로 누적(k회 배열 덧셈)해 행 구현의
+    `sum(noise_ratios)`와 동일한 부동소수 결과를 낸다. 도지(Range=0)는 0을 더하고 개수에서 제외.
+    """
+    o, h, l, c = cols["open"], cols["high"], cols["low"], cols["close"]
+    n = len(o)
+    targets = np.full(n, np.nan)
+    if n <= k_window or k_window <= 0:
+        return targets
+
+    rng = h - l
+    valid = rng > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        noise = np.where(valid, 1.0 - np.abs(c - o) / rng, 0.0)
+
+    m = n - k_window
+    acc = np.zeros(m)
+    cnt = np.zeros(m)
+    for j in range(k_window):
+        acc += noise[j:j + m]
+        cnt += valid[j:j + m]
+
+    today_open = o[k_window:]
+    prev_range = rng[k_window - 1:n - 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k20 = acc / cnt
+        ok = (cnt > 0) & (today_open > 0) & (prev_range > 0)
+        targets[k_window:] = np.where(ok, today_open + prev_range * k20, np.nan)
+    return targets
+
+
 class VolatilityBreakoutStrategy(Strategy):
     id = "volatility_breakout"
     default_params = {
@@ -101,3 +138,23 @@ class VolatilityBreakoutStrategy(Strategy):
             return ExitSignal(price=stop_price, reason="stop_loss")
         # 당일 종가 강제 청산
         return ExitSignal(price=today_close, reason="close_same_day")
+
+    # ── 벡터화 경로 ─────────────────────────────────────────────────────────
+
+    def precompute(self, df: pd.DataFrame, params: dict) -> Precomputed:
+        cols = ohlcv_arrays(df)
+        target = _compute_targets(cols, params.get("k_window", 20))
+        entry = cols["high"] >= target
+        return Precomputed(
+            df, entry, np.where(entry, target, np.nan), "vb_breakout", cols, row_dates(df)
+        )
+
+    def exit_at(
+        self, pre: Precomputed, idx: int, position: Position, params: dict
+    ) -> Optional[ExitSignal]:
+        if idx < 0 or idx >= len(pre.entry):
+            return None
+        stop_price = position.entry_price * params.get("stop_loss_pct", 0.97)
+        if pre.cols["low"][idx] <= stop_price:
+            return ExitSignal(price=stop_price, reason="stop_loss")
+        return ExitSignal(price=float(pre.cols["close"][idx]), reason="close_same_day")
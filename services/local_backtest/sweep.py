@@ -0,0 +1,285 @@
+"""파라미터 스윕 — 프리셋 1개 × 파라미터 조합 N개를 프로세스 풀로 병렬 시뮬레이션.
+
+흐름:
+  1) `build_param_sets` — 그리드(곱집합) 또는 `param_schema` 범위 랜덤 샘플 → 조합 리스트
+  2) `run_sweep` — OHLCV 1회 적재(`engine.load_symbol_data`) → 워커 초기화 시 1회 전달
+     → 조합별 `simulate(data=...)` → 완료 순서대로 `on_progress(ranking, done, total)` 콜백
+
+워커는 메트릭만 반환한다 (equity_curve/trades는 순위표에 불필요 — IPC 비용 절감).
+프로세스 풀 실행(`run_pool`)은 워크포워드(`walkforward.py`)와 공유한다.
+순위: `rank_by` 메트릭 내림차순 (max_drawdown은 음수이므로 내림차순 = 낙폭 작은 순),
+None은 마지막, 동률은 조합 순서 유지.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Optional
+
+import pandas as pd
+
+from config import LOCAL_BACKTEST_SWEEP_MAX_RUNS, LOCAL_BACKTEST_SWEEP_WORKERS
+from services.local_backtest.engine import load_symbol_data, simulate
+from services.local_backtest.presets import get_preset
+from services.local_backtest.strategies import get_strategy
+
+logger = logging.getLogger(__name__)
+
+RANK_METRICS = (
+    "sharpe_ratio",
+    "sortino_ratio",
+    "cagr",
+    "total_return_pct",
+    "max_drawdown",
+    "win_rate",
+    "profit_factor",
+)
+
+
+@dataclass
+class SweepResult:
+    ranking: list[dict]
+    total_runs: int
+    failures: list[str] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+
+
+# ── 조합 생성 ─────────────────────────────────────────────────────────────
+
+def expand_grid(grid: dict[str, list]) -> list[dict]:
+    """{"k_window": [10, 20], "stop_loss_pct": [0.95, 0.97]} → 4개 조합 (키 순서 = 입력 순서)."""
+    keys = list(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+def _sample_value(spec: dict, rnd: random.Random):
+    lo, hi = spec["min"], spec["max"]
+    step = spec.get("step") or (1 if spec.get("type") == "integer" else 0)
+    if spec.get("type") == "integer":
+        return rnd.randrange(int(lo), int(hi) + 1, int(step) or 1)
+    if step:
+        n = int(round((hi - lo) / step))
+        return round(lo + step * rnd.randint(0, n), 6)
+    return rnd.uniform(lo, hi)
+
+
+def sample_params(
+    param_schema: dict[str, dict],
+    n: int,
+    seed: Optional[int] = None,
+    fixed: Optional[dict] = None,
+) -> list[dict]:
+    """`param_schema` min/max/step 격자에서 중복 없이 최대 n개 랜덤 샘플 (fixed 키는 고정값)."""
+    rnd = random.Random(seed)
+    fixed = fixed or {}
+    keys = [k for k in param_schema if k not in fixed]
+    out: list[dict] = []
+    seen: set[tuple] = set()
+    attempts = 0
+    while len(out) < n and attempts < n * 20:
+        attempts += 1
+        combo = {k: _sample_value(param_schema[k], rnd) for k in keys}
+        sig = tuple(combo[k] for k in keys)
+        if sig in seen:
+            continue
+        seen.add(sig)
+        out.append({**combo, **fixed})
+    return out
+
+
+def build_param_sets(
+    preset_id: str,
+    grid: Optional[dict[str, list]] = None,
+    samples: Optional[int] = None,
+    seed: Optional[int] = None,
+    max_runs: int = LOCAL_BACKTEST_SWEEP_MAX_RUNS,
+) -> list[dict]:
+    """프리셋 스키마 검증 후 조합 리스트.
+
+    grid만 → 곱집합, samples만 → 스키마 전체 범위 랜덤, 둘 다 → grid 값 후보 중 랜덤 samples개.
+
+    Raises:
+        KeyError: 알 수 없는 프리셋.
+        ValueError: 스키마에 없는 파라미터 / 빈 후보 / 조합 수 초과 / grid·samples 모두 없음.
+    """
+    schema = get_preset(preset_id).get("param_schema") or {}
+    if not grid and not samples:
+        raise ValueError("param_grid 또는 samples 중 하나는 필요합니다")
+    grid = grid or {}
+    unknown = [k for k in grid if k not in schema]
+    if unknown:
+        raise ValueError(f"{preset_id} 프리셋에 없는 파라미터: {', '.join(unknown)}")
+    empty = [k for k, v in grid.items() if not isinstance(v, (list, tuple)) or not v]
+    if empty:
+        raise ValueError(f"파라미터 후보가 비어 있습니다: {', '.join(empty)}")
+    if samples and samples > max_runs:
+        raise ValueError(f"samples {samples}개 — 최대 {max_runs}개까지 지원")
+
+    if grid and samples:
+        combos = expand_grid(grid)
+        random.Random(seed).shuffle(combos)
+        combos = combos[:samples]
+    elif grid:
+        combos = expand_grid(grid)
+    else:
+        combos = sample_params(schema, samples, seed)
+
+    if len(combos) > max_runs:
+        raise ValueError(f"조합 수 {len(combos)}개 — 최대 {max_runs}개까지 지원")
+    return combos
+
+
+# ── 순위 ──────────────────────────────────────────────────────────────────
+
+def rank_results(results: list[dict], rank_by: str = "sharpe_ratio") -> list[dict]:
+    """메트릭 내림차순 (None/NaN 마지막, 동률은 조합 index 순) + rank 부여. 입력 불변."""
+    def key(r):
+        v = (r.get("metrics") or {}).get(rank_by)
+        missing = v is None or v != v
+        return (missing, 0.0 if missing else -v, r["index"])
+
+    ranked = sorted(results, key=key)
+    return [{**r, "rank": i + 1} for i, r in enumerate(ranked)]
+
+
+# ── 실행 ──────────────────────────────────────────────────────────────────
+
+# 워커 프로세스 전역 — initializer가 1회 설정 (조합마다 OHLCV 재전송 방지)
+_worker_data: dict[str, pd.DataFrame] = {}
+_worker_kwargs: dict = {}
+
+
+def _init_worker(data: dict[str, pd.DataFrame], kwargs: dict) -> None:
+    global _worker_data, _worker_kwargs
+    _worker_data = data
+    _worker_kwargs = kwargs
+
+
+def _mp_context():
+    """워커 시작 방식 — fork 제외 (멀티스레드 웹 프로세스의 잡힌 잠금·스레드 로컬 연결 상속 방지)."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def run_pool(
+    fn: Callable[..., dict],
+    items: list[tuple],
+    data: dict[str, pd.DataFrame],
+    kwargs: dict,
+    workers: int,
+    collect: Callable[[dict], None],
+) -> None:
+    """items마다 `fn(*item)` 실행 → 결과를 완료 순서대로 `collect`에 전달.
+
+    data/kwargs는 워커 initializer로 1회 전달되고 fn은 모듈 전역 `_worker_data`/`_worker_kwargs`로
+    읽는다. workers == 1이면 호출 스레드에서 순차 실행 (프로세스 생성 없음).
+    """
+    if workers == 1:
+        _init_worker(data, kwargs)
+        try:
+            for item in items:
+                collect(fn(*item))
+        finally:
+            _init_worker({}, {})
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=_mp_context(),
+        initializer=_init_worker, initargs=(data, kwargs),
+    ) as pool:
+        futures = [pool.submit(fn, *item) for item in items]
+        for fut in as_completed(futures):
+            collect(fut.result())
+
+
+def _run_one(index: int, params: dict) -> dict:
+    try:
+        sim = simulate(params=params, data=_worker_data, **_worker_kwargs)
+    except Exception as e:
+        return {"index": index, "params": params, "error": f"{type(e).__name__}: {e}"}
+    return {
+        "index": index,
+        "params": sim.params,
+        "metrics": sim.metrics,
+        "closed_trades": sum(1 for t in sim.trades if t.get("exit_date")),
+    }
+
+
+def _resolve_workers(max_workers: Optional[int], n_runs: int) -> int:
+    n = LOCAL_BACKTEST_SWEEP_WORKERS if max_workers is None else max_workers
+    if n <= 0:
+        n = max(1, (os.cpu_count() or 2) - 1)
+    return max(1, min(n, n_runs))
+
+
+def run_sweep(
+    symbols: list[str],
+    strategy_id: str,
+    market: str,
+    start: date,
+    end: date,
+    param_sets: list[dict],
+    initial_capital: float,
+    commission_rate: float = 0.0015,
+    tax_rate: float = 0.0023,
+    slippage: float = 0.001,
+    rank_by: str = "sharpe_ratio",
+    max_workers: Optional[int] = None,
+    on_progress: Optional[Callable[[list[dict], int, int], None]] = None,
+) -> SweepResult:
+    """조합별 시뮬레이션 병렬 실행 → 순위표.
+
+    on_progress(ranking, done, total): 조합 1건 완료마다 호출 (메인 프로세스/호출 스레드).
+    콜백 예외는 로그만 남기고 스윕은 계속한다.
+
+    Raises:
+        ValueError: rank_by 미지원 / 조합 없음 / simulate 입력 검증 실패.
+    """
+    if rank_by not in RANK_METRICS:
+        raise ValueError(f"rank_by 미지원: {rank_by} (가능: {', '.join(RANK_METRICS)})")
+    if not param_sets:
+        raise ValueError("실행할 파라미터 조합이 없습니다")
+    if not symbols or len(symbols) > 10:
+        raise ValueError("symbols 1~10개")
+    if start >= end:
+        raise ValueError("start ≥ end")
+
+    data, failures = load_symbol_data(symbols, get_strategy(strategy_id), market, start, end)
+    kwargs = dict(
+        symbols=symbols, strategy_id=strategy_id, market=market, start=start, end=end,
+        initial_capital=initial_capital, commission_rate=commission_rate,
+        tax_rate=tax_rate, slippage=slippage,
+    )
+    total = len(param_sets)
+    done: list[dict] = []
+    errors: list[dict] = []
+
+    def _collect(res: dict) -> None:
+        if "error" in res:
+            errors.append(res)
+        else:
+            done.append(res)
+        if on_progress is not None:
+            try:
+                on_progress(rank_results(done, rank_by), len(done) + len(errors), total)
+            except Exception as e:
+                logger.warning("sweep on_progress 콜백 실패: %s", e)
+
+    run_pool(_run_one, list(enumerate(param_sets)), data, kwargs,
+             _resolve_workers(max_workers, total), _collect)
+
+    if errors:
+        logger.warning("sweep %s: %d/%d 조합 실패 (첫 오류: %s)",
+                       strategy_id, len(errors), total, errors[0]["error"])
+    return SweepResult(
+        ranking=rank_results(done, rank_by),
+        total_runs=total,
+        failures=failures,
+        errors=sorted(errors, key=lambda r: r["index"]),
+    )
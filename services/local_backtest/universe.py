@@ -0,0 +1,266 @@
+"""유니버스 규모 포트폴리오 백테스트 — 수백~수천 종목, 슬롯 수 설정, 후보 순위.
+
+`engine.simulate`(최대 10종목, `PortfolioState` dict 포지션)와 같은 전략·체결·비용 규칙
+(`engine._close_trade` / `engine._open_position` 공유)을 쓰되 상태를 종목 축 NumPy 배열로 관리한다.
+
+- 적재: 청크 단위 병렬 fetch → 즉시 `precompute` → DataFrame 폐기 (신호/청산 배열만 유지).
+  `DataLoader(cache=False)`로 종목 DataFrame이 실행 내내 쌓이지 않는다.
+- 정렬: `panel.align_indexes`로 공통 거래일 축 (S, T) 행 번호 → 신호/종가 그리드.
+- 포지션: held/qty/entry_px 배열 + 보유 종목만 `Position` (전략 `extra` 상태용).
+- 평가: 현금 + `qty · 최근 종가`(거래일 축 forward-fill) 벡터 합.
+- 후보 순위: `rank_by` — input(입력 순) / turnover(거래대금) / change(당일 등락률) /
+  volume_surge(거래량 ÷ 직전 20일 평균). 같은 점수는 입력 순서 유지, NaN은 마지막.
+- 배분: allocation="slots" — 현금 ÷ 가용 슬롯 (슬롯당 균등), "candidates" — 현금 ÷ 당일 매수 수
+  (`engine.simulate` 규칙).
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from config import LOCAL_BACKTEST_UNIVERSE_LOAD_CHUNK, LOCAL_BACKTEST_UNIVERSE_LOAD_WORKERS
+from services.local_backtest.data_loader import DataLoader
+from services.local_backtest.engine import (
+    SimulationResult,
+    _close_trade,
+    _open_position,
+    normalize_index,
+)
+from services.local_backtest.metrics import compute_metrics
+from services.local_backtest.panel import align_indexes
+from services.local_backtest.strategies import get_strategy
+from services.local_backtest.strategies._base import Position, Precomputed, Strategy
+
+logger = logging.getLogger(__name__)
+
+RANK_KEYS = ("input", "turnover", "change", "volume_surge")
+ALLOCATIONS = ("slots", "candidates")
+_SURGE_WINDOW = 20
+
+
+def _compact(strategy: Strategy, df: pd.DataFrame, params: dict) -> Precomputed:
+    """precompute 후 DataFrame 참조 해제 (벡터 exit_at 전략). 행 API 전략은 df 유지."""
+    pre = strategy.precompute(df, params)
+    if type(strategy).exit_at is not Strategy.exit_at:
+        pre.df = None
+    return pre
+
+
+def load_universe(
+    symbols: list[str],
+    strategy: Strategy,
+    params: dict,
+    market: str,
+    start: date,
+    end: date,
+    data: Optional[dict[str, pd.DataFrame]] = None,
+    chunk_size: int = LOCAL_BACKTEST_UNIVERSE_LOAD_CHUNK,
+    workers: int = LOCAL_BACKTEST_UNIVERSE_LOAD_WORKERS,
+) -> tuple[list[str], list[Precomputed], list[pd.DatetimeIndex], list[str]]:
+    """종목별 (precompute 결과, 인덱스) — 청크 단위 적재로 동시 보유 DataFrame ≤ chunk_size.
+
+    Returns:
+        (loaded_symbols, pres, indexes, failures) — 입력 순서 보존.
+    """
+    loader = DataLoader(market=market, cache=False)
+    history_buffer = max(strategy.required_history_days() + 20, 80)
+
+    def _fetch(sym: str) -> Optional[pd.DataFrame]:
+        if data is not None:
+            return data.get(sym)
+        try:
+            return loader.load(sym, start, end, history_buffer_days=history_buffer)
+        except Exception as e:
+            logger.warning("universe 적재 실패 sym=%s err=%s", sym, e)
+            return None
+
+    loaded: list[str] = []
+    pres: list[Precomputed] = []
+    indexes: list[pd.DatetimeIndex] = []
+    failures: list[str] = []
+    chunk_size = max(1, chunk_size)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for lo in range(0, len(symbols), chunk_size):
+            chunk = symbols[lo:lo + chunk_size]
+            for sym, df in zip(chunk, pool.map(_fetch, chunk)):
+                if df is None or df.empty:
+                    failures.append(sym)
+                    continue
+                df = normalize_index(df if data is None else df.copy(), sym)
+                loaded.append(sym)
+                pres.append(_compact(strategy, df, params))
+                indexes.append(df.index)
+    return loaded, pres, indexes, failures
+
+
+def _grid(rows: np.ndarray, per_symbol: list[np.ndarray], fill, dtype) -> np.ndarray:
+    out = np.full(rows.shape, fill, dtype=dtype)
+    for k, arr in enumerate(per_symbol):
+        r = rows[k]
+        m = r >= 0
+        out[k, m] = arr[r[m]]
+    return out
+
+
+def _ffill(grid: np.ndarray) -> np.ndarray:
+    """(S, T) 시간축 forward-fill (NaN → 직전 유효값)."""
+    t_idx = np.where(np.isnan(grid), 0, np.arange(grid.shape[1]))
+    np.maximum.accumulate(t_idx, axis=1, out=t_idx)
+    out = grid[np.arange(grid.shape[0])[:, None], t_idx]
+    return out
+
+
+def _rank_scores(rank_by: str, rows: np.ndarray, pres: list[Precomputed]) -> Optional[np.ndarray]:
+    if rank_by == "input":
+        return None
+    if rank_by == "turnover":
+        per = [p.cols["close"] * p.cols.get("volume", np.full(len(p.entry), np.nan)) for p in pres]
+    elif rank_by == "change":
+        per = []
+        for p in pres:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                per.append(np.where(p.cols["prev_close"] > 0,
+                                    p.cols["close"] / p.cols["prev_close"] - 1.0, np.nan))
+    else:  # volume_surge
+        per = []
+        for p in pres:
+            vol = pd.Series(p.cols.get("volume", np.full(len(p.entry), np.nan)))
+            base = vol.rolling(_SURGE_WINDOW, min_periods=_SURGE_WINDOW).mean().shift(1).to_numpy()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                per.append(np.where(base > 0, vol.to_numpy() / base, np.nan))
+    return _grid(rows, per, np.nan, np.float64)
+
+
+def simulate_universe(
+    symbols: list[str],
+    strategy_id: str,
+    market: str,
+    start: date,
+    end: date,
+    initial_capital: float,
+    max_slots: int = 20,
+    rank_by: str = "turnover",
+    allocation: str = "slots",
+    commission_rate: float = 0.0015,
+    tax_rate: float = 0.0023,
+    slippage: float = 0.001,
+    params: Optional[dict] = None,
+    data: Optional[dict[str, pd.DataFrame]] = None,
+) -> SimulationResult:
+    """유니버스 포트폴리오 일봉 시뮬레이션 (결과 형식은 `engine.simulate`와 동일).
+
+    per_symbol_contribution은 거래가 발생한 종목만 포함한다 (수천 종목 응답 크기 제한).
+
+    Raises:
+        ValueError: 입력 검증 실패 (빈 symbols / 기간 / max_slots / rank_by / allocation).
+    """
+    if not symbols:
+        raise ValueError("symbols 비어있음")
+    if start >= end:
+        raise ValueError("start ≥ end")
+    if max_slots < 1:
+        raise ValueError("max_slots ≥ 1")
+    if rank_by not in RANK_KEYS:
+        raise ValueError(f"rank_by 미지원: {rank_by}")
+    if allocation not in ALLOCATIONS:
+        raise ValueError(f"allocation 미지원: {allocation}")
+
+    strategy = get_strategy(strategy_id)
+    eff_params = dict(strategy.default_params)
+    if params:
+        eff_params.update({k: v for k, v in params.items() if v is not None})
+
+    loaded, pres, indexes, failures = load_universe(
+        symbols, strategy, eff_params, market, start, end, data=data,
+    )
+    axis, rows = align_indexes(indexes, start, end)
+    if not loaded or len(axis) == 0:
+        return SimulationResult(
+            equity_curve=[], trades=[], metrics=compute_metrics([], [], initial_capital),
+            per_symbol_contribution={}, params=eff_params, failures=failures,
+        )
+    days = [ts.date() for ts in axis]
+
+    entry_grid = _grid(rows, [p.entry for p in pres], False, bool)
+    close_grid = _grid(rows, [p.cols["close"] for p in pres], np.nan, np.float64)
+    mark_grid = _ffill(close_grid)
+    scores = _rank_scores(rank_by, rows, pres)
+
+    n = len(loaded)
+    held = np.zeros(n, dtype=bool)
+    qty = np.zeros(n, dtype=np.int64)
+    entry_px = np.zeros(n, dtype=np.float64)
+    positions: dict[int, Position] = {}
+    cash = float(initial_capital)
+
+    equity_curve: list[dict] = []
+    trades: list[dict] = []
+    contrib: dict[str, dict] = {}
+
+    for t, d in enumerate(days):
+        # ── (a) Exit 평가 (보유 종목만) ──────────────────────────────────
+        to_close = []
+        for k, pos in positions.items():
+            i = int(rows[k, t])
+            if i < 0:
+                continue
+            sig = strategy.exit_at(pres[k], i, pos, eff_params)
+            if sig is not None:
+                to_close.append((k, sig))
+
+        for k, sig in to_close:
+            pos = positions.pop(k)
+            _, net = _close_trade(pos, sig, d, slippage, commission_rate, tax_rate, trades, contrib)
+            cash += net
+            held[k] = False
+            qty[k] = 0
+
+        # ── (b) 후보 수집 + 순위 ─────────────────────────────────────────
+        free = max_slots - len(positions)
+        cand = np.flatnonzero(entry_grid[:, t] & ~held)
+        if free > 0 and cand.size:
+            if scores is not None:
+                s = scores[cand, t]
+                nan = np.isnan(s)
+                cand = cand[np.lexsort((np.where(nan, 0.0, -s), nan))]
+            picks = cand[:free]
+            budget = cash / (free if allocation == "slots" else len(picks))
+            for k in picks:
+                k = int(k)
+                sig = pres[k].entry_at(int(rows[k, t]))
+                if sig is None:
+                    continue
+                opened = _open_position(loaded[k], sig, d, budget, cash, slippage, commission_rate, trades)
+                if opened is None:
+                    continue
+                pos, total_cost = opened
+                cash -= total_cost
+                held[k] = True
+                qty[k] = pos.qty
+                entry_px[k] = pos.entry_price
+                positions[k] = pos
+
+        # ── (c) MTM — 최근 종가(없으면 매수가) × 수량 ────────────────────
+        if positions:
+            mark = mark_grid[held, t]
+            mark = np.where(np.isnan(mark), entry_px[held], mark)
+            eq = cash + float(np.dot(qty[held], mark))
+        else:
+            eq = cash
+        equity_curve.append({"date": d.isoformat(), "equity": eq})
+
+    metrics = compute_metrics(equity_curve, [t for t in trades if t.get("exit_date")], initial_capital)
+    return SimulationResult(
+        equity_curve=equity_curve,
+        trades=trades,
+        metrics=metrics,
+        per_symbol_contribution=contrib,
+        params=eff_params,
+        failures=failures,
+    )
@@ -0,0 +1,239 @@
+"""워크포워드(롤링 표본 외) 평가 — 학습 구간 최적화 → 직후 검증 구간 실행 → 검증 자본곡선 연결.
+
+흐름:
+  1) `split_windows` — [start, end]를 달력일 기준 (학습 train_days, 검증 test_days) 창으로 분할.
+     검증 구간은 겹치지 않고 연속이며, 창은 test_days씩 전진한다.
+     anchored=True면 학습 시작을 start에 고정(확장 창), 아니면 길이 고정(롤링 창).
+  2) `run_walkforward` — OHLCV 1회 적재(`engine.load_symbol_data`) → 창 단위로 프로세스 풀 병렬:
+     창마다 파라미터 조합 전부를 학습 구간에서 `simulate(data=...)` → `rank_by` 1위 조합으로
+     검증 구간 1회 실행.
+  3) `stitch_equity` — 검증 구간 자본곡선을 순서대로 복리 연결 (각 창은 초기 자본으로 시작하므로
+     직전 창 종료 자본 / 초기 자본 배율을 곱한다).
+
+창 경계에서 포지션은 이월하지 않는다 — 검증 종료 시 미청산 포지션은 종가 평가액 그대로 연결
+(매도 비용 미차감). 신호 사전 계산은 적재된 전 구간 배열을 쓰지만 행 i 신호는 i 이전 봉만
+사용하므로 검증 구간 정보가 학습에 새지 않는다.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Optional
+
+from config import LOCAL_BACKTEST_WALKFORWARD_MAX_WINDOWS
+from services.local_backtest.engine import load_symbol_data, simulate
+from services.local_backtest.metrics import compute_metrics
+from services.local_backtest.strategies import get_strategy
+from services.local_backtest import sweep
+from services.local_backtest.sweep import RANK_METRICS, _resolve_workers, rank_results, run_pool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Window:
+    index: int
+    train_start: date
+    train_end: date
+    test_start: date
+    test_end: date
+
+    def to_dict(self) -> dict:
+        return {k: (v.isoformat() if isinstance(v, date) else v) for k, v in asdict(self).items()}
+
+
+@dataclass
+class WalkForwardResult:
+    windows: list[dict]
+    equity_curve: list[dict]
+    trades: list[dict]
+    metrics: dict
+    summary: dict
+    failures: list[str] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+
+
+# ── 창 분할 ───────────────────────────────────────────────────────────────
+
+def split_windows(
+    start: date,
+    end: date,
+    train_days: int,
+    test_days: int,
+    anchored: bool = False,
+    max_windows: int = LOCAL_BACKTEST_WALKFORWARD_MAX_WINDOWS,
+) -> list[Window]:
+    """[start, end] → 학습/검증 창 리스트. 마지막 검증 구간은 end에서 잘린다.
+
+    Raises:
+        ValueError: train_days/test_days < 2, 창이 하나도 없음, 창 수 초과.
+    """
+    if train_days < 2 or test_days < 2:
+        raise ValueError("train_days/test_days는 2일 이상이어야 합니다")
+    windows: list[Window] = []
+    i = 0
+    while True:
+        test_start = start + timedelta(days=train_days + i * test_days)
+        test_end = min(test_start + timedelta(days=test_days - 1), end)
+        if test_end <= test_start:
+            break
+        train_end = test_start - timedelta(days=1)
+        train_start = start if anchored else test_start - timedelta(days=train_days)
+        windows.append(Window(i, train_start, train_end, test_start, test_end))
+        i += 1
+    if not windows:
+        raise ValueError(f"기간이 학습 {train_days}일 + 검증 구간보다 짧습니다")
+    if len(windows) > max_windows:
+        raise ValueError(f"창 수 {len(windows)}개 — 최대 {max_windows}개까지 지원")
+    return windows
+
+
+# ── 연결 ──────────────────────────────────────────────────────────────────
+
+def stitch_equity(windows: list[dict], initial_capital: float) -> list[dict]:
+    """창 index 순 검증 자본곡선 → 복리 연결 곡선. 곡선 없는 창(실패/거래일 없음)은 건너뛴다."""
+    capital = float(initial_capital)
+    out: list[dict] = []
+    for w in sorted(windows, key=lambda r: r["index"]):
+        curve = w.get("equity_curve") or []
+        if not curve:
+            continue
+        scale = capital / initial_capital
+        out.extend({"date": p["date"], "equity": float(p["equity"]) * scale} for p in curve)
+        capital = out[-1]["equity"]
+    return out
+
+
+# ── 실행 ──────────────────────────────────────────────────────────────────
+
+def _run_window(window: Window, param_sets: list[dict], rank_by: str) -> dict:
+    """학습 구간 조합별 시뮬레이션 → 1위 조합으로 검증 구간 실행 (`sweep.run_pool` 워커)."""
+    out = window.to_dict()
+    trained: list[dict] = []
+    train_errors = 0
+    for i, p in enumerate(param_sets):
+        try:
+            sim = simulate(params=p, data=sweep._worker_data, start=window.train_start,
+                           end=window.train_end, **sweep._worker_kwargs)
+        except Exception as e:
+            train_errors += 1
+            logger.debug("walkforward 창 %d 조합 %d 실패: %s", window.index, i, e)
+            continue
+        trained.append({"index": i, "params": sim.params, "metrics": sim.metrics})
+    if not trained:
+        return {**out, "error": f"학습 구간 조합 {len(param_sets)}개 모두 실패"}
+
+    best = rank_results(trained, rank_by)[0]
+    try:
+        test = simulate(params=best["params"], data=sweep._worker_data, start=window.test_start,
+                        end=window.test_end, **sweep._worker_kwargs)
+    except Exception as e:
+        return {**out, "error": f"검증 구간 실행 실패: {type(e).__name__}: {e}"}
+    return {
+        **out,
+        "best_params": best["params"],
+        "best_index": best["index"],
+        "train_metrics": best["metrics"],
+        "test_metrics": test.metrics,
+        "train_runs": len(trained),
+        "train_errors": train_errors,
+        "equity_curve": test.equity_curve,
+        "trades": [{**t, "window": window.index} for t in test.trades],
+    }
+
+
+def _summary(windows: list[dict], rank_by: str) -> dict:
+    """창별 학습/검증 rank_by 평균 — 검증/학습 비율이 낮을수록 과최적화."""
+    def _avg(key: str) -> Optional[float]:
+        vals = [w[key].get(rank_by) for w in windows if w.get(key)]
+        vals = [v for v in vals if v is not None and v == v]
+        return sum(vals) / len(vals) if vals else None
+
+    distinct = {tuple(sorted(w["best_params"].items())) for w in windows if w.get("best_params")}
+    return {
+        "rank_by": rank_by,
+        "avg_train": _avg("train_metrics"),
+        "avg_test": _avg("test_metrics"),
+        "distinct_best_params": len(distinct),
+    }
+
+
+def run_walkforward(
+    symbols: list[str],
+    strategy_id: str,
+    market: str,
+    start: date,
+    end: date,
+    param_sets: list[dict],
+    initial_capital: float,
+    train_days: int,
+    test_days: int,
+    anchored: bool = False,
+    commission_rate: float = 0.0015,
+    tax_rate: float = 0.0023,
+    slippage: float = 0.001,
+    rank_by: str = "sharpe_ratio",
+    max_workers: Optional[int] = None,
+    on_progress: Optional[Callable[[list[dict], int, int], None]] = None,
+) -> WalkForwardResult:
+    """워크포워드 실행 → 창별 결과 + 연결 검증 자본곡선/메트릭.
+
+    on_progress(windows, done, total): 창 1개 완료마다 호출 (windows는 완료분 index 순,
+    equity_curve/trades 제외). 콜백 예외는 로그만 남긴다.
+
+    Raises:
+        ValueError: rank_by 미지원 / 조합 없음 / 종목 수 / 창 분할 실패.
+    """
+    if rank_by not in RANK_METRICS:
+        raise ValueError(f"rank_by 미지원: {rank_by} (가능: {', '.join(RANK_METRICS)})")
+    if not param_sets:
+        raise ValueError("실행할 파라미터 조합이 없습니다")
+    if not symbols or len(symbols) > 10:
+        raise ValueError("symbols 1~10개")
+    windows = split_windows(start, end, train_days, test_days, anchored)
+
+    data, failures = load_symbol_data(symbols, get_strategy(strategy_id), market, start, end)
+    kwargs = dict(
+        symbols=symbols, strategy_id=strategy_id, market=market,
+        initial_capital=initial_capital, commission_rate=commission_rate,
+        tax_rate=tax_rate, slippage=slippage,
+    )
+    total = len(windows)
+    done: list[dict] = []
+
+    def _collect(res: dict) -> None:
+        done.append(res)
+        if on_progress is not None:
+            try:
+                view = [
+                    {k: v for k, v in r.items() if k not in ("equity_curve", "trades")}
+                    for r in sorted(done, key=lambda r: r["index"])
+                ]
+                on_progress(view, len(done), total)
+            except Exception as e:
+                logger.warning("walkforward on_progress 콜백 실패: %s", e)
+
+    run_pool(_run_window, [(w, param_sets, rank_by) for w in windows], data, kwargs,
+             _resolve_workers(max_workers, total), _collect)
+
+    done.sort(key=lambda r: r["index"])
+    ok = [r for r in done if "error" not in r]
+    errors = [{"index": r["index"], "error": r["error"]} for r in done if "error" in r]
+    if errors:
+        logger.warning("walkforward %s: %d/%d 창 실패 (첫 오류: %s)",
+                       strategy_id, len(errors), total, errors[0]["error"])
+
+    curve = stitch_equity(ok, initial_capital)
+    trades = [t for r in ok for t in r["trades"]]
+    metrics = compute_metrics(curve, [t for t in trades if t.get("exit_date")], initial_capital)
+    return WalkForwardResult(
+        windows=[{k: v for k, v in r.items() if k not in ("equity_curve", "trades")} for r in done],
+        equity_curve=curve,
+        trades=trades,
+        metrics=metrics,
+        summary=_summary(ok, rank_by),
+        failures=failures,
+        errors=errors,
+    )
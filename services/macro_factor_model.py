@@ -545,19 +545,18 @@ def _collect_portfolio_stocks() -> tuple[list[tuple[str, str, str]], bool]:
 def _fetch_stock_logret_series(code: str, market: str) -> dict[str, float]:
     """종목 7년 일별 종가 → logret {date: float}. 실패 시 빈 dict.
 
-    KR=`_resolve_yf_code`로 .KS/.KQ 자동 부착, US=티커 그대로. yfinance 7y 일봉.
+    stock/ohlcv_store 일봉 저장소 경유 (미확인 최근 구간만 yfinance 보충).
+    배당 조정 종가(adj_close) 사용 — 기존 yfinance auto_adjust 종가와 동일 기준.
     """
     try:
         import numpy as _np
         import pandas as pd
-        import yfinance as yf
-        from stock.yf_client import _resolve_yf_code
+        from stock import ohlcv_store
 
-        ticker = _resolve_yf_code(code) if market == "KR" else code
-        hist = yf.Ticker(ticker).history(period="7y", interval="1d")
+        hist = ohlcv_store.get_bars_period(code, "7y", market=market, interval="1d")
         if hist is None or hist.empty:
             return {}
-        close = hist["Close"].dropna()
+        close = hist["adj_close"].dropna()
         close = close[close > 0]
         if len(close) < _MIN_STOCK_OBS + 1:
             return {}
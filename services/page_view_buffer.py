@@ -0,0 +1,159 @@
+"""페이지뷰 기록 버퍼 — 요청당 INSERT 트랜잭션 대신 메모리 버퍼 + 백그라운드 일괄 INSERT.
+
+기존 `record_page_view_middleware`는 요청마다 `asyncio.create_task`로 세션을 열고
+`PageViewRepository.record` 1행 INSERT + commit을 이벤트 루프 스레드에서 동기 I/O로 실행했다
+(API 호출 1건 = 트랜잭션 1건 = fsync 1회).
+
+  - 미들웨어는 `offer()`로 행 dict를 deque에 넣기만 한다 (락 + append, I/O 없음).
+  - 전용 스레드(`page-view-writer`)가 `PAGE_VIEW_FLUSH_MS`마다, 또는 `PAGE_VIEW_BATCH_SIZE`행이
+    차면 즉시 깨어나 배치당 트랜잭션 1회로 `record_many` (executemany).
+  - 버퍼가 `PAGE_VIEW_BUFFER_CAPACITY`행이면 새 행은 드롭하고 `dropped` 카운트 (DB 지연이
+    요청 경로로 번지지 않게). 쓰기 실패 배치도 재시도 없이 버리고 `failed`에 집계.
+  - `stop()`은 스레드 종료 후 남은 행을 모두 flush (main.py lifespan shutdown).
+  - `created_at`은 offer 시점(요청 완료 시각)으로 기록 — 배치 지연과 무관.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from config import PAGE_VIEW_BATCH_SIZE, PAGE_VIEW_BUFFER_CAPACITY, PAGE_VIEW_FLUSH_MS
+from db.utils import now_kst_iso
+
+logger = logging.getLogger(__name__)
+
+
+def _default_writer(rows: list[dict]) -> None:
+    from db.repositories.page_view_repo import PageViewRepository
+    from db.session import get_session
+
+    with get_session() as db:
+        PageViewRepository(db).record_many(rows)
+
+
+class PageViewBuffer:
+    def __init__(
+        self,
+        *,
+        capacity: int = PAGE_VIEW_BUFFER_CAPACITY,
+        batch_size: int = PAGE_VIEW_BATCH_SIZE,
+        flush_interval: float = PAGE_VIEW_FLUSH_MS / 1000,
+        writer: Optional[Callable[[list[dict]], None]] = None,
+    ):
+        self._capacity = max(int(capacity), 1)
+        self._batch_size = max(int(batch_size), 1)
+        self._interval = max(float(flush_interval), 0.01)
+        self._writer = writer or _default_writer
+        self._rows: deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 스레드 flush와 stop()의 최종 flush 직렬화
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._accepted = 0
+        self._dropped = 0
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+
+    def offer(
+        self,
+        user_id: Optional[int],
+        path: str,
+        method: str,
+        status_code: int,
+        duration_ms: float,
+    ) -> bool:
+        """행 추가 (논블로킹). 버퍼가 가득 차면 False (드롭)."""
+        row = {
+            "user_id": user_id,
+            "path": path,
+            "method": method,
+            "status_code": status_code,
+            "duration_ms": float(duration_ms),
+            "created_at": now_kst_iso(),
+        }
+        with self._lock:
+            if len(self._rows) >= self._capacity:
+                self._dropped += 1
+                return False
+            self._rows.append(row)
+            self._accepted += 1
+            full = len(self._rows) >= self._batch_size
+        if full:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """버퍼 전체를 배치 단위로 기록. 기록한 행 수 반환."""
+        total = 0
+        with self._write_lock:
+            while True:
+                with self._lock:
+                    n = min(len(self._rows), self._batch_size)
+                    batch = [self._rows.popleft() for _ in range(n)]
+                if not batch:
+                    return total
+                try:
+                    self._writer(batch)
+                except Exception as e:
+                    with self._lock:
+                        self._failed += len(batch)
+                    logger.warning("page view batch write failed (%d rows): %s", len(batch), e)
+                    continue
+                with self._lock:
+                    self._written += len(batch)
+                    self._batches += 1
+                total += len(batch)
+
+    def start(self) -> None:
+        """writer 스레드 시작 (main.py lifespan startup). 이미 실행 중이면 무시."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="page-view-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """writer 스레드 종료 + 남은 행 최종 flush."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # 스레드가 죽지 않도록
+                logger.warning("page view flush failed: %s", e)
+
+    def stats(self) -> dict:
+        """버퍼 지표 (관리자 페이지 통계 응답에 포함)."""
+        with self._lock:
+            return {
+                "pending": len(self._rows),
+                "capacity": self._capacity,
+                "accepted": self._accepted,
+                "dropped": self._dropped,
+                "written": self._written,
+                "failed": self._failed,
+                "batches": self._batches,
+                "running": self._thread is not None and self._thread.is_alive(),
+            }
+
+
+_buffer: Optional[PageViewBuffer] = None
+
+
+def get_page_view_buffer() -> PageViewBuffer:
+    global _buffer
+    if _buffer is None:
+        _buffer = PageViewBuffer()
+    return _buffer
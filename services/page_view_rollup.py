@@ -0,0 +1,159 @@
+"""페이지뷰 rollup 잡 — raw `page_views` → 시간/일 사전 집계 + raw 보존기간 정리.
+
+관리자 통계(경로별 호출·latency 백분위·고유 사용자, 사용자별 접속 이력)는
+db/repositories/page_view_rollup_repo.py가 rollup 테이블만 읽는다.
+
+증분 갱신 (`rollup`, `PAGE_VIEW_ROLLUP_INTERVAL_MIN`마다):
+  - 시작 일자 = 마지막 rollup 시간 버킷 1시간 전이 속한 KST 일자 (최초 실행은 raw 최소 일자 → 전체 backfill).
+  - 시작 일자 ~ 오늘을 하루씩 raw 1회 스캔 → 시간×path / 일×path / 일×사용자×path 행을 만들어
+    그 일자 rollup을 통째로 교체 (delete + executemany). 재실행·중복 실행에 멱등, 진행 중인 오늘은 매번 갱신.
+  - 평상시 스캔량 = 오늘(자정 직후는 어제 포함) raw 행 — 테이블 누적 크기와 무관.
+
+보존 (`purge`, 매일): rollup이 끝난 일자만 대상으로
+raw `PAGE_VIEW_RAW_RETENTION_DAYS`, 시간 rollup `PAGE_VIEW_HOURLY_RETENTION_DAYS` 경과분 삭제. 일 rollup은 영구.
+"""
+from __future__ import annotations
+
+from datetime import date as date_cls, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config import PAGE_VIEW_HOURLY_RETENTION_DAYS, PAGE_VIEW_RAW_RETENTION_DAYS
+from db.models.page_view import PageView
+from db.repositories.page_view_rollup_repo import PageViewRollupRepository
+from db.utils import now_kst
+from services._sketches import LATENCY_BUCKETS, hist_merge, hll_add, hll_merge, hll_new, latency_bucket
+
+
+class _PathAcc:
+    __slots__ = ("calls", "errors", "server_errors", "duration_sum", "duration_max", "hist", "hll")
+
+    def __init__(self):
+        self.calls = self.errors = self.server_errors = 0
+        self.duration_sum = self.duration_max = 0.0
+        self.hist = [0] * LATENCY_BUCKETS
+        self.hll: Optional[bytearray] = None
+
+    def add(self, user_id: Optional[int], status_code: int, duration_ms: float) -> None:
+        self.calls += 1
+        if status_code >= 400:
+            self.errors += 1
+            if status_code >= 500:
+                self.server_errors += 1
+        self.duration_sum += duration_ms
+        if duration_ms > self.duration_max:
+            self.duration_max = duration_ms
+        self.hist[latency_bucket(duration_ms)] += 1
+        if user_id is not None:
+            if self.hll is None:
+                self.hll = hll_new()
+            hll_add(self.hll, user_id)
+
+    def row(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "server_errors": self.server_errors,
+            "duration_sum": self.duration_sum,
+            "duration_max": self.duration_max,
+            "latency_hist": self.hist,
+            "users_hll": bytes(self.hll) if self.hll is not None else None,
+        }
+
+
+def _rollup_day(db: Session, day: str) -> tuple[list[dict], list[dict], list[dict], int]:
+    """하루치 raw 1회 스캔 → (hourly, daily, user_daily) 행 + raw 행 수."""
+    nxt = (date_cls.fromisoformat(day) + timedelta(days=1)).isoformat()
+    hourly: dict[tuple[str, str], _PathAcc] = {}
+    users: dict[tuple[int, str], list] = {}
+    n = 0
+    stmt = (
+        select(PageView.user_id, PageView.path, PageView.status_code, PageView.duration_ms, PageView.created_at)
+        .where(PageView.created_at >= day, PageView.created_at < nxt)
+    )
+    for user_id, path, status_code, duration_ms, created_at in db.execute(stmt):
+        n += 1
+        key = (created_at[:13], path)
+        acc = hourly.get(key)
+        if acc is None:
+            acc = hourly[key] = _PathAcc()
+        acc.add(user_id, status_code, float(duration_ms or 0))
+        if user_id is not None:
+            u = users.get((user_id, path))
+            if u is None:
+                users[(user_id, path)] = [1, created_at]
+            else:
+                u[0] += 1
+                if created_at > u[1]:
+                    u[1] = created_at
+
+    hourly_rows = [{"hour": hour, "path": path, **acc.row()} for (hour, path), acc in hourly.items()]
+    by_path: dict[str, list[dict]] = {}
+    for r in hourly_rows:
+        by_path.setdefault(r["path"], []).append(r)
+    daily_rows = [
+        {
+            "date": day,
+            "path": path,
+            "calls": sum(r["calls"] for r in rows),
+            "errors": sum(r["errors"] for r in rows),
+            "server_errors": sum(r["server_errors"] for r in rows),
+            "duration_sum": sum(r["duration_sum"] for r in rows),
+            "duration_max": max(r["duration_max"] for r in rows),
+            "latency_hist": hist_merge(r["latency_hist"] for r in rows),
+            "users_hll": hll_merge(r["users_hll"] for r in rows),
+        }
+        for path, rows in by_path.items()
+    ]
+    user_rows = [
+        {"date": day, "user_id": uid, "path": path, "calls": calls, "last_at": last_at}
+        for (uid, path), (calls, last_at) in users.items()
+    ]
+    return hourly_rows, daily_rows, user_rows, n
+
+
+def _resume_date(repo: PageViewRollupRepository) -> Optional[date_cls]:
+    """다음 rollup 시작 일자 — 마지막 시간 버킷 1시간 전(늦게 기록된 행 흡수)이 속한 일자. 없으면 None."""
+    last = repo.last_hour()
+    if not last:
+        return None
+    return (datetime.strptime(last, "%Y-%m-%dT%H") - timedelta(hours=1)).date()
+
+
+def rollup(db: Session, now: Optional[datetime] = None) -> dict:
+    """마지막 rollup 일자 ~ 오늘 rollup 재계산 (일자별 commit). {"days", "rows", "from"} 반환."""
+    now = now or now_kst()
+    repo = PageViewRollupRepository(db)
+    start = _resume_date(repo)
+    if start is None:
+        first = repo.first_raw_date()
+        if first is None:
+            return {"days": 0, "rows": 0, "from": None}
+        start = date_cls.fromisoformat(first)
+    today = now.date()
+    days = rows = 0
+    day = start
+    while day <= today:
+        hourly, daily, users, n = _rollup_day(db, day.isoformat())
+        repo.replace_day(day.isoformat(), hourly, daily, users)
+        db.commit()
+        days += 1
+        rows += n
+        day += timedelta(days=1)
+    return {"days": days, "rows": rows, "from": start.isoformat()}
+
+
+def purge(db: Session, now: Optional[datetime] = None) -> dict:
+    """보존기간 경과 raw/시간 rollup 삭제. 다음 rollup이 다시 읽을 일자(`_resume_date` 이후)의 raw는 남긴다."""
+    now = now or now_kst()
+    repo = PageViewRollupRepository(db)
+    resume = _resume_date(repo)
+    if resume is None:
+        return {"raw": 0, "hourly": 0}
+    raw_cutoff = min((now - timedelta(days=PAGE_VIEW_RAW_RETENTION_DAYS)).strftime("%Y-%m-%d"), resume.isoformat())
+    hourly_cutoff = (now - timedelta(days=PAGE_VIEW_HOURLY_RETENTION_DAYS)).strftime("%Y-%m-%d")
+    result = {"raw": repo.delete_raw_before(raw_cutoff), "hourly": repo.delete_hourly_before(hourly_cutoff)}
+    db.commit()
+    return result
@@ -0,0 +1,168 @@
+"""심볼별 병합(conflating) 브로드캐스터 — 직렬화 1회, 인코딩 텍스트를 구독자 간 공유.
+
+기존 `/ws/quote` 경로는 `KISQuoteManager._broadcast`가 같은 dict를 구독 큐마다 넣고,
+구독자 코루틴마다 100ms 병합 창 + `websocket.send_json` 재직렬화를 돌렸다.
+인기 종목을 탭 N개가 보면 JSON 비용·타이머가 구독자 수 × 틱에 비례한다.
+
+  - publish: 심볼별 대기 dict에 type 키로 덮어쓰기 (창 내 같은 type은 최신만).
+    창의 첫 메시지가 `loop.call_later` 타이머를 1개 건다 — 구독자 수와 무관하게 심볼당 1개.
+  - flush: 대기 메시지마다 `json.dumps` 1회 → 같은 str 객체를 모든 구독 큐에 put
+    (큐가 가득 차면 가장 오래된 프레임을 버림).
+  - 라우트는 큐에서 꺼낸 텍스트를 `websocket.send_text`로 그대로 보낸다.
+
+인코딩은 Starlette `send_json`과 같은 규칙(`separators=(",", ":")`, `ensure_ascii=False`).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Optional
+
+from config import QUOTE_FANOUT_WINDOW_MS
+
+logger = logging.getLogger(__name__)
+
+
+def encode(message: dict) -> str:
+    """메시지 dict → WS 텍스트 프레임 (Starlette `send_json`과 동일 인코딩)."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def put_latest(q: asyncio.Queue, item) -> bool:
+    """큐에 넣기 — 가득 차면 가장 오래된 항목을 버린다. 버렸으면 True."""
+    dropped = False
+    if q.full():
+        try:
+            q.get_nowait()
+            dropped = True
+        except asyncio.QueueEmpty:
+            pass
+    try:
+        q.put_nowait(item)
+    except asyncio.QueueFull:
+        dropped = True
+    return dropped
+
+
+class _Channel:
+    """심볼 1개의 구독 큐 + 병합 대기 메시지 + 계측 카운터."""
+
+    __slots__ = ("queues", "pending", "timer", "published", "conflated", "flushes", "frames",
+                 "deliveries", "drops")
+
+    def __init__(self):
+        self.queues: set[asyncio.Queue] = set()
+        self.pending: dict[str, dict] = {}
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.published = 0   # publish 호출 수
+        self.conflated = 0   # 창 내 같은 type 최신 메시지로 덮어써진 수
+        self.flushes = 0     # 타이머 flush 수
+        self.frames = 0      # 직렬화한 프레임 수 (= json.dumps 호출 수)
+        self.deliveries = 0  # 큐에 넣은 프레임 수 (frames × 구독자)
+        self.drops = 0       # 큐 만재로 버린 프레임 수
+
+
+class FanoutHub:
+    """심볼별 병합 브로드캐스터 모음 (KISQuoteManager 소유, 이벤트 루프 단일 스레드 전용)."""
+
+    def __init__(self, window: Optional[float] = None):
+        self.window = QUOTE_FANOUT_WINDOW_MS / 1000 if window is None else window
+        self._channels: dict[str, _Channel] = {}
+
+    # ── 구독 ──────────────────────────────────────────────────────
+
+    def add(self, symbol: str, queue: asyncio.Queue):
+        ch = self._channels.get(symbol)
+        if ch is None:
+            ch = self._channels[symbol] = _Channel()
+        ch.queues.add(queue)
+
+    def remove(self, symbol: str, queue: asyncio.Queue):
+        """구독 해제. 마지막 구독자면 대기 메시지·타이머까지 정리."""
+        ch = self._channels.get(symbol)
+        if ch is None:
+            return
+        ch.queues.discard(queue)
+        if not ch.queues:
+            if ch.timer is not None:
+                ch.timer.cancel()
+            self._channels.pop(symbol, None)
+
+    def queues(self, symbol: str) -> set[asyncio.Queue]:
+        ch = self._channels.get(symbol)
+        return ch.queues if ch is not None else set()
+
+    # ── 전달 ──────────────────────────────────────────────────────
+
+    def publish(self, symbol: str, message):
+        """병합 대기열에 넣고, 창의 첫 메시지면 flush 타이머 예약.
+
+        message: dict 또는 `type` 속성 + `message()`를 가진 레코드(services/quote_frames) —
+        레코드는 flush 때 살아남은 것만 dict로 만든다.
+        """
+        ch = self._channels.get(symbol)
+        if ch is None:
+            return
+        key = message["type"] if isinstance(message, dict) else message.type
+        if key in ch.pending:
+            ch.conflated += 1
+        ch.pending[key] = message
+        ch.published += 1
+        if ch.timer is None:
+            loop = asyncio.get_running_loop()
+            ch.timer = loop.call_later(self.window, self._flush, symbol, ch)
+
+    def send(self, symbol: str, queue: asyncio.Queue, message: dict):
+        """구독 큐 1개에 즉시 전달 (구독 직후 초기 가격 등 — 병합 대상 아님)."""
+        ch = self._channels.get(symbol)
+        if ch is None or queue not in ch.queues:
+            return
+        ch.frames += 1
+        ch.deliveries += 1
+        if put_latest(queue, encode(message)):
+            ch.drops += 1
+
+    def _flush(self, symbol: str, ch: _Channel):
+        ch.timer = None
+        if self._channels.get(symbol) is not ch or not ch.pending:
+            return
+        frames = [encode(m if isinstance(m, dict) else m.message()) for m in ch.pending.values()]
+        ch.pending = {}
+        ch.flushes += 1
+        ch.frames += len(frames)
+        ch.deliveries += len(frames) * len(ch.queues)
+        dropped = 0
+        for q in list(ch.queues):
+            for frame in frames:
+                if put_latest(q, frame):
+                    dropped += 1
+        if dropped:
+            ch.drops += dropped
+            if ch.drops % 100 < dropped:
+                logger.warning("[QuoteFanout] %s: %d frames dropped (queue full)", symbol, ch.drops)
+
+    def close(self):
+        """모든 flush 타이머 취소 (매니저 종료)."""
+        for ch in self._channels.values():
+            if ch.timer is not None:
+                ch.timer.cancel()
+                ch.timer = None
+            ch.pending = {}
+
+    # ── 계측 ──────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, dict]:
+        """심볼별 fan-out/드롭 지표 (관리자 진단용)."""
+        return {
+            symbol: {
+                "subscribers": len(ch.queues),
+                "published": ch.published,
+                "conflated": ch.conflated,
+                "flushes": ch.flushes,
+                "frames": ch.frames,
+                "deliveries": ch.deliveries,
+                "drops": ch.drops,
+            }
+            for symbol, ch in self._channels.items()
+        }
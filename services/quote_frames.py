@@ -0,0 +1,213 @@
+"""KIS 실시간 WebSocket 프레임 파서 — TR_ID별 필드 인덱스 표 + `__slots__` 레코드.
+
+프레임: `"0|TR_ID|건수|필드^필드^..."`. 건수(count)가 2 이상이면 레코드 n개의 필드가
+'^'로 이어져 온다 (레코드 길이 = 전체 필드 수 / 건수).
+
+기존 `KISQuoteManager._parse_*`는 레코드 1건만 보고(나머지 체결 유실), 필드마다 메서드 호출
++ 예외 처리로 float 변환, `{"type": ..., **parsed}`로 dict를 두 번 만들었다. 장 시작 직후
+수십 종목 체결이 이벤트 루프 스레드에서 이 경로를 돈다.
+
+  - 레이아웃(`ExecLayout`/`BookLayout`)은 TR_ID별로 한 번 만든 인덱스 표 — 소비자가 쓰는 필드만 변환
+    (체결 46필드 중 10개).
+  - 페이로드는 프레임당 `split('^')` 1회, 레코드는 기준 오프셋 + 인덱스로 접근 (레코드별 재분할 없음).
+    단건 프레임은 레이아웃이 쓰는 최대 인덱스까지만 분할 (`maxsplit` — 체결 46필드 중 13개).
+  - 구독하지 않는 종목 레코드는 종목코드만 보고 건너뛴다 (KIS 해제 전 잔여 프레임).
+  - 호가 가격/잔량 구간은 `map(float, ...)` 일괄 변환, 실패 시에만 필드별 0.0 대체.
+  - 레코드(`Execution`/`Orderbook`)는 `__slots__` 객체 — `message()`가 브로드캐스트 dict를 생성.
+    프레임 구독자만 있는 종목은 fan-out flush 시점에 창당 1회만 만든다 (services/quote_fanout.py).
+"""
+from __future__ import annotations
+
+from typing import Container, Optional, Union
+
+
+def _f(v: str) -> float:
+    try:
+        return float(v)
+    except ValueError:
+        return 0.0
+
+
+def _floats(seg: list[str]) -> list[float]:
+    try:
+        return list(map(float, seg))
+    except ValueError:
+        return [_f(v) for v in seg]
+
+
+# ── 레이아웃 ──────────────────────────────────────────────────────────────
+
+class ExecLayout:
+    """체결 레코드 필드 인덱스. ohlc/tick은 레코드 길이가 충분할 때만 채운다 (없으면 None)."""
+
+    __slots__ = ("min_fields", "max_index", "price", "sign", "change", "rate", "ohlc", "tick_time",
+                 "tick_volume")
+
+    def __init__(self, *, price: int, sign: int, change: int, rate: int,
+                 ohlc: Optional[tuple[int, int, int]] = None,
+                 tick_time: Optional[int] = None, tick_volume: Optional[int] = None):
+        self.price, self.sign, self.change, self.rate = price, sign, change, rate
+        self.ohlc = ohlc
+        self.tick_time = tick_time
+        self.tick_volume = tick_volume
+        self.min_fields = max(price, sign, change, rate) + 1
+        self.max_index = max(self.min_fields - 1, *(ohlc or ()), tick_time or 0, tick_volume or 0)
+
+
+class BookLayout:
+    """호가 레코드 필드 인덱스 — 매도/매수 호가·잔량 구간 시작 + 총잔량.
+
+    네 구간과 총잔량을 덮는 연속 블록 [lo, hi)를 한 번에 float 변환하고 블록 내 상대 오프셋으로 자른다.
+    """
+
+    __slots__ = ("min_fields", "levels", "ask_price", "bid_price", "ask_volume", "bid_volume",
+                 "total_ask", "total_bid", "lo", "hi", "cuts", "max_index")
+
+    def __init__(self, *, levels: int, ask_price: int, bid_price: int, ask_volume: int,
+                 bid_volume: int, total_ask: int, total_bid: int):
+        self.levels = levels
+        self.ask_price, self.bid_price = ask_price, bid_price
+        self.ask_volume, self.bid_volume = ask_volume, bid_volume
+        self.total_ask, self.total_bid = total_ask, total_bid
+        self.min_fields = max(total_ask, total_bid) + 1
+        self.max_index = self.min_fields - 1
+        self.lo = min(ask_price, bid_price, ask_volume, bid_volume)
+        self.hi = self.min_fields
+        self.cuts = tuple(x - self.lo for x in (ask_price, bid_price, ask_volume, bid_volume,
+                                                  total_ask, total_bid))
+
+
+# KR 체결 (H0STCNT0/H0UNCNT0/H0NXCNT0): [0]=종목 [1]=체결시각 [2]=현재가 [3]=부호 [4]=전일대비
+# [5]=대비율 [7]=시가 [8]=고가 [9]=저가 [12]=체결거래량
+KR_EXECUTION = ExecLayout(price=2, sign=3, change=4, rate=5, ohlc=(7, 8, 9), tick_time=1, tick_volume=12)
+# KR 호가 (H0STASP0/H0UNASP0/H0NXASP0): [3-12]=매도호가1-10 [13-22]=매수호가1-10
+# [23-32]=매도잔량1-10 [33-42]=매수잔량1-10 [43]=총매도잔량 [44]=총매수잔량
+KR_ORDERBOOK = BookLayout(levels=10, ask_price=3, bid_price=13, ask_volume=23, bid_volume=33,
+                          total_ask=43, total_bid=44)
+# FNO 체결 (H0IFCNT0/H0IOCNT0/H0ZFCNT0/H0ZOCNT0): [2]=전일대비 [3]=부호 [4]=대비율 [5]=현재가
+FNO_EXECUTION = ExecLayout(price=5, sign=3, change=2, rate=4)
+# FNO 5레벨 (H0IFASP0/H0IOASP0): [2-6]=매도호가 [7-11]=매수호가 [22-26]=매도잔량 [27-31]=매수잔량
+FNO_ORDERBOOK_5 = BookLayout(levels=5, ask_price=2, bid_price=7, ask_volume=22, bid_volume=27,
+                             total_ask=34, total_bid=35)
+# FNO 10레벨 (H0ZFASP0/H0ZOASP0) — 5레벨과 유사한 패턴으로 추정 (실데이터 확인 후 오프셋 조정 필요)
+FNO_ORDERBOOK_10 = BookLayout(levels=10, ask_price=2, bid_price=12, ask_volume=32, bid_volume=42,
+                              total_ask=54, total_bid=55)
+
+Layout = Union[ExecLayout, BookLayout]
+
+
+# ── 레코드 ────────────────────────────────────────────────────────────────
+
+class Execution:
+    type = "price"
+    __slots__ = ("symbol", "price", "sign", "change", "change_rate", "open", "high", "low",
+                 "tick_time", "tick_volume")
+
+    def message(self) -> dict:
+        """브로드캐스트 `{"type": "price", ...}` — 기존 `_parse_execution` dict와 같은 키."""
+        msg = {
+            "type": "price",
+            "symbol": self.symbol,
+            "price": self.price,
+            "sign": self.sign,
+            "change": self.change,
+            "change_rate": self.change_rate,
+        }
+        if self.open is not None:
+            msg["open"] = self.open
+            msg["high"] = self.high
+            msg["low"] = self.low
+        if self.tick_time is not None:
+            msg["tick_time"] = self.tick_time
+            msg["tick_volume"] = self.tick_volume
+        return msg
+
+
+class Orderbook:
+    type = "orderbook"
+    __slots__ = ("symbol", "ask_prices", "ask_volumes", "bid_prices", "bid_volumes",
+                 "total_ask_volume", "total_bid_volume")
+
+    def message(self) -> dict:
+        """브로드캐스트 `{"type": "orderbook", ...}` — asks/bids `[{price, volume}]` (1호가부터)."""
+        return {
+            "type": "orderbook",
+            "symbol": self.symbol,
+            "asks": [{"price": p, "volume": v} for p, v in zip(self.ask_prices, self.ask_volumes)],
+            "bids": [{"price": p, "volume": v} for p, v in zip(self.bid_prices, self.bid_volumes)],
+            "total_ask_volume": self.total_ask_volume,
+            "total_bid_volume": self.total_bid_volume,
+        }
+
+
+def _execution(t: list[str], b: int, n: int, L: ExecLayout) -> Execution:
+    r = Execution()
+    r.symbol = t[b]
+    r.sign = t[b + L.sign]
+    r.price, r.change, r.change_rate = _floats([t[b + L.price], t[b + L.change], t[b + L.rate]])
+    ohlc = L.ohlc
+    if ohlc is not None and n > ohlc[2]:
+        r.open, r.high, r.low = _floats([t[b + ohlc[0]], t[b + ohlc[1]], t[b + ohlc[2]]])
+    else:
+        r.open = r.high = r.low = None
+    if L.tick_volume is not None and n > L.tick_volume:
+        r.tick_time = t[b + L.tick_time]
+        r.tick_volume = _f(t[b + L.tick_volume])
+    else:
+        r.tick_time = r.tick_volume = None
+    return r
+
+
+def _orderbook(t: list[str], b: int, L: BookLayout) -> Orderbook:
+    k = L.levels
+    v = _floats(t[b + L.lo:b + L.hi])
+    ap, bp, av, bv, ta, tb = L.cuts
+    r = Orderbook()
+    r.symbol = t[b]
+    r.ask_prices = v[ap:ap + k]
+    r.bid_prices = v[bp:bp + k]
+    r.ask_volumes = v[av:av + k]
+    r.bid_volumes = v[bv:bv + k]
+    r.total_ask_volume = v[ta]
+    r.total_bid_volume = v[tb]
+    return r
+
+
+def parse_records(
+    payload: str,
+    count: str,
+    layout: Layout,
+    wanted: Optional[Container[str]] = None,
+) -> list[Union[Execution, Orderbook]]:
+    """페이로드(`^` 구분) → 레코드. count=프레임 헤더 건수, wanted 지정 시 그 종목만.
+
+    레코드 길이가 레이아웃 최소 필드 수보다 짧으면 건너뛴다.
+    """
+    try:
+        n_rec = max(int(count), 1)
+    except ValueError:
+        n_rec = 1
+    if n_rec == 1:
+        if wanted is not None and payload[:payload.find('^')] not in wanted:
+            return []
+        t = payload.split('^', layout.max_index + 1)
+    else:
+        t = payload.split('^')
+    stride = len(t) // n_rec
+    if stride < layout.min_fields:
+        return []
+    if isinstance(layout, ExecLayout):
+        return [_execution(t, b, stride, layout) for b in range(0, stride * n_rec, stride)
+                if wanted is None or t[b] in wanted]
+    return [_orderbook(t, b, layout) for b in range(0, stride * n_rec, stride)
+            if wanted is None or t[b] in wanted]
+
+
+def parse_one(payload: str, layout: Layout) -> Optional[dict]:
+    """단일 레코드 → dict (type 제외) — 기존 `_parse_*` 반환 형식 호환."""
+    recs = parse_records(payload, "1", layout)
+    if not recs:
+        return None
+    msg = recs[0].message()
+    del msg["type"]
+    return msg
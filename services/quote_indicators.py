@@ -0,0 +1,417 @@
+"""실시간 체결 → 분봉 집계 + 증분 기술지표 (KISQuoteManager 체결 스트림 연동).
+
+`stock.indicators.calc_technical_indicators`는 요청마다 전체 봉 이력을 다시 계산한다.
+여기서는 구독 종목의 체결 틱(H0UNCNT0/H0STCNT0/H0NXCNT0)을 1/15/60분봉으로 집계하고
+지표 상태를 봉 단위로 갱신한다 — 봉 확정·미확정 봉 스냅샷 모두 봉당 O(1).
+
+지표 정의·파라미터는 `stock.indicators`와 동일 (MACD 12/26/9 — 시그널은 4자리 반올림 MACD의
+EMA(9), RSI/ATR Wilder 14, Stochastic 14/3, Bollinger 20/2σ 모집단 표준편차, MA 5/20/60).
+같은 봉 계열이면 마지막 봉 값이 `calc_technical_indicators` 결과와 같다 (창 합 반올림 오차 이내).
+
+  - EMA/Wilder: 직전 확정 값 1개로 재귀
+  - SMA/Bollinger: 최근 period-1개 확정 값의 이동 합·제곱합 (period회마다 재합산해 누적 오차 차단)
+  - Stochastic 최고/최저: 단조 덱 (amortized O(1))
+
+미확정(진행 중) 봉은 확정 상태를 바꾸지 않고 `peek`으로 계산한다. 봉 확정은 다음 버킷 틱 도착 시점.
+구독자가 없는 종목은 상태를 유지하지 않는다 (`IndicatorHub.untrack`).
+"""
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from config import QUOTE_INDICATOR_INTERVALS
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+# 분봉 간격(분) → 초기 이력 yfinance (interval, period). MA60 워밍업(60봉) 이상 확보.
+_SEED_SOURCE: dict[int, tuple[str, str]] = {
+    1: ("1m", "5d"),
+    15: ("15m", "60d"),
+    60: ("60m", "3mo"),
+}
+# 재시드 시 재적용할 스트림 확정 봉 보관 수 (종목·간격별)
+_RECENT_BARS = 500
+
+
+def allowed_intervals() -> tuple[int, ...]:
+    """설정된 지원 간격(분). 파싱 불가 값은 무시."""
+    out = []
+    for tok in QUOTE_INDICATOR_INTERVALS.split(","):
+        tok = tok.strip()
+        if tok.isdigit() and int(tok) in _SEED_SOURCE:
+            out.append(int(tok))
+    return tuple(sorted(set(out)))
+
+
+def _round(v: Optional[float]) -> Optional[float]:
+    """`stock.indicators._safe_val`과 동일 — 소수 4자리, NaN/Inf → None."""
+    if v is None or math.isnan(v) or math.isinf(v):
+        return None
+    return round(v, 4)
+
+
+# ── 증분 지표 구성요소 ──────────────────────────────────────────────────────
+
+class _Recursive:
+    """SMA 시드 재귀 평활. wilder=False: EMA(k=2/(p+1)), True: Wilder((prev·(p-1)+x)/p)."""
+
+    __slots__ = ("period", "wilder", "k", "count", "seed_sum", "value")
+
+    def __init__(self, period: int, wilder: bool = False):
+        self.period = period
+        self.wilder = wilder
+        self.k = 2 / (period + 1)
+        self.count = 0
+        self.seed_sum = 0.0
+        self.value: Optional[float] = None
+
+    def _next(self, x: float) -> Optional[float]:
+        if self.count + 1 < self.period:
+            return None
+        if self.count + 1 == self.period:
+            return (self.seed_sum + x) / self.period
+        if self.wilder:
+            return (self.value * (self.period - 1) + x) / self.period
+        return x * self.k + self.value * (1 - self.k)
+
+    def peek(self, x: float) -> Optional[float]:
+        return self._next(x)
+
+    def push(self, x: float) -> Optional[float]:
+        v = self._next(x)
+        if self.count < self.period:
+            self.seed_sum += x
+        self.count += 1
+        self.value = v
+        return v
+
+
+class _Window:
+    """최근 period-1개 확정 값의 이동 합/제곱합 → 새 값 포함 period개 평균·모집단 표준편차.
+
+    제곱합은 기준값(ref) 차이로 누적해 큰 가격대의 상쇄 오차를 줄이고, period회마다 재합산한다.
+    """
+
+    __slots__ = ("period", "values", "ref", "s1", "s2", "since_resum")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values: deque[float] = deque(maxlen=max(period - 1, 0))
+        self.ref = 0.0
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.since_resum = 0
+
+    def push(self, x: float) -> None:
+        if self.period <= 1:
+            return
+        if len(self.values) == self.values.maxlen:
+            old = self.values[0] - self.ref
+            self.s1 -= old
+            self.s2 -= old * old
+        self.values.append(x)
+        d = x - self.ref
+        self.s1 += d
+        self.s2 += d * d
+        self.since_resum += 1
+        if self.since_resum >= self.period:
+            self._resum()
+
+    def _resum(self) -> None:
+        self.ref = self.values[-1] if self.values else 0.0
+        self.s1 = sum(v - self.ref for v in self.values)
+        self.s2 = sum((v - self.ref) ** 2 for v in self.values)
+        self.since_resum = 0
+
+    def ready(self) -> bool:
+        return len(self.values) >= self.period - 1
+
+    def mean(self, x: float) -> Optional[float]:
+        if not self.ready():
+            return None
+        return self.ref + (self.s1 + (x - self.ref)) / self.period
+
+    def mean_std(self, x: float) -> tuple[Optional[float], Optional[float]]:
+        if not self.ready():
+            return None, None
+        d = x - self.ref
+        m1 = (self.s1 + d) / self.period
+        var = (self.s2 + d * d) / self.period - m1 * m1
+        return self.ref + m1, math.sqrt(max(var, 0.0))
+
+
+class _Extreme:
+    """최근 period-1개 확정 값의 최대(또는 최소) — 단조 덱."""
+
+    __slots__ = ("span", "is_max", "dq", "n")
+
+    def __init__(self, period: int, is_max: bool):
+        self.span = period - 1
+        self.is_max = is_max
+        self.dq: deque[tuple[int, float]] = deque()
+        self.n = 0
+
+    def push(self, x: float) -> None:
+        dq = self.dq
+        if self.is_max:
+            while dq and dq[-1][1] <= x:
+                dq.pop()
+        else:
+            while dq and dq[-1][1] >= x:
+                dq.pop()
+        dq.append((self.n, x))
+        self.n += 1
+        while dq and dq[0][0] <= self.n - 1 - self.span:
+            dq.popleft()
+
+    def ready(self) -> bool:
+        return self.n >= self.span
+
+    def with_(self, x: float) -> Optional[float]:
+        if not self.ready():
+            return None
+        if not self.dq:
+            return x
+        v = self.dq[0][1]
+        return max(v, x) if self.is_max else min(v, x)
+
+
+class IndicatorState:
+    """봉 계열 1개(종목·간격)의 증분 지표 상태. push(확정 봉) / snapshot(진행 중 봉)."""
+
+    def __init__(self):
+        self.bars = 0
+        self.prev_close: Optional[float] = None
+        self.ema12 = _Recursive(12)
+        self.ema26 = _Recursive(26)
+        self.signal = _Recursive(9)
+        self.rsi_gain = _Recursive(14, wilder=True)
+        self.rsi_loss = _Recursive(14, wilder=True)
+        self.atr = _Recursive(14, wilder=True)
+        self.stoch_hi = _Extreme(14, is_max=True)
+        self.stoch_lo = _Extreme(14, is_max=False)
+        self.stoch_d = _Window(3)
+        self.bb = _Window(20)
+        self.ma5 = _Window(5)
+        self.ma60 = _Window(60)
+
+    def _compute(self, bar: dict, commit: bool) -> dict:
+        h, lo, c = float(bar["high"]), float(bar["low"]), float(bar["close"])
+        op = "push" if commit else "peek"
+
+        # MACD — 시그널 입력은 반올림 MACD, 미확정 구간은 0.0 (stock.indicators와 동일)
+        e12 = getattr(self.ema12, op)(c)
+        e26 = getattr(self.ema26, op)(c)
+        macd = _round(e12 - e26) if (e12 is not None and e26 is not None) else None
+        sig = _round(getattr(self.signal, op)(macd if macd is not None else 0.0))
+        hist = _round(macd - sig) if (macd is not None and sig is not None) else None
+
+        rsi = atr = None
+        if self.prev_close is not None:
+            diff = c - self.prev_close
+            ag = getattr(self.rsi_gain, op)(max(diff, 0))
+            al = getattr(self.rsi_loss, op)(max(-diff, 0))
+            if ag is not None and al is not None:
+                rs = ag / al if al > 0 else 100
+                rsi = 100 - (100 / (1 + rs))
+            tr = max(h - lo, abs(h - self.prev_close), abs(lo - self.prev_close))
+            atr = getattr(self.atr, op)(tr)
+
+        k = d = None
+        hh, ll = self.stoch_hi.with_(h), self.stoch_lo.with_(lo)
+        if hh is not None and ll is not None:
+            k = 50.0 if hh == ll else (c - ll) / (hh - ll) * 100
+            d = self.stoch_d.mean(k)
+
+        mid, std = self.bb.mean_std(c)
+        upper = lower = None
+        if mid is not None:
+            upper, lower = mid + 2.0 * std, mid - 2.0 * std
+
+        out = {
+            "macd": {"macd": macd, "signal": sig, "histogram": hist},
+            "rsi": _round(rsi),
+            "stoch": {"k": _round(k), "d": _round(d)},
+            "bb": {"upper": _round(upper), "mid": _round(mid), "lower": _round(lower)},
+            "ma": {"ma5": _round(self.ma5.mean(c)), "ma20": _round(mid), "ma60": _round(self.ma60.mean(c))},
+            "atr": _round(atr),
+        }
+        if commit:
+            self.stoch_hi.push(h)
+            self.stoch_lo.push(lo)
+            if k is not None:
+                self.stoch_d.push(k)
+            self.bb.push(c)
+            self.ma5.push(c)
+            self.ma60.push(c)
+            self.prev_close = c
+            self.bars += 1
+        return out
+
+    def push(self, bar: dict) -> dict:
+        """확정 봉 반영 → 그 봉의 지표 값."""
+        return self._compute(bar, commit=True)
+
+    def snapshot(self, bar: dict) -> dict:
+        """진행 중 봉을 마지막 봉으로 본 지표 값 (상태 불변)."""
+        return self._compute(bar, commit=False)
+
+
+# ── 틱 → 분봉 집계 ───────────────────────────────────────────────────────────
+
+def bucket_start(ts: datetime, minutes: int) -> datetime:
+    """틱 시각 → 봉 시작 시각 (자정 기준 minutes 단위 내림 — 09:00/09:15/…, 60분은 정시)."""
+    m = (ts.hour * 60 + ts.minute) // minutes * minutes
+    return ts.replace(hour=m // 60, minute=m % 60, second=0, microsecond=0)
+
+
+class _Series:
+    """종목·간격 1개: 확정 지표 상태 + 진행 중 봉 + 최근 확정 봉(재시드용)."""
+
+    __slots__ = ("minutes", "state", "forming", "recent", "seeded")
+
+    def __init__(self, minutes: int):
+        self.minutes = minutes
+        self.state = IndicatorState()
+        self.forming: Optional[dict] = None
+        self.recent: deque[dict] = deque(maxlen=_RECENT_BARS)
+        self.seeded = False
+
+    def on_tick(self, ts: datetime, price: float, volume: float) -> bool:
+        """틱 반영. 과거 버킷 틱(지연 도착)은 무시하고 False."""
+        start = bucket_start(ts, self.minutes).strftime("%Y-%m-%dT%H:%M:%S")
+        bar = self.forming
+        if bar is not None and start < bar["time"]:
+            return False
+        if bar is None or start > bar["time"]:
+            if bar is not None:
+                self.state.push(bar)
+                self.recent.append(bar)
+            self.forming = {"time": start, "open": price, "high": price, "low": price,
+                            "close": price, "volume": volume}
+            return True
+        bar["high"] = max(bar["high"], price)
+        bar["low"] = min(bar["low"], price)
+        bar["close"] = price
+        bar["volume"] += volume
+        return True
+
+    def seed(self, history: list[dict], now: Optional[datetime] = None) -> None:
+        """이력 봉(과거→최신)으로 상태 재구성 후 스트림 확정 봉 재적용.
+
+        스트림 첫 봉 이후·현재 버킷 이후 시각의 이력 봉은 버린다 (yfinance 분봉은 지연/부분 봉).
+        """
+        now = now or datetime.now(KST).replace(tzinfo=None)
+        cutoff = bucket_start(now, self.minutes).strftime("%Y-%m-%dT%H:%M:%S")
+        first = self.recent[0]["time"] if self.recent else (self.forming or {}).get("time")
+        if first is not None:
+            cutoff = min(cutoff, first)
+        state = IndicatorState()
+        for b in history:
+            if b["time"] >= cutoff:
+                break
+            state.push(b)
+        for b in self.recent:
+            state.push(b)
+        self.state = state
+        self.seeded = True
+
+    def snapshot(self, symbol: str) -> Optional[dict]:
+        if self.forming is None:
+            return None
+        return {
+            "type": "indicators",
+            "symbol": symbol,
+            "interval": self.minutes,
+            "bar": dict(self.forming),
+            "closed_bars": self.state.bars,
+            **self.state.snapshot(self.forming),
+        }
+
+
+class IndicatorHub:
+    """구독 종목별 분봉 지표 상태 + 구독 큐 레지스트리 (이벤트 루프 단일 스레드에서만 호출)."""
+
+    def __init__(self):
+        self._series: dict[str, dict[int, _Series]] = {}
+        # symbol → {queue: 구독 간격}
+        self._subscribers: dict[str, dict[object, tuple[int, ...]]] = {}
+
+    def tracking(self, symbol: str) -> bool:
+        return symbol in self._subscribers
+
+    def track(self, symbol: str, queue, intervals: Iterable[int]) -> list[int]:
+        """구독 등록 → 새로 만든(시드 필요한) 간격 목록."""
+        intervals = tuple(sorted(set(intervals)))
+        self._subscribers.setdefault(symbol, {})[queue] = intervals
+        per = self._series.setdefault(symbol, {})
+        created = []
+        for m in intervals:
+            if m not in per:
+                per[m] = _Series(m)
+                created.append(m)
+        return created
+
+    def untrack(self, symbol: str, queue) -> None:
+        subs = self._subscribers.get(symbol)
+        if subs is None:
+            return
+        subs.pop(queue, None)
+        if not subs:
+            self._subscribers.pop(symbol, None)
+            self._series.pop(symbol, None)
+            return
+        wanted = {m for ivs in subs.values() for m in ivs}
+        per = self._series.get(symbol, {})
+        for m in list(per):
+            if m not in wanted:
+                per.pop(m)
+
+    def seed(self, symbol: str, minutes: int, history: list[dict], now: Optional[datetime] = None) -> None:
+        series = self._series.get(symbol, {}).get(minutes)
+        if series is not None:
+            series.seed(history, now)
+
+    def on_tick(self, symbol: str, ts: datetime, price: float, volume: float) -> list[dict]:
+        """체결 틱 → 갱신된 간격별 스냅샷 리스트."""
+        out = []
+        for series in self._series.get(symbol, {}).values():
+            if series.on_tick(ts, price, volume):
+                snap = series.snapshot(symbol)
+                if snap is not None:
+                    out.append(snap)
+        return out
+
+    def snapshot(self, symbol: str, minutes: int) -> Optional[dict]:
+        series = self._series.get(symbol, {}).get(minutes)
+        return series.snapshot(symbol) if series is not None else None
+
+    def queues_for(self, symbol: str, minutes: int) -> list:
+        return [q for q, ivs in self._subscribers.get(symbol, {}).items() if minutes in ivs]
+
+
+def tick_time(hhmmss: str, now: Optional[datetime] = None) -> datetime:
+    """체결시각 HHMMSS(KST) → 당일 naive KST datetime. 파싱 실패 시 현재 시각."""
+    now = now or datetime.now(KST).replace(tzinfo=None)
+    try:
+        return now.replace(hour=int(hhmmss[0:2]), minute=int(hhmmss[2:4]),
+                           second=int(hhmmss[4:6]), microsecond=0)
+    except (TypeError, ValueError):
+        return now
+
+
+def load_history(symbol: str, minutes: int) -> list[dict]:
+    """초기 시드용 yfinance 분봉 이력 (동기 — executor에서 호출). 실패 시 []."""
+    src = _SEED_SOURCE.get(minutes)
+    if src is None:
+        return []
+    from stock.advisory_fetcher import _fetch_ohlcv_kr_yf
+
+    interval, period = src
+    return _fetch_ohlcv_kr_yf(symbol, interval=interval, period=period)
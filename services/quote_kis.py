@@ -4,10 +4,12 @@
   - 통합(UN, 09:00~15:30): H0UNCNT0 + H0UNASP0 (KRX+NXT 통합시세)
   - KRX(15:30~15:40, 마감 동시호가): H0STCNT0 + H0STASP0
   - NXT(08:00~09:00, 15:40~20:00): H0NXCNT0 + H0NXASP0
-  WS 끊김 시 KIS REST FHKST01010100 3초 폴링 자동 전환.
+  WS 끊김 시 KIS REST FHKST01010100 폴링 자동 전환 (services/quote_rest_poller — 토큰 버킷 동시 요청).
 선물옵션(FNO): H0IFASP0/H0IFCNT0(지수) H0IOASP0/H0IOCNT0(지수옵션)
               H0ZFASP0/H0ZFCNT0(주식선물) H0ZOASP0/H0ZOCNT0(주식옵션)
               동일 WS 연결, 5레벨(지수) 또는 10레벨(주식) 호가
+WS 라우트 구독(subscribe_frames): services/quote_fanout.FanoutHub — 심볼별 병합·직렬화 1회 fan-out
+실시간 분봉 지표: KR 체결 틱 → services/quote_indicators.IndicatorHub (지표 구독 종목만)
 체결통보(H0STCNI0): KIS_HTS_ID 설정 시 AES-CBC 복호화
                    ORD_EXG_GB 토큰(1=KRX/2=NXT/3=SOR-KRX/4=SOR-NXT) 포함.
 
@@ -24,8 +26,20 @@ import requests
 import websockets
 from collections import defaultdict
 
-from config import KIS_APP_KEY, KIS_APP_SECRET, KIS_BASE_URL, KIS_HTS_ID
+from config import KIS_APP_KEY, KIS_APP_SECRET, KIS_BASE_URL, KIS_HTS_ID, QUOTE_FALLBACK_CYCLE_SEC
 from routers._kis_auth import get_access_token_safe, clear_token_cache
+from services.quote_fanout import FanoutHub, put_latest
+from services.quote_frames import (
+    FNO_EXECUTION,
+    FNO_ORDERBOOK_5,
+    FNO_ORDERBOOK_10,
+    KR_EXECUTION,
+    KR_ORDERBOOK,
+    parse_one,
+    parse_records,
+)
+from services.quote_indicators import IndicatorHub, load_history, tick_time
+from services.quote_rest_poller import FNO_MRKT_DIV, RestFallbackPoller, parse_fno_price
 
 KIS_WS_URL = "ws://ops.koreainvestment.com:21000"
 KST = timezone(timedelta(hours=9))
@@ -85,6 +99,15 @@ _FNO_EXECUTION_TR_IDS: set[str] = {"H0IFCNT0", "H0IOCNT0", "H0ZFCNT0", "H0ZOCNT0
 _FNO_ORDERBOOK_TR_IDS: set[str] = {"H0IFASP0", "H0IOASP0", "H0ZFASP0", "H0ZOASP0"}
 _FNO_5LEVEL_TR_IDS:   set[str] = {"H0IFASP0", "H0IOASP0"}
 
+# 실시간 시세 TR_ID → 프레임 필드 레이아웃 (services/quote_frames.py)
+_FRAME_LAYOUTS: dict = {
+    **{tr: KR_EXECUTION for tr in _KR_EXECUTION_TR_IDS},
+    **{tr: KR_ORDERBOOK for tr in _KR_ORDERBOOK_TR_IDS},
+    **{tr: FNO_EXECUTION for tr in _FNO_EXECUTION_TR_IDS},
+    **{tr: FNO_ORDERBOOK_5 if tr in _FNO_5LEVEL_TR_IDS else FNO_ORDERBOOK_10
+       for tr in _FNO_ORDERBOOK_TR_IDS},
+}
+
 
 def _resolve_fno_type(symbol: str) -> str:
     """FNO 심볼 → 상품 유형 코드 ('IF'|'IO'|'ZF'|'ZO')."""
@@ -125,6 +148,7 @@ class KISQuoteManager:
         # REST fallback
         self._fallback_mode: bool = False
         self._fallback_task: asyncio.Task | None = None
+        self._poller = RestFallbackPoller()
         # FNO 구독 관리
         self._fno_symbols: set[str] = set()
         self._fno_types: dict[str, str] = {}  # symbol → 'IF'|'IO'|'ZF'|'ZO'
@@ -141,6 +165,10 @@ class KISQuoteManager:
         self._clock_resync_task: asyncio.Task | None = None
         # _connect_loop 연속 실패 카운터 (5회 이상 시 critical 로그 1회)
         self._consecutive_connect_failures: int = 0
+        # 실시간 분봉 지표 (지표 구독 종목만 상태 유지)
+        self._indicators = IndicatorHub()
+        # WS 라우트 구독자 — 심볼별 병합 + 인코딩 텍스트 공유 (_subscribers에도 함께 등록)
+        self._fanout = FanoutHub()
 
     # ── lifecycle ──────────────────────────────────────────────────
 
@@ -162,6 +190,7 @@ class KISQuoteManager:
     async def stop(self):
         self._running = False
         self._fallback_mode = False
+        self._fanout.close()
         if self._ws:
             try:
                 await self._ws.close()
@@ -179,6 +208,7 @@ class KISQuoteManager:
                 await self._fallback_task
             except asyncio.CancelledError:
                 pass
+        await self._poller.aclose()
         if self._clock_resync_task:
             self._clock_resync_task.cancel()
             try:
@@ -232,6 +262,69 @@ class KISQuoteManager:
             self._fno_types.pop(symbol, None)
             self._kr_exchange_pref.pop(symbol, None)
             self._kr_active_exchange.pop(symbol, None)
+            self._poller.forget(symbol)
+
+    async def subscribe_frames(
+        self,
+        symbol: str,
+        queue: asyncio.Queue,
+        is_fno: bool = False,
+        *,
+        exchange: str = "auto",
+    ):
+        """심볼 구독 (WS 라우트용) — queue에는 병합·직렬화된 JSON 텍스트 프레임이 들어온다.
+
+        같은 심볼 구독자들은 flush 타이머 1개와 인코딩 결과를 공유한다 (services/quote_fanout.py).
+        """
+        self._fanout.add(symbol, queue)
+        await self.subscribe(symbol, queue, is_fno, exchange=exchange)
+
+    def unsubscribe_frames(self, symbol: str, queue: asyncio.Queue):
+        self._fanout.remove(symbol, queue)
+        self.unsubscribe(symbol, queue)
+
+    async def subscribe_indicators(
+        self,
+        symbol: str,
+        queue: asyncio.Queue,
+        intervals: list[int],
+        *,
+        exchange: str = "auto",
+    ):
+        """KR 종목 분봉 지표 구독 — 체결 구독(subscribe) + 간격별 지표 상태 등록.
+
+        새로 만든 간격은 yfinance 분봉 이력으로 백그라운드 시드 후 현재 스냅샷을 push.
+        queue에는 price/orderbook 메시지도 함께 들어온다 (호출자가 필터).
+        """
+        await self.subscribe(symbol, queue, exchange=exchange)
+        created = self._indicators.track(symbol, queue, intervals)
+        for minutes in intervals:
+            if minutes in created:
+                asyncio.create_task(self._seed_indicators(symbol, minutes))
+            else:
+                snap = self._indicators.snapshot(symbol, minutes)
+                if snap is not None:
+                    self._put_latest(queue, snap, symbol)
+
+    def unsubscribe_indicators(self, symbol: str, queue: asyncio.Queue):
+        self._indicators.untrack(symbol, queue)
+        self.unsubscribe(symbol, queue)
+
+    async def _seed_indicators(self, symbol: str, minutes: int):
+        """분봉 이력 시드 (executor) → 구독자에게 현재 스냅샷 push."""
+        try:
+            loop = asyncio.get_event_loop()
+            history = await loop.run_in_executor(None, load_history, symbol, minutes)
+        except Exception as e:
+            logger.debug("[QuoteService] 지표 시드 실패: %s/%dm — %s", symbol, minutes, e)
+            return
+        if not self._indicators.tracking(symbol):
+            return
+        self._indicators.seed(symbol, minutes, history)
+        snap = self._indicators.snapshot(symbol, minutes)
+        if snap is not None:
+            for q in self._indicators.queues_for(symbol, minutes):
+                self._put_latest(q, snap, symbol)
 
     async def subscribe_notice(self, queue: asyncio.Queue):
         """체결통보(H0STCNI0) 구독."""
@@ -260,10 +353,7 @@ class KISQuoteManager:
                     "change": 0.0,
                     "change_rate": data.get("change_pct") or 0.0,
                 }
-                try:
-                    queue.put_nowait(msg)
-                except asyncio.QueueFull:
-                    pass
+                self._deliver(symbol, queue, msg)
         except Exception as e:
             logger.debug("[QuoteService] 초기 가격 push 실패: %s — %s", symbol, e)
 
@@ -273,10 +363,7 @@ class KISQuoteManager:
             loop = asyncio.get_event_loop()
             msg = await loop.run_in_executor(None, self._fetch_fno_rest_price_sync, symbol)
             if msg:
-                try:
-                    queue.put_nowait(msg)
-                except asyncio.QueueFull:
-                    pass
+                self._deliver(symbol, queue, msg)
         except Exception as e:
             logger.debug("[QuoteService] FNO 초기 가격 push 실패: %s — %s", symbol, e)
 
@@ -516,28 +603,17 @@ class KISQuoteManager:
         if not data:
             return
         if data[0] in ('0', '1'):
-            tokens = data.split('|')
+            tokens = data.split('|', 3)
             if len(tokens) < 4:
                 return
             tr_id = tokens[1]
-            # KR 종목: 통합(H0UN*) / KRX(H0ST*) / NXT(H0NX*) 모두 동일 파서 재사용
-            if tr_id in _KR_EXECUTION_TR_IDS:
-                parsed = self._parse_execution(tokens[3])
-                if parsed:
-                    await self._broadcast(parsed["symbol"], {"type": "price", **parsed})
-            elif tr_id in _KR_ORDERBOOK_TR_IDS:
-                parsed = self._parse_orderbook(tokens[3])
-                if parsed:
-                    await self._broadcast(parsed["symbol"], {"type": "orderbook", **parsed})
-            elif tr_id in _FNO_EXECUTION_TR_IDS:
-                parsed = self._parse_fno_execution(tokens[3])
-                if parsed:
-                    await self._broadcast(parsed["symbol"], {"type": "price", **parsed})
-            elif tr_id in _FNO_ORDERBOOK_TR_IDS:
-                levels = 5 if tr_id in _FNO_5LEVEL_TR_IDS else 10
-                parsed = self._parse_fno_orderbook(tokens[3], levels)
-                if parsed:
-                    await self._broadcast(parsed["symbol"], {"type": "orderbook", **parsed})
+            # KR 통합(H0UN*) / KRX(H0ST*) / NXT(H0NX*) / FNO — TR_ID별 레이아웃 표, 다건 프레임 일괄 파싱
+            layout = _FRAME_LAYOUTS.get(tr_id)
+            if layout is not None:
+                for rec in parse_records(tokens[3], tokens[2], layout, self._subscribers):
+                    self._broadcast_record(rec)
+                    if layout is KR_EXECUTION and self._indicators.tracking(rec.symbol):
+                        self._on_indicator_tick(rec)
             elif tr_id == "H0STCNI0":
                 parsed = self._parse_notice(tokens[3])
                 if parsed:
@@ -563,20 +639,51 @@ class KISQuoteManager:
     _drop_count: dict[str, int] = {}
 
     async def _broadcast(self, symbol: str, message: dict):
+        framed = self._fanout.queues(symbol)
         for q in list(self._subscribers.get(symbol, set())):
-            if q.full():
-                try:
-                    q.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                cnt = self._drop_count[symbol] = self._drop_count.get(symbol, 0) + 1
-                if cnt % 100 == 1:
-                    logger.warning("[QuoteManager] %s: %d messages dropped (queue full)", symbol, cnt)
+            if q not in framed:
+                self._put_latest(q, message, symbol)
+        if framed:
+            self._fanout.publish(symbol, message)
+
+    def _broadcast_record(self, rec):
+        """파싱 레코드 브로드캐스트 — dict는 일반 큐 구독자가 있을 때만 즉시 생성, 프레임 구독자는 flush 시."""
+        symbol = rec.symbol
+        framed = self._fanout.queues(symbol)
+        message = None
+        for q in list(self._subscribers.get(symbol, set())):
+            if q not in framed:
+                if message is None:
+                    message = rec.message()
+                self._put_latest(q, message, symbol)
+        if framed:
+            self._fanout.publish(symbol, rec)
+
+    def _deliver(self, symbol: str, queue: asyncio.Queue, message: dict):
+        """구독 큐 1개에 즉시 전달 — 프레임 구독자면 인코딩 텍스트, 아니면 dict."""
+        if queue in self._fanout.queues(symbol):
+            self._fanout.send(symbol, queue, message)
+        else:
             try:
-                q.put_nowait(message)
+                queue.put_nowait(message)
             except asyncio.QueueFull:
                 pass
 
+    def _on_indicator_tick(self, rec):
+        """KR 체결 레코드(quote_frames.Execution) → 분봉 집계·지표 갱신 → 간격별 구독 큐에 스냅샷."""
+        symbol = rec.symbol
+        ts = tick_time(rec.tick_time or "")
+        for snap in self._indicators.on_tick(symbol, ts, rec.price, rec.tick_volume or 0.0):
+            for q in self._indicators.queues_for(symbol, snap["interval"]):
+                self._put_latest(q, snap, symbol)
+
+    def _put_latest(self, q: asyncio.Queue, message: dict, symbol: str):
+        """큐가 가득 차면 가장 오래된 메시지를 버리고 넣는다."""
+        if put_latest(q, message):
+            cnt = self._drop_count[symbol] = self._drop_count.get(symbol, 0) + 1
+            if cnt % 100 == 1:
+                logger.warning("[QuoteManager] %s: %d messages dropped (queue full)", symbol, cnt)
+
     async def _broadcast_all(self, message: dict):
         for symbol in list(self._subscribers.keys()):
             await self._broadcast(symbol, message)
@@ -584,183 +691,49 @@ class KISQuoteManager:
     # ── REST Fallback ──────────────────────────────────────────────
 
     async def _rest_fallback_loop(self):
-        """WS 끊김 시 KIS REST 3초 폴링 (price only). FNO는 FHMIF10000000, 국내는 FHKST01010100."""
-        logger.info("[QuoteService] REST fallback 폴링 시작")
-        while self._fallback_mode and self._running:
-            symbols = list(self._subscribers.keys())
-            for symbol in symbols:
-                if not self._fallback_mode or not self._running:
-                    break
-                try:
-                    if symbol in self._fno_symbols:
-                        loop = asyncio.get_event_loop()
-                        msg = await loop.run_in_executor(None, self._fetch_fno_rest_price_sync, symbol)
-                    else:
-                        msg = await self._fetch_rest_price(symbol)
-                    if msg:
-                        await self._broadcast(symbol, msg)
-                except Exception as e:
-                    logger.debug("[QuoteService] REST fallback %s: %s", symbol, e)
-                await asyncio.sleep(0.1)  # 심볼 간 0.1초 (KIS 초당 10건)
-            await asyncio.sleep(3)  # 폴링 주기 3초
-        logger.info("[QuoteService] REST fallback 폴링 종료")
+        """WS 끊김 시 KIS REST 폴링 (price only). FNO는 FHMIF10000000, 국내는 FHKST01010100.
 
-    async def _fetch_rest_price(self, symbol: str) -> dict | None:
-        if not KIS_APP_KEY or not KIS_APP_SECRET:
-            return None
+        RestFallbackPoller — 토큰 버킷(초당 상한) 안에서 동시 요청, 구독자 수가 많은 종목부터.
+        사이클 간격은 최소 QUOTE_FALLBACK_CYCLE_SEC.
+        """
+        logger.info("[QuoteService] REST fallback 폴링 시작")
 
-        loop = asyncio.get_event_loop()
+        def active() -> bool:
+            return self._fallback_mode and self._running
 
-        def _sync():
-            token = get_access_token_safe()
-            if not token:
-                return None
-            headers = {
-                "content-type": "application/json",
-                "authorization": f"Bearer {token}",
-                "appkey": KIS_APP_KEY,
-                "appsecret": KIS_APP_SECRET,
-                "tr_id": "FHKST01010100",
-                "custtype": "P",
-            }
-            params = {
-                "fid_cond_mrkt_div_code": "J",
-                "fid_input_iscd": symbol,
-            }
-            resp = requests.get(
-                f"{KIS_BASE_URL}/uapi/domestic-stock/v1/quotations/inquire-price",
-                headers=headers,
-                params=params,
-                timeout=5,
-            )
-            if resp.status_code == 401:
-                clear_token_cache()
-                return None
-            output = resp.json().get("output", {})
-            price = float(output.get("stck_prpr", 0) or 0)
-            if price <= 0:
-                # 비개장일: yfinance fallback으로 직전 거래일 가격 반환
-                try:
-                    from stock.market import fetch_price
-                    data = fetch_price(symbol)
-                    if data and data.get("price"):
-                        return {
-                            "type": "price",
-                            "symbol": symbol,
-                            "price": data["price"],
-                            "sign": "3",
-                            "change": 0.0,
-                            "change_rate": data.get("change_pct") or 0.0,
-                        }
-                except Exception:
-                    pass
-                return None
-            return {
-                "type": "price",
-                "symbol": symbol,
-                "price": price,
-                "sign": output.get("prdy_vrss_sign", "3"),
-                "change": float(output.get("prdy_vrss", 0) or 0),
-                "change_rate": float(output.get("prdy_ctrt", 0) or 0),
-            }
+        while active():
+            started = time.monotonic()
+            symbols = sorted(self._subscribers, key=lambda s: -len(self._subscribers.get(s, ())))
+            targets = [(s, self._fno_type(s) if s in self._fno_symbols else None) for s in symbols]
+            try:
+                await self._poller.poll(targets, self._broadcast, active)
+            except Exception as e:
+                logger.debug("[QuoteService] REST fallback 사이클 실패: %s", e)
+            await asyncio.sleep(max(QUOTE_FALLBACK_CYCLE_SEC - (time.monotonic() - started), 0.1))
+        logger.info("[QuoteService] REST fallback 폴링 종료")
 
-        return await loop.run_in_executor(None, _sync)
+    def _fno_type(self, symbol: str) -> str:
+        fno_type = self._fno_types.get(symbol)
+        if not fno_type:
+            fno_type = _resolve_fno_type(symbol)
+            self._fno_types[symbol] = fno_type
+        return fno_type
 
-    @staticmethod
-    def _sf(v) -> float:
-        try:
-            return float(v)
-        except Exception:
-            return 0.0
+    # 단일 레코드 파서 — services/quote_frames 레이아웃 위임 (type 키 없는 dict 반환)
 
     def _parse_execution(self, raw: str) -> dict | None:
-        t = raw.split('^')
-        if len(t) < 6:
-            return None
-        sf = self._sf
-        result = {
-            "symbol": t[0],
-            "price": sf(t[2]),
-            "sign": t[3],
-            "change": sf(t[4]),
-            "change_rate": sf(t[5]),
-        }
-        # H0STCNT0: t[7]=시가, t[8]=고가, t[9]=저가
-        if len(t) > 9:
-            result["open"] = sf(t[7])
-            result["high"] = sf(t[8])
-            result["low"] = sf(t[9])
-        return result
+        return parse_one(raw, KR_EXECUTION)
 
     def _parse_orderbook(self, raw: str) -> dict | None:
-        t = raw.split('^')
-        if len(t) < 45:
-            return None
-        sf = self._sf
-        asks = [{"price": sf(t[3 + i]), "volume": sf(t[23 + i])} for i in range(10)]
-        bids = [{"price": sf(t[13 + i]), "volume": sf(t[33 + i])} for i in range(10)]
-        return {
-            "symbol": t[0],
-            "asks": asks,
-            "bids": bids,
-            "total_ask_volume": sf(t[43]),
-            "total_bid_volume": sf(t[44]),
-        }
+        return parse_one(raw, KR_ORDERBOOK)
 
     def _parse_fno_execution(self, raw: str) -> dict | None:
-        """FNO 체결 파싱. H0IFCNT0/H0IOCNT0/H0ZFCNT0/H0ZOCNT0 공통.
-        [0]=종목코드, [2]=전일대비, [3]=부호, [4]=대비율, [5]=현재가
-        """
-        t = raw.split('^')
-        if len(t) < 6:
-            return None
-        sf = self._sf
-        return {
-            "symbol": t[0],
-            "price": sf(t[5]),
-            "sign": t[3],
-            "change": sf(t[2]),
-            "change_rate": sf(t[4]),
-        }
+        """FNO 체결 파싱. H0IFCNT0/H0IOCNT0/H0ZFCNT0/H0ZOCNT0 공통."""
+        return parse_one(raw, FNO_EXECUTION)
 
     def _parse_fno_orderbook(self, raw: str, levels: int) -> dict | None:
-        """FNO 호가 파싱.
-        5레벨(H0IFASP0/H0IOASP0):
-          [0]=종목코드, [2-6]=매도호가1-5, [7-11]=매수호가1-5,
-          [22-26]=매도잔량1-5, [27-31]=매수잔량1-5, [34]=총매도잔량, [35]=총매수잔량
-        10레벨(H0ZFASP0/H0ZOASP0):
-          5레벨 확장 구조 (실데이터 확인 후 오프셋 조정 필요)
-        """
-        t = raw.split('^')
-        sf = self._sf
-        if levels == 5:
-            if len(t) < 36:
-                return None
-            asks = [{"price": sf(t[2 + i]), "volume": sf(t[22 + i])} for i in range(5)]
-            bids = [{"price": sf(t[7 + i]), "volume": sf(t[27 + i])} for i in range(5)]
-            return {
-                "symbol": t[0],
-                "asks": asks,
-                "bids": bids,
-                "total_ask_volume": sf(t[34]),
-                "total_bid_volume": sf(t[35]),
-            }
-        else:
-            # 10레벨: H0ZFASP0/H0ZOASP0 — 오프셋은 5레벨과 유사한 패턴으로 추정
-            # [0]=종목, [2-11]=매도호가1-10, [12-21]=매수호가1-10,
-            # [32-41]=매도잔량1-10, [42-51]=매수잔량1-10, [54]=총매도, [55]=총매수
-            if len(t) < 56:
-                logger.debug("[QuoteService] FNO 10레벨 호가 필드 부족: %d", len(t))
-                return None
-            asks = [{"price": sf(t[2 + i]),  "volume": sf(t[32 + i])} for i in range(10)]
-            bids = [{"price": sf(t[12 + i]), "volume": sf(t[42 + i])} for i in range(10)]
-            return {
-                "symbol": t[0],
-                "asks": asks,
-                "bids": bids,
-                "total_ask_volume": sf(t[54]),
-                "total_bid_volume": sf(t[55]),
-            }
+        """FNO 호가 파싱. 5레벨(H0IFASP0/H0IOASP0) / 10레벨(H0ZFASP0/H0ZOASP0)."""
+        return parse_one(raw, FNO_ORDERBOOK_5 if levels == 5 else FNO_ORDERBOOK_10)
 
     def _parse_notice(self, encrypted_data: str) -> dict | None:
         """H0STCNI0 체결통보 AES 복호화 + 파싱."""
@@ -840,14 +813,7 @@ class KISQuoteManager:
             token = get_access_token_safe()
             if not token:
                 return None
-            fno_type = self._fno_types.get(symbol)
-            if not fno_type:
-                fno_type = _resolve_fno_type(symbol)
-                self._fno_types[symbol] = fno_type
-            tr_info = _FNO_TR_IDS.get(fno_type, _FNO_TR_IDS["IF"])
-            # mrkt_div: IF/IO → F/O, ZF/ZO → JF
-            mrkt_div_map = {"IF": "F", "IO": "O", "ZF": "JF", "ZO": "JF"}
-            mrkt_div = mrkt_div_map.get(fno_type, "F")
+            mrkt_div = FNO_MRKT_DIV.get(self._fno_type(symbol), "F")
             headers = {
                 "content-type": "application/json",
                 "authorization": f"Bearer {token}",
@@ -869,22 +835,7 @@ class KISQuoteManager:
             if resp.status_code == 401:
                 clear_token_cache()
                 return None
-            output = resp.json().get("output", {})
-            price = float(output.get("last", 0) or output.get("stck_prpr", 0) or 0)
-            if price <= 0:
-                return None
-            prev = float(output.get("base", 0) or 0)
-            change = price - prev if prev else 0.0
-            change_rate = (change / prev * 100) if prev else 0.0
-            sign = "2" if change > 0 else ("5" if change < 0 else "3")
-            return {
-                "type": "price",
-                "symbol": symbol,
-                "price": price,
-                "sign": sign,
-                "change": change,
-                "change_rate": change_rate,
-            }
+            return parse_fno_price(symbol, resp.json().get("output", {}))
         except Exception as e:
             logger.debug("[QuoteService] FNO REST 가격 조회 실패 %s: %s", symbol, e)
             return None
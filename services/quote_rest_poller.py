@@ -0,0 +1,279 @@
+"""KIS WS 끊김 시 REST 현재가 폴백 폴러 — 토큰 버킷 + 공유 커넥션 풀 + 동시 요청.
+
+기존 `KISQuoteManager._rest_fallback_loop`는 종목을 1개씩 executor로 조회하고 종목 간 0.1초,
+사이클 후 3초를 쉬었다 — 50종목이면 같은 종목 재조회까지 최소 8초(응답 지연 포함 10초+).
+
+  - 토큰 버킷: 초당 `QUOTE_FALLBACK_RATE_PER_SEC`개 충전, 버스트 1 — 임의 1초 창의 요청 수가
+    rate+1을 넘지 않는다 (KIS 계정당 초당 한도 보호).
+  - 동시 요청: 워커 `QUOTE_FALLBACK_CONCURRENCY`개가 우선순위 순 목록을 공유 iterator로 소비 —
+    응답 지연이 겹쳐도 요청 시작 순서는 우선순위(구독자 수 내림차순) 그대로.
+  - `httpx.AsyncClient` 1개를 폴러 수명 동안 재사용 (keep-alive 커넥션 풀).
+  - 시세 메시지에 `source="rest"`, `as_of`(KST 수신 시각), `refresh_sec`(같은 종목 직전 수신 후 경과)
+    → 클라이언트가 신선도를 표시할 수 있다. `stats()`의 `age_sec`는 종목별 마지막 수신 후 경과.
+
+`base_url`/`app_key`/`token_provider`를 주입할 수 있어 로컬 스텁 HTTP 서버로 테스트한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Iterable, Optional
+
+import httpx
+
+from config import (
+    KIS_APP_KEY,
+    KIS_APP_SECRET,
+    KIS_BASE_URL,
+    QUOTE_FALLBACK_CONCURRENCY,
+    QUOTE_FALLBACK_RATE_PER_SEC,
+)
+from routers._kis_auth import clear_token_cache, get_access_token_safe
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+_KR_PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-price"
+_FNO_PRICE_PATH = "/uapi/domestic-futureoption/v1/quotations/inquire-price"
+# FNO 유형 → FID_COND_MRKT_DIV_CODE (IF/IO → F/O, ZF/ZO → JF)
+FNO_MRKT_DIV = {"IF": "F", "IO": "O", "ZF": "JF", "ZO": "JF"}
+
+
+def parse_kr_price(symbol: str, output: dict) -> Optional[dict]:
+    """FHKST01010100 output → price 메시지. 가격 0(비개장일 등)이면 None."""
+    price = float(output.get("stck_prpr", 0) or 0)
+    if price <= 0:
+        return None
+    return {
+        "type": "price",
+        "symbol": symbol,
+        "price": price,
+        "sign": output.get("prdy_vrss_sign", "3"),
+        "change": float(output.get("prdy_vrss", 0) or 0),
+        "change_rate": float(output.get("prdy_ctrt", 0) or 0),
+    }
+
+
+def parse_fno_price(symbol: str, output: dict) -> Optional[dict]:
+    """FHMIF10000000 output → price 메시지 (전일 기준가 대비 등락 계산). 가격 0이면 None."""
+    price = float(output.get("last", 0) or output.get("stck_prpr", 0) or 0)
+    if price <= 0:
+        return None
+    prev = float(output.get("base", 0) or 0)
+    change = price - prev if prev else 0.0
+    change_rate = (change / prev * 100) if prev else 0.0
+    sign = "2" if change > 0 else ("5" if change < 0 else "3")
+    return {
+        "type": "price",
+        "symbol": symbol,
+        "price": price,
+        "sign": sign,
+        "change": change,
+        "change_rate": change_rate,
+    }
+
+
+def _closed_market_price(symbol: str) -> Optional[dict]:
+    """KIS 가격 0(비개장일) → yfinance 직전 거래일 가격."""
+    try:
+        from stock.market import fetch_price
+        data = fetch_price(symbol)
+    except Exception:
+        return None
+    if not data or not data.get("price"):
+        return None
+    return {
+        "type": "price",
+        "symbol": symbol,
+        "price": data["price"],
+        "sign": "3",
+        "change": 0.0,
+        "change_rate": data.get("change_pct") or 0.0,
+    }
+
+
+class TokenBucket:
+    """초당 rate개 충전, 최대 capacity개 보관 (기본 1 — 버스트 없음)."""
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._last = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기 (이벤트 루프 단일 스레드 — 확인·차감 사이 await 없음)."""
+        while not self.try_acquire():
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RestFallbackPoller:
+    """KR/FNO 현재가 REST 폴러 (KISQuoteManager 소유, 폴백 모드에서만 사용)."""
+
+    def __init__(
+        self,
+        *,
+        base_url: Optional[str] = None,
+        app_key: Optional[str] = None,
+        app_secret: Optional[str] = None,
+        rate: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        token_provider: Optional[Callable[[], Optional[str]]] = None,
+        on_unauthorized: Optional[Callable[[], None]] = None,
+    ):
+        self.base_url = (base_url or KIS_BASE_URL).rstrip("/")
+        self._app_key = app_key if app_key is not None else KIS_APP_KEY
+        self._app_secret = app_secret if app_secret is not None else KIS_APP_SECRET
+        self.bucket = TokenBucket(rate or QUOTE_FALLBACK_RATE_PER_SEC)
+        self.concurrency = max(1, concurrency or QUOTE_FALLBACK_CONCURRENCY)
+        self._token_provider = token_provider or get_access_token_safe
+        self._on_unauthorized = on_unauthorized or clear_token_cache
+        self._client: Optional[httpx.AsyncClient] = None
+        self._last: dict[str, float] = {}  # symbol → 마지막 수신 시각 (epoch)
+        self.cycles = 0
+        self.requests = 0
+        self.errors = 0
+        self.last_cycle_sec: Optional[float] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(5.0),
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def forget(self, symbol: str):
+        """구독 해제된 종목의 신선도 기록 제거."""
+        self._last.pop(symbol, None)
+
+    # ── 폴링 ──────────────────────────────────────────────────────
+
+    async def poll(
+        self,
+        targets: Iterable[tuple[str, Optional[str]]],
+        publish: Callable[[str, dict], Awaitable[None]],
+        active: Callable[[], bool] = lambda: True,
+    ) -> int:
+        """1 사이클 — targets(우선순위 순 `(symbol, fno_type|None)`)를 동시 조회, 수신 즉시 publish.
+
+        Returns: 성공(publish) 건수.
+        """
+        targets = list(targets)
+        if not targets or not (self._app_key and self._app_secret):
+            return 0
+        loop = asyncio.get_running_loop()
+        token = await loop.run_in_executor(None, self._token_provider)
+        if not token:
+            return 0
+        started = time.monotonic()
+        pending = iter(targets)
+        ok = 0
+
+        async def worker():
+            nonlocal ok
+            for symbol, fno_type in pending:
+                if not active():
+                    return
+                await self.bucket.acquire()
+                if not active():
+                    return
+                msg = await self._fetch(symbol, fno_type, token)
+                if msg is not None:
+                    ok += 1
+                    await publish(symbol, msg)
+
+        # 워커 1개의 예외가 나머지 워커·사이클 전체를 중단시키지 않도록 결과로 수집
+        results = await asyncio.gather(
+            *(worker() for _ in range(min(self.concurrency, len(targets)))), return_exceptions=True
+        )
+        for r in results:
+            if isinstance(r, Exception):
+                self.errors += 1
+                logger.warning("[QuoteService] REST fallback 워커 오류: %s", r)
+        self.cycles += 1
+        self.last_cycle_sec = round(time.monotonic() - started, 3)
+        return ok
+
+    async def _fetch(self, symbol: str, fno_type: Optional[str], token: str) -> Optional[dict]:
+        if fno_type:
+            path, tr_id = _FNO_PRICE_PATH, "FHMIF10000000"
+            params = {"FID_COND_MRKT_DIV_CODE": FNO_MRKT_DIV.get(fno_type, "F"), "FID_INPUT_ISCD": symbol}
+        else:
+            path, tr_id = _KR_PRICE_PATH, "FHKST01010100"
+            params = {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": symbol}
+        headers = {
+            "content-type": "application/json",
+            "authorization": f"Bearer {token}",
+            "appkey": self._app_key,
+            "appsecret": self._app_secret,
+            "tr_id": tr_id,
+            "custtype": "P",
+        }
+        self.requests += 1
+        try:
+            resp = await self._http().get(path, headers=headers, params=params)
+            if resp.status_code == 401:
+                self.errors += 1
+                self._on_unauthorized()
+                return None
+            output = resp.json().get("output") or {}
+            # 필드 형식 오류(숫자 아님 등)도 종목 단위 실패로 처리
+            msg = parse_fno_price(symbol, output) if fno_type else parse_kr_price(symbol, output)
+        except (httpx.HTTPError, ValueError, TypeError, AttributeError) as e:
+            self.errors += 1
+            logger.debug("[QuoteService] REST fallback %s: %s", symbol, e)
+            return None
+
+        if msg is None and not fno_type:
+            loop = asyncio.get_running_loop()
+            msg = await loop.run_in_executor(None, _closed_market_price, symbol)
+        if msg is None:
+            return None
+        now = time.time()
+        prev = self._last.get(symbol)
+        self._last[symbol] = now
+        msg["source"] = "rest"
+        msg["as_of"] = datetime.fromtimestamp(now, KST).isoformat(timespec="milliseconds")
+        msg["refresh_sec"] = round(now - prev, 3) if prev is not None else None
+        return msg
+
+    # ── 계측 ──────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """폴러 지표 + 종목별 마지막 수신 후 경과(초) (관리자 진단용)."""
+        now = time.time()
+        return {
+            "rate_per_sec": self.bucket.rate,
+            "concurrency": self.concurrency,
+            "cycles": self.cycles,
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_cycle_sec": self.last_cycle_sec,
+            "age_sec": {s: round(now - t, 3) for s, t in self._last.items()},
+        }
@@ -229,6 +229,65 @@ def _run_macro_prewarm_job():
         logger.error(f"[스케줄러] 매크로 pre-warm 실패: {e}", exc_info=True)
 
 
+def _run_cache_sweep_job():
+    """cache.db 만료 행 배치 삭제 + 용량 상한 LRU 축출 (매시 45분).
+
+    만료 행은 조회 시 무시만 되고 삭제되지 않아 파일이 무한 증가하던 문제 대응.
+    배치 단위 commit이라 요청 경로 set_cached와의 잠금 경합은 짧다.
+    """
+    from stock import cache
+    try:
+        result = cache.sweep()
+        logger.info(
+            "[스케줄러] 캐시 스윕 완료: 만료 %s건, 축출 %s건, vacuum=%s",
+            result["expired"], result["evicted"], result["vacuumed"],
+        )
+    except Exception as e:
+        logger.error(f"[스케줄러] 캐시 스윕 실패: {e}", exc_info=True)
+
+
+def _run_screener_history_job():
+    """전종목 일별 스냅샷 저장 (평일 16:40, 장 마감 + KRX 집계 확정 후).
+
+    screener/history.py 컬럼 저장소에 당일 거래일 파티션이 없으면 수집해 추가한다.
+    휴장일은 직전 거래일로 소급되며 이미 있으면 no-op.
+    """
+    from screener.krx import record_history
+    try:
+        recorded = record_history(_now_kst().strftime("%Y%m%d"))
+        if recorded:
+            logger.info(f"[스케줄러] 스크리너 스냅샷 저장: {recorded}")
+    except Exception as e:
+        logger.error(f"[스케줄러] 스크리너 스냅샷 저장 실패: {e}", exc_info=True)
+
+
+def _run_page_view_rollup_job():
+    """페이지뷰 rollup 증분 갱신 (PAGE_VIEW_ROLLUP_INTERVAL_MIN 분마다).
+
+    마지막 rollup 일자 ~ 오늘 raw만 다시 집계 — 관리자 통계 화면은 rollup 테이블만 읽는다.
+    """
+    from db.session import get_session
+    from services.page_view_rollup import rollup
+    try:
+        with get_session() as db:
+            result = rollup(db)
+        logger.info(f"[스케줄러] 페이지뷰 rollup: {result['days']}일, raw {result['rows']}행 (from {result['from']})")
+    except Exception as e:
+        logger.error(f"[스케줄러] 페이지뷰 rollup 실패: {e}", exc_info=True)
+
+
+def _run_page_view_purge_job():
+    """페이지뷰 raw / 시간 rollup 보존기간 경과분 삭제 (매일 03:50)."""
+    from db.session import get_session
+    from services.page_view_rollup import purge
+    try:
+        with get_session() as db:
+            result = purge(db)
+        logger.info(f"[스케줄러] 페이지뷰 보존 정리: raw {result['raw']}행, hourly {result['hourly']}행")
+    except Exception as e:
+        logger.error(f"[스케줄러] 페이지뷰 보존 정리 실패: {e}", exc_info=True)
+
+
 def setup_scheduler():
     """APScheduler 시작 (08:00 KR / 16:00 US KST)."""
     global _scheduler
@@ -341,10 +400,43 @@ def setup_scheduler():
             name="반도체 — 시그널 평가 (매시 정각)",
             replace_existing=True,
         )
+        # cache.db 만료 행 스윕 (매시 45분) — 정각 잡(반도체 평가/파이프라인)과 시각 분리.
+        _scheduler.add_job(
+            _run_cache_sweep_job,
+            CronTrigger(minute=45),
+            id="cache_sweep",
+            name="cache.db 만료 스윕 (매시 45분)",
+            replace_existing=True,
+        )
+        # 전종목 일별 스냅샷 (평일 16:40) — 16:00 정각 잡(US 파이프라인/시장폭)과 시각 분리.
+        _scheduler.add_job(
+            _run_screener_history_job,
+            CronTrigger(day_of_week="mon-fri", hour=16, minute=40),
+            id="screener_history",
+            name="스크리너 전종목 스냅샷 (평일 16:40)",
+            replace_existing=True,
+        )
+        # 페이지뷰 rollup (N분 간격, 정각 회피 3분 오프셋) + 보존 정리 (03:50)
+        from config import PAGE_VIEW_ROLLUP_INTERVAL_MIN
+        _scheduler.add_job(
+            _run_page_view_rollup_job,
+            CronTrigger(minute=f"3-59/{max(PAGE_VIEW_ROLLUP_INTERVAL_MIN, 1)}"),
+            id="page_view_rollup",
+            name=f"페이지뷰 rollup ({PAGE_VIEW_ROLLUP_INTERVAL_MIN}분)",
+            replace_existing=True,
+        )
+        _scheduler.add_job(
+            _run_page_view_purge_job,
+            CronTrigger(hour=3, minute=50),
+            id="page_view_purge",
+            name="페이지뷰 보존 정리 (03:50)",
+            replace_existing=True,
+        )
         _scheduler.start()
         logger.info(
             "[스케줄러] 스케줄러 시작 "
-            "(08:00 KR / 16:00 US / 00:05 cleanup+prewarm / 18:00 FH backfill / 반도체 5 cron + 매시 평가)"
+            "(08:00 KR / 16:00 US / 00:05 cleanup+prewarm / 18:00 FH backfill / 반도체 5 cron + 매시 평가 / 매시 45분 cache 스윕 / 16:40 스냅샷"
+            " / 페이지뷰 rollup + 03:50 보존 정리)"
         )
     except ImportError:
         logger.warning("[스케줄러] apscheduler 미설치 — 스케줄러 비활성화")
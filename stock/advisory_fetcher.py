@@ -351,6 +351,40 @@ def _fetch_ohlcv_us_yf(code: str, interval: str = "15m", period: str = "60d") ->
         return []
 
 
+def _fetch_ohlcv_store(code: str, market: str, interval: str, period: str) -> Optional[list[dict]]:
+    """일봉/주봉은 stock/ohlcv_store 영구 저장소 경유 (미확인 최근 구간만 yfinance 보충).
+
+    분봉('15m'/'60m') 또는 해석 불가 period('max' 등)는 None → 호출자가 yfinance 직접 조회.
+    저장소 원가격을 `ohlcv_store.adjusted()`로 배당·분할 조정 — yfinance 직접 조회(auto_adjust)와 같은 기준.
+    """
+    from stock import ohlcv_store
+
+    if interval not in ohlcv_store.INTERVALS or ohlcv_store.period_start(period) is None:
+        return None
+    try:
+        hist = ohlcv_store.get_bars_period(code, period, market=market, interval=interval)
+    except Exception as e:
+        logger.warning("OHLCV 저장소 조회 실패 (%s, %s, %s): %s", code, interval, period, e)
+        return []
+    if hist is None or hist.empty:
+        return []
+    hist = ohlcv_store.adjusted(hist)
+    return [
+        {
+            "time": ts.strftime("%Y-%m-%dT%H:%M:%S"),
+            "open": float(o),
+            "high": float(h),
+            "low": float(lo),
+            "close": float(c),
+            "volume": int(v) if v == v else 0,
+        }
+        for ts, o, h, lo, c, v in zip(
+            hist.index, hist["open"], hist["high"], hist["low"], hist["close"], hist["volume"]
+        )
+        if c
+    ]
+
+
 # yfinance interval별 허용 interval 매핑 (입력값 → yfinance 파라미터)
 _YF_INTERVAL_MAP = {
     "15m":  "15m",
@@ -390,10 +424,12 @@ def fetch_ohlcv_by_interval(code: str, market: str, interval: str = "15m", perio
 
     yf_interval = _YF_INTERVAL_MAP[interval]
 
-    if market == "KR":
-        ohlcv = _fetch_ohlcv_kr_yf(code, interval=yf_interval, period=period)
-    else:
-        ohlcv = _fetch_ohlcv_us_yf(code, interval=yf_interval, period=period)
+    ohlcv = _fetch_ohlcv_store(code, market, interval=yf_interval, period=period)
+    if ohlcv is None:
+        if market == "KR":
+            ohlcv = _fetch_ohlcv_kr_yf(code, interval=yf_interval, period=period)
+        else:
+            ohlcv = _fetch_ohlcv_us_yf(code, interval=yf_interval, period=period)
 
     indicators = calc_technical_indicators(ohlcv)
     return {"ohlcv": ohlcv, "indicators": indicators}
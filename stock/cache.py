@@ -1,94 +1,511 @@
-"""24시간 TTL SQLite 캐시 (~/stock-watchlist/cache.db)."""
+"""TTL 캐시 — L1 in-memory LRU + L2 SQLite (~/stock-watchlist/cache.db) 2계층.
 
-import json
+설계
+----
+- L1: 프로세스 내 thread-safe LRU. 항목 수/바이트 상한 초과 시 만료 항목 → LRU 순으로 축출.
+  값은 직렬화된 비압축 payload(bytes)로 보관하고 조회마다 새 객체로 역직렬화한다
+  (caller가 반환값을 mutate해도 캐시 원본은 오염되지 않음).
+- 직렬화: stock/cache_codec — 쓰기 시 1회 정규화 후 pickle(기본)/JSON 인코딩,
+  임계 크기 이상은 L2에만 zlib 압축 저장. 읽기 경로는 역직렬화만 (재귀 정제 없음).
+- L2: 스레드별 1개의 장수명 SQLite 연결 (threading.local). PRAGMA/CREATE TABLE은
+  연결 생성 시 1회만 실행 — 호출마다 connect/PRAGMA/DDL 반복하던 오버헤드 제거.
+- L2 만료: `expires_at` epoch 정수 컬럼 + 인덱스. 만료 행은 조회 시 무시되고
+  scheduler_service의 주기 잡(`sweep`)이 배치 삭제 + 용량 상한(행 수/바이트) 초과분 LRU 축출.
+- single-flight: `get_or_compute`/`single_flight` — 같은 키 동시 miss는 1회만 계산,
+  선택적 stale-while-revalidate(만료 값 즉시 반환 + 백그라운드 1회 갱신).
+- 계측: `cache.l1.hit|miss|eviction`, `cache.l2.hit|miss|expired|eviction`,
+  `cache.singleflight.shared|stale_served|wait_timeout` 카운터를 services/_telemetry로 기록.
+
+멀티 인스턴스 제약
+------------------
+- L1은 프로세스별 독립. 같은 프로세스의 delete_cached/delete_prefix는 L1도 즉시 무효화하지만
+  다른 프로세스(CLI 등)의 쓰기는 L1 항목 만료 전까지 반영되지 않는다.
+"""
+
+import copy
 import logging
-import math
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from pathlib import Path
+from typing import Callable, Optional, TypeVar
 
+from config import (
+    CACHE_L1_MAX_BYTES,
+    CACHE_L1_MAX_ENTRIES,
+    CACHE_L2_MAX_BYTES,
+    CACHE_L2_MAX_ROWS,
+    CACHE_STALE_GRACE_HOURS,
+)
+from services import _telemetry
+from stock import cache_codec
 from stock.db_base import now_kst
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
-def _sanitize(obj):
-    """재귀적으로 NaN/Inf를 None으로 변환 (JSON 직렬화 안전 보장)."""
-    if isinstance(obj, float):
-        return None if (math.isnan(obj) or math.isinf(obj)) else obj
-    if isinstance(obj, dict):
-        return {k: _sanitize(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_sanitize(v) for v in obj]
-    return obj
+# 하위 호환 alias — 쓰기 시 1회 정규화(NaN/Inf→None 포함)는 cache_codec.normalize가 담당.
+_sanitize = cache_codec.normalize
 
 _CACHE_DIR = Path.home() / "stock-watchlist"
 _DB_PATH = _CACHE_DIR / "cache.db"
 
 
-def _conn() -> sqlite3.Connection:
-    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(_DB_PATH, timeout=10.0)
-    con.execute("PRAGMA journal_mode=WAL")
+# ── L1: in-memory LRU ────────────────────────────────────────────────────────
+
+
+class _LRU:
+    """TTL 인지 size-bounded LRU. 값은 직렬화 payload(bytes), 크기는 len()."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[str, tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None and time.time() <= entry[1] else None
+
+    def get_entry(self, key: str, stale_sec: float = 0) -> Optional[tuple[bytes, float]]:
+        """(payload, expires_at) 반환. 만료 후 stale_sec 이내면 stale 항목도 반환."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if time.time() > item[1] + stale_sec:
+                self._remove(key)
+                return None
+            self._data.move_to_end(key)
+            return item
+
+    def put(self, key: str, payload: bytes, expires_at: float) -> None:
+        if self.max_entries <= 0 or len(payload) > self.max_bytes:
+            self.pop(key)
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (payload, expires_at)
+            self._bytes += len(payload)
+            evicted = self._evict()
+        if evicted:
+            _telemetry.record_event("cache.l1.eviction", evicted)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def pop_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for k in [k for k in self._data if k.startswith(prefix)]:
+                self._remove(k)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _remove(self, key: str) -> None:
+        payload, _ = self._data.pop(key)
+        self._bytes -= len(payload)
+
+    def _evict(self) -> int:
+        """상한 초과 시 만료 항목 우선, 이후 LRU 순으로 축출. 축출 건수 반환 (lock 보유 상태)."""
+        if len(self._data) <= self.max_entries and self._bytes <= self.max_bytes:
+            return 0
+        evicted = 0
+        now = time.time()
+        for k in [k for k, (_, exp) in self._data.items() if exp < now]:
+            self._remove(k)
+            evicted += 1
+        while self._data and (
+            len(self._data) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            k, (payload, _) = self._data.popitem(last=False)
+            self._bytes -= len(payload)
+            evicted += 1
+        return evicted
+
+
+_l1 = _LRU(CACHE_L1_MAX_ENTRIES, CACHE_L1_MAX_BYTES)
+
+
+def clear_l1() -> None:
+    """L1 전체 비우기 (테스트/관리용). L2(SQLite)는 유지."""
+    _l1.clear()
+
+
+# ── L2: 스레드별 pooled SQLite 연결 ──────────────────────────────────────────
+
+_local = threading.local()
+_schema_ready: set[str] = set()
+_schema_lock = threading.Lock()
+
+# L2 hit 시 accessed(LRU 기준) 갱신 최소 간격 — 읽기 경로 쓰기 부하 억제.
+_ACCESS_TOUCH_SEC = 60
+
+
+def _init_schema(con: sqlite3.Connection) -> None:
+    """테이블/인덱스 생성 + 레거시(expires TEXT만 존재) 스키마 마이그레이션.
+
+    - expires_at: 만료 epoch 초 (INTEGER, 인덱스) — 조회/스윕 기준.
+    - accessed:   마지막 접근 epoch 초 — 용량 상한 초과 시 LRU 축출 기준.
+    - expires:    ISO 문자열은 가독성/구버전 호환용으로 계속 기록.
+    """
     con.execute(
         """
         CREATE TABLE IF NOT EXISTS cache (
-            key     TEXT PRIMARY KEY,
-            value   TEXT NOT NULL,
-            expires TEXT NOT NULL
+            key        TEXT PRIMARY KEY,
+            value      TEXT NOT NULL,
+            expires    TEXT NOT NULL,
+            expires_at INTEGER,
+            accessed   INTEGER NOT NULL DEFAULT 0
         )
         """
     )
+    cols = {r[1] for r in con.execute("PRAGMA table_info(cache)")}
+    if "expires_at" not in cols:
+        con.execute("ALTER TABLE cache ADD COLUMN expires_at INTEGER")
+        # 파싱 불가 레거시 값은 NULL → 만료 취급 (다음 스윕에서 삭제)
+        con.execute("UPDATE cache SET expires_at = CAST(strftime('%s', expires) AS INTEGER)")
+    if "accessed" not in cols:
+        con.execute("ALTER TABLE cache ADD COLUMN accessed INTEGER NOT NULL DEFAULT 0")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache(expires_at)")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed)")
     con.commit()
+
+
+def _conn() -> sqlite3.Connection:
+    """현재 스레드의 장수명 연결 반환. _DB_PATH가 바뀌면(테스트 monkeypatch) 재연결."""
+    path = str(_DB_PATH)
+    con = getattr(_local, "con", None)
+    if con is not None and getattr(_local, "path", None) == path:
+        return con
+    _drop_conn()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(path, timeout=10.0)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    with _schema_lock:
+        if path not in _schema_ready:
+            _init_schema(con)
+            _schema_ready.add(path)
+    _local.con = con
+    _local.path = path
     return con
 
 
+def _drop_conn() -> None:
+    """현재 스레드 연결 폐기 (오류 후 재연결 유도)."""
+    con = getattr(_local, "con", None)
+    _local.con = None
+    _local.path = None
+    if con is not None:
+        try:
+            con.close()
+        except Exception:
+            pass
+
+
+def _prefix_upper(prefix: str) -> Optional[str]:
+    """prefix로 시작하는 모든 문자열보다 큰 최소 상한. 없으면 None (= 상한 없음).
+
+    SQLite TEXT 기본 BINARY 비교(UTF-8 바이트 순) = 코드포인트 순이므로
+    마지막 문자를 +1 하면 `key >= prefix AND key < upper`가 접두사 범위와 일치.
+    """
+    for i in range(len(prefix) - 1, -1, -1):
+        c = ord(prefix[i]) + 1
+        if 0xD800 <= c <= 0xDFFF:  # surrogate 구간은 인코딩 불가 → 건너뜀
+            c = 0xE000
+        if c <= 0x10FFFF:
+            return prefix[:i] + chr(c)
+    return None
+
+
+# ── 공개 API ─────────────────────────────────────────────────────────────────
+
+
+def _read(key: str, stale_sec: float = 0) -> Optional[tuple[object, float]]:
+    """L1 → L2 조회. (값, expires_at) 또는 None. stale_sec > 0이면 만료 후 그 시간 내 값도 반환."""
+    entry = _l1.get_entry(key, stale_sec)
+    if entry is not None:
+        _telemetry.record_event("cache.l1.hit")
+        return cache_codec.decode(entry[0]), entry[1]
+    _telemetry.record_event("cache.l1.miss")
+
+    con = _conn()
+    row = con.execute(
+        "SELECT value, expires_at, accessed FROM cache WHERE key = ?", (key,)
+    ).fetchone()
+    now = time.time()
+    if not row or row[1] is None or now > row[1] + stale_sec:
+        _telemetry.record_event("cache.l2.miss")
+        return None
+    stored, expires_at, accessed = row
+    _telemetry.record_event("cache.l2.hit")
+    if now - (accessed or 0) > _ACCESS_TOUCH_SEC:
+        with con:
+            con.execute("UPDATE cache SET accessed = ? WHERE key = ?", (int(now), key))
+    payload = cache_codec.decompress(stored)
+    _l1.put(key, payload, expires_at)
+    return cache_codec.decode(payload), expires_at
+
+
 def get_cached(key: str):
-    """캐시 조회. 만료됐거나 없으면 None 반환. NaN 값은 None으로 정제."""
+    """캐시 조회. 만료됐거나 없으면 None 반환. (NaN은 쓰기 시 이미 None으로 정제됨)"""
     try:
-        with _conn() as con:
-            row = con.execute(
-                "SELECT value, expires FROM cache WHERE key = ?", (key,)
-            ).fetchone()
-        if not row:
-            return None
-        value, expires = row
-        now = now_kst().replace(tzinfo=None)
-        exp = datetime.fromisoformat(expires).replace(tzinfo=None)
-        if now > exp:
-            return None
-        return _sanitize(json.loads(value))
+        hit = _read(key)
+        return hit[0] if hit is not None else None
     except Exception as e:
+        _drop_conn()
         logger.warning("캐시 읽기 실패 (%s): %s", key, e)
         return None
 
 
 def set_cached(key: str, value, ttl_hours: float = 24) -> None:
     """데이터를 캐시에 저장. NaN/Inf는 None으로 변환 후 저장."""
-    expires = (now_kst() + timedelta(hours=ttl_hours)).isoformat()
+    exp = now_kst() + timedelta(hours=ttl_hours)
+    expires_at = int(exp.timestamp())
     try:
-        sanitized = _sanitize(value)
-        with _conn() as con:
+        payload = cache_codec.encode(cache_codec.normalize(value))
+        con = _conn()
+        with con:
             con.execute(
-                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
-                (key, json.dumps(sanitized, ensure_ascii=False), expires),
+                "INSERT OR REPLACE INTO cache (key, value, expires, expires_at, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, cache_codec.compress(payload), exp.isoformat(), expires_at, int(time.time())),
             )
+        _l1.put(key, payload, expires_at)
     except Exception as e:
+        _l1.pop(key)
+        _drop_conn()
         logger.warning("캐시 쓰기 실패 (%s): %s", key, e)
 
 
 def delete_cached(key: str) -> None:
+    _l1.pop(key)
     try:
-        with _conn() as con:
+        con = _conn()
+        with con:
             con.execute("DELETE FROM cache WHERE key = ?", (key,))
     except Exception as e:
+        _drop_conn()
         logger.warning("캐시 삭제 실패 (%s): %s", key, e)
 
 
 def delete_prefix(prefix: str) -> None:
-    """접두사로 시작하는 캐시 키 일괄 삭제."""
+    """접두사로 시작하는 캐시 키 일괄 삭제 (PK 범위 스캔 `key >= ? AND key < ?`)."""
+    _l1.pop_prefix(prefix)
     try:
-        with _conn() as con:
-            con.execute("DELETE FROM cache WHERE key LIKE ?", (f"{prefix}%",))
+        con = _conn()
+        upper = _prefix_upper(prefix)
+        with con:
+            if upper is None:
+                con.execute("DELETE FROM cache WHERE key >= ?", (prefix,))
+            else:
+                con.execute(
+                    "DELETE FROM cache WHERE key >= ? AND key < ?", (prefix, upper)
+                )
     except Exception as e:
+        _drop_conn()
         logger.warning("캐시 접두사 삭제 실패 (%s): %s", prefix, e)
+
+
+# ── single-flight + stale-while-revalidate ──────────────────────────────────
+#
+# 캐시 만료 순간 ThreadPool 작업자(fetch_batch_details / get_bundle / 파이프라인)가
+# 같은 키를 동시에 miss → yfinance/DART 중복 호출 + rate-limit 차단 위험.
+# 키당 1개 스레드(leader)만 계산하고 나머지는 결과를 공유받는다.
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+_flights: dict[str, _Flight] = {}
+_flights_lock = threading.Lock()
+
+# leader가 이 시간 안에 끝나지 않으면 대기자는 독자 계산으로 진행 (기존 동작으로 강등).
+SINGLE_FLIGHT_WAIT_SEC = 30.0
+
+
+def single_flight(key: str, fn: Callable[[], T], wait_timeout: float = SINGLE_FLIGHT_WAIT_SEC) -> T:
+    """같은 key의 동시 호출을 1회 실행으로 합친다.
+
+    - leader: fn() 실행. 예외도 대기자에게 그대로 전파.
+    - 대기자: leader 결과의 deepcopy를 받는다 (호출자 간 객체 공유 방지).
+    - wait_timeout 초과 시 대기자는 fn()을 직접 실행 (hang 전파 방지).
+    """
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        _telemetry.record_event("cache.singleflight.shared")
+        if flight.done.wait(wait_timeout):
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+        _telemetry.record_event("cache.singleflight.wait_timeout")
+        return fn()
+
+    try:
+        flight.result = fn()
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.done.set()
+
+
+def get_or_compute(
+    key: str,
+    compute: Callable[[], T],
+    ttl_hours: float = 24,
+    stale_hours: float = 0,
+    ttl_for: Optional[Callable[[T], Optional[float]]] = None,
+) -> T:
+    """cache-aside + single-flight. miss 시 key당 1회만 compute() 후 저장.
+
+    - ttl_for(value) → 저장 TTL(시간). None 반환 시 저장 생략. 미지정 시 value가 None이 아니면 ttl_hours.
+    - stale_hours > 0: 만료 후 stale_hours 이내 값은 즉시 반환하고 백그라운드에서 1회만 재계산
+      (stale-while-revalidate). 만료 행은 sweep이 CACHE_STALE_GRACE_HOURS 동안 보존하므로
+      실효 stale 창은 min(stale_hours, CACHE_STALE_GRACE_HOURS).
+    """
+    try:
+        hit = _read(key, stale_hours * 3600)
+    except Exception as e:
+        _drop_conn()
+        logger.warning("캐시 읽기 실패 (%s): %s", key, e)
+        hit = None
+
+    def _compute_and_store():
+        # leader 진입 직전 다른 leader가 막 저장했을 수 있음 — 재확인으로 중복 호출 차단
+        fresh = get_cached(key)
+        if fresh is not None:
+            return fresh
+        value = compute()
+        hours = ttl_for(value) if ttl_for is not None else (None if value is None else ttl_hours)
+        if hours is not None:
+            set_cached(key, value, ttl_hours=hours)
+        return value
+
+    if hit is not None:
+        value, expires_at = hit
+        if time.time() <= expires_at:
+            return value
+        _telemetry.record_event("cache.singleflight.stale_served")
+        _revalidate_in_background(key, _compute_and_store)
+        return value
+    return single_flight(key, _compute_and_store)
+
+
+def _revalidate_in_background(key: str, fn: Callable[[], object]) -> None:
+    """key 갱신이 이미 진행 중이면 생략, 아니면 daemon 스레드에서 single_flight 실행."""
+    with _flights_lock:
+        if key in _flights:
+            return
+
+    def _run():
+        try:
+            single_flight(key, fn)
+        except Exception as e:
+            logger.warning("캐시 백그라운드 갱신 실패 (%s): %s", key, e)
+
+    threading.Thread(target=_run, name=f"cache-swr:{key[:40]}", daemon=True).start()
+
+
+# ── 스윕 (scheduler_service 주기 잡) ─────────────────────────────────────────
+
+
+def sweep(
+    batch_size: int = 1000,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    vacuum_ratio: float = 0.25,
+    grace_hours: Optional[float] = None,
+) -> dict:
+    """만료 행 배치 삭제 → 용량 상한 초과분 LRU 축출 → 여유 페이지 과다 시 VACUUM.
+
+    - 배치마다 commit → 쓰기 잠금 점유를 짧게 유지 (요청 경로 set_cached 블로킹 최소화).
+    - max_rows/max_bytes 미지정 시 config(CACHE_L2_MAX_ROWS/CACHE_L2_MAX_BYTES). 0 = 무제한.
+    - 바이트는 value 길이 합(논리 크기)으로 판정. 파일 축소는 VACUUM이 담당.
+    - 만료 후 grace_hours(기본 CACHE_STALE_GRACE_HOURS) 이내 행은 보존 — get_or_compute의
+      stale-while-revalidate 재료.
+
+    Returns: {"expired": int, "evicted": int, "vacuumed": bool}
+    """
+    max_rows = CACHE_L2_MAX_ROWS if max_rows is None else max_rows
+    max_bytes = CACHE_L2_MAX_BYTES if max_bytes is None else max_bytes
+    grace_hours = CACHE_STALE_GRACE_HOURS if grace_hours is None else grace_hours
+    con = _conn()
+    cutoff = int(time.time() - grace_hours * 3600)
+
+    expired = 0
+    while True:
+        with con:
+            cur = con.execute(
+                "DELETE FROM cache WHERE rowid IN ("
+                " SELECT rowid FROM cache WHERE expires_at IS NULL OR expires_at <= ? LIMIT ?)",
+                (cutoff, batch_size),
+            )
+        expired += cur.rowcount
+        if cur.rowcount < batch_size:
+            break
+
+    evicted = 0
+    n_rows, n_bytes = con.execute(
+        "SELECT COUNT(*), COALESCE(SUM(length(value)), 0) FROM cache"
+    ).fetchone()
+    while (max_rows and n_rows > max_rows) or (max_bytes and n_bytes > max_bytes):
+        victims: list[str] = []
+        for key, size in con.execute(
+            "SELECT key, length(value) FROM cache ORDER BY accessed ASC LIMIT ?",
+            (batch_size,),
+        ):
+            if not ((max_rows and n_rows > max_rows) or (max_bytes and n_bytes > max_bytes)):
+                break
+            victims.append(key)
+            n_rows -= 1
+            n_bytes -= size
+        if not victims:
+            break
+        with con:
+            con.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k in victims])
+        for k in victims:
+            _l1.pop(k)
+        evicted += len(victims)
+
+    vacuumed = False
+    page_count = con.execute("PRAGMA page_count").fetchone()[0]
+    freelist = con.execute("PRAGMA freelist_count").fetchone()[0]
+    if page_count and freelist / page_count > vacuum_ratio:
+        con.execute("VACUUM")
+        con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        vacuumed = True
+
+    if expired:
+        _telemetry.record_event("cache.l2.expired", expired)
+    if evicted:
+        _telemetry.record_event("cache.l2.eviction", evicted)
+    return {"expired": expired, "evicted": evicted, "vacuumed": vacuumed}
@@ -0,0 +1,142 @@
+"""stock/cache.py 값 직렬화 코덱 — JSON/pickle 선택 + 임계 크기 이상 zlib 압축.
+
+저장 포맷 (bytes, 첫 바이트 = 태그)
+-----------------------------------
+- `j` + UTF-8 JSON
+- `p` + pickle protocol 5
+- `z` + zlib(<위 포맷 중 하나>)   — 압축 래퍼. 디코드 시 벗겨낸 뒤 내부 태그로 재분기.
+- str (태그 없음)                  — 레거시 TEXT 행. JSON으로 해석.
+
+설계
+----
+- **정규화는 쓰기 시 1회**: `normalize()`가 NaN/Inf→None, tuple→list, dict key→str을
+  JSON 의미 그대로 적용. 읽기 경로는 역직렬화만 한다 (재귀 정제 없음).
+- **pickle 안전성**: 정규화 결과는 dict/list/str/int/float/bool/None만 포함 →
+  pickle 스트림에 전역 참조(GLOBAL) opcode가 생길 수 없다. `_SafeUnpickler`는
+  `find_class`를 전면 거부해 외부에서 주입된 행이 임의 객체를 만들지 못하게 한다.
+- **코덱 교체 안전**: 쓰기 코덱은 `CACHE_CODEC` 설정, 읽기는 태그로 자동 판별 →
+  설정 변경 후에도 기존 행을 그대로 읽는다.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+import pickle
+import zlib
+from typing import Callable
+
+from config import CACHE_CODEC, CACHE_COMPRESS_MIN_BYTES
+
+_TAG_JSON = b"j"
+_TAG_PICKLE = b"p"
+_TAG_ZLIB = b"z"
+
+# zlib level 1: 압축률보다 속도 우선 (요청 경로 set_cached).
+_ZLIB_LEVEL = 1
+
+
+def _json_key(k) -> str:
+    """json.dumps와 동일한 dict key 문자열화 규칙."""
+    if isinstance(k, str):
+        return str(k)
+    if k is True:
+        return "true"
+    if k is False:
+        return "false"
+    if k is None:
+        return "null"
+    if isinstance(k, int):
+        return int.__repr__(k)
+    if isinstance(k, float):
+        return json.dumps(float(k))
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(k).__name__}")
+
+
+def normalize(obj):
+    """JSON 왕복과 동일한 결과를 내는 단일 재귀 정규화.
+
+    - float NaN/Inf → None, float/int/str 서브클래스(numpy.float64, IntEnum 등) → 기본 타입
+    - tuple → list, dict key → str
+    - 그 외 타입은 TypeError (기존 json.dumps 실패와 동일 — 캐시 쓰기 생략)
+    """
+    if obj is None or obj is True or obj is False:
+        return obj
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, float):
+        return None if (math.isnan(obj) or math.isinf(obj)) else float(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, dict):
+        return {_json_key(k): normalize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [normalize(v) for v in obj]
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _SafeUnpickler(pickle.Unpickler):
+    """전역 참조 전면 거부 — builtin 컨테이너/스칼라만 복원."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"cache: 허용되지 않은 타입 {module}.{name}")
+
+
+def _json_encode(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_decode(body: bytes):
+    return json.loads(body)
+
+
+def _pickle_encode(obj) -> bytes:
+    return pickle.dumps(obj, protocol=5)
+
+
+def _pickle_decode(body: bytes):
+    return _SafeUnpickler(io.BytesIO(body)).load()
+
+
+# name → (tag, encode, decode). 새 코덱은 여기에 등록 (태그 1바이트, 기존과 중복 금지).
+CODECS: dict[str, tuple[bytes, Callable, Callable]] = {
+    "json": (_TAG_JSON, _json_encode, _json_decode),
+    "pickle": (_TAG_PICKLE, _pickle_encode, _pickle_decode),
+}
+_DECODERS: dict[bytes, Callable] = {tag: dec for tag, _, dec in CODECS.values()}
+
+
+def encode(obj, codec: str = CACHE_CODEC) -> bytes:
+    """정규화 완료된 값 → 태그 포함 bytes (비압축). L1에는 이 형태로 보관."""
+    tag, enc, _ = CODECS[codec]
+    return tag + enc(obj)
+
+
+def compress(payload: bytes, min_bytes: int = CACHE_COMPRESS_MIN_BYTES) -> bytes:
+    """임계 크기 이상이고 실제로 작아질 때만 zlib 래핑. L2 저장용."""
+    if min_bytes <= 0 or len(payload) < min_bytes:
+        return payload
+    packed = _TAG_ZLIB + zlib.compress(payload, _ZLIB_LEVEL)
+    return packed if len(packed) < len(payload) else payload
+
+
+def decompress(stored) -> bytes | str:
+    """L2 저장값 → 비압축 payload. 레거시 str은 그대로."""
+    if isinstance(stored, str):
+        return stored
+    stored = bytes(stored)
+    while stored[:1] == _TAG_ZLIB:
+        stored = zlib.decompress(stored[1:])
+    return stored
+
+
+def decode(payload):
+    """비압축 payload(bytes) 또는 레거시 TEXT(str) → 값."""
+    if isinstance(payload, str):
+        return json.loads(payload)
+    payload = decompress(payload)
+    dec = _DECODERS.get(payload[:1])
+    if dec is None:
+        raise ValueError(f"cache: 알 수 없는 코덱 태그 {payload[:1]!r}")
+    return dec(payload[1:])
@@ -5,6 +5,7 @@
     python -m stock watch list
     python -m stock watch dashboard
     python -m stock watch info 005930
+    python -m stock dart-prefetch 005930 000660 --years 10
 """
 
 import sys
@@ -269,3 +270,19 @@ def watch_info(code_or_name: str, refresh: bool, export_fmt):
         console.print(f"[red]재무 조회 오류: {e}[/red]")
 
     print_stock_info(item, detail, fin, export=export_fmt)
+
+
+# ── dart-prefetch ────────────────────────────────────────────────────────────
+
+@stock.command("dart-prefetch")
+@click.argument("codes", nargs=-1, required=True)
+@click.option("--years", default=10, show_default=True, help="최근 사업연도 수")
+def dart_prefetch(codes: tuple[str, ...], years: int):
+    """국내 종목 사업보고서 원시 재무제표 일괄 선적재 (DART 다중회사 조회 + 동시 호출)."""
+    from .dart_fin import prefetch_annual_statements
+
+    stats = prefetch_annual_statements(list(codes), years=years)
+    console.print(
+        f"기업 {stats['companies']}개 · 다중회사 조회 {stats['multi_calls']}회 · "
+        f"재무제표 {stats['fetched']}건 저장 (실패 {stats['failed']})"
+    )
@@ -0,0 +1,202 @@
+"""DART 상장법인 마스터 — corpCode.xml 1회 다운로드 → 로컬 SQLite 인덱스 (stock_code PK).
+
+`stock/dart_fin`(corp_code 조회), `stock/dart_segments`·`research_collector`(dart_fin 경유),
+`stock/symbol_map`·`market_board`(종목명 fallback)가 같은 인덱스를 공유한다.
+이전에는 corp_code 맵과 corp_name 맵이 같은 ZIP을 각각 내려받아 `ET.parse`로 통째 파싱하고,
+수 MB dict를 JSON 캐시에 따로 저장 → `_fetch_corp_code` miss마다 전체 맵을 역직렬화했다.
+
+저장
+----
+    {DART_CORP_DB_PATH}
+        corp(stock_code TEXT PK, corp_code, corp_name, modify_date) WITHOUT ROWID
+        meta(key PK, value)  — built_at(epoch), rows
+
+- 갱신: ZIP 1회 다운로드 → `ET.iterparse` 스트리밍 파싱(`<list>` 단위 clear) →
+  한 트랜잭션에서 DELETE + executemany. WAL 모드라 다른 연결의 조회는 갱신 중에도 이전 스냅샷을 본다.
+- 조회: 스레드별 장수명 연결(stock/cache.py와 동일)로 PK point lookup — 맵 역직렬화 없음.
+- 신선도: `DART_CORP_REFRESH_DAYS` 경과 시 다음 조회가 갱신 (프로세스 내 single-flight).
+  갱신 실패 시 기존 인덱스를 계속 쓰고 `_RETRY_SEC` 동안 재다운로드하지 않는다.
+  인덱스가 아예 없는데 다운로드도 실패하면 `lookup`은 예외, `corp_name`/`name_map`은 None/{}.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import sqlite3
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+from config import DART_CORP_DB_PATH, DART_CORP_REFRESH_DAYS
+
+logger = logging.getLogger(__name__)
+
+_DB_PATH = Path(DART_CORP_DB_PATH)
+
+# 갱신 실패 후 재시도 간격 (초) — 만료 인덱스로 서비스하는 동안 조회마다 다운로드하지 않도록
+_RETRY_SEC = 3600
+
+
+class CorpEntry(NamedTuple):
+    corp_code: str
+    corp_name: str
+    modify_date: str
+
+
+_local = threading.local()
+_refresh_lock = threading.Lock()
+# 경로별 (built_at, 다음 갱신 시도 가능 시각) — 조회마다 meta를 읽지 않도록 프로세스 메모리에 보관
+_state: dict[str, tuple[float, float]] = {}
+
+
+def _conn() -> sqlite3.Connection:
+    """현재 스레드의 장수명 연결. _DB_PATH가 바뀌면(테스트 monkeypatch) 재연결."""
+    path = str(_DB_PATH)
+    con = getattr(_local, "con", None)
+    if con is not None and getattr(_local, "path", None) == path:
+        return con
+    if con is not None:
+        con.close()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(path, timeout=10.0)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS corp ("
+        " stock_code TEXT PRIMARY KEY, corp_code TEXT NOT NULL,"
+        " corp_name TEXT NOT NULL, modify_date TEXT NOT NULL"
+        ") WITHOUT ROWID"
+    )
+    con.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    con.commit()
+    _local.con = con
+    _local.path = path
+    return con
+
+
+# ── 다운로드 / 파싱 ──────────────────────────────────────────────────────────
+
+def _download() -> bytes:
+    """corpCode.xml ZIP 원본 bytes."""
+    from stock.dart_fin import _BASE_URL, _api_key, _dart_get
+
+    resp = _dart_get(f"{_BASE_URL}/corpCode.xml", params={"crtfc_key": _api_key()}, timeout=60)
+    resp.raise_for_status()
+    return resp.content
+
+
+def iter_listed(zip_bytes: bytes) -> Iterator[tuple[str, str, str, str]]:
+    """ZIP 안 XML을 스트리밍 파싱 → 상장법인 (stock_code, corp_code, corp_name, modify_date)."""
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
+        with z.open(z.namelist()[0]) as f:
+            for _, elem in ET.iterparse(f, events=("end",)):
+                if elem.tag != "list":
+                    continue
+                stock_code = (elem.findtext("stock_code") or "").strip()
+                corp_code = (elem.findtext("corp_code") or "").strip()
+                if stock_code and corp_code:
+                    yield (
+                        stock_code,
+                        corp_code,
+                        (elem.findtext("corp_name") or "").strip(),
+                        (elem.findtext("modify_date") or "").strip(),
+                    )
+                elem.clear()
+
+
+def _built_at(con: sqlite3.Connection) -> float:
+    row = con.execute("SELECT value FROM meta WHERE key = 'built_at'").fetchone()
+    return float(row[0]) if row else 0.0
+
+
+def rebuild(zip_bytes: Optional[bytes] = None) -> int:
+    """인덱스 전체 재구축 (한 트랜잭션 교체). 적재한 상장법인 수 반환."""
+    if zip_bytes is None:
+        zip_bytes = _download()
+    rows = list(iter_listed(zip_bytes))
+    if not rows:
+        raise RuntimeError("corpCode.xml에 상장법인 항목이 없습니다")
+    con = _conn()
+    now = time.time()
+    with con:
+        con.execute("DELETE FROM corp")
+        con.executemany("INSERT OR REPLACE INTO corp VALUES (?, ?, ?, ?)", rows)
+        con.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [("built_at", str(now)), ("rows", str(len(rows)))],
+        )
+    _state[str(_DB_PATH)] = (now, 0.0)
+    logger.info("DART corp 인덱스 재구축: %d건", len(rows))
+    return len(rows)
+
+
+def _ensure() -> bool:
+    """인덱스 사용 가능 여부. 없거나 만료면 갱신 시도 (single-flight). 실패 시 기존 인덱스 유지."""
+    path = str(_DB_PATH)
+    state = _state.get(path)
+    if state is None:
+        state = _state[path] = (_built_at(_conn()), 0.0)
+    built_at, retry_at = state
+    now = time.time()
+    if now - built_at < DART_CORP_REFRESH_DAYS * 86400 or now < retry_at:
+        return built_at > 0
+    with _refresh_lock:
+        built_at, retry_at = _state[path]
+        if now - built_at < DART_CORP_REFRESH_DAYS * 86400 or now < retry_at:
+            return built_at > 0
+        try:
+            rebuild()
+            return True
+        except Exception as e:
+            logger.warning("DART corp 인덱스 갱신 실패 (기존 %s): %s", "유지" if built_at else "없음", e)
+            _state[path] = (built_at, time.time() + _RETRY_SEC)
+            return built_at > 0
+
+
+# ── 조회 ─────────────────────────────────────────────────────────────────────
+
+def lookup(stock_code: str) -> Optional[CorpEntry]:
+    """종목코드 → CorpEntry (미상장/미등록 None). 인덱스가 없고 구축도 실패하면 RuntimeError."""
+    if not _ensure():
+        raise RuntimeError("DART corp 인덱스를 구축할 수 없습니다 (corpCode.xml 다운로드 실패)")
+    row = _conn().execute(
+        "SELECT corp_code, corp_name, modify_date FROM corp WHERE stock_code = ?", (stock_code,)
+    ).fetchone()
+    return CorpEntry(*row) if row else None
+
+
+def corp_code(stock_code: str) -> Optional[str]:
+    """종목코드 → OpenDart 기업고유번호(8자리). 인덱스 구축 불가 시 RuntimeError."""
+    entry = lookup(stock_code)
+    return entry.corp_code if entry else None
+
+
+def corp_name(stock_code: str) -> Optional[str]:
+    """종목코드 → DART 기업명. 조회 불가(인덱스 없음 포함)는 None."""
+    try:
+        entry = lookup(stock_code)
+    except Exception:
+        return None
+    return (entry.corp_name or None) if entry else None
+
+
+def name_map() -> dict[str, str]:
+    """전체 stock_code → corp_name (symbol_map 전종목 fallback용). 인덱스 없으면 {}."""
+    try:
+        if not _ensure():
+            return {}
+        return {code: name for code, name in _conn().execute("SELECT stock_code, corp_name FROM corp") if name}
+    except Exception as e:
+        logger.warning("DART corp 이름 맵 조회 실패: %s", e)
+        return {}
+
+
+def code_map() -> dict[str, str]:
+    """전체 stock_code → corp_code. 인덱스 구축 불가 시 RuntimeError."""
+    if not _ensure():
+        raise RuntimeError("DART corp 인덱스를 구축할 수 없습니다 (corpCode.xml 다운로드 실패)")
+    return dict(_conn().execute("SELECT stock_code, corp_code FROM corp"))
@@ -3,15 +3,17 @@
 최근 사업보고서(연간) 기준 연결재무제표 우선, 없으면 개별재무제표.
 
 OpenDart 연동 구조:
-  1. corpCode.xml ZIP → stock_code → corp_code 매핑 (30일 캐시)
+  1. corpCode.xml ZIP → stock_code → corp_code 매핑 (stock/dart_corp.py 로컬 인덱스, 30일 갱신)
   2. fnlttSinglAcntAll.json API → 재무제표 원시 데이터
   3. 계정명 정규식 매핑 (_ACCOUNT_REGEX 등) → 표준 필드 추출
   4. 3년 단위 배치 호출로 최대 10년치 효율적 수집
 
 캐시 전략:
-  - corp_code/corp_name 매핑: 30일 (corpCode.xml 변경 빈도 낮음)
-  - 재무 데이터: 7일(168시간) — 사업보고서 공시 주기 고려
-  - 빈 결과: 6시간 — 신규상장 등 일시적 미공시 대응
+  - corp_code/corp_name 매핑: 로컬 인덱스 30일 주기 재구축 (corpCode.xml 변경 빈도 낮음)
+  - 보고서 계정 행: stock/dart_warehouse.py 영구 보관 — 마감 기간 만료 없음, 진행 중 회계연도만 재확인
+  - 다연도/세부/BS·CF/분기 함수: 결과 캐시 없이 웨어하우스 조회로 계산
+  - DART 오류(013 제외): 웨어하우스 backoff로 보고서 단위 10분, 한도 초과(020)·키 오류는 전체 1시간 재호출 보류
+  - fetch_financials(최근 1개 연도): 7일(168시간), 빈 결과 6시간 (stock_info_store write-through)
 
 계정명 매핑 체계 (전체 정규식 기반):
   - _ACCOUNT_REGEX: IS/CIS 매출/영업이익/순이익 (적자기업 변형 포함)
@@ -23,16 +25,24 @@ OpenDart 연동 구조:
 OPENDART_API_KEY 환경변수 필수. https://opendart.fss.or.kr 에서 발급.
 """
 
+import logging
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Optional
+from typing import Callable, Optional
 
 import requests
 
+from config import DART_ERROR_BACKOFF_SEC, DART_FETCH_WORKERS, DART_QUOTA_BACKOFF_SEC, DART_RATE_PER_SEC
+
+from . import dart_corp, dart_warehouse
 from .cache import delete_prefix, get_cached, set_cached
 
+logger = logging.getLogger(__name__)
+
 _BASE_URL = "https://opendart.fss.or.kr/api"
 # 사업보고서 reprt_code. 연간 확정 재무제표 기준.
 # 분기별 코드: 11013(Q1), 11012(반기), 11014(Q3), 11011(사업보고서=연간)
@@ -44,14 +54,36 @@ _REPRT_CODE = "11011"
 _DART_HEADERS = {"Connection": "close"}
 
 
+class _RateLimiter:
+    """스레드 공용 호출 간격 제한 — 동시 조회 워커 전체 합산 초당 rate회 이하."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next)
+            self._next = at + self._interval
+        if at > now:
+            time.sleep(at - now)
+
+
+_limiter = _RateLimiter(DART_RATE_PER_SEC)
+
+
 def _dart_get(url: str, params: dict, timeout: int = 20) -> requests.Response:
     """DART API GET 요청.
 
     Connection: close 헤더로 keep-alive 재사용을 끊어 RemoteDisconnected를 방지.
     ConnectionError 발생 시 최대 3회 재시도 (1s / 2s 간격).
+    모든 시도는 `_limiter`(DART_RATE_PER_SEC)를 거친다 — 동시 조회 시에도 DART 호출 한도 보호.
     """
     last_exc: Exception = RuntimeError("no attempt")
     for attempt in range(3):
+        _limiter.wait()
         try:
             return requests.get(url, params=params, timeout=timeout, headers=_DART_HEADERS)
         except requests.exceptions.ConnectionError as e:
@@ -76,97 +108,43 @@ def _api_key() -> str:
 def _load_corp_map() -> dict[str, str]:
     """전체 기업코드 맵 (stock_code → corp_code) 반환.
 
-    DART corpCode.xml ZIP을 다운로드해 파싱하고 30일 캐싱.
-    상장법인(stock_code 있는 것)만 포함.
+    stock/dart_corp.py 로컬 인덱스(corpCode.xml 1회 다운로드, 30일 갱신)에서 읽는다.
+    상장법인(stock_code 있는 것)만 포함. 단건 조회는 `_fetch_corp_code` 사용.
     """
-    cache_key = "dart:corp_map:v1"
-    cached = get_cached(cache_key)
-    if cached:
-        return cached
-
-    import io
-    import xml.etree.ElementTree as ET
-    import zipfile
-
-    resp = _dart_get(
-        f"{_BASE_URL}/corpCode.xml",
-        params={"crtfc_key": _api_key()},
-        timeout=60,
-    )
-    resp.raise_for_status()
-
-    corp_map: dict[str, str] = {}
-    with zipfile.ZipFile(io.BytesIO(resp.content)) as z:
-        with z.open(z.namelist()[0]) as f:
-            root = ET.parse(f).getroot()
-            for child in root:
-                stock_code = (child.findtext("stock_code") or "").strip()
-                corp_code = (child.findtext("corp_code") or "").strip()
-                if stock_code and corp_code:
-                    corp_map[stock_code] = corp_code
-
-    set_cached(cache_key, corp_map, ttl_hours=24 * 30)
-    return corp_map
+    return dart_corp.code_map()
 
 
 def _load_corp_name_map() -> dict[str, str]:
-    """전체 기업명 맵 (stock_code → corp_name) 반환.
+    """전체 기업명 맵 (stock_code → corp_name) 반환. 인덱스 구축 불가 시 {}.
 
-    DART corpCode.xml ZIP에서 stock_code → corp_name 매핑을 추출. 30일 캐싱.
-    stock/symbol_map.py의 code_to_name()에서 pykrx 실패 시 fallback 소스로 활용.
+    stock/dart_corp.py 로컬 인덱스에서 읽는다 (corp_code와 같은 다운로드 1회 공유).
+    stock/symbol_map.py의 pykrx 실패 시 fallback 소스로 활용.
     2026-02 KRX 서버 변경 이후 pykrx로 종목명 조회 실패 시 이 맵이 대체한다.
     """
-    cache_key = "dart:corp_name_map:v1"
-    cached = get_cached(cache_key)
-    if cached:
-        return cached
+    return dart_corp.name_map()
 
-    import io
-    import xml.etree.ElementTree as ET
-    import zipfile
 
-    try:
-        resp = _dart_get(
-            f"{_BASE_URL}/corpCode.xml",
-            params={"crtfc_key": _api_key()},
-            timeout=60,
-        )
-        resp.raise_for_status()
-    except Exception:
-        return {}
+def _fetch_corp_code(stock_code: str) -> Optional[str]:
+    """종목코드 → OpenDart 기업고유번호(8자리). 로컬 인덱스 PK 조회 (맵 역직렬화 없음)."""
+    return dart_corp.corp_code(stock_code)
 
-    name_map: dict[str, str] = {}
-    with zipfile.ZipFile(io.BytesIO(resp.content)) as z:
-        with z.open(z.namelist()[0]) as f:
-            root = ET.parse(f).getroot()
-            for child in root:
-                stock_code = (child.findtext("stock_code") or "").strip()
-                corp_name = (child.findtext("corp_name") or "").strip()
-                if stock_code and corp_name:
-                    name_map[stock_code] = corp_name
 
-    set_cached(cache_key, name_map, ttl_hours=24 * 30)
-    return name_map
+# ── fnlttSinglAcntAll 호출 ──────────────────────────────────────────────────
 
+# 계정 단위 오류 status — 키 미등록/휴면(010·011), 접근 불가(012), 한도 초과(020), 점검(800), 키 만료(901).
+# 어느 보고서를 호출해도 같은 오류이므로 전체 호출을 보류한다.
+_ACCOUNT_WIDE_STATUS = frozenset({"010", "011", "012", "020", "800", "901"})
 
-def _fetch_corp_code(stock_code: str) -> Optional[str]:
-    """종목코드 → OpenDart 기업고유번호(8자리)."""
-    # 개별 캐시 우선
-    cache_key = f"dart:corp_code:{stock_code}"
-    cached = get_cached(cache_key)
-    if cached:
-        return cached
 
-    corp_map = _load_corp_map()
-    corp_code = corp_map.get(stock_code)
-    if corp_code:
-        set_cached(cache_key, corp_code, ttl_hours=24 * 30)
-    return corp_code
+class _DartStatusError(RuntimeError):
+    """DART 응답 status 오류 (013 제외)."""
 
+    def __init__(self, status: str, message: str):
+        super().__init__(f"DART API 오류: {message}")
+        self.status = status
 
-# ── fnlttSinglAcntAll 호출 ──────────────────────────────────────────────────
 
-def _call_fin_api(corp_code: str, bsns_year: int, fs_div: str) -> list[dict]:
+def _call_fin_api(corp_code: str, bsns_year: int, fs_div: str, reprt_code: str = _REPRT_CODE) -> list[dict]:
     """fnlttSinglAcntAll 원시 응답 반환."""
     resp = _dart_get(
         f"{_BASE_URL}/fnlttSinglAcntAll.json",
@@ -174,7 +152,7 @@ def _call_fin_api(corp_code: str, bsns_year: int, fs_div: str) -> list[dict]:
             "crtfc_key": _api_key(),
             "corp_code": corp_code,
             "bsns_year": str(bsns_year),
-            "reprt_code": _REPRT_CODE,
+            "reprt_code": reprt_code,
             "fs_div": fs_div,
         },
         timeout=20,
@@ -184,10 +162,119 @@ def _call_fin_api(corp_code: str, bsns_year: int, fs_div: str) -> list[dict]:
     if data.get("status") == "013":  # 데이터 없음
         return []
     if data.get("status") != "000":
-        raise RuntimeError(f"DART API 오류: {data.get('message', '')}")
+        raise _DartStatusError(data.get("status", ""), data.get("message", ""))
     return data.get("list", [])
 
 
+def _fin_items(corp_code: str, bsns_year: int, fs_div: str, reprt_code: str = _REPRT_CODE) -> list[dict]:
+    """보고서 계정 행 — stock/dart_warehouse 우선, 없거나 재확인 시점이면 API 호출 후 기록.
+
+    오류는 warehouse backoff로 기록해 `DART_ERROR_BACKOFF_SEC`(계정 단위 오류는 `DART_QUOTA_BACKOFF_SEC`)
+    동안 재호출하지 않는다. 보류 중에는 지난 기록(재확인 시점 경과분)을 반환하고, 기록도 없으면 예외.
+    """
+    stored = dart_warehouse.lookup(corp_code, bsns_year, reprt_code, fs_div)
+    if stored is not None:
+        return stored
+    reason = dart_warehouse.backoff_reason(corp_code, bsns_year, reprt_code, fs_div)
+    if reason is None:
+        try:
+            items = _call_fin_api(corp_code, bsns_year, fs_div, reprt_code)
+        except Exception as e:
+            account_wide = getattr(e, "status", None) in _ACCOUNT_WIDE_STATUS
+            dart_warehouse.record_error(
+                corp_code, bsns_year, reprt_code, fs_div, str(e),
+                DART_QUOTA_BACKOFF_SEC if account_wide else DART_ERROR_BACKOFF_SEC,
+                account_wide=account_wide,
+            )
+            reason = str(e)
+        else:
+            dart_warehouse.store(corp_code, bsns_year, reprt_code, fs_div, items)
+            return items
+    stale = dart_warehouse.lookup(corp_code, bsns_year, reprt_code, fs_div, stale_ok=True)
+    if stale is not None:
+        return stale
+    raise RuntimeError(f"DART 재무 조회 보류 — {reason}")
+
+
+# ── 동시 조회 (연도 병렬 + CFS/OFS 1회 결정) ─────────────────────────────────
+
+_Cell = tuple[int, str, str]  # (bsns_year, reprt_code, fs_div)
+
+
+def _fetch_cells(corp_code: str, cells: list[_Cell]) -> dict[_Cell, Optional[list[dict]]]:
+    """셀별 원시 응답을 `DART_FETCH_WORKERS` 스레드로 동시 조회. 오류 셀은 None."""
+    def one(cell: _Cell):
+        year, reprt_code, fs_div = cell
+        try:
+            return cell, _fin_items(corp_code, year, fs_div, reprt_code)
+        except Exception as e:
+            logger.debug("DART 재무 조회 실패 corp=%s cell=%s: %s", corp_code, cell, e)
+            return cell, None
+
+    if len(cells) <= 1:
+        return dict(one(c) for c in cells)
+    with ThreadPoolExecutor(max_workers=min(DART_FETCH_WORKERS, len(cells))) as pool:
+        return dict(pool.map(one, cells))
+
+
+_PROBE_REPORTS = 2  # CFS/OFS를 함께 조회해 fs_div를 결정할 최신 보고서 수
+
+
+def _prefetch(
+    corp_code: str, reports: list[tuple[int, str]], valid: Callable[[list[dict]], bool]
+) -> dict[_Cell, Optional[list[dict]]]:
+    """(연도, reprt_code) 목록(최신 우선)의 원시 응답을 동시 선조회 — 순차 루프가 읽을 memo 반환.
+
+    순차 루프 규칙(연결 CFS 우선 → 첫 유효 보고서의 fs_div로 이후 고정)과 같은 fs_div를 1회 결정:
+      1차: 최신 `_PROBE_REPORTS`개 보고서 CFS+OFS 동시 조회 → 첫 유효 보고서의 fs_div (CFS 우선)
+      2차: 나머지 보고서를 결정된 fs_div로만 동시 조회
+    1차에서 유효 보고서가 없으면 나머지를 CFS로 조회한 뒤, 첫 유효 CFS보다 최신인 보고서만 OFS 보충
+    (OFS가 먼저 유효하면 나머지도 OFS). 같은 보고서의 다른 fs_div가 공시된 빈 응답은
+    '공시 없음 확정'으로 저장해 다음 조회에서 생략. memo에 없는 셀은 순차 루프가 직접 조회.
+    """
+    probe, rest = reports[:_PROBE_REPORTS], reports[_PROBE_REPORTS:]
+    memo = _fetch_cells(corp_code, [(y, r, fs) for y, r in probe for fs in ("CFS", "OFS")])
+    fs_div = next(
+        (fs for y, r in probe for fs in ("CFS", "OFS") if valid(memo[(y, r, fs)] or [])), None,
+    )
+    if fs_div:
+        memo.update(_fetch_cells(corp_code, [(y, r, fs_div) for y, r in rest]))
+    else:
+        memo.update(_fetch_cells(corp_code, [(y, r, "CFS") for y, r in rest]))
+        first = next((i for i, (y, r) in enumerate(rest) if valid(memo[(y, r, "CFS")] or [])), len(rest))
+        memo.update(_fetch_cells(corp_code, [(y, r, "OFS") for y, r in rest[:first]]))
+        if any(valid(memo[(y, r, "OFS")] or []) for y, r in rest[:first]):
+            memo.update(_fetch_cells(corp_code, [(y, r, "OFS") for y, r in rest[first:]]))
+
+    for y, r in reports:
+        cfs, ofs = memo.get((y, r, "CFS")), memo.get((y, r, "OFS"))
+        for absent, other, fs in ((cfs, ofs, "CFS"), (ofs, cfs, "OFS")):
+            if absent == [] and other:
+                try:
+                    dart_warehouse.mark_absent(corp_code, y, r, fs)
+                except Exception:
+                    pass
+    return memo
+
+
+def _memo_items(
+    memo: dict[_Cell, Optional[list[dict]]], corp_code: str, bsns_year: int, fs_div: str,
+    reprt_code: str = _REPRT_CODE,
+) -> list[dict]:
+    """memo 셀 반환 (오류 셀은 예외), 없으면 `_fin_items` 직접 조회."""
+    cell = (bsns_year, reprt_code, fs_div)
+    if cell not in memo:
+        return _fin_items(corp_code, bsns_year, fs_div, reprt_code)
+    items = memo[cell]
+    if items is None:
+        raise RuntimeError(f"DART 재무 조회 실패: {corp_code} {cell}")
+    return items
+
+
+def _has_sheet(*sj_divs: str) -> Callable[[list[dict]], bool]:
+    return lambda items: any(i.get("sj_div") in sj_divs for i in items)
+
+
 def _parse_amount(s) -> Optional[int]:
     """금액 문자열 → int (원). 빈값/'-' 이면 None."""
     if not s or s.strip() in ("-", ""):
@@ -526,7 +613,6 @@ def fetch_financials(stock_code: str, refresh: bool = False) -> Optional[dict]:
     cache_key = f"dart:fin:{stock_code}"
     if refresh:
         delete_prefix(f"dart:fin:{stock_code}")
-        delete_prefix(f"dart:corp_code:{stock_code}")
     else:
         cached = get_cached(cache_key)
         if cached is not None:
@@ -535,11 +621,17 @@ def fetch_financials(stock_code: str, refresh: bool = False) -> Optional[dict]:
     corp_code = _fetch_corp_code(stock_code)
     if not corp_code:
         return None
+    if refresh:
+        # 정정공시 즉시 반영 — 웨어하우스 보관분도 폐기 후 재조회
+        try:
+            dart_warehouse.delete(corp_code)
+        except Exception:
+            pass
 
     for bsns_year in _bsns_year_candidates():
         for fs_div in ("CFS", "OFS"):
             try:
-                items = _call_fin_api(corp_code, bsns_year, fs_div)
+                items = _fin_items(corp_code, bsns_year, fs_div)
             except Exception:
                 continue
 
@@ -579,7 +671,8 @@ def fetch_financials_multi_year(
 ) -> list[dict]:
     """최대 years개 사업연도의 재무데이터 반환.
 
-    연도별 API 호출로 각 연도의 고유 rcept_no(DART 보고서 링크)를 보장한다.
+    연도별 사업보고서로 각 연도의 고유 rcept_no(DART 보고서 링크)를 보장한다.
+    결과 캐시 없음 — 보고서는 stock/dart_warehouse에서 읽고 없을 때만 DART 조회.
     반환: [
         {
             "year": 2024,
@@ -592,14 +685,8 @@ def fetch_financials_multi_year(
         ...  # 과거 → 최신 순 정렬
     ]
     """
-    cache_key = f"dart:fin_multi_v2:{stock_code}:{years}"
-    cached = get_cached(cache_key)
-    if cached is not None:
-        return cached
-
     corp_code = _fetch_corp_code(stock_code)
     if not corp_code:
-        set_cached(cache_key, [], ttl_hours=6)
         return []
 
     # 최근 확정 사업연도 결정: 항상 year-1 사용 (월 경계 제거).
@@ -609,8 +696,13 @@ def fetch_financials_multi_year(
     collected: dict[int, dict] = {}
     fs_div_used: Optional[str] = None  # 연결/별도 결정 후 고정
 
-    # 연도별 API 호출 — 각 연도 사업보고서의 고유 rcept_no 확보
-    for year in range(latest_year, latest_year - years - 2, -1):
+    # 최근 years개 연도 동시 선조회 (CFS/OFS 1회 결정) — 아래 순차 루프는 memo를 읽는다.
+    # 부족분 보충용 추가 2개 연도는 필요할 때만 직접 조회.
+    year_list = list(range(latest_year, latest_year - years - 2, -1))
+    memo = _prefetch(corp_code, [(y, _REPRT_CODE) for y in year_list[:years]], _has_sheet("IS", "CIS"))
+
+    # 연도별 보고서 — 각 연도 사업보고서의 고유 rcept_no 확보
+    for year in year_list:
         if len(collected) >= years:
             break
 
@@ -620,7 +712,7 @@ def fetch_financials_multi_year(
 
         for fs_div in fs_divs:
             try:
-                candidate = _call_fin_api(corp_code, year, fs_div)
+                candidate = _memo_items(memo, corp_code, year, fs_div)
             except Exception:
                 continue
             if not candidate:
@@ -663,10 +755,100 @@ def fetch_financials_multi_year(
             fs_div_used = found_fs
 
     # 과거 → 최신 정렬, 최대 years개
-    result = sorted(collected.values(), key=lambda x: x["year"])[-years:]
+    return sorted(collected.values(), key=lambda x: x["year"])[-years:]
 
-    set_cached(cache_key, result, ttl_hours=168)
-    return result
+
+# ── 다종목 일괄 선적재 ──────────────────────────────────────────────────────
+
+_MULTI_ACNT_MAX_CORPS = 100  # fnlttMultiAcnt corp_code 최대 개수
+
+
+def _call_multi_acnt(corp_codes: list[str], bsns_year: int, by_stock: dict[str, str]) -> dict[str, set[str]]:
+    """fnlttMultiAcnt(다중회사 주요계정) 1회 — 사업보고서 공시 기업별 fs_div 집합 {corp_code: {"CFS", "OFS"}}."""
+    resp = _dart_get(
+        f"{_BASE_URL}/fnlttMultiAcnt.json",
+        params={
+            "crtfc_key": _api_key(),
+            "corp_code": ",".join(corp_codes),
+            "bsns_year": str(bsns_year),
+            "reprt_code": _REPRT_CODE,
+        },
+        timeout=20,
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    if data.get("status") == "013":
+        return {}
+    if data.get("status") != "000":
+        raise RuntimeError(f"DART API 오류: {data.get('message', '')}")
+    filed: dict[str, set[str]] = {}
+    for row in data.get("list", []):
+        corp_code = row.get("corp_code") or by_stock.get((row.get("stock_code") or "").strip())
+        if corp_code and row.get("fs_div") in ("CFS", "OFS"):
+            filed.setdefault(corp_code, set()).add(row["fs_div"])
+    return filed
+
+
+def prefetch_annual_statements(stock_codes: list[str], years: int = 10) -> dict:
+    """여러 종목의 최근 years개 사업보고서 재무제표를 한 번에 웨어하우스로 선적재.
+
+    1) 연도 × 100개 묶음마다 fnlttMultiAcnt 1회로 공시 여부 + 연결(CFS) 유무 확인
+    2) 공시된 (기업, 연도)만 fnlttSinglAcntAll 1회 (CFS 있으면 CFS, 없으면 OFS + CFS '없음 확정' 기록)
+    모든 호출은 `DART_FETCH_WORKERS` 스레드 + `_limiter` 공유. 이미 저장된 (기업, 연도)는 건너뛴다.
+    이후 fetch_financials_multi_year / fetch_income_detail_annual / fetch_bs_cf_annual은 로컬에서 끝난다.
+
+    반환: {"companies", "multi_calls", "fetched", "failed"}
+    """
+    by_stock: dict[str, str] = {}
+    for code in dict.fromkeys(stock_codes):
+        try:
+            corp_code = _fetch_corp_code(code)
+        except Exception as e:
+            logger.warning("corp_code 조회 실패 code=%s: %s", code, e)
+            continue
+        if corp_code:
+            by_stock[code] = corp_code
+    corp_codes = sorted(set(by_stock.values()))
+    latest_year = date.today().year - 1
+
+    batches = []
+    for year in range(latest_year, latest_year - years, -1):
+        pending = sorted(set(corp_codes) - dart_warehouse.known(corp_codes, year, _REPRT_CODE))
+        for i in range(0, len(pending), _MULTI_ACNT_MAX_CORPS):
+            batches.append((year, pending[i:i + _MULTI_ACNT_MAX_CORPS]))
+
+    def multi(batch):
+        year, chunk = batch
+        try:
+            return year, _call_multi_acnt(chunk, year, by_stock)
+        except Exception as e:
+            logger.warning("fnlttMultiAcnt 실패 year=%s n=%d: %s", year, len(chunk), e)
+            return year, {}
+
+    def single(task):
+        corp_code, year, fs_div = task
+        try:
+            _fin_items(corp_code, year, fs_div)
+            return True
+        except Exception as e:
+            logger.debug("DART 재무 선적재 실패 corp=%s year=%s: %s", corp_code, year, e)
+            return False
+
+    stats = {"companies": len(corp_codes), "multi_calls": len(batches), "fetched": 0, "failed": 0}
+    if not batches:
+        return stats
+    with ThreadPoolExecutor(max_workers=DART_FETCH_WORKERS) as pool:
+        tasks = []
+        for year, filed in pool.map(multi, batches):
+            for corp_code, fs_divs in filed.items():
+                if "CFS" in fs_divs:
+                    tasks.append((corp_code, year, "CFS"))
+                else:
+                    dart_warehouse.mark_absent(corp_code, year, _REPRT_CODE, "CFS")
+                    tasks.append((corp_code, year, "OFS"))
+        for ok in pool.map(single, tasks):
+            stats["fetched" if ok else "failed"] += 1
+    return stats
 
 
 # ── BS/CF 공용 헬퍼 ───────────────────────────────────────────────────────────
@@ -731,16 +913,9 @@ def fetch_bs_cf_annual(stock_code: str, years: int = 5) -> dict:
         }
     데이터 없으면 빈 리스트.
     """
-    cache_key = f"dart:bs_cf:{stock_code}:{years}"
-    cached = get_cached(cache_key)
-    if cached is not None:
-        return cached
-
     corp_code = _fetch_corp_code(stock_code)
     if not corp_code:
-        empty = {"balance_sheet": [], "cashflow": []}
-        set_cached(cache_key, empty, ttl_hours=6)
-        return empty
+        return {"balance_sheet": [], "cashflow": []}
 
     today = date.today()
     latest_year = today.year - 1  # 3~4월에도 전년도 사업보고서 공시됨
@@ -751,6 +926,7 @@ def fetch_bs_cf_annual(stock_code: str, years: int = 5) -> dict:
     bs_collected: dict[int, dict] = {}
     cf_collected: dict[int, dict] = {}
     fs_div_used: Optional[str] = None
+    memo = _prefetch(corp_code, [(a, _REPRT_CODE) for a in anchor_years], _has_sheet("BS", "CBS", "CF", "CCF"))
 
     for batch_idx, anchor in enumerate(anchor_years):
         if len(bs_collected) >= years and len(cf_collected) >= years:
@@ -765,7 +941,7 @@ def fetch_bs_cf_annual(stock_code: str, years: int = 5) -> dict:
             fs_divs = [fs_div_used] if fs_div_used else ["CFS", "OFS"]
             for fs_div in fs_divs:
                 try:
-                    candidate = _call_fin_api(corp_code, try_anchor, fs_div)
+                    candidate = _memo_items(memo, corp_code, try_anchor, fs_div)
                 except Exception:
                     continue
                 if not candidate:
@@ -826,13 +1002,11 @@ def fetch_bs_cf_annual(stock_code: str, years: int = 5) -> dict:
     bs_result = sorted(bs_collected.values(), key=lambda x: x["year"])[-years:]
     cf_result = sorted(cf_collected.values(), key=lambda x: x["year"])[-years:]
 
-    result = {
+    return {
         "balance_sheet": bs_result,
         "cashflow": cf_result,
         "sector_tier": locals().get("_detected_sector_tier", "general"),
     }
-    set_cached(cache_key, result, ttl_hours=168)
-    return result
 
 
 def fetch_income_detail_annual(stock_code: str, years: int = 5) -> list[dict]:
@@ -842,14 +1016,8 @@ def fetch_income_detail_annual(stock_code: str, years: int = 5) -> list[dict]:
              interest_income, interest_expense, pretax_income,
              tax_expense, net_income, eps, oi_margin, net_margin}]
     """
-    cache_key = f"dart:is_detail:{stock_code}:{years}"
-    cached = get_cached(cache_key)
-    if cached is not None:
-        return cached
-
     corp_code = _fetch_corp_code(stock_code)
     if not corp_code:
-        set_cached(cache_key, [], ttl_hours=6)
         return []
 
     today = date.today()
@@ -860,6 +1028,7 @@ def fetch_income_detail_annual(stock_code: str, years: int = 5) -> list[dict]:
 
     collected: dict[int, dict] = {}
     fs_div_used: Optional[str] = None
+    memo = _prefetch(corp_code, [(a, _REPRT_CODE) for a in anchor_years], _has_sheet("IS", "CIS"))
 
     for batch_idx, anchor in enumerate(anchor_years):
         if len(collected) >= years:
@@ -874,7 +1043,7 @@ def fetch_income_detail_annual(stock_code: str, years: int = 5) -> list[dict]:
             fs_divs = [fs_div_used] if fs_div_used else ["CFS", "OFS"]
             for fs_div in fs_divs:
                 try:
-                    candidate = _call_fin_api(corp_code, try_anchor, fs_div)
+                    candidate = _memo_items(memo, corp_code, try_anchor, fs_div)
                 except Exception:
                     continue
                 if not candidate:
@@ -916,9 +1085,7 @@ def fetch_income_detail_annual(stock_code: str, years: int = 5) -> list[dict]:
         if fs_div_used is None and collected:
             fs_div_used = found_fs
 
-    result = sorted(collected.values(), key=lambda x: x["year"])[-years:]
-    set_cached(cache_key, result, ttl_hours=168)
-    return result
+    return sorted(collected.values(), key=lambda x: x["year"])[-years:]
 
 
 # ── Phase 2-3: 분기 실적 ─────────────────────────────────────────────────────
@@ -938,25 +1105,13 @@ _QUARTERLY_REPRT_CODES = [
 ]
 
 
-def _call_fin_api_reprt(corp_code: str, bsns_year: int, reprt_code: str, fs_div: str) -> list[dict]:
-    """분기 보고서 원시 응답 반환 (reprt_code 지정). 실패/비어있으면 []."""
+def _call_fin_api_reprt(
+    corp_code: str, bsns_year: int, reprt_code: str, fs_div: str,
+    memo: Optional[dict[_Cell, Optional[list[dict]]]] = None,
+) -> list[dict]:
+    """분기 보고서 계정 행 반환 (reprt_code 지정, 웨어하우스 우선). 실패/비어있으면 []."""
     try:
-        resp = _dart_get(
-            f"{_BASE_URL}/fnlttSinglAcntAll.json",
-            params={
-                "crtfc_key": _api_key(),
-                "corp_code": corp_code,
-                "bsns_year": str(bsns_year),
-                "reprt_code": reprt_code,
-                "fs_div": fs_div,
-            },
-            timeout=20,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        if data.get("status") != "000":
-            return []
-        return data.get("list", []) or []
+        return _memo_items(memo or {}, corp_code, bsns_year, fs_div, reprt_code) or []
     except Exception:
         return []
 
@@ -1004,16 +1159,10 @@ def fetch_quarterly_financials(stock_code: str, quarters: int = 4) -> list[dict]
     첫 번째 유효한 fs_div가 결정되면 이후 배치에서도 동일 fs_div 유지.
 
     반환: [{year, quarter, revenue, operating_income, net_income, oi_margin, net_margin}] 오래된순
-    미공시 분기 건너뜀. 캐시: 'dart:quarterly:{code}:{quarters}' TTL 7일.
+    미공시 분기 건너뜀. 결과 캐시 없음 — stock/dart_warehouse 조회로 계산.
     """
-    cache_key = f"dart:quarterly:{stock_code}:{quarters}"
-    cached = get_cached(cache_key)
-    if cached is not None:
-        return cached
-
     corp_code = _fetch_corp_code(stock_code)
     if not corp_code:
-        set_cached(cache_key, [], ttl_hours=24)
         return []
 
     today = date.today()
@@ -1022,6 +1171,11 @@ def fetch_quarterly_financials(stock_code: str, quarters: int = 4) -> list[dict]
     years_to_fetch = max(2, (quarters + 3) // 4 + 1)
 
     quarterly_rows: list[dict] = []
+    memo = _prefetch(
+        corp_code,
+        [(latest_year - off, reprt_code) for off in range(years_to_fetch) for reprt_code, _ in _QUARTERLY_REPRT_CODES],
+        bool,
+    )
 
     for year_offset in range(years_to_fetch):
         target_year = latest_year - year_offset
@@ -1034,7 +1188,7 @@ def fetch_quarterly_financials(stock_code: str, quarters: int = 4) -> list[dict]
             fs_divs = [fs_div_used] if fs_div_used else ["CFS", "OFS"]
             items: list = []
             for fs_div in fs_divs:
-                candidate = _call_fin_api_reprt(corp_code, target_year, reprt_code, fs_div)
+                candidate = _call_fin_api_reprt(corp_code, target_year, reprt_code, fs_div, memo)
                 if candidate:
                     items = candidate
                     if fs_div_used is None:
@@ -1074,9 +1228,7 @@ def fetch_quarterly_financials(stock_code: str, quarters: int = 4) -> list[dict]
 
     # 연도-분기 오래된→최신 정렬 후 최근 quarters만
     quarterly_rows.sort(key=lambda r: (r["year"], r["quarter"]))
-    result = quarterly_rows[-quarters:] if len(quarterly_rows) > quarters else quarterly_rows
-    set_cached(cache_key, result, ttl_hours=24 * 7)
-    return result
+    return quarterly_rows[-quarters:] if len(quarterly_rows) > quarters else quarterly_rows
 
 
 # ── 리��치 데이터 헬퍼 ───────────────────���──────────────────────────────────────
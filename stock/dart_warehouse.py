@@ -0,0 +1,223 @@
+"""DART 재무제표 웨어하우스 — fnlttSinglAcntAll 응답을 계정 행 단위로 정규화해 로컬 SQLite에 영구 보관.
+
+`stock/dart_fin`의 `fetch_financials_multi_year` / `fetch_income_detail_annual` / `fetch_bs_cf_annual` /
+`fetch_quarterly_financials`(+ `fetch_financials`)는 결과 캐시 없이 이 웨어하우스 조회로 계산한다.
+DART 호출은 웨어하우스에 없거나 재확인 시점이 된 보고서에만 발생한다.
+
+    {DART_WAREHOUSE_DB_PATH}
+        report(corp_code, bsns_year, reprt_code, fs_div PK, status, rcept_no, checked_at)
+        line(corp_code, bsns_year, reprt_code, fs_div, line_no PK, sj_div, account_id, account_nm, ... 금액)
+            + INDEX (corp_code, account_id) — 표준 계정 ID 시계열 조회용
+        backoff(corp_code, bsns_year, reprt_code, fs_div PK, until, reason) — 오류 후 재호출 보류
+
+- `line_no`: 응답 내 순번. 비표준 계정은 account_id가 모두 `-표준계정코드 미사용-`이라 PK에 순번을 쓴다.
+- `report.status`
+    filed   — 공시됨, 계정 행 보관
+    absent  — 같은 보고서의 다른 fs_div만 공시됨 (예: 별도 전용 기업의 CFS)
+    pending — 미공시(DART 013). `DART_PENDING_RECHECK_HOURS` 후 재확인
+- 마감 기간(사업보고서 bsns_year < 올해-1, 분기·반기 bsns_year < 올해)은 만료 없음 — 마감 기간의 미공시(013)는
+  absent로 확정. 진행 중 회계연도 보고서만 `DART_OPEN_PERIOD_REVALIDATE_HOURS`마다 재조회(정정공시 반영).
+- 오류 응답은 report에 기록하지 않고 `record_error()`로 backoff 행만 남긴다 → 보류 시각까지 재호출 없음
+  (`lookup(..., stale_ok=True)`로 지난 응답 제공). 계정 단위 오류(한도 초과 등)는 `ACCOUNT_WIDE` 키 1행으로
+  전체 보류 — 프로세스 간 공유. 성공 기록 시 해당 보고서 backoff 해제. `delete(corp_code)`로 기업 단위 폐기.
+- 연결은 스레드별 장수명 (stock/cache.py, stock/dart_corp.py와 동일).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from config import DART_OPEN_PERIOD_REVALIDATE_HOURS, DART_PENDING_RECHECK_HOURS, DART_WAREHOUSE_DB_PATH
+
+_DB_PATH = Path(DART_WAREHOUSE_DB_PATH)
+
+_ANNUAL_REPRT_CODE = "11011"
+
+# fnlttSinglAcntAll 응답 필드 — line 컬럼 (rcept_no는 report 행에서 복원)
+LINE_FIELDS = (
+    "sj_div", "sj_nm", "account_id", "account_nm", "account_detail",
+    "thstrm_nm", "thstrm_dt", "thstrm_amount", "thstrm_add_amount",
+    "frmtrm_nm", "frmtrm_amount", "frmtrm_q_nm", "frmtrm_q_amount", "frmtrm_add_amount",
+    "bfefrmtrm_nm", "bfefrmtrm_amount", "ord", "currency",
+)
+
+# 계정 단위 backoff 키 (한도 초과·키 오류 — 모든 보고서 호출 보류)
+ACCOUNT_WIDE = ("*", 0, "", "")
+
+_local = threading.local()
+
+
+def _conn() -> sqlite3.Connection:
+    """현재 스레드의 장수명 연결. _DB_PATH가 바뀌면(테스트 monkeypatch) 재연결."""
+    path = str(_DB_PATH)
+    con = getattr(_local, "con", None)
+    if con is not None and getattr(_local, "path", None) == path:
+        return con
+    if con is not None:
+        con.close()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(path, timeout=10.0)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS report ("
+        " corp_code TEXT NOT NULL, bsns_year INTEGER NOT NULL, reprt_code TEXT NOT NULL, fs_div TEXT NOT NULL,"
+        " status TEXT NOT NULL, rcept_no TEXT NOT NULL, checked_at INTEGER NOT NULL,"
+        " PRIMARY KEY (corp_code, bsns_year, reprt_code, fs_div)"
+        ") WITHOUT ROWID"
+    )
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS line ("
+        " corp_code TEXT NOT NULL, bsns_year INTEGER NOT NULL, reprt_code TEXT NOT NULL, fs_div TEXT NOT NULL,"
+        " line_no INTEGER NOT NULL, "
+        + ", ".join(f"{f} TEXT" for f in LINE_FIELDS)
+        + ", PRIMARY KEY (corp_code, bsns_year, reprt_code, fs_div, line_no)) WITHOUT ROWID"
+    )
+    con.execute("CREATE INDEX IF NOT EXISTS idx_line_account ON line(corp_code, account_id)")
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS backoff ("
+        " corp_code TEXT NOT NULL, bsns_year INTEGER NOT NULL, reprt_code TEXT NOT NULL, fs_div TEXT NOT NULL,"
+        " until INTEGER NOT NULL, reason TEXT NOT NULL,"
+        " PRIMARY KEY (corp_code, bsns_year, reprt_code, fs_div)"
+        ") WITHOUT ROWID"
+    )
+    con.commit()
+    _local.con = con
+    _local.path = path
+    return con
+
+
+def is_closed(bsns_year: int, reprt_code: str, today: Optional[date] = None) -> bool:
+    """마감 기간 여부 — 사업보고서는 올해-1 이전, 분기·반기 보고서는 올해 이전."""
+    year = (today or date.today()).year
+    return bsns_year < (year - 1 if reprt_code == _ANNUAL_REPRT_CODE else year)
+
+
+def _fresh(status: str, checked_at: int, bsns_year: int, reprt_code: str, now: float) -> bool:
+    if status != "pending" and is_closed(bsns_year, reprt_code):
+        return True
+    hours = DART_PENDING_RECHECK_HOURS if status == "pending" else DART_OPEN_PERIOD_REVALIDATE_HOURS
+    return now - checked_at < hours * 3600
+
+
+def lookup(
+    corp_code: str, bsns_year: int, reprt_code: str, fs_div: str, stale_ok: bool = False
+) -> Optional[list[dict]]:
+    """보고서 계정 행(응답 순서). 공시 없음(absent/pending) [], 미저장·재확인 필요 None.
+
+    stale_ok=True면 재확인 시점이 지난 기록도 반환 (DART 오류 보류 중 지난 응답 제공용).
+    """
+    con = _conn()
+    key = (corp_code, bsns_year, reprt_code, fs_div)
+    row = con.execute(
+        "SELECT status, rcept_no, checked_at FROM report"
+        " WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ? AND fs_div = ?",
+        key,
+    ).fetchone()
+    if row is None or not (stale_ok or _fresh(row[0], row[2], bsns_year, reprt_code, time.time())):
+        return None
+    if row[0] != "filed":
+        return []
+    rcept_no = row[1]
+    lines = con.execute(
+        f"SELECT {', '.join(LINE_FIELDS)} FROM line"
+        " WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ? AND fs_div = ? ORDER BY line_no",
+        key,
+    )
+    return [
+        {"rcept_no": rcept_no, **{f: v for f, v in zip(LINE_FIELDS, values) if v is not None}}
+        for values in lines
+    ]
+
+
+def store(corp_code: str, bsns_year: int, reprt_code: str, fs_div: str, items: list[dict]) -> None:
+    """API 응답 기록 — 비어 있으면 pending(마감 기간은 absent), 아니면 filed + 계정 행 교체."""
+    key = (corp_code, bsns_year, reprt_code, fs_div)
+    if items:
+        status = "filed"
+    else:
+        status = "absent" if is_closed(bsns_year, reprt_code) else "pending"
+    rcept_no = (items[0].get("rcept_no") or "") if items else ""
+    con = _conn()
+    with con:
+        con.execute(
+            "DELETE FROM line WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ? AND fs_div = ?", key
+        )
+        if items:
+            con.executemany(
+                f"INSERT INTO line VALUES (?, ?, ?, ?, ?, {', '.join('?' * len(LINE_FIELDS))})",
+                [(*key, i, *(it.get(f) for f in LINE_FIELDS)) for i, it in enumerate(items)],
+            )
+        con.execute(
+            "INSERT OR REPLACE INTO report VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (*key, status, rcept_no, int(time.time())),
+        )
+        con.execute(
+            "DELETE FROM backoff WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ? AND fs_div = ?", key
+        )
+
+
+def mark_absent(corp_code: str, bsns_year: int, reprt_code: str, fs_div: str) -> None:
+    """다른 fs_div만 공시된 보고서 — 이 fs_div는 공시 없음으로 확정 (진행 중 기간은 재확인 대상)."""
+    con = _conn()
+    with con:
+        con.execute(
+            "INSERT OR REPLACE INTO report VALUES (?, ?, ?, ?, 'absent', '', ?)",
+            (corp_code, bsns_year, reprt_code, fs_div, int(time.time())),
+        )
+
+
+def record_error(
+    corp_code: str, bsns_year: int, reprt_code: str, fs_div: str, reason: str, seconds: float,
+    account_wide: bool = False,
+) -> None:
+    """DART 오류 기록 — `seconds` 동안 해당 보고서(account_wide면 전체) 재호출 보류."""
+    key = ACCOUNT_WIDE if account_wide else (corp_code, bsns_year, reprt_code, fs_div)
+    con = _conn()
+    with con:
+        con.execute(
+            "INSERT OR REPLACE INTO backoff VALUES (?, ?, ?, ?, ?, ?)",
+            (*key, int(time.time() + seconds), reason[:200]),
+        )
+
+
+def backoff_reason(corp_code: str, bsns_year: int, reprt_code: str, fs_div: str) -> Optional[str]:
+    """재호출 보류 중이면 오류 사유 (계정 단위 보류 우선), 아니면 None."""
+    now = int(time.time())
+    for key in (ACCOUNT_WIDE, (corp_code, bsns_year, reprt_code, fs_div)):
+        row = _conn().execute(
+            "SELECT reason FROM backoff"
+            " WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ? AND fs_div = ? AND until > ?",
+            (*key, now),
+        ).fetchone()
+        if row is not None:
+            return row[0]
+    return None
+
+
+def known(corp_codes: list[str], bsns_year: int, reprt_code: str) -> set[str]:
+    """해당 연도·보고서를 재확인 없이 답할 수 있는 corp_code 집합 (일괄 선적재 시 건너뛰기용)."""
+    if not corp_codes:
+        return set()
+    marks = ",".join("?" * len(corp_codes))
+    now = time.time()
+    rows = _conn().execute(
+        f"SELECT corp_code, status, checked_at FROM report"
+        f" WHERE bsns_year = ? AND reprt_code = ? AND corp_code IN ({marks})",
+        (bsns_year, reprt_code, *corp_codes),
+    )
+    return {cc for cc, status, checked_at in rows if _fresh(status, checked_at, bsns_year, reprt_code, now)}
+
+
+def delete(corp_code: str) -> int:
+    """기업 보고서 전체 폐기 (정정공시 즉시 반영용). 삭제한 보고서 수 반환."""
+    con = _conn()
+    with con:
+        con.execute("DELETE FROM line WHERE corp_code = ?", (corp_code,))
+        con.execute("DELETE FROM backoff WHERE corp_code = ?", (corp_code,))
+        return con.execute("DELETE FROM report WHERE corp_code = ?", (corp_code,)).rowcount
@@ -5,6 +5,8 @@ MACD / RSI(Wilder) / Stochastic / Bollinger Band / MA / ATR / 변동성돌파 
 
 순수 계산 함수 8개 (_ema, _sma, _rsi, _stoch, _bollinger, _atr, _safe_val,
 calc_technical_indicators). 외부 의존성 없음 — math, typing만 사용.
+기본 경로는 같은 값을 내는 NumPy 백엔드(`stock.indicators_np`) — 순수 Python 구현은
+backend="python" 기준 구현으로 유지 (parity 테스트 대상).
 
 advisory_fetcher.py의 fetch_ohlcv_by_interval()에서 OHLCV 수집 후 자동 호출된다.
 프론트엔드 TechnicalPanel에서 시각화에 사용하는 모든 지표가 이 모듈에서 계산된다.
@@ -187,11 +189,55 @@ def _safe_val(v: Optional[float]) -> Optional[float]:
     return round(v, 4) if not math.isnan(v) and not math.isinf(v) else None
 
 
-def calc_technical_indicators(ohlcv: list[dict]) -> dict:
-    """pandas 없이 순수 Python으로 기술지표 계산.
+def _series_py(highs: list[float], lows: list[float], closes: list[float]) -> dict:
+    """순수 Python 지표 계열 — {macd, signal, histogram, rsi, k, d, bb_*, ma*: 반올림 리스트, atr_cur}."""
+    # MACD (12, 26, 9): 업계 표준 파라미터
+    # MACD Line = EMA(12) - EMA(26), Signal Line = EMA(9) of MACD Line
+    # Histogram = MACD Line - Signal Line
+    ema12 = _ema(closes, 12)
+    ema26 = _ema(closes, 26)
+    macd_line = [
+        _safe_val((e12 - e26) if (e12 is not None and e26 is not None) else None)
+        for e12, e26 in zip(ema12, ema26)
+    ]
+    macd_valid = [v if v is not None else 0.0 for v in macd_line]
+    signal_line_raw = _ema(macd_valid, 9)
+    signal_line = [_safe_val(v) for v in signal_line_raw]
+    histogram = [
+        _safe_val((m - s) if (m is not None and s is not None) else None)
+        for m, s in zip(macd_line, signal_line)
+    ]
+
+    # Stochastic / 볼린저밴드
+    k_raw, d_raw = _stoch(highs, lows, closes, 14, 3)
+    bb_upper_raw, bb_mid_raw, bb_lower_raw = _bollinger(closes, 20, 2.0)
+
+    # ATR (14기간, Wilder)
+    atr_raw = _atr(highs, lows, closes, 14)
+
+    return {
+        "macd": macd_line,
+        "signal": signal_line,
+        "histogram": histogram,
+        "rsi": [_safe_val(v) for v in _rsi(closes, 14)],
+        "k": [_safe_val(v) for v in k_raw],
+        "d": [_safe_val(v) for v in d_raw],
+        "bb_upper": [_safe_val(v) for v in bb_upper_raw],
+        "bb_mid": [_safe_val(v) for v in bb_mid_raw],
+        "bb_lower": [_safe_val(v) for v in bb_lower_raw],
+        "ma5": [_safe_val(v) for v in _sma(closes, 5)],
+        "ma20": [_safe_val(v) for v in _sma(closes, 20)],
+        "ma60": [_safe_val(v) for v in _sma(closes, 60)],
+        "atr_cur": next((v for v in reversed(atr_raw) if v is not None), None),
+    }
+
+
+def calc_technical_indicators(ohlcv: list[dict], backend: str = "numpy") -> dict:
+    """OHLCV → 기술지표 + 현재 시그널 요약.
 
     입력: [{time, open, high, low, close, volume}]
     반환: {macd, rsi, stoch, bb, ma, volatility_target, current_signals}
+    backend: "numpy"(기본, `stock.indicators_np`) | "python"(순수 Python 기준 구현). 결과 동일.
     """
     if len(ohlcv) < 2:
         return {
@@ -211,54 +257,23 @@ def calc_technical_indicators(ohlcv: list[dict]) -> dict:
         }
 
     times = [b["time"] for b in ohlcv]
-    opens = [b["open"] for b in ohlcv]
     highs = [b["high"] for b in ohlcv]
     lows = [b["low"] for b in ohlcv]
     closes = [b["close"] for b in ohlcv]
     volumes = [b.get("volume") or 0 for b in ohlcv]
 
-    # MACD (12, 26, 9): 업계 표준 파라미터
-    # MACD Line = EMA(12) - EMA(26), Signal Line = EMA(9) of MACD Line
-    # Histogram = MACD Line - Signal Line
-    ema12 = _ema(closes, 12)
-    ema26 = _ema(closes, 26)
-    macd_line = [
-        _safe_val((e12 - e26) if (e12 is not None and e26 is not None) else None)
-        for e12, e26 in zip(ema12, ema26)
-    ]
-    macd_valid = [v if v is not None else 0.0 for v in macd_line]
-    signal_line_raw = _ema(macd_valid, 9)
-    signal_line = [_safe_val(v) for v in signal_line_raw]
-    histogram = [
-        _safe_val((m - s) if (m is not None and s is not None) else None)
-        for m, s in zip(macd_line, signal_line)
-    ]
-
-    # RSI
-    rsi_vals = [_safe_val(v) for v in _rsi(closes, 14)]
-
-    # Stochastic
-    k_raw, d_raw = _stoch(highs, lows, closes, 14, 3)
-    k_vals = [_safe_val(v) for v in k_raw]
-    d_vals = [_safe_val(v) for v in d_raw]
-
-    # 볼린저밴드
-    bb_upper_raw, bb_mid_raw, bb_lower_raw = _bollinger(closes, 20, 2.0)
-    bb_upper = [_safe_val(v) for v in bb_upper_raw]
-    bb_mid = [_safe_val(v) for v in bb_mid_raw]
-    bb_lower = [_safe_val(v) for v in bb_lower_raw]
-
-    # 이동평균
-    ma5_raw = _sma(closes, 5)
-    ma20_raw = _sma(closes, 20)
-    ma60_raw = _sma(closes, 60)
-    ma5 = [_safe_val(v) for v in ma5_raw]
-    ma20 = [_safe_val(v) for v in ma20_raw]
-    ma60 = [_safe_val(v) for v in ma60_raw]
-
-    # ATR (14기간, Wilder)
-    atr_raw = _atr(highs, lows, closes, 14)
-    atr_cur = next((v for v in reversed(atr_raw) if v is not None), None)
+    if backend == "python":
+        series = _series_py(highs, lows, closes)
+    else:
+        from stock.indicators_np import indicator_series
+        series = indicator_series(highs, lows, closes)
+
+    macd_line, signal_line, histogram = series["macd"], series["signal"], series["histogram"]
+    rsi_vals = series["rsi"]
+    k_vals, d_vals = series["k"], series["d"]
+    bb_upper, bb_mid, bb_lower = series["bb_upper"], series["bb_mid"], series["bb_lower"]
+    ma5, ma20, ma60 = series["ma5"], series["ma20"], series["ma60"]
+    atr_cur = series["atr_cur"]
 
     # 변동성 돌파 목표가 (Larry Williams 전략):
     # 목표가 = 당일 시가 + 전일 (고가 - 저가) × K
@@ -0,0 +1,198 @@
+"""기술적 지표 NumPy 백엔드 — `stock.indicators` 순수 Python 구현과 같은 값·같은 출력 스키마.
+
+`indicators.calc_technical_indicators`(기본 backend="numpy")가 호출한다.
+순수 Python 구현은 봉마다 창 슬라이스 합(SMA/볼린저 O(n·period))·max/min(스토캐스틱)과
+원소별 `_safe_val`을 반복해 15분봉 3,000개 기준 수십 ms가 걸린다.
+
+  - 창 합/제곱합: 시프트 슬라이스를 period번 누적 — Python `sum(window)`과 같은 순서로 더해
+    결과가 비트 단위로 같다 (cumsum 차분은 큰 누적합의 반올림 오차로 4자리 반올림이 달라질 수 있음).
+  - 창 max/min: 2배씩 넓힌 시프트 비교 (log2(period)회 배열 연산).
+  - 재귀 지표(EMA, Wilder RSI/ATR): 직전 값에 의존하므로 float 스칼라 루프 1회 — 나머지 연산은 배열.
+  - 반올림: Python `round(·, 4)`과 같은 값 + 비유한값 → None (`_safe_val`과 동일 규칙).
+    `np.round`는 10⁴배 후 반올림이라 0.10005 → 0.1처럼 `round`(0.1001)와 어긋날 수 있다 —
+    `rint` 일괄 후 .5 경계에 붙은 원소만 `round`로 재계산.
+
+입력은 유한한 가격을 가정한다 (순수 Python 구현과 동일).
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+
+def _round4(a: np.ndarray) -> np.ndarray:
+    """Python `round(v, 4)`과 같은 값의 배열 반올림 (NaN/Inf는 그대로).
+
+    `rint(v·10⁴)/10⁴`는 v·10⁴가 .5 경계에 붙은 값에서만 `round`와 다른 자리를 고를 수 있으므로
+    그 원소만 `round`로 다시 계산한다.
+    """
+    y = a * 1e4
+    r = np.rint(y) / 1e4
+    with np.errstate(invalid="ignore"):
+        near_tie = np.abs(y - np.floor(y) - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(y))
+    for i in np.flatnonzero(near_tie).tolist():
+        r[i] = round(float(a[i]), 4)
+    return r
+
+
+def _rounded(a: np.ndarray) -> list[Optional[float]]:
+    """배열 → 소수 4자리 반올림 리스트. NaN/Inf는 None (`_safe_val` 벡터판)."""
+    r = _round4(a)
+    out = r.tolist()
+    bad = ~np.isfinite(r)
+    if bad.any():
+        for i in np.flatnonzero(bad).tolist():
+            out[i] = None
+    return out
+
+
+def _window_sum(x: np.ndarray, period: int) -> np.ndarray:
+    """길이 n-period+1 창 합 — 창 내 앞에서부터 순차 누적 (Python sum과 같은 덧셈 순서)."""
+    m = len(x) - period + 1
+    acc = x[:m].copy()
+    for j in range(1, period):
+        acc += x[j:j + m]
+    return acc
+
+
+def _window_extreme(x: np.ndarray, period: int, op) -> np.ndarray:
+    """길이 n-period+1 창 max/min — 폭 w 결과 두 개를 겹쳐 폭 2w (마지막은 period에 맞춰 겹침)."""
+    acc, w = x, 1
+    while w * 2 <= period:
+        acc = op(acc[:-w], acc[w:])
+        w *= 2
+    if w < period:
+        acc = op(acc[:len(acc) - (period - w)], acc[period - w:])
+    return acc
+
+
+def _sma(x: np.ndarray, period: int) -> np.ndarray:
+    out = np.full(len(x), np.nan)
+    if len(x) >= period:
+        out[period - 1:] = _window_sum(x, period) / period
+    return out
+
+
+def _ema(x: list[float], period: int) -> np.ndarray:
+    """SMA 시드 EMA. x는 float 리스트 (스칼라 루프가 ndarray 원소 접근보다 빠름)."""
+    n = len(x)
+    out = [np.nan] * n
+    if n >= period:
+        k = 2 / (period + 1)
+        k1 = 1 - k
+        prev = sum(x[:period]) / period
+        out[period - 1] = prev
+        for i in range(period, n):
+            prev = x[i] * k + prev * k1
+            out[i] = prev
+    return np.asarray(out, dtype=np.float64)
+
+
+def _wilder(x: list[float], period: int, first: int, n: int) -> np.ndarray:
+    """Wilder 평활 — out[first] = mean(x[:period]), 이후 out[i] = (prev·(p-1) + x[i-1]) / p.
+
+    x는 길이 n-1 차분 계열(gains/losses/TR — x[i-1]이 봉 i 값). RSI/ATR 모두 first=period.
+    """
+    out = [np.nan] * n
+    prev = sum(x[:period]) / period
+    out[first] = prev
+    p1 = period - 1
+    for i in range(first + 1, n):
+        prev = (prev * p1 + x[i - 1]) / period
+        out[i] = prev
+    return np.asarray(out, dtype=np.float64)
+
+
+def _rsi(c: np.ndarray, period: int) -> np.ndarray:
+    n = len(c)
+    if n <= period:
+        return np.full(n, np.nan)
+    diff = np.diff(c)
+    gains = np.maximum(diff, 0.0).tolist()
+    losses = np.maximum(-diff, 0.0).tolist()
+    ag = _wilder(gains, period, period, n)
+    al = _wilder(losses, period, period, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = np.where(al > 0, ag / al, 100.0)
+        out = 100 - (100 / (1 + rs))
+    out[:period] = np.nan
+    return out
+
+
+def _stoch(h: np.ndarray, lo: np.ndarray, c: np.ndarray, k_period: int, d_period: int):
+    n = len(c)
+    k = np.full(n, np.nan)
+    d = np.full(n, np.nan)
+    if n < k_period:
+        return k, d
+    hh = _window_extreme(h, k_period, np.maximum)
+    ll = _window_extreme(lo, k_period, np.minimum)
+    rng = hh - ll
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kv = np.where(rng == 0, 50.0, (c[k_period - 1:] - ll) / rng * 100)
+    k[k_period - 1:] = kv
+    if len(kv) >= d_period:
+        d[k_period + d_period - 2:] = _window_sum(kv, d_period) / d_period
+    return k, d
+
+
+def _bollinger(c: np.ndarray, period: int, sigma: float):
+    n = len(c)
+    upper, mid, lower = (np.full(n, np.nan) for _ in range(3))
+    if n < period:
+        return upper, mid, lower
+    m = n - period + 1
+    avg = _window_sum(c, period) / period
+    dev = c[:m] - avg
+    ss = dev * dev
+    for j in range(1, period):
+        dev = c[j:j + m] - avg
+        ss += dev * dev
+    std = np.sqrt(ss / period)
+    mid[period - 1:] = avg
+    upper[period - 1:] = avg + sigma * std
+    lower[period - 1:] = avg - sigma * std
+    return upper, mid, lower
+
+
+def _atr(h: np.ndarray, lo: np.ndarray, c: np.ndarray, period: int) -> np.ndarray:
+    n = len(c)
+    if n < period + 1:
+        return np.full(n, np.nan)
+    prev = c[:-1]
+    tr = np.maximum(np.maximum(h[1:] - lo[1:], np.abs(h[1:] - prev)), np.abs(lo[1:] - prev))
+    return _wilder(tr.tolist(), period, period, n)
+
+
+def indicator_series(highs: list, lows: list, closes: list) -> dict:
+    """지표 계열 계산 → `indicators._series_py`와 같은 키·같은 값 (반올림 리스트 + atr_cur)."""
+    h = np.asarray(highs, dtype=np.float64)
+    lo = np.asarray(lows, dtype=np.float64)
+    c = np.asarray(closes, dtype=np.float64)
+    c_list = c.tolist()
+
+    # MACD — 시그널은 반올림된 MACD 라인(None→0.0)의 EMA(9) (순수 Python 구현과 동일)
+    macd = _round4(_ema(c_list, 12) - _ema(c_list, 26))
+    macd_valid = np.where(np.isfinite(macd), macd, 0.0)
+    signal = _round4(_ema(macd_valid.tolist(), 9))
+
+    k, d = _stoch(h, lo, c, 14, 3)
+    upper, mid, lower = _bollinger(c, 20, 2.0)
+    atr = _atr(h, lo, c, 14)
+    atr_ok = np.flatnonzero(np.isfinite(atr))
+    return {
+        "macd": _rounded(macd),
+        "signal": _rounded(signal),
+        "histogram": _rounded(macd - signal),
+        "rsi": _rounded(_rsi(c, 14)),
+        "k": _rounded(k),
+        "d": _rounded(d),
+        "bb_upper": _rounded(upper),
+        "bb_mid": _rounded(mid),
+        "bb_lower": _rounded(lower),
+        "ma5": _rounded(_sma(c, 5)),
+        "ma20": _rounded(_sma(c, 20)),
+        "ma60": _rounded(_sma(c, 60)),
+        "atr_cur": float(atr[atr_ok[-1]]) if len(atr_ok) else None,
+    }
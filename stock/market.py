@@ -17,7 +17,7 @@ from typing import Optional
 
 import pandas as pd
 
-from .cache import delete_prefix, get_cached, set_cached
+from .cache import delete_prefix, get_cached, get_or_compute, set_cached
 
 logger = logging.getLogger(__name__)
 
@@ -180,12 +180,18 @@ def fetch_detail(code: str, refresh: bool = False) -> Optional[dict]:
     if price is None:
         return None
 
-    # 메타는 6시간 캐시 — 가격과 분리
-    if not refresh:
-        cached_meta = get_cached(meta_cache_key)
-        if cached_meta is not None:
-            return {**cached_meta, **price}
+    # 메타는 6시간 캐시 — 가격과 분리. 동시 miss는 single-flight 1회 조회,
+    # 만료 후 6시간 이내는 stale 메타 즉시 반환 + 백그라운드 갱신 (메타는 일중 변동 미미).
+    meta = get_or_compute(
+        meta_cache_key, lambda: _fetch_detail_meta(code), ttl_hours=6, stale_hours=6,
+    )
+    if meta is None:
+        return None
+    return {**meta, **price}
+
 
+def _fetch_detail_meta(code: str) -> Optional[dict]:
+    """fetch_detail 메타(market_type/sector/52주/PER/PBR) yfinance 조회. ticker 미해결 시 None."""
     from .yf_client import _ticker
 
     ticker_str = _kr_yf_ticker_str(code)
@@ -208,7 +214,7 @@ def fetch_detail(code: str, refresh: bool = False) -> Optional[dict]:
         per_raw = info.get("trailingPE")
         pbr_raw = info.get("priceToBook")
 
-        meta = {
+        return {
             "market_type": market_type,
             "sector": sector,
             "high_52": int(high_52) if high_52 else None,
@@ -216,8 +222,6 @@ def fetch_detail(code: str, refresh: bool = False) -> Optional[dict]:
             "per": round(per_raw, 2) if per_raw else None,
             "pbr": round(pbr_raw, 2) if pbr_raw else None,
         }
-        set_cached(meta_cache_key, meta, ttl_hours=6)
-        return {**meta, **price}
 
     except Exception as e:
         raise RuntimeError(f"상세정보 조회 실패 ({code}): {e}") from e
@@ -227,18 +231,14 @@ def _fetch_valuation_history_yf_kr(code: str, years: int) -> list[dict]:
     """KRX 인증 없을 때 yfinance로 국내 종목 PER/PBR 히스토리 추정.
 
     fetch_valuation_history_yf()와 동일한 로직. .KS/.KQ ticker 자동 선택.
-    결과를 market:val_hist 캐시에도 저장하여 일관된 응답 보장.
+    market:val_hist 캐시 저장은 호출부(fetch_valuation_history의 get_or_compute)가 담당.
     """
     ticker_str = _kr_yf_ticker_str(code)
     if not ticker_str:
         return []
     try:
         from stock.yf_client import fetch_valuation_history_yf
-        result = fetch_valuation_history_yf(ticker_str, min(years, 5))
-        if result:
-            cache_key = f"market:val_hist:{code}:{years}"
-            set_cached(cache_key, result, ttl_hours=24)
-        return result
+        return fetch_valuation_history_yf(ticker_str, min(years, 5))
     except Exception:
         return []
 
@@ -249,11 +249,18 @@ def fetch_valuation_history(code: str, years: int = 10) -> list[dict]:
     pykrx get_market_fundamental 사용. KRX 인증(KRX_ID/KRX_PASSWORD) 필요.
     미인증 또는 조회 실패 시 yfinance(분기 EPS/BPS + 일별 주가)로 fallback.
     """
-    cache_key = f"market:val_hist:{code}:{years}"
-    cached = get_cached(cache_key)
-    if cached is not None:
-        return cached
-
+    # 월말 시계열은 하루 stale도 무해 → 만료 후 24시간은 즉시 반환 + 백그라운드 갱신.
+    # 빈 결과(조회 실패)는 저장하지 않아 다음 호출에서 재시도.
+    return get_or_compute(
+        f"market:val_hist:{code}:{years}",
+        lambda: _fetch_valuation_history_fresh(code, years),
+        stale_hours=24,
+        ttl_for=lambda v: 24 if v else None,
+    )
+
+
+def _fetch_valuation_history_fresh(code: str, years: int) -> list[dict]:
+    """fetch_valuation_history 캐시 miss 경로 — pykrx(KRX 인증) → yfinance fallback."""
     # KRX 인증 시도
     try:
         from screener.krx_auth import ensure_krx_session
@@ -346,7 +353,6 @@ def fetch_valuation_history(code: str, years: int = 10) -> list[dict]:
             "shares": int(shares) if shares else None,
         })
 
-    set_cached(cache_key, result, ttl_hours=24)
     return result
 
 
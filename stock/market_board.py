@@ -80,14 +80,9 @@ def fetch_new_highs_lows(top_n: int = 10, candidate_limit: int = 200) -> dict:
         return cached
 
     from .symbol_map import get_symbol_map
-    from .dart_fin import _load_corp_name_map
+    from .dart_corp import corp_name
 
     sym_map = get_symbol_map()
-    # 종목명 매핑 (DART fallback)
-    try:
-        dart_names = _load_corp_name_map()
-    except Exception:
-        dart_names = {}
 
     all_codes = list(sym_map.keys())
 
@@ -106,7 +101,7 @@ def fetch_new_highs_lows(top_n: int = 10, candidate_limit: int = 200) -> dict:
                 if info is None:
                     continue
                 entry = sym_map.get(code, {})
-                name = entry.get("name") or dart_names.get(code) or code
+                name = entry.get("name") or corp_name(code) or code  # DART fallback (인덱스 PK 조회)
                 results.append({
                     "code": code,
                     "name": name,
@@ -166,29 +161,18 @@ def fetch_sparkline(code: str, market: str = "KR") -> list[dict]:
     if cached is not None:
         return cached
 
-    from .yf_client import _ticker
-
-    if market == "KR":
-        ticker_str = _kr_yf_ticker_str(code)
-        if not ticker_str:
-            return []
-    else:
-        ticker_str = code.upper()
+    from . import ohlcv_store
 
     try:
-        hist = _ticker(ticker_str).history(period="1y", interval="1wk")
+        # 주봉은 ohlcv_store 영구 저장소에서 읽고 미확인 최근 구간만 yfinance 보충.
+        # 배당·분할 조정 종가(adj_close) — 기존 yfinance auto_adjust 종가와 동일 기준
+        hist = ohlcv_store.get_bars_period(code, "1y", market=market, interval="1wk")
         if hist is None or hist.empty:
             return []
-        # tz-aware → tz-naive
-        try:
-            hist.index = hist.index.tz_convert(None)
-        except Exception:
-            hist.index = hist.index.tz_localize(None)
-
         result = [
-            {"date": str(ts.date()), "close": round(float(row["Close"]), 4)}
-            for ts, row in hist.iterrows()
-            if row["Close"] and row["Close"] > 0
+            {"date": str(ts.date()), "close": round(float(c), 4)}
+            for ts, c in zip(hist.index, hist["adj_close"].to_numpy())
+            if c and c > 0
         ]
         set_cached(cache_key, result, ttl_hours=24)
         return result
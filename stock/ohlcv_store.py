@@ -0,0 +1,407 @@
+"""종목 OHLCV 영구 저장소 — (interval, 시장, 종목)별 디렉터리 + 컬럼별 .npy (memory-mapped 읽기).
+
+로컬 백테스트(`services/local_backtest/data_loader`), 마켓보드 sparkline, 매크로 팩터
+종목 logret, 자문 차트(일봉/주봉)가 같은 일봉을 매번 yfinance `Ticker.history`로 다시
+받던 것을 디스크 저장소 1곳으로 모은다. 요청 구간 중 **아직 확인하지 않은 앞/뒤 구간만**
+yfinance에서 보충(top-up)하고, 나머지는 로컬 memmap에서 읽는다.
+
+디렉터리 구조
+-------------
+    {OHLCV_STORE_DIR}/{interval}/{market}/{symbol}/
+        date.npy                          — datetime64[D] 오름차순, 중복 없음
+        open.npy high.npy low.npy close.npy adj_close.npy volume.npy  — float64
+        _meta.json  — {"checked_from", "checked_through", "fetched_at", "rows"}
+
+- `checked_from`~`checked_through`: yfinance 조회를 마친 구간 (휴장일 포함). 이 구간 안의
+  요청은 네트워크 없이 응답한다.
+- **뒤쪽 보충**: 저장된 끝에서 두 번째 봉(완결 봉)부터 다시 받아 겹치는 봉을 덮어쓴다 →
+  장중 부분 봉 갱신. 기준 봉의 close/adj_close가 달라졌으면 배당·분할 소급 조정이므로
+  전 구간을 다시 받는다.
+- 당일까지 확인된 경우에도 `OHLCV_STORE_TOPUP_TTL_SEC`가 지나면 뒤쪽을 다시 확인한다.
+- 가격은 `auto_adjust=False` 원가격(분할만 반영) + `adj_close`(배당 조정 종가) 별도 보관.
+  차트·지표 소비자는 `adjusted(df)`로 yfinance `auto_adjust=True`와 같은 조정 OHLC를 쓴다.
+- 기록은 임시 디렉터리 → rename 교체 (screener/history.py와 동일) — 부분 기록 노출 없음.
+  보충·기록·읽기는 종목별 프로세스 내 락 + 파일 락(`.{symbol}.lock`, fcntl)으로 직렬화 →
+  여러 워커 프로세스가 같은 종목 디렉터리를 동시에 교체하지 않는다.
+- 조회 실패(None)는 기록하지 않는다 → 다음 호출에서 재시도.
+- 봉이 하나도 없는 응답(상장폐지·미상 코드)은 `.{symbol}.empty.json` 음성 표식으로 기록 →
+  `OHLCV_STORE_EMPTY_TTL_SEC` 동안 표식 구간 안의 요청은 조회 없이 None.
+"""
+
+from __future__ import annotations
+
+import calendar
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from config import OHLCV_STORE_DIR, OHLCV_STORE_EMPTY_TTL_SEC, OHLCV_STORE_TOPUP_TTL_SEC
+
+try:
+    import fcntl
+except ImportError:  # Windows — 프로세스 내 락만 사용
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_ROOT = Path(OHLCV_STORE_DIR)
+
+INTERVALS = ("1d", "1wk")
+COLUMNS = ("open", "high", "low", "close", "adj_close", "volume")
+_META = "_meta.json"
+
+# 기준 봉 비교 허용 오차 (상대) — 초과 시 소급 조정으로 판단해 전 구간 재조회
+_REVISION_RTOL = 1e-6
+
+_locks: dict[tuple[str, str, str], threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(key: tuple[str, str, str]) -> threading.Lock:
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = threading.Lock()
+        return lock
+
+
+@contextmanager
+def _locked(path: Path, key: tuple[str, str, str]):
+    """종목 단위 배타 구간 — 스레드 락 + (POSIX) 종목 디렉터리 옆 파일 락."""
+    with _lock_for(key):
+        if fcntl is None:
+            yield
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_name(f".{path.name}.lock"), "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _today() -> date:
+    from stock.db_base import now_kst
+
+    return now_kst().date()
+
+
+def _dir(symbol: str, market: str, interval: str) -> Path:
+    return _ROOT / interval / market / (symbol if market == "KR" else symbol.upper())
+
+
+# ── yfinance 조회 ────────────────────────────────────────────────────────────
+
+def _yf_ticker_str(symbol: str, market: str) -> Optional[str]:
+    if market != "KR":
+        return symbol.upper()
+    try:
+        from stock.market import _kr_yf_ticker_str
+
+        return _kr_yf_ticker_str(symbol)
+    except Exception as e:
+        logger.warning("KR ticker resolve 실패 code=%s err=%s", symbol, e)
+        return None
+
+
+def _fetch_yf(
+    symbol: str, market: str, start: date, end: date, interval: str
+) -> Optional[pd.DataFrame]:
+    """yfinance [start, end] 봉 → 저장 스키마 DataFrame. 조회 실패 None, 해당 구간 봉 없음은 빈 DataFrame."""
+    ticker_str = _yf_ticker_str(symbol, market)
+    if not ticker_str:
+        return None
+    try:
+        from stock.yf_client import _ticker
+
+        # yfinance.history는 end exclusive — +1일
+        hist = _ticker(ticker_str).history(
+            start=start.isoformat(),
+            end=(end + timedelta(days=1)).isoformat(),
+            interval=interval,
+            auto_adjust=False,
+            actions=False,
+        )
+    except Exception as e:
+        logger.warning("yf history 실패 %s/%s %s err=%s", market, symbol, interval, e)
+        return None
+    if hist is None:
+        return None
+    if hist.empty:
+        return pd.DataFrame(columns=list(COLUMNS), index=pd.DatetimeIndex([]), dtype=np.float64)
+
+    df = hist.rename(columns={
+        "Open": "open", "High": "high", "Low": "low", "Close": "close",
+        "Adj Close": "adj_close", "Volume": "volume",
+    })
+    if "adj_close" not in df.columns:
+        df["adj_close"] = df["close"]
+    df = df[list(COLUMNS)].astype(np.float64)
+    idx = df.index
+    if getattr(idx, "tz", None) is not None:
+        idx = idx.tz_localize(None)
+    df.index = pd.DatetimeIndex(idx).normalize()
+    df = df.dropna(subset=["open", "high", "low", "close"])
+    return df[~df.index.duplicated(keep="last")].sort_index()
+
+
+# ── 디스크 읽기/쓰기 ──────────────────────────────────────────────────────────
+
+def _read_meta(path: Path) -> Optional[dict]:
+    try:
+        return json.loads((path / _META).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def read_bars(
+    symbol: str, market: str = "KR", interval: str = "1d"
+) -> Optional[dict[str, np.ndarray]]:
+    """저장된 봉 전체 → {"date", *COLUMNS: 읽기 전용 memmap 배열}. 없으면 None (네트워크 없음)."""
+    path = _dir(symbol, market.upper(), interval)
+    if _read_meta(path) is None:
+        return None
+    return {
+        name: np.load(path / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+        for name in ("date", *COLUMNS)
+    }
+
+
+def adjusted(df: pd.DataFrame) -> pd.DataFrame:
+    """배당·분할 조정 OHLC — yfinance `auto_adjust=True`와 동일 (open/high/low × adj_close/close, close=adj_close)."""
+    close = df["close"].to_numpy(dtype=np.float64)
+    adj = df["adj_close"].to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(close > 0, adj / close, 1.0)
+    ratio = np.where(np.isfinite(ratio), ratio, 1.0)
+    out = df.copy()
+    for c in ("open", "high", "low"):
+        out[c] = df[c].to_numpy(dtype=np.float64) * ratio
+    out["close"] = np.where(np.isfinite(adj), adj, close)
+    return out
+
+
+def _frame(cols: dict[str, np.ndarray], lo: int = 0, hi: Optional[int] = None) -> pd.DataFrame:
+    """memmap 컬럼 [lo, hi) 행 → DataFrame (해당 페이지만 복사)."""
+    index = pd.DatetimeIndex(np.array(cols["date"][lo:hi]).astype("datetime64[ns]"))
+    return pd.DataFrame({c: np.array(cols[c][lo:hi]) for c in COLUMNS}, index=index)
+
+
+def _write(path: Path, df: pd.DataFrame, meta: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{path.name}.", dir=path.parent))
+    try:
+        dates = df.index.values.astype("datetime64[D]")
+        np.save(tmp / "date.npy", dates, allow_pickle=False)
+        for c in COLUMNS:
+            np.save(tmp / f"{c}.npy", df[c].to_numpy(dtype=np.float64), allow_pickle=False)
+        (tmp / _META).write_text(json.dumps({**meta, "rows": len(df)}), encoding="utf-8")
+        old = path.with_name(f".{path.name}.old")
+        shutil.rmtree(old, ignore_errors=True)
+        if path.exists():
+            os.replace(path, old)
+        os.replace(tmp, path)
+        shutil.rmtree(old, ignore_errors=True)
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+# ── 음성 표식 (봉 없는 종목) ────────────────────────────────────────────────────
+
+def _empty_marker(path: Path) -> Path:
+    return path.with_name(f".{path.name}.empty.json")
+
+
+def _known_empty(path: Path, start: date, end: date) -> bool:
+    """[start, end]가 TTL 안의 음성 표식 구간에 포함되면 True."""
+    try:
+        mark = json.loads(_empty_marker(path).read_text(encoding="utf-8"))
+        fresh = time.time() - float(mark["checked_at"]) < OHLCV_STORE_EMPTY_TTL_SEC
+        return fresh and date.fromisoformat(mark["from"]) <= start and end <= date.fromisoformat(mark["through"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _mark_empty(path: Path, start: date, end: date) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mark = {"from": start.isoformat(), "through": end.isoformat(), "checked_at": time.time()}
+    try:
+        _empty_marker(path).write_text(json.dumps(mark), encoding="utf-8")
+    except OSError as e:
+        logger.debug("OHLCV 음성 표식 기록 실패 %s: %s", path, e)
+
+
+# ── 보충 (top-up) ─────────────────────────────────────────────────────────────
+
+def _revised(old: pd.DataFrame, new: pd.DataFrame, anchor: pd.Timestamp) -> bool:
+    """기준 봉의 close/adj_close가 재조회 결과와 다르면 True (배당·분할 소급 조정)."""
+    if anchor not in old.index or anchor not in new.index:
+        return False
+    a = old.loc[anchor, ["close", "adj_close"]].to_numpy(dtype=np.float64)
+    b = new.loc[anchor, ["close", "adj_close"]].to_numpy(dtype=np.float64)
+    return not np.allclose(a, b, rtol=_REVISION_RTOL, atol=0.0)
+
+
+def _merge(base: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    if base.empty:
+        return new
+    if new.empty:
+        return base
+    out = pd.concat([base, new])
+    return out[~out.index.duplicated(keep="last")].sort_index()
+
+
+def _top_up(
+    path: Path, symbol: str, market: str, interval: str, start: date, end: date, today: date
+) -> None:
+    """[start, end] 중 미확인 구간만 조회해 저장소에 병합. 실패 시 기존 저장분 유지."""
+    meta = _read_meta(path)
+    if meta is None:
+        if _known_empty(path, start, end):
+            return
+        df = _fetch_yf(symbol, market, start, end, interval)
+        if df is None:
+            return
+        if df.empty:
+            _mark_empty(path, start, end)
+            return
+        _empty_marker(path).unlink(missing_ok=True)
+        _write(path, df, {
+            "checked_from": start.isoformat(),
+            "checked_through": end.isoformat(),
+            "fetched_at": time.time(),
+        })
+        return
+
+    checked_from = date.fromisoformat(meta["checked_from"])
+    checked_through = date.fromisoformat(meta["checked_through"])
+    stale = (
+        end >= checked_through == today
+        and time.time() - float(meta.get("fetched_at", 0)) > OHLCV_STORE_TOPUP_TTL_SEC
+    )
+    need_head = start < checked_from
+    need_tail = end > checked_through or stale
+    if not (need_head or need_tail):
+        return
+
+    cols = read_bars(symbol, market, interval)
+    df = _frame(cols) if cols is not None else pd.DataFrame(columns=list(COLUMNS))
+    new_from, new_through = checked_from, checked_through
+    changed = False
+
+    if need_tail:
+        # 끝에서 두 번째(완결) 봉부터 재조회 — 마지막 봉(부분 봉 가능)을 덮어쓰고 기준 봉으로 소급 조정 감지
+        anchor = df.index[-2] if len(df) >= 2 else (df.index[-1] if len(df) else None)
+        tail_from = anchor.date() if anchor is not None else checked_through
+        tail = _fetch_yf(symbol, market, tail_from, end, interval)
+        if tail is not None:
+            if anchor is not None and _revised(df, tail, anchor):
+                full = _fetch_yf(symbol, market, min(start, checked_from), end, interval)
+                if full is None or full.empty:
+                    return
+                logger.info("OHLCV 소급 조정 감지 → 전 구간 재조회 %s/%s %s", market, symbol, interval)
+                _write(path, full, {
+                    "checked_from": min(start, checked_from).isoformat(),
+                    "checked_through": max(end, checked_through).isoformat(),
+                    "fetched_at": time.time(),
+                })
+                return
+            df = _merge(df, tail)
+            new_through = max(end, checked_through)
+            changed = True
+
+    if need_head:
+        head = _fetch_yf(symbol, market, start, checked_from - timedelta(days=1), interval)
+        if head is not None:
+            df = _merge(head, df)
+            new_from = start
+            changed = True
+
+    if changed:
+        _write(path, df, {
+            "checked_from": new_from.isoformat(),
+            "checked_through": new_through.isoformat(),
+            "fetched_at": time.time() if need_tail else float(meta.get("fetched_at", 0)),
+        })
+
+
+def get_bars(
+    symbol: str,
+    start: date,
+    end: date,
+    market: str = "KR",
+    interval: str = "1d",
+) -> Optional[pd.DataFrame]:
+    """[start, end] 봉 DataFrame (index=naive DatetimeIndex, columns=COLUMNS).
+
+    저장소에 없는 앞/뒤 구간만 yfinance로 보충한 뒤 memmap에서 잘라 반환한다.
+    보충 실패 시 저장된 범위만 반환하고, 저장분도 없으면 None.
+
+    Raises:
+        ValueError: 지원하지 않는 interval.
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"ohlcv_store: 지원하지 않는 interval {interval}")
+    market = market.upper()
+    today = _today()
+    end = min(end, today)
+    if start > end:
+        return None
+
+    path = _dir(symbol, market, interval)
+    with _locked(path, (interval, market, symbol)):
+        _top_up(path, symbol, market, interval, start, end, today)
+        cols = read_bars(symbol, market, interval)
+    if cols is None:
+        return None
+    dates = cols["date"]
+    lo = int(np.searchsorted(dates, np.datetime64(start, "D"), side="left"))
+    hi = int(np.searchsorted(dates, np.datetime64(end, "D"), side="right"))
+    if lo >= hi:
+        return None
+    return _frame(cols, lo, hi)
+
+
+_PERIOD_RE = re.compile(r"^(\d+)(d|wk|mo|y)$")
+
+
+def period_start(period: str, today: Optional[date] = None) -> Optional[date]:
+    """yfinance period 문자열('60d', '6mo', '1y', 'ytd' 등) → 시작일. 해석 불가('max' 등)면 None."""
+    today = today or _today()
+    if period == "ytd":
+        return date(today.year, 1, 1)
+    m = _PERIOD_RE.match(period or "")
+    if not m:
+        return None
+    n, unit = int(m.group(1)), m.group(2)
+    if unit == "d":
+        return today - timedelta(days=n)
+    if unit == "wk":
+        return today - timedelta(weeks=n)
+    months = n * 12 if unit == "y" else n
+    y, mo = divmod(today.year * 12 + today.month - 1 - months, 12)
+    return date(y, mo + 1, min(today.day, calendar.monthrange(y, mo + 1)[1]))
+
+
+def get_bars_period(
+    symbol: str, period: str, market: str = "KR", interval: str = "1d"
+) -> Optional[pd.DataFrame]:
+    """period 문자열 기준 최근 봉. period 해석 불가 시 ValueError."""
+    start = period_start(period)
+    if start is None:
+        raise ValueError(f"ohlcv_store: 해석할 수 없는 period {period}")
+    return get_bars(symbol, start, _today(), market=market, interval=interval)
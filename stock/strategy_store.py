@@ -50,6 +50,12 @@ def update_job_status(job_id: str, status: str) -> bool:
         return BacktestRepository(db).update_job_status(job_id, status)
 
 
+def update_job_progress(job_id: str, result_json: dict) -> bool:
+    """실행 중 중간 결과 저장 (status=running 유지)."""
+    with get_session() as db:
+        return BacktestRepository(db).update_job_progress(job_id, result_json)
+
+
 def set_mcp_job_id(job_id: str, mcp_job_id: str) -> bool:
     """fire-and-poll: MCP 측 job_id 영속화. alembic 미적용 환경 graceful."""
     with get_session() as db:
@@ -0,0 +1,143 @@
+"""KRX 종목 검색 인덱스 (프로세스 상주, symbol_map 갱신 시에만 재빌드).
+
+자동완성 키 입력마다 전 종목 맵 역직렬화 + ~2,700개 이름 소문자화·부분문자열 선형 스캔하던
+`symbol_map.name_to_results`를 대체한다.
+
+구조
+----
+- 엔트리는 시가총액 내림차순(동률 시 코드순)으로 정렬 → 엔트리 id = 순위.
+- 이름/초성 문자열마다 1-gram + 2-gram posting list (id 오름차순 = 시총순).
+  질의의 2-gram 중 가장 짧은 posting list만 후보로 잡고 `q in name`으로 검증.
+- 초성 검색: 질의가 한글 자음(ㄱ~ㅎ)으로만 구성되면 "삼성전자" → "ㅅㅅㅈㅈ" 문자열에서 검색.
+- 코드 접두사: 정렬된 코드 배열 + bisect (접두사 trie와 동일한 범위 조회).
+- 순위: 완전일치 > 접두사 > 중간일치, 각 그룹 내 시가총액 내림차순.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Optional
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 21 * 28
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 치환. 비한글 문자는 그대로 둔다 ("LG화학" → "LGㅎㅎ")."""
+    out = []
+    for ch in text:
+        cp = ord(ch)
+        if _HANGUL_BASE <= cp <= _HANGUL_LAST:
+            out.append(_CHOSEONG[(cp - _HANGUL_BASE) // _SYLLABLES_PER_CHOSEONG])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(query: str) -> bool:
+    """질의가 한글 초성 자음으로만 구성됐는지."""
+    return bool(query) and all(ch in _CHOSEONG_SET for ch in query)
+
+
+def _build_grams(strings: list[str]) -> dict[str, list[int]]:
+    grams: dict[str, list[int]] = {}
+    for idx, s in enumerate(strings):
+        seen = set(s)
+        seen.update(s[i:i + 2] for i in range(len(s) - 1))
+        for g in seen:
+            grams.setdefault(g, []).append(idx)
+    return grams
+
+
+class SymbolIndex:
+    """symbol_map dict({code: {"name", "market", "mktcap"?}}) → 검색 인덱스."""
+
+    __slots__ = (
+        "codes", "names", "markets",
+        "_lower", "_cho", "_name_grams", "_cho_grams", "_code_sorted", "_code_ids",
+    )
+
+    def __init__(self, sym_map: dict[str, dict]):
+        entries = sorted(
+            (
+                (code, info.get("name") or "", info.get("market") or "KRX", info.get("mktcap") or 0)
+                for code, info in sym_map.items()
+            ),
+            key=lambda e: (-e[3], e[0]),
+        )
+        self.codes = [e[0] for e in entries]
+        self.names = [e[1] for e in entries]
+        self.markets = [e[2] for e in entries]
+        self._lower = [n.lower() for n in self.names]
+        self._cho = [to_choseong(n) for n in self._lower]
+        self._name_grams = _build_grams(self._lower)
+        self._cho_grams = _build_grams(self._cho)
+        by_code = sorted(range(len(self.codes)), key=self.codes.__getitem__)
+        self._code_sorted = [self.codes[i] for i in by_code]
+        self._code_ids = by_code
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    # ── 조회 ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _match(q: str, strings: list[str], grams: dict[str, list[int]]) -> list[int]:
+        """부분문자열 매칭 id를 완전일치 > 접두사 > 중간일치(각 시총순)로 반환."""
+        if not q:
+            return []
+        if len(q) == 1:
+            candidates = grams.get(q, [])
+        else:
+            postings = []
+            for i in range(len(q) - 1):
+                p = grams.get(q[i:i + 2])
+                if not p:
+                    return []
+                postings.append(p)
+            candidates = min(postings, key=len)
+        exact, prefix, infix = [], [], []
+        for idx in candidates:
+            s = strings[idx]
+            if s == q:
+                exact.append(idx)
+            elif s.startswith(q):
+                prefix.append(idx)
+            elif q in s:
+                infix.append(idx)
+        return exact + prefix + infix
+
+    def match_names(self, query: str) -> list[int]:
+        return self._match(query.strip().lower(), self._lower, self._name_grams)
+
+    def match_choseong(self, query: str) -> list[int]:
+        return self._match(query.strip(), self._cho, self._cho_grams)
+
+    def match_code_prefix(self, prefix: str) -> list[int]:
+        """코드 접두사 매칭 id (시총순)."""
+        lo = bisect_left(self._code_sorted, prefix)
+        hi = bisect_left(self._code_sorted, prefix + "\uffff")
+        return sorted(self._code_ids[lo:hi])
+
+    def rows(self, ids: list[int], limit: Optional[int] = None) -> list[tuple[str, str, str]]:
+        if limit is not None:
+            ids = ids[:limit]
+        return [(self.codes[i], self.names[i], self.markets[i]) for i in ids]
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[tuple[str, str, str]]:
+        """자동완성 통합 검색 — 숫자면 코드 접두사 우선, 초성 질의면 초성, 그 외 이름."""
+        q = query.strip()
+        if not q:
+            return []
+        if q.isascii() and q.isdigit():
+            ids = self.match_code_prefix(q)
+            seen = set(ids)
+            ids += [i for i in self.match_names(q) if i not in seen]
+        elif is_choseong_query(q):
+            ids = self.match_choseong(q)
+        else:
+            ids = self.match_names(q)
+        return self.rows(ids, limit)
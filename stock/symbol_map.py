@@ -1,16 +1,31 @@
-"""종목코드 ↔ 종목명 매핑 (pykrx 기반, 7일 캐싱)."""
+"""종목코드 ↔ 종목명 매핑 (pykrx 기반, 7일 캐싱).
+
+맵과 검색 인덱스(stock/symbol_index.py)는 프로세스에 상주한다. cache.db는 최대
+_RESIDENT_RECHECK_SEC 간격으로만 재확인하고, 내용이 바뀐 경우에만 인덱스를 재빌드한다
+→ 자동완성 키 입력마다 맵 역직렬화/선형 스캔 0회.
+"""
 
 from __future__ import annotations  # PEP 604 호환 (Python 3.9 테스트 환경 지원)
 
 import re
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
 from .cache import delete_prefix, get_cached, set_cached
+from .symbol_index import SymbolIndex
 
-_CACHE_KEY = "symbol_map:v1"
+_CACHE_KEY = "symbol_map:v2"  # v2: 엔트리에 mktcap 추가 (검색 순위용)
 _TTL_HOURS = 24 * 7  # 7일
 
+# 상주 맵 재확인 주기 — 다른 프로세스/refresh로 cache.db가 갱신된 경우 반영.
+_RESIDENT_RECHECK_SEC = 600
+
+# (sym_map, index, recheck_at). sym_map은 호출자 간 공유되므로 읽기 전용으로 취급.
+_resident: Optional[tuple[dict, SymbolIndex, float]] = None
+_resident_lock = threading.Lock()
+
 
 def _find_latest_trading_day() -> str:
     """오늘 또는 가장 최근 거래일 날짜 문자열(YYYYMMDD) 반환."""
@@ -47,19 +62,26 @@ def _build_map() -> dict[str, dict]:
     trading_date = _find_latest_trading_day()
     result: dict[str, dict] = {}
     for market_name in ("KOSPI", "KOSDAQ"):
+        # 시가총액 (검색 순위용) — 시장당 1회 일괄 조회, 실패 시 0
+        try:
+            caps = krx.get_market_cap(trading_date, market=market_name)["시가총액"].to_dict()
+        except Exception:
+            caps = {}
         try:
             for code in krx.get_market_ticker_list(trading_date, market=market_name):
                 name = krx.get_market_ticker_name(code)
                 if name:
-                    result[code] = {"name": name, "market": market_name}
+                    result[code] = {
+                        "name": name, "market": market_name, "mktcap": int(caps.get(code) or 0),
+                    }
         except Exception:
             pass
 
     # pykrx 결과가 너무 적으면 DART corpCode.xml fallback
     if len(result) < 100:
         try:
-            from .dart_fin import _load_corp_name_map
-            dart_map = _load_corp_name_map()
+            from .dart_corp import name_map
+            dart_map = name_map()
             for code, name in dart_map.items():
                 if code not in result and re.match(r"^\d{6}$", code):
                     result[code] = {"name": name, "market": "KRX"}
@@ -69,21 +91,48 @@ def _build_map() -> dict[str, dict]:
     return result
 
 
+def _install(sym_map: dict[str, dict]) -> dict[str, dict]:
+    """상주 맵 교체. 내용이 같으면 기존 인덱스 재사용 (재빌드는 맵 변경 시에만)."""
+    global _resident
+    with _resident_lock:
+        if _resident is not None and _resident[0] == sym_map:
+            sym_map, index = _resident[0], _resident[1]
+        else:
+            index = SymbolIndex(sym_map)
+        _resident = (sym_map, index, time.monotonic() + _RESIDENT_RECHECK_SEC)
+    return sym_map
+
+
 def get_symbol_map(refresh: bool = False) -> dict[str, dict]:
-    """종목 맵 반환. refresh=True 이면 캐시 무시하고 재수집."""
+    """종목 맵 반환. refresh=True 이면 캐시 무시하고 재수집. 반환 dict는 읽기 전용."""
+    global _resident
     if refresh:
         delete_prefix("symbol_map:")
+        _resident = None
     else:
+        state = _resident
+        if state is not None and time.monotonic() < state[2]:
+            return state[0]
         cached = get_cached(_CACHE_KEY)
         if cached:
-            return cached
+            return _install(cached)
     sym_map = _build_map()
     # 빈 결과는 캐시하지 않음 (다음 호출에서 재시도)
     if sym_map:
         set_cached(_CACHE_KEY, sym_map, ttl_hours=_TTL_HOURS)
+        return _install(sym_map)
     return sym_map
 
 
+def get_index(refresh: bool = False) -> SymbolIndex:
+    """상주 검색 인덱스. 맵이 비어 있으면(빌드 실패) 빈 인덱스."""
+    sym_map = get_symbol_map(refresh)
+    state = _resident
+    if state is not None and state[0] is sym_map:
+        return state[1]
+    return SymbolIndex(sym_map)
+
+
 def code_to_name(code: str, refresh: bool = False) -> Optional[str]:
     entry = get_symbol_map(refresh).get(code)
     if entry:
@@ -98,9 +147,8 @@ def code_to_name(code: str, refresh: bool = False) -> Optional[str]:
         pass
     # pykrx도 실패하면 DART corpCode.xml에서 종목명 조회
     try:
-        from .dart_fin import _load_corp_name_map
-        name_map = _load_corp_name_map()
-        return name_map.get(code)
+        from .dart_corp import corp_name
+        return corp_name(code)
     except Exception:
         return None
 
@@ -113,18 +161,15 @@ def code_to_market(code: str, refresh: bool = False) -> Optional[str]:
 def name_to_results(query: str, refresh: bool = False) -> list[tuple[str, str, str]]:
     """
     이름(부분 일치)으로 검색.
-    반환: [(code, name, market), ...] 정확한 일치 우선.
+    반환: [(code, name, market), ...] 완전일치 > 접두사 > 중간일치, 그룹 내 시가총액순.
     """
-    sym_map = get_symbol_map(refresh)
-    query_lower = query.lower()
-    exact, partial = [], []
-    for code, info in sym_map.items():
-        name, market = info["name"], info["market"]
-        if name == query:
-            exact.append((code, name, market))
-        elif query_lower in name.lower():
-            partial.append((code, name, market))
-    return exact + partial
+    index = get_index(refresh)
+    return index.rows(index.match_names(query))
+
+
+def search(query: str, limit: int = 10) -> list[tuple[str, str, str]]:
+    """자동완성 검색 — 코드 접두사 / 초성(ㅅㅅㅈㅈ) / 이름 부분일치, 시가총액순 상위 limit개."""
+    return get_index().search(query, limit)
 
 
 def resolve(code_or_name: str, refresh: bool = False) -> tuple[str, str] | None:
@@ -26,7 +26,7 @@ from __future__ import annotations
 import math
 from typing import Optional
 
-from stock.cache import get_cached, set_cached
+from stock.cache import get_cached, set_cached, single_flight
 from stock.market import _is_us_trading_hours
 from stock.kis_overseas_client import get_kis_price, get_kis_ohlcv_daily
 from stock.sector_normalize import normalize_sector
@@ -252,7 +252,12 @@ def fetch_detail_yf(code: str) -> Optional[dict]:
     cached = get_cached(key)
     if cached is not None:
         return cached or None
+    # 동시 miss(배치 ThreadPool/상세 번들/파이프라인) → yfinance 1회만 조회, 나머지는 결과 공유
+    return single_flight(key, lambda: _fetch_detail_yf_fresh(code, key))
 
+
+def _fetch_detail_yf_fresh(code: str, key: str) -> Optional[dict]:
+    """fetch_detail_yf 캐시 miss 경로. 실패/미지원 종목은 {}를 1시간 negative 캐시."""
     try:
         t = _ticker(code)
         info = t.info
@@ -12,6 +12,9 @@ def _seed(db, paths_calls: dict[str, int]):
         for _ in range(n):
             repo.record(user_id=1, path=path, method="GET", status_code=200, duration_ms=15.0)
     db.commit()
+    # 관리자 통계는 rollup 테이블만 조회 — 스케줄러 잡 대신 직접 갱신
+    from services.page_view_rollup import rollup
+    rollup(db)
 
 
 def test_page_stats_basic(client, db_session):
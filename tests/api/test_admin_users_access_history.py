@@ -11,6 +11,7 @@ import pytest
 
 from db.models.page_view import PageView
 from db.repositories.user_repo import UserRepository
+from services.page_view_rollup import rollup
 
 KST = timezone(timedelta(hours=9))
 
@@ -67,6 +68,7 @@ def seeded_user(db_session):
     _insert_pv(db_session, user_id=99, path="/api/other", created_at=_ts(today, 14))
 
     db_session.commit()
+    rollup(db_session)  # 접속 이력은 rollup 테이블 조회
     return alice
 
 
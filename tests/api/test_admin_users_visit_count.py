@@ -4,6 +4,7 @@ import pytest
 
 from db.repositories.page_view_repo import PageViewRepository
 from db.repositories.user_repo import UserRepository
+from services.page_view_rollup import rollup
 
 
 @pytest.fixture
@@ -23,6 +24,7 @@ def seeded_users(db_session):
     for _ in range(2):
         pv.record(user_id=user["id"], path="/api/y", method="GET", status_code=200, duration_ms=10)
     db_session.commit()
+    rollup(db_session)  # visit_count는 rollup 누계
     return {"admin": admin, "user": user}
 
 
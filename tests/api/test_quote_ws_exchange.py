@@ -1,6 +1,6 @@
 """R_5 (KRX+NXT 통합시세): /ws/quote/{symbol} exchange 쿼리 WS API 테스트.
 
-KIS WS 실연결은 모킹하지 않고, KISQuoteManager 의 subscribe 만 mock.
+KIS WS 실연결은 모킹하지 않고, KISQuoteManager 의 subscribe_frames 만 mock.
 verify_token 도 mock 으로 통과시켜 인증 분기 검증과 본문 흐름 검증을 분리.
 
 NOTE: /ws/market-status (장운영정보 WS) 관련 테스트는 2026-05-12 엔드포인트 폐지에 따라 제거됨.
@@ -33,16 +33,16 @@ def test_quote_ws_rejects_missing_token(app):
 
 
 def test_quote_ws_subscribe_exchange_nxt(app):
-    """exchange=NXT 쿼리가 manager.subscribe 에 forward 된다."""
+    """exchange=NXT 쿼리가 manager.subscribe_frames 에 forward 된다."""
     captured = {}
 
     class FakeManager:
-        async def subscribe(self, symbol, queue, *, is_fno=False, exchange="auto"):
+        async def subscribe_frames(self, symbol, queue, *, is_fno=False, exchange="auto"):
             captured["symbol"] = symbol
             captured["exchange"] = exchange
             captured["is_fno"] = is_fno
 
-        def unsubscribe(self, *a, **kw):
+        def unsubscribe_frames(self, *a, **kw):
             pass
 
     with patch("routers.quote.get_manager", return_value=FakeManager()), \
@@ -64,10 +64,10 @@ def test_quote_ws_subscribe_default_exchange_is_auto(app):
     captured = {}
 
     class FakeManager:
-        async def subscribe(self, symbol, queue, *, is_fno=False, exchange="auto"):
+        async def subscribe_frames(self, symbol, queue, *, is_fno=False, exchange="auto"):
             captured["exchange"] = exchange
 
-        def unsubscribe(self, *a, **kw):
+        def unsubscribe_frames(self, *a, **kw):
             pass
 
     with patch("routers.quote.get_manager", return_value=FakeManager()), \
@@ -80,3 +80,56 @@ def test_quote_ws_subscribe_default_exchange_is_auto(app):
             pass
 
     assert captured.get("exchange") == "auto"
+
+
+def test_quote_indicators_ws_forwards_snapshots(app):
+    """/ws/quote/{symbol}/indicators — intervals 파싱 후 subscribe_indicators, 지표 메시지 전달."""
+    captured = {}
+
+    class FakeManager:
+        async def subscribe_indicators(self, symbol, queue, intervals, *, exchange="auto"):
+            captured.update(symbol=symbol, intervals=intervals, exchange=exchange)
+            queue.put_nowait({"type": "orderbook", "symbol": symbol})
+            queue.put_nowait({"type": "indicators", "symbol": symbol, "interval": 15, "rsi": 55.0})
+
+        def unsubscribe_indicators(self, symbol, queue):
+            captured["unsubscribed"] = symbol
+
+    with patch("routers.quote.get_manager", return_value=FakeManager()), \
+         patch("services.auth_service.verify_token", return_value={"sub": "1"}):
+        client = TestClient(app)
+        with client.websocket_connect("/ws/quote/005930/indicators?token=abc&intervals=15") as ws:
+            msg = ws.receive_json()
+
+    assert msg["type"] == "indicators" and msg["interval"] == 15
+    assert captured["intervals"] == [15] and captured["exchange"] == "auto"
+    assert captured["unsubscribed"] == "005930"
+
+
+def test_quote_indicators_ws_rejects_unsupported_interval(app):
+    with patch("services.auth_service.verify_token", return_value={"sub": "1"}):
+        client = TestClient(app)
+        with client.websocket_connect("/ws/quote/005930/indicators?token=abc&intervals=5") as ws:
+            msg = ws.receive_json()
+    assert msg["type"] == "error"
+
+
+def test_quote_ws_sends_manager_frames_verbatim(app):
+    """KR 스트림은 매니저가 병합·인코딩한 텍스트 프레임을 그대로 전송."""
+    captured = {}
+
+    class FakeManager:
+        async def subscribe_frames(self, symbol, queue, *, is_fno=False, exchange="auto"):
+            queue.put_nowait('{"type":"price","symbol":"005930","price":71000.0}')
+
+        def unsubscribe_frames(self, symbol, queue):
+            captured["unsubscribed"] = symbol
+
+    with patch("routers.quote.get_manager", return_value=FakeManager()), \
+         patch("services.auth_service.verify_token", return_value={"sub": "1"}):
+        client = TestClient(app)
+        with client.websocket_connect("/ws/quote/005930?token=abc") as ws:
+            msg = ws.receive_json()
+
+    assert msg == {"type": "price", "symbol": "005930", "price": 71000.0}
+    assert captured["unsubscribed"] == "005930"
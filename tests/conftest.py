@@ -29,6 +29,23 @@ TEST_DATABASE_URL = os.environ.get(
 _FAKE_ADMIN = {"id": 1, "username": "admin", "name": "관리자", "role": "admin"}
 
 
+@pytest.fixture(autouse=True)
+def _isolate_dart_sqlite(tmp_path, monkeypatch):
+    """DART corpCode 인덱스·재무 웨어하우스 SQLite를 테스트별 tmp_path로 격리 (실제 HOME 오염 방지)."""
+    from stock import dart_corp, dart_warehouse
+
+    monkeypatch.setattr(dart_corp, "_DB_PATH", tmp_path / "dart_corp.db")
+    monkeypatch.setattr(dart_warehouse, "_DB_PATH", tmp_path / "dart_fin.db")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_screener_cache(tmp_path, monkeypatch):
+    """스크리너 SQLite 캐시(저장소 루트 screener_cache.db)를 테스트별 tmp_path로 격리."""
+    from screener import cache
+
+    monkeypatch.setattr(cache, "_DB_PATH", str(tmp_path / "screener_cache.db"))
+
+
 @pytest.fixture(scope="session")
 def _test_engine():
     """테스트 세션 전체에서 공유하는 PostgreSQL 엔진."""
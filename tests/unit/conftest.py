@@ -0,0 +1,64 @@
+"""tests/unit 공용 fixtures — 로컬 백테스트(스윕/워크포워드/유니버스) 테스트 공유 헬퍼.
+
+- `synthetic_ohlcv(seed, ...)`: 시드 고정 랜덤워크 일봉 OHLCV
+- `fetch_calls`: data_loader.fetch_daily_ohlcv를 테스트 모듈의 `FRAMES`로 대체, 요청 종목 기록
+- `FakeStrategyStore`: backtest_service가 쓰는 strategy_store job API의 메모리 대체
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def synthetic_ohlcv(seed: int, n: int = 320, start: str = "2023-01-02", drift: float = 0.001) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10000.0 * np.cumprod(1 + rng.normal(drift, 0.03, n))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.02, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close,
+         "volume": rng.integers(1_000, 50_000, n).astype(float)},
+        index=pd.bdate_range(start, periods=n),
+    )
+
+
+@pytest.fixture
+def fetch_calls(request, monkeypatch):
+    """테스트 모듈의 `FRAMES`(종목 → DataFrame)로 OHLCV 조회 대체. 없는 종목은 None(적재 실패)."""
+    frames = request.module.FRAMES
+    calls = []
+
+    def fake_fetch(code, start, end, market="KR"):
+        calls.append(code)
+        return frames[code].copy() if code in frames else None
+
+    monkeypatch.setattr("services.local_backtest.data_loader.fetch_daily_ohlcv", fake_fetch)
+    monkeypatch.setattr("services.local_backtest.data_loader._RETRY_SLEEP_SEC", 0)
+    return calls
+
+
+class FakeStrategyStore:
+    def __init__(self):
+        self.jobs = {}
+        self.progress = []
+
+    def save_backtest_job(self, **kw):
+        self.jobs[kw["job_id"]] = {"status": "submitted", **kw}
+
+    def update_job_status(self, job_id, status):
+        self.jobs[job_id]["status"] = status
+
+    def update_job_progress(self, job_id, result_json):
+        self.progress.append(result_json)
+
+    def save_backtest_result(self, job_id, metrics, result_json, completed_at):
+        self.jobs[job_id].update(status="completed", metrics=metrics, result_json=result_json)
+
+    def update_job_failed(self, job_id, msg):
+        self.jobs[job_id].update(status="failed", error=msg)
+
+    def get_job(self, job_id):
+        return self.jobs.get(job_id)
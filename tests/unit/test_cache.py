@@ -1,7 +1,14 @@
-"""stock/cache.py _sanitize 함수 단위 테스트."""
+"""stock/cache.py 단위 테스트 — _sanitize + L1 LRU/L2 SQLite 2계층."""
 
 import math
+import sqlite3
+import threading
+import time
 
+import pytest
+
+from services import _telemetry as tel
+from stock import cache, cache_codec
 from stock.cache import _sanitize
 
 
@@ -47,3 +54,260 @@ class TestSanitize:
 
     def test_empty_list(self):
         assert _sanitize([]) == []
+
+
+# ── L1 LRU + L2 pooled 연결 ──────────────────────────────────────────────────
+
+
+@pytest.fixture
+def tmp_cache(tmp_path, monkeypatch):
+    """cache.db를 임시 경로로 격리 + L1/계측 초기화."""
+    monkeypatch.setattr(cache, "_DB_PATH", tmp_path / "cache.db")
+    monkeypatch.setattr(tel, "_ENABLED", True)
+    cache.clear_l1()
+    tel._reset_for_test()
+    yield cache
+    cache.clear_l1()
+    cache._drop_conn()
+    tel._reset_for_test()
+
+
+class TestTieredCache:
+    def test_roundtrip_and_l1_hit(self, tmp_cache):
+        tmp_cache.set_cached("k1", {"a": 1, "b": float("nan")})
+        assert tmp_cache.get_cached("k1") == {"a": 1, "b": None}
+        counters = tel.snapshot()["counters"]
+        assert counters["cache.l1.hit"] == 1
+        assert "cache.l2.hit" not in counters
+
+    def test_l2_hit_populates_l1(self, tmp_cache):
+        tmp_cache.set_cached("k1", [1, 2, 3])
+        tmp_cache.clear_l1()
+        assert tmp_cache.get_cached("k1") == [1, 2, 3]
+        assert tmp_cache.get_cached("k1") == [1, 2, 3]
+        counters = tel.snapshot()["counters"]
+        assert counters["cache.l2.hit"] == 1
+        assert counters["cache.l1.hit"] == 1
+
+    def test_returned_value_is_isolated_copy(self, tmp_cache):
+        tmp_cache.set_cached("k1", {"items": [1]})
+        got = tmp_cache.get_cached("k1")
+        got["items"].append(2)
+        assert tmp_cache.get_cached("k1") == {"items": [1]}
+
+    def test_expired_entry_returns_none(self, tmp_cache):
+        tmp_cache.set_cached("k1", "v", ttl_hours=-1)
+        assert tmp_cache.get_cached("k1") is None
+        tmp_cache.clear_l1()
+        assert tmp_cache.get_cached("k1") is None
+
+    def test_delete_invalidates_both_tiers(self, tmp_cache):
+        tmp_cache.set_cached("p:1", 1)
+        tmp_cache.set_cached("p:2", 2)
+        tmp_cache.set_cached("q:1", 3)
+        tmp_cache.delete_cached("q:1")
+        tmp_cache.delete_prefix("p:")
+        assert tmp_cache.get_cached("p:1") is None
+        assert tmp_cache.get_cached("p:2") is None
+        assert tmp_cache.get_cached("q:1") is None
+
+    def test_large_value_compressed_in_l2(self, tmp_cache, monkeypatch):
+        orig = cache_codec.compress
+        monkeypatch.setattr(cache_codec, "compress", lambda p, min_bytes=0: orig(p, min_bytes=1))
+        value = {f"{i:06d}": {"name": "종목", "market": "KOSPI"} for i in range(300)}
+        tmp_cache.set_cached("symbol_map:v1", value)
+        stored = tmp_cache._conn().execute(
+            "SELECT value FROM cache WHERE key = 'symbol_map:v1'"
+        ).fetchone()[0]
+        assert stored[:1] == b"z"
+        tmp_cache.clear_l1()
+        assert tmp_cache.get_cached("symbol_map:v1") == value
+
+    def test_connection_reused_per_thread(self, tmp_cache):
+        assert tmp_cache._conn() is tmp_cache._conn()
+        other = []
+        t = threading.Thread(target=lambda: other.append(tmp_cache._conn()))
+        t.start()
+        t.join()
+        assert other[0] is not tmp_cache._conn()
+
+
+class TestLRU:
+    def test_entry_cap_evicts_lru(self, monkeypatch):
+        monkeypatch.setattr(tel, "_ENABLED", True)
+        tel._reset_for_test()
+        lru = cache._LRU(max_entries=2, max_bytes=1_000)
+        far = time.time() + 60
+        lru.put("a", b"1", far)
+        lru.put("b", b"2", far)
+        assert lru.get("a") == b"1"  # a를 최근으로
+        lru.put("c", b"3", far)
+        assert lru.get("b") is None
+        assert lru.get("a") == b"1"
+        assert tel.snapshot()["counters"]["cache.l1.eviction"] == 1
+
+    def test_byte_cap_prefers_expired(self):
+        lru = cache._LRU(max_entries=10, max_bytes=10)
+        lru.put("old", b"xxxx", time.time() - 1)
+        lru.put("live", b"yyyy", time.time() + 60)
+        lru.put("new", b"zzzz", time.time() + 60)
+        assert len(lru) == 2
+        assert lru.get("live") == b"yyyy"
+        assert lru.get("new") == b"zzzz"
+
+    def test_oversized_value_not_stored(self):
+        lru = cache._LRU(max_entries=10, max_bytes=3)
+        lru.put("k", b"toolong", time.time() + 60)
+        assert lru.get("k") is None
+
+
+class TestExpiryAndSweep:
+    def test_legacy_schema_migrated(self, tmp_path, monkeypatch):
+        """expires TEXT만 있던 구 스키마 → expires_at/accessed 컬럼 + 값 backfill."""
+        db = tmp_path / "legacy.db"
+        con = sqlite3.connect(db)
+        con.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires TEXT NOT NULL)")
+        con.execute("INSERT INTO cache VALUES ('live', '1', '2999-01-01T00:00:00+09:00')")
+        con.execute("INSERT INTO cache VALUES ('dead', '2', '2000-01-01T00:00:00.123456+09:00')")
+        con.commit()
+        con.close()
+        monkeypatch.setattr(cache, "_DB_PATH", db)
+        cache.clear_l1()
+        try:
+            assert cache.get_cached("live") == 1
+            assert cache.get_cached("dead") is None
+            assert cache.sweep()["expired"] == 1
+        finally:
+            cache._drop_conn()
+
+    def test_sweep_deletes_expired_in_batches(self, tmp_cache):
+        for i in range(25):
+            tmp_cache.set_cached(f"old:{i}", i, ttl_hours=-1)
+        tmp_cache.set_cached("live", 1)
+        result = tmp_cache.sweep(batch_size=10, max_rows=0, max_bytes=0, grace_hours=0)
+        assert result["expired"] == 25
+        assert result["evicted"] == 0
+        count = tmp_cache._conn().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        assert count == 1
+        assert tel.snapshot()["counters"]["cache.l2.expired"] == 25
+
+    def test_sweep_row_cap_evicts_lru(self, tmp_cache):
+        con = tmp_cache._conn()
+        for i in range(5):
+            tmp_cache.set_cached(f"k{i}", "x" * 10)
+            with con:
+                con.execute("UPDATE cache SET accessed = ? WHERE key = ?", (i, f"k{i}"))
+        result = tmp_cache.sweep(batch_size=2, max_rows=3, max_bytes=0)
+        assert result["evicted"] == 2
+        keys = {r[0] for r in con.execute("SELECT key FROM cache")}
+        assert keys == {"k2", "k3", "k4"}
+        assert tmp_cache.get_cached("k0") is None  # L1도 함께 무효화
+
+    def test_sweep_byte_cap(self, tmp_cache):
+        con = tmp_cache._conn()
+        for i in range(4):
+            tmp_cache.set_cached(f"k{i}", "x" * 98)  # json 직렬화 100자
+            with con:
+                con.execute("UPDATE cache SET accessed = ? WHERE key = ?", (i, f"k{i}"))
+        result = tmp_cache.sweep(max_rows=0, max_bytes=250)
+        assert result["evicted"] == 2
+        keys = {r[0] for r in con.execute("SELECT key FROM cache")}
+        assert keys == {"k2", "k3"}
+
+    def test_sweep_keeps_rows_within_stale_grace(self, tmp_cache):
+        tmp_cache.set_cached("recent", 1, ttl_hours=-1)
+        tmp_cache.set_cached("ancient", 2, ttl_hours=-48)
+        assert tmp_cache.sweep(max_rows=0, max_bytes=0, grace_hours=24)["expired"] == 1
+        keys = {r[0] for r in tmp_cache._conn().execute("SELECT key FROM cache")}
+        assert keys == {"recent"}
+
+    def test_delete_prefix_is_range_not_like(self, tmp_cache):
+        """LIKE 와일드카드(_ %)·대소문자 무시 부작용 없이 정확히 접두사만 삭제."""
+        for k in ("a_b:1", "axb:1", "A_B:1", "a_b;", "a_c:1"):
+            tmp_cache.set_cached(k, 1)
+        tmp_cache.delete_prefix("a_b:")
+        tmp_cache.clear_l1()
+        remaining = {k for k in ("a_b:1", "axb:1", "A_B:1", "a_b;", "a_c:1") if tmp_cache.get_cached(k)}
+        assert remaining == {"axb:1", "A_B:1", "a_b;", "a_c:1"}
+
+    def test_prefix_upper(self):
+        assert cache._prefix_upper("abc") == "abd"
+        assert cache._prefix_upper("") is None
+        assert cache._prefix_upper("a\U0010FFFF") == "b"
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_compute_once(self, tmp_cache):
+        calls = []
+        gate = threading.Event()
+
+        def compute():
+            calls.append(1)
+            gate.wait(2)
+            return {"v": [1, 2]}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(tmp_cache.get_or_compute("sf:k", compute)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        gate.set()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert results == [{"v": [1, 2]}] * 8
+        assert len({id(r) for r in results}) == 8  # 호출자별 독립 객체
+        assert tmp_cache.get_cached("sf:k") == {"v": [1, 2]}
+        assert tel.snapshot()["counters"]["cache.singleflight.shared"] == 7
+
+    def test_error_propagates_to_waiters(self, tmp_cache):
+        gate = threading.Event()
+
+        def boom():
+            gate.wait(2)
+            raise RuntimeError("upstream down")
+
+        errors = []
+
+        def _call():
+            try:
+                tmp_cache.single_flight("sf:err", boom)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=_call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        gate.set()
+        for t in threads:
+            t.join()
+        assert errors == ["upstream down"] * 3
+
+    def test_ttl_for_none_skips_store(self, tmp_cache):
+        assert tmp_cache.get_or_compute("sf:empty", lambda: [], ttl_for=lambda v: 24 if v else None) == []
+        assert tmp_cache.get_cached("sf:empty") is None
+
+    def test_stale_while_revalidate(self, tmp_cache):
+        tmp_cache.set_cached("sf:stale", "old", ttl_hours=-0.5)
+        refreshed = threading.Event()
+
+        def compute():
+            refreshed.set()
+            return "new"
+
+        assert tmp_cache.get_or_compute("sf:stale", compute, stale_hours=1) == "old"
+        assert refreshed.wait(2)
+        for _ in range(50):
+            if tmp_cache.get_cached("sf:stale") == "new":
+                break
+            time.sleep(0.02)
+        assert tmp_cache.get_cached("sf:stale") == "new"
+        assert tel.snapshot()["counters"]["cache.singleflight.stale_served"] == 1
+
+    def test_expired_beyond_stale_window_recomputes(self, tmp_cache):
+        tmp_cache.set_cached("sf:old", "old", ttl_hours=-2)
+        assert tmp_cache.get_or_compute("sf:old", lambda: "new", stale_hours=1) == "new"
@@ -0,0 +1,71 @@
+"""stock/cache_codec.py 단위 테스트 — 정규화/코덱 왕복/압축/안전 unpickle."""
+
+import json
+import pickle
+from enum import IntEnum
+
+import pytest
+
+from stock import cache_codec as cc
+
+
+class _Level(IntEnum):
+    HIGH = 3
+
+
+class TestNormalize:
+    def test_matches_json_roundtrip(self):
+        value = {
+            1: (1.5, float("nan")),
+            None: [True, {"x": float("inf")}],
+            2.5: "s",
+            False: _Level.HIGH,
+        }
+        expected = json.loads(json.dumps(cc.normalize(value)))
+        assert cc.normalize(value) == expected
+        assert cc.normalize(value) == {
+            "1": [1.5, None], "null": [True, {"x": None}], "2.5": "s", "false": 3,
+        }
+
+    def test_subclasses_become_builtin(self):
+        out = cc.normalize([_Level.HIGH])
+        assert type(out[0]) is int
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(TypeError):
+            cc.normalize({"d": object()})
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec", list(cc.CODECS))
+    def test_roundtrip(self, codec):
+        value = cc.normalize({"a": [1, 2.0, "한글", None, True], "b": {"c": []}})
+        payload = cc.encode(value, codec)
+        assert cc.decode(payload) == value
+
+    @pytest.mark.parametrize("codec", list(cc.CODECS))
+    def test_compressed_roundtrip(self, codec):
+        value = cc.normalize([{"code": f"{i:06d}", "name": "종목"} for i in range(500)])
+        payload = cc.encode(value, codec)
+        stored = cc.compress(payload, min_bytes=1)
+        assert stored[:1] == b"z"
+        assert len(stored) < len(payload)
+        assert cc.decompress(stored) == payload
+        assert cc.decode(stored) == value
+
+    def test_below_threshold_not_compressed(self):
+        payload = cc.encode([1, 2, 3], "pickle")
+        assert cc.compress(payload, min_bytes=1024) is payload
+
+    def test_legacy_text_row(self):
+        assert cc.decode('{"a": [1, null]}') == {"a": [1, None]}
+        assert cc.decompress("[1]") == "[1]"
+
+    def test_unknown_tag_raises(self):
+        with pytest.raises(ValueError):
+            cc.decode(b"?abc")
+
+    def test_safe_unpickler_rejects_globals(self):
+        evil = b"p" + pickle.dumps(_Level.HIGH, protocol=5)
+        with pytest.raises(pickle.UnpicklingError):
+            cc.decode(evil)
@@ -0,0 +1,85 @@
+"""stock/dart_corp.py — corpCode.xml 스트리밍 파싱, 단일 다운로드 공유, 만료 갱신/실패 시 기존 인덱스 유지."""
+
+from __future__ import annotations
+
+import io
+import time
+import zipfile
+
+import pytest
+
+from stock import dart_corp, dart_fin
+
+
+def _zip(entries) -> bytes:
+    body = "".join(
+        f"<list><corp_code>{cc}</corp_code><corp_name>{name}</corp_name>"
+        f"<stock_code>{sc}</stock_code><modify_date>{md}</modify_date></list>"
+        for cc, name, sc, md in entries
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("CORPCODE.xml", f'<?xml version="1.0" encoding="UTF-8"?><result>{body}</result>')
+    return buf.getvalue()
+
+
+ENTRIES = [
+    ("00126380", "삼성전자", "005930", "20260901"),
+    ("00164779", "SK하이닉스", "000660", "20260815"),
+    ("00999999", "비상장법인", " ", "20260101"),
+]
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_download():
+        calls.append(1)
+        return _zip(ENTRIES)
+
+    monkeypatch.setattr(dart_corp, "_DB_PATH", tmp_path / "dart_corp.db")
+    monkeypatch.setattr(dart_corp, "_state", {})
+    monkeypatch.setattr(dart_corp, "_download", fake_download)
+    return calls
+
+
+def test_single_download_shared_by_code_and_name_lookups(index):
+    assert dart_fin._fetch_corp_code("005930") == "00126380"
+    assert dart_fin._fetch_corp_code("999999") is None
+    assert dart_corp.corp_name("000660") == "SK하이닉스"
+    assert dart_corp.lookup("005930") == ("00126380", "삼성전자", "20260901")
+    assert dart_fin._load_corp_name_map() == {"005930": "삼성전자", "000660": "SK하이닉스"}
+    assert dart_fin._load_corp_map() == {"005930": "00126380", "000660": "00164779"}  # 비상장 제외
+    assert len(index) == 1
+
+
+def test_stale_index_refreshes_once_and_survives_failed_download(index, monkeypatch):
+    dart_corp.rebuild(_zip(ENTRIES[:1]))
+    assert dart_corp.corp_name("000660") is None and not index
+
+    built_at, _ = dart_corp._state[str(dart_corp._DB_PATH)]
+    dart_corp._state[str(dart_corp._DB_PATH)] = (built_at - 31 * 86400, 0.0)
+    assert dart_corp.corp_code("000660") == "00164779"  # 만료 → 재구축
+    assert len(index) == 1
+
+    def broken():
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(dart_corp, "_download", broken)
+    dart_corp._state[str(dart_corp._DB_PATH)] = (time.time() - 31 * 86400, 0.0)
+    assert dart_corp.corp_code("005930") == "00126380"  # 갱신 실패 → 기존 인덱스
+    assert dart_corp._state[str(dart_corp._DB_PATH)][1] > time.time()  # 재시도 보류
+
+
+def test_missing_index_and_failed_download(tmp_path, monkeypatch):
+    def broken():
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(dart_corp, "_DB_PATH", tmp_path / "dart_corp.db")
+    monkeypatch.setattr(dart_corp, "_state", {})
+    monkeypatch.setattr(dart_corp, "_download", broken)
+    with pytest.raises(RuntimeError):
+        dart_fin._fetch_corp_code("005930")
+    assert dart_fin._load_corp_name_map() == {}
+    assert dart_corp.corp_name("005930") is None
@@ -0,0 +1,136 @@
+"""stock/dart_fin.py 동시 조회 + stock/dart_warehouse.py 보관 — 순차 결과 동일, CFS/OFS 1회 결정,
+보관분 재사용(재호출 0), 다종목 선적재(fnlttMultiAcnt)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from stock import dart_fin, dart_warehouse
+
+LATEST = date.today().year - 1
+
+
+def _items(year: int, fs_div: str) -> list[dict]:
+    def amounts(scale):
+        return {
+            f"{period}_amount": str(((year - back - 2000) * 1000 + (1 if fs_div == "CFS" else 2)) * scale)
+            for back, period in enumerate(("thstrm", "frmtrm", "bfefrmtrm"))
+        }
+
+    return [
+        {"sj_div": "IS", "account_nm": nm, "rcept_no": f"{year}0331{fs_div}", **amounts(scale)}
+        for nm, scale in (("매출액", 10), ("영업이익", 2), ("당기순이익", 1))
+    ]
+
+
+@pytest.fixture
+def dart(tmp_path, monkeypatch):
+    """가짜 fnlttSinglAcntAll — filed[(corp, year)] = {"CFS", "OFS"} 중 공시된 fs_div."""
+    filed: dict[tuple[str, int], set[str]] = {}
+    calls: list[tuple] = []
+    active = [0, 0]  # 현재 동시 호출 수, 최대값
+    lock = threading.Lock()
+
+    def fake_call(corp_code, bsns_year, fs_div, reprt_code=dart_fin._REPRT_CODE):
+        with lock:
+            calls.append((corp_code, bsns_year, fs_div, reprt_code))
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return _items(bsns_year, fs_div) if fs_div in filed.get((corp_code, bsns_year), ()) else []
+
+    monkeypatch.setattr(dart_warehouse, "_DB_PATH", tmp_path / "dart_fin.db")
+    monkeypatch.setattr(dart_fin, "_call_fin_api", fake_call)
+    monkeypatch.setattr(dart_fin, "_fetch_corp_code", lambda code: f"C{code}")
+    monkeypatch.setattr(dart_fin, "get_cached", lambda key: None)
+    monkeypatch.setattr(dart_fin, "set_cached", lambda *a, **k: None)
+    return filed, calls, active
+
+
+def test_multi_year_parallel_cfs_company_then_served_from_store(dart):
+    filed, calls, active = dart
+    for y in range(LATEST - 11, LATEST):  # 최신 연도 미공시, 이전 11년 연결 공시
+        filed[("C005930", y)] = {"CFS", "OFS"}
+
+    rows = dart_fin.fetch_financials_multi_year("005930", years=10)
+    assert [r["year"] for r in rows] == list(range(LATEST - 10, LATEST))
+    assert all(r["rcept_no"].endswith("CFS") for r in rows)
+    assert rows[-1]["revenue"] == ((LATEST - 1 - 2000) * 1000 + 1) * 10
+    assert active[1] > 1  # 연도 병렬
+    # 최신 2개 연도만 CFS+OFS로 fs_div 결정, 나머지는 CFS 1회씩 (+ 부족분 1개 연도 순차 보충)
+    assert sorted((y, fs) for _, y, fs, _ in calls) == sorted(
+        [(y, "CFS") for y in range(LATEST - 10, LATEST + 1)] + [(LATEST, "OFS"), (LATEST - 1, "OFS")]
+    )
+
+    calls.clear()
+    assert dart_fin.fetch_financials_multi_year("005930", years=10) == rows
+    assert calls == []  # 미공시 최신 연도도 pending 재확인 주기 전까지 DART 호출 없음
+
+
+def test_ofs_only_company_decides_once_and_records_cfs_absence(dart):
+    filed, calls, _ = dart
+    for y in range(LATEST - 6, LATEST + 1):
+        filed[("C123456", y)] = {"OFS"}
+
+    rows = dart_fin.fetch_financials_multi_year("123456", years=5)
+    assert [r["year"] for r in rows] == list(range(LATEST - 4, LATEST + 1))
+    assert all(r["rcept_no"].endswith("OFS") for r in rows)
+    # 최신 2개 연도 CFS+OFS → OFS 결정 → 나머지 3개 연도는 OFS만
+    assert sorted((y, fs) for _, y, fs, _ in calls) == sorted(
+        [(LATEST, "CFS"), (LATEST - 1, "CFS")] + [(y, "OFS") for y in range(LATEST - 4, LATEST + 1)]
+    )
+    assert dart_warehouse.lookup("C123456", LATEST, dart_fin._REPRT_CODE, "CFS") == []  # 없음 확정
+
+    calls.clear()
+    assert dart_fin.fetch_financials_multi_year("123456", years=5) == rows
+    assert calls == []
+    detail = dart_fin.fetch_income_detail_annual("123456", years=5)  # 같은 원시 응답 공유
+    assert [r["year"] for r in detail] == list(range(LATEST - 4, LATEST + 1))
+    assert [(y, fs) for _, y, fs, _ in calls] == [(LATEST - 3, "CFS")]  # 미확인 CFS 1건만
+
+
+def test_prefetch_many_companies_uses_multi_company_endpoint(dart, monkeypatch):
+    filed, calls, _ = dart
+    codes = [f"{i:06d}" for i in range(150)]
+    for i, code in enumerate(codes):
+        for y in range(LATEST - 2, LATEST + 1):
+            filed[(f"C{code}", y)] = {"CFS", "OFS"} if i % 3 else {"OFS"}
+    multi_params = []
+
+    def fake_get(url, params, timeout=20):
+        assert url.endswith("fnlttMultiAcnt.json")
+        multi_params.append(params)
+        year = int(params["bsns_year"])
+        rows = [
+            {"stock_code": cc[1:], "fs_div": fs}
+            for cc in params["corp_code"].split(",")
+            for fs in sorted(filed.get((cc, year), ()))
+        ]
+
+        class Resp:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"status": "000", "list": rows}
+
+        return Resp()
+
+    monkeypatch.setattr(dart_fin, "_dart_get", fake_get)
+    monkeypatch.setattr(dart_fin, "_api_key", lambda: "dummy")
+
+    stats = dart_fin.prefetch_annual_statements(codes, years=3)
+    assert stats == {"companies": 150, "multi_calls": 6, "fetched": 450, "failed": 0}
+    assert max(len(p["corp_code"].split(",")) for p in multi_params) == 100
+    assert len(calls) == 450  # (기업, 연도)당 단건 1회
+
+    calls.clear()
+    rows = dart_fin.fetch_financials_multi_year("000000", years=3)  # OFS 전용 — 저장분만으로 응답
+    assert [r["year"] for r in rows] == list(range(LATEST - 2, LATEST + 1)) and calls == []
+    assert dart_fin.prefetch_annual_statements(codes, years=3)["multi_calls"] == 0  # 저장분 건너뜀
@@ -0,0 +1,154 @@
+"""stock/dart_warehouse.py — 계정 행 정규화 왕복, 마감 기간 무만료 / 진행 중 기간만 재확인, 미공시 pending,
+dart_fin 네 함수가 결과 캐시 없이 웨어하우스로 응답, DART 오류 backoff."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from stock import dart_fin, dart_warehouse
+
+YEAR = date.today().year
+CLOSED, OPEN = YEAR - 3, YEAR - 1  # 사업보고서 기준
+
+ITEMS = [
+    {
+        "rcept_no": "20250317000123", "sj_div": "IS", "sj_nm": "손익계산서", "account_id": "ifrs-full_Revenue",
+        "account_nm": "매출액", "thstrm_nm": "제 56 기", "thstrm_amount": "1000", "frmtrm_amount": "900",
+        "bfefrmtrm_amount": "800", "ord": "1", "currency": "KRW",
+    },
+    {
+        "rcept_no": "20250317000123", "sj_div": "IS", "account_id": "-표준계정코드 미사용-",
+        "account_nm": "기타영업수익", "thstrm_amount": "", "ord": "2", "currency": "KRW",
+    },
+    {
+        "rcept_no": "20250317000123", "sj_div": "IS", "account_id": "-표준계정코드 미사용-",
+        "account_nm": "기타영업비용", "thstrm_amount": "-5", "ord": "3", "currency": "KRW",
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def warehouse(tmp_path, monkeypatch):
+    monkeypatch.setattr(dart_warehouse, "_DB_PATH", tmp_path / "dart_fin.db")
+
+
+def _age(corp_code: str, hours: float) -> None:
+    con = dart_warehouse._conn()
+    with con:
+        con.execute("UPDATE report SET checked_at = checked_at - ? WHERE corp_code = ?", (int(hours * 3600), corp_code))
+
+
+def test_lines_round_trip_in_order_with_duplicate_account_ids():
+    dart_warehouse.store("C1", CLOSED, "11011", "CFS", ITEMS)
+    assert dart_warehouse.lookup("C1", CLOSED, "11011", "CFS") == ITEMS
+    assert dart_warehouse.lookup("C1", CLOSED, "11011", "OFS") is None  # 미저장
+    ids = dart_warehouse._conn().execute(
+        "SELECT bsns_year FROM line WHERE corp_code = 'C1' AND account_id = 'ifrs-full_Revenue'"
+    ).fetchall()
+    assert ids == [(CLOSED,)]
+    assert dart_warehouse.delete("C1") == 1 and dart_warehouse.lookup("C1", CLOSED, "11011", "CFS") is None
+
+
+def test_closed_periods_never_expire_open_periods_revalidate():
+    dart_warehouse.store("C1", CLOSED, "11011", "CFS", ITEMS)
+    dart_warehouse.store("C1", OPEN, "11011", "CFS", ITEMS)
+    dart_warehouse.store("C1", YEAR - 1, "11014", "CFS", ITEMS)  # 작년 3분기 — 마감
+    dart_warehouse.mark_absent("C1", CLOSED, "11011", "OFS")
+    _age("C1", 24 * 365)
+    assert dart_warehouse.lookup("C1", CLOSED, "11011", "CFS") == ITEMS
+    assert dart_warehouse.lookup("C1", YEAR - 1, "11014", "CFS") == ITEMS
+    assert dart_warehouse.lookup("C1", CLOSED, "11011", "OFS") == []
+    assert dart_warehouse.lookup("C1", OPEN, "11011", "CFS") is None  # 진행 중 회계연도 → 재조회
+    assert dart_warehouse.known(["C1", "C2"], CLOSED, "11011") == {"C1"}
+
+
+def test_unfiled_report_is_pending_then_rechecked_closed_is_absent():
+    dart_warehouse.store("C1", OPEN, "11011", "CFS", [])
+    dart_warehouse.store("C1", CLOSED, "11011", "CFS", [])
+    assert dart_warehouse.lookup("C1", OPEN, "11011", "CFS") == []
+    _age("C1", dart_warehouse.DART_PENDING_RECHECK_HOURS + 1)
+    assert dart_warehouse.lookup("C1", OPEN, "11011", "CFS") is None
+    assert dart_warehouse.lookup("C1", CLOSED, "11011", "CFS") == []  # 마감 기간 미공시는 확정
+
+
+def test_fetchers_answer_from_warehouse_without_result_cache(monkeypatch):
+    calls = []
+
+    def fake_call(corp_code, bsns_year, fs_div, reprt_code=dart_fin._REPRT_CODE):
+        calls.append((bsns_year, reprt_code, fs_div))
+        if fs_div != "CFS" or bsns_year == YEAR and reprt_code != "11013":
+            return []
+        amount = str(bsns_year * 10 + int(reprt_code[-1]))
+        return [
+            {"rcept_no": f"{bsns_year}{reprt_code}", "sj_div": "IS", "account_nm": nm,
+             "thstrm_amount": amount, "frmtrm_amount": amount, "bfefrmtrm_amount": amount}
+            for nm in ("매출액", "영업이익", "당기순이익")
+        ] + [
+            {"rcept_no": f"{bsns_year}{reprt_code}", "sj_div": "BS", "account_nm": nm,
+             "thstrm_amount": amount, "frmtrm_amount": amount, "bfefrmtrm_amount": amount}
+            for nm in ("자산총계", "부채총계", "자본총계")
+        ]
+
+    monkeypatch.setattr(dart_fin, "_call_fin_api", fake_call)
+    monkeypatch.setattr(dart_fin, "_fetch_corp_code", lambda code: "C9")
+    monkeypatch.setattr(dart_fin, "get_cached", lambda key: pytest.fail(f"result cache read: {key}"))
+    monkeypatch.setattr(dart_fin, "set_cached", lambda key, *a, **k: pytest.fail(f"result cache write: {key}"))
+
+    first = (
+        dart_fin.fetch_financials_multi_year("000001", years=5),
+        dart_fin.fetch_income_detail_annual("000001", years=5),
+        dart_fin.fetch_bs_cf_annual("000001", years=5),
+        dart_fin.fetch_quarterly_financials("000001", quarters=4),
+    )
+    assert [r["year"] for r in first[0]] == list(range(YEAR - 5, YEAR))
+    assert first[2]["balance_sheet"] and first[3][-1] == {**first[3][-1], "year": YEAR, "quarter": 1}
+    assert calls
+
+    calls.clear()
+    again = (
+        dart_fin.fetch_financials_multi_year("000001", years=5),
+        dart_fin.fetch_income_detail_annual("000001", years=5),
+        dart_fin.fetch_bs_cf_annual("000001", years=5),
+        dart_fin.fetch_quarterly_financials("000001", quarters=4),
+    )
+    assert again == first and calls == []
+
+
+def test_dart_errors_back_off_and_serve_stale(monkeypatch):
+    calls = []
+    status = {"code": "020"}
+
+    def fake_call(corp_code, bsns_year, fs_div, reprt_code=dart_fin._REPRT_CODE):
+        calls.append((corp_code, bsns_year))
+        if status["code"] != "000":
+            raise dart_fin._DartStatusError(status["code"], "요청 제한 초과")
+        return ITEMS
+
+    monkeypatch.setattr(dart_fin, "_call_fin_api", fake_call)
+
+    # 한도 초과(020) → 계정 단위 보류: 다른 기업·보고서도 호출 없이 실패
+    for corp in ("C1", "C1", "C2"):
+        with pytest.raises(RuntimeError, match="보류"):
+            dart_fin._fin_items(corp, OPEN, "CFS")
+    assert calls == [("C1", OPEN)]
+
+    # 보고서 단위 오류 → 그 보고서만 보류, 재확인 시점이 지난 기록은 계속 제공
+    con = dart_warehouse._conn()
+    with con:
+        con.execute("DELETE FROM backoff")
+    status["code"] = "000"
+    assert dart_fin._fin_items("C1", OPEN, "CFS") == ITEMS
+    _age("C1", dart_warehouse.DART_OPEN_PERIOD_REVALIDATE_HOURS + 1)
+    status["code"] = "100"
+    calls.clear()
+    assert dart_fin._fin_items("C1", OPEN, "CFS") == ITEMS
+    assert dart_fin._fin_items("C1", OPEN, "CFS") == ITEMS
+    assert calls == [("C1", OPEN)]
+    assert dart_warehouse.backoff_reason("C2", OPEN, "11011", "CFS") is None
+
+    dart_warehouse.record_error("C1", OPEN, "11011", "CFS", "x", -1)  # 보류 만료 → 재호출 후 해제
+    status["code"] = "000"
+    assert dart_fin._fin_items("C1", OPEN, "CFS") == ITEMS
+    assert dart_warehouse.backoff_reason("C1", OPEN, "11011", "CFS") is None
@@ -380,3 +380,64 @@ class TestCalcTechnicalIndicators:
             })
         result = calc_technical_indicators(bars)
         assert result["current_signals"]["macd_cross"] in ("golden", "dead", "none")
+
+
+# ── NumPy 백엔드 parity (stock/indicators_np.py) ───────────────
+
+def _random_ohlcv(seed, n, kind="float"):
+    """랜덤 워크 OHLCV. kind: float(US 2자리) / int(KR 원 단위) / flat(고가=저가) / up(연속 상승)."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    c = 10000 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    if kind == "up":
+        c = np.arange(1, n + 1) * 10.0
+    o = c * (1 + rng.normal(0, 0.003, n))
+    h = np.maximum(o, c) * (1 + np.abs(rng.normal(0, 0.01, n)))
+    lo = np.minimum(o, c) * (1 - np.abs(rng.normal(0, 0.01, n)))
+    if kind == "flat":
+        o = h = lo = c = np.full(n, 500.0)
+    conv = (lambda a: [int(round(x)) for x in a]) if kind == "int" else (lambda a: [round(float(x), 2) for x in a])
+    vol = rng.integers(0, 1_000_000, n).tolist()
+    return [
+        {"time": i, "open": a, "high": b, "low": d, "close": e, "volume": v}
+        for i, (a, b, d, e, v) in enumerate(zip(conv(o), conv(h), conv(lo), conv(c), vol))
+    ]
+
+
+class TestNumpyBackendParity:
+    @pytest.mark.parametrize("kind", ["float", "int", "flat", "up"])
+    @pytest.mark.parametrize("n", [2, 3, 14, 15, 16, 26, 27, 34, 35, 60, 61, 250])
+    def test_identical_to_python(self, kind, n):
+        for seed in range(3):
+            bars = _random_ohlcv(seed, n, kind)
+            assert calc_technical_indicators(bars) == calc_technical_indicators(bars, backend="python")
+
+    def test_identical_on_3000_bars(self):
+        bars = _random_ohlcv(7, 3000)
+        assert calc_technical_indicators(bars) == calc_technical_indicators(bars, backend="python")
+
+    def test_integer_inputs_from_fixtures(self):
+        bars = _make_ohlcv(80)
+        assert calc_technical_indicators(bars) == calc_technical_indicators(bars, backend="python")
+
+    def test_half_ties_round_like_python(self):
+        # 0.10005: np.round → 0.1, Python round → 0.1001
+        bars = [{"time": i, "open": 0.10005, "high": 0.10005, "low": 0.10005, "close": 0.10005, "volume": 1}
+                for i in range(30)]
+        result = calc_technical_indicators(bars)
+        assert result == calc_technical_indicators(bars, backend="python")
+        assert result["ma"]["ma5"][-1] == 0.1001
+
+    def test_round4_matches_python_round(self):
+        import numpy as np
+
+        from stock.indicators_np import _round4
+
+        rng = np.random.default_rng(0)
+        ties = np.round(rng.uniform(-1e4, 1e4, 50_000), 4) + 5e-5  # .5 경계 근처
+        vals = np.concatenate([rng.uniform(-1e5, 1e5, 50_000), ties, [np.nan, np.inf, 0.0]])
+        got = _round4(vals).tolist()
+        want = [round(v, 4) for v in vals.tolist()]
+        assert got[:-3] == want[:-3]
+        assert np.isnan(got[-3]) and got[-2] == np.inf and got[-1] == 0.0
@@ -0,0 +1,128 @@
+"""local_backtest/montecarlo.py — 부트스트랩 경로 메트릭이 compute_metrics와 일치하는지 + 분포/파산/서비스 포함."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.local_backtest import montecarlo
+from services.local_backtest.metrics import compute_metrics
+
+
+def _curve(returns, start="2023-01-02", capital=10_000_000.0):
+    eq = capital * np.cumprod(1 + np.asarray(returns))
+    days = pd.bdate_range(start, periods=len(eq))
+    return [{"date": d.date().isoformat(), "equity": float(e)} for d, e in zip(days, eq)]
+
+
+def _point(curve, capital=10_000_000.0):
+    """compute_metrics는 date 객체를 받는다 (서비스 응답 곡선은 ISO 문자열)."""
+    rows = [{"date": date.fromisoformat(p["date"]), "equity": p["equity"]} for p in curve]
+    return compute_metrics(rows, [], capital)
+
+
+def test_paths_match_compute_metrics_per_path():
+    """경로 재구성 → compute_metrics 결과와 total_return/MDD/Sharpe 동일."""
+    rng = np.random.default_rng(1)
+    r = rng.normal(0.001, 0.02, 120)
+    idx = np.random.default_rng(5).integers(0, len(r), size=(4, len(r)), dtype=np.int32)
+    paths = montecarlo._simulate_paths(r, 1.0, 1.0, 4, np.random.default_rng(5), -np.inf, True)
+    for k in range(4):
+        eq = 100.0 * np.concatenate([[1.0], np.cumprod(1 + r[idx[k]])])
+        ref = compute_metrics([{"date": None, "equity": v} for v in eq], [], 100.0)
+        assert paths["total_return_pct"][k] == pytest.approx(ref["total_return_pct"], rel=1e-9)
+        assert paths["max_drawdown"][k] == pytest.approx(ref["max_drawdown"], rel=1e-9, abs=1e-12)
+        assert paths["sharpe_ratio"][k] == pytest.approx(ref["sharpe_ratio"], rel=1e-8)
+
+
+def test_daily_bootstrap_distribution_and_seed():
+    rng = np.random.default_rng(2)
+    curve = _curve(rng.normal(0.0008, 0.015, 500))
+    a = montecarlo.bootstrap_daily(curve, 10_000_000.0, n_paths=2000, seed=7)
+    b = montecarlo.bootstrap_daily(curve, 10_000_000.0, n_paths=2000, seed=7)
+    assert a == b and a["days"] == 499
+    point = _point(curve)
+    for key in ("cagr", "max_drawdown", "sharpe_ratio"):
+        d = a[key]
+        assert d["ci_low"] <= d["p5"] <= d["p50"] <= d["p95"] <= d["ci_high"]
+        # 실현 경로 점추정은 95% 구간 안
+        assert d["ci_low"] <= point[key] <= d["ci_high"]
+    assert all(v <= 0 for v in (a["max_drawdown"]["p5"], a["max_drawdown"]["p95"]))
+
+
+def test_constant_returns_are_degenerate():
+    curve = _curve([0.001] * 300)
+    out = montecarlo.bootstrap_daily(curve, 10_000_000.0, n_paths=500, seed=0)
+    point = _point(curve)
+    assert out["cagr"]["std"] == pytest.approx(0.0, abs=1e-9)
+    assert out["cagr"]["p50"] == pytest.approx(point["cagr"], rel=1e-9)
+    assert out["max_drawdown"]["p5"] == 0.0
+    assert out["sharpe_ratio"] is None  # 분산 0 → Sharpe 정의 불가
+    assert out["risk_of_ruin"] == 0.0
+
+
+def test_risk_of_ruin():
+    rng = np.random.default_rng(3)
+    curve = _curve(rng.normal(-0.002, 0.04, 400))
+    high = montecarlo.bootstrap_daily(curve, 10_000_000.0, n_paths=3000, seed=1, ruin_level=0.5)
+    none = montecarlo.bootstrap_daily(curve, 10_000_000.0, n_paths=3000, seed=1, ruin_level=0.0)
+    assert high["risk_of_ruin"] > 0.3 and none["risk_of_ruin"] == 0.0
+
+
+def test_trade_bootstrap_uses_entry_equity():
+    curve = _curve([0.0] * 10)
+    trades = [
+        {"entry_date": curve[1]["date"], "exit_date": curve[2]["date"], "pnl": 1_000_000.0},
+        {"entry_date": curve[3]["date"], "exit_date": curve[4]["date"], "pnl": -500_000.0},
+        {"entry_date": curve[5]["date"], "exit_date": None, "pnl": None},
+    ]
+    np.testing.assert_allclose(montecarlo.trade_returns(trades, curve, 10_000_000.0), [0.1, -0.05])
+    out = montecarlo.bootstrap_trades(trades, curve, 10_000_000.0, n_paths=4000, seed=2)
+    assert out["trades"] == 2
+    # 2거래 복원 추출 → 최종 수익 {+21%, +4.5%, -9.75%}
+    assert out["total_return_pct"]["p5"] == pytest.approx(-9.75)
+    assert out["total_return_pct"]["p95"] == pytest.approx(21.0)
+    assert montecarlo.bootstrap_trades(trades[:1], curve, 10_000_000.0, n_paths=10) is None
+
+
+def test_monte_carlo_disabled_and_short_inputs():
+    assert montecarlo.monte_carlo(_curve([0.01] * 5), [], 1e7, n_paths=0) is None
+    out = montecarlo.monte_carlo(_curve([0.01]), [], 1e7, n_paths=100, seed=0)
+    assert out["daily"] is None and out["trades"] is None and out["n_paths"] == 100
+
+
+def test_local_backtest_response_includes_monte_carlo(monkeypatch):
+    from services import backtest_service
+
+    rng = np.random.default_rng(4)
+    n = 300
+    close = 10000.0 * np.cumprod(1 + rng.normal(0.001, 0.03, n))
+    frame = pd.DataFrame(
+        {"open": close * (1 + rng.normal(0, 0.01, n)), "high": close * 1.03, "low": close * 0.97,
+         "close": close, "volume": rng.integers(1_000, 50_000, n).astype(float)},
+        index=pd.bdate_range("2023-01-02", periods=n),
+    )
+    monkeypatch.setattr("services.local_backtest.data_loader.fetch_daily_ohlcv",
+                        lambda code, start, end, market="KR": frame.copy())
+
+    saved = {}
+
+    class _Store:
+        def save_backtest_job(self, **kw):
+            pass
+
+        def save_backtest_result(self, job_id, metrics, result_json, completed_at):
+            saved["result_json"] = result_json
+
+    monkeypatch.setattr(backtest_service, "strategy_store", _Store())
+    out = backtest_service.run_local_backtest(
+        preset="volatility_breakout", symbols=["005930"],
+        start_date="2023-04-03", end_date=date(2024, 2, 28).isoformat(),
+    )
+    mc = out["result"]["monte_carlo"]
+    assert mc["n_paths"] == montecarlo.LOCAL_BACKTEST_MC_PATHS
+    assert set(mc["daily"]) >= {"cagr", "max_drawdown", "sharpe_ratio", "risk_of_ruin"}
+    assert saved["result_json"]["monte_carlo"] == mc
@@ -0,0 +1,85 @@
+"""local_backtest/panel.py — 공통 거래일 축 정렬이 기존 날짜별 get_loc 매핑과 동일한지 검증."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from services.local_backtest.engine import simulate
+from services.local_backtest.panel import align_panel
+
+
+def _ohlcv(idx: pd.DatetimeIndex, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1 + rng.normal(0, 0.02, len(idx)))
+    return pd.DataFrame(
+        {"open": close, "high": close * 1.01, "low": close * 0.99,
+         "close": close, "volume": rng.integers(1, 100, len(idx)).astype(float)},
+        index=idx,
+    )
+
+
+def _staggered():
+    full = pd.bdate_range("2024-01-01", periods=120)
+    a = _ohlcv(full, 1)
+    b = _ohlcv(full[::2], 2)            # 격일 봉
+    c = _ohlcv(full[30:90], 3)           # 중간 상장/거래정지
+    return {"A": a, "B": b, "C": c}
+
+
+def test_rows_match_get_loc_reference():
+    data = _staggered()
+    start, end = date(2024, 1, 15), date(2024, 5, 31)
+    panel = align_panel(data, start, end)
+
+    ref_days = sorted({ts.date() for df in data.values() for ts in df.index
+                       if start <= ts.date() <= end})
+    assert panel.days == ref_days
+    for k, (sym, df) in enumerate(data.items()):
+        for t, d in enumerate(panel.days):
+            ts = pd.Timestamp(d)
+            expected = df.index.get_loc(ts) if ts in df.index else -1
+            assert panel.rows[k, t] == expected
+            if expected >= 0:
+                assert panel.close[k, t] == df["close"].iloc[expected]
+            else:
+                assert not panel.valid[k, t] and np.isnan(panel.close[k, t])
+
+
+def test_gather_fills_missing_bars():
+    data = _staggered()
+    panel = align_panel(data, date(2024, 1, 1), date(2024, 12, 31))
+    flags = [np.arange(len(df)) % 3 == 0 for df in data.values()]
+    grid = panel.gather(flags, False)
+    assert grid.dtype == bool and grid.shape == panel.rows.shape
+    assert not grid[~panel.valid].any()
+    k = 2
+    m = panel.valid[k]
+    assert (grid[k, m] == flags[k][panel.rows[k, m]]).all()
+
+
+def test_empty_range():
+    panel = align_panel(_staggered(), date(2030, 1, 1), date(2030, 12, 31))
+    assert panel.days == [] and panel.rows.shape == (3, 0)
+
+
+def test_simulate_tolerates_unsorted_duplicate_index(monkeypatch):
+    idx = pd.bdate_range("2024-01-01", periods=200)
+    df = _ohlcv(idx, 4)
+    df.iloc[120, df.columns.get_loc("close")] = df["close"].iloc[119] * 1.295
+    messy = pd.concat([df.iloc[100:], df.iloc[:100], df.iloc[[50]]])
+
+    frames = {"ORD": df, "MESSY": messy}
+    monkeypatch.setattr(
+        "services.local_backtest.data_loader.fetch_daily_ohlcv",
+        lambda code, start, end, market="KR": frames[code].copy(),
+    )
+    kw = dict(strategy_id="momentum", market="KR", start=date(2024, 2, 1),
+              end=date(2024, 9, 30), initial_capital=10_000_000.0)
+    clean = simulate(symbols=["ORD"], **kw)
+    dirty = simulate(symbols=["MESSY"], **kw)
+    assert clean.equity_curve == dirty.equity_curve
+    assert [t["entry_date"] for t in clean.trades] == [t["entry_date"] for t in dirty.trades]
+    assert len(clean.trades) > 0
@@ -0,0 +1,171 @@
+"""local_backtest 전략 precompute/exit_at(벡터화) ↔ check_entry/check_exit(행 기준) 동등성.
+
+- 4개 전략 × 랜덤 OHLCV (급등/도지/갭 포함) 모든 행에서 매수 신호·체결가 완전 일치
+- 청산: 다양한 포지션(진입가/진입일/spike 마킹)에서 가격·사유·extra 부수효과 일치
+- 엔진: precompute 경로와 행 API 경로의 simulate 결과(trades/equity) 일치
+"""
+
+from __future__ import annotations
+
+import copy
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.local_backtest.strategies import STRATEGY_REGISTRY, get_strategy
+from services.local_backtest.strategies._base import Position, Strategy
+
+
+def _random_ohlcv(n: int = 400, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = [10000.0]
+    for _ in range(n - 1):
+        r = rng.normal(0.002, 0.03)
+        if rng.random() < 0.03:
+            r = rng.uniform(0.25, 0.31)  # 상한가 근처 급등
+        close.append(max(100.0, round(close[-1] * (1 + r))))
+    close = np.array(close)
+    prev = np.concatenate([[close[0]], close[:-1]])
+    open_ = np.round(prev * (1 + rng.normal(0, 0.015, n)))
+    gap_days = rng.random(n) < 0.05
+    open_[gap_days] = np.round(prev[gap_days] * 1.05)
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.02, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.02, n)))
+    doji = rng.random(n) < 0.03
+    high[doji] = low[doji] = open_[doji] = close[doji]
+    volume = rng.integers(1_000, 200_000, n).astype(float)
+    volume[rng.random(n) < 0.1] *= 5
+    idx = pd.bdate_range("2022-01-03", periods=n)
+    return pd.DataFrame(
+        {"open": open_, "high": np.round(high), "low": np.round(low),
+         "close": close, "volume": volume},
+        index=idx,
+    )
+
+
+_PARAM_VARIANTS = {
+    "momentum": [{}, {"rise_threshold": 0.05}],
+    "volatility_breakout": [{}, {"k_window": 5}],
+    "donchian_swing": [{}, {"channel_period": 10, "ema_period": 20, "volume_factor": 1.0}],
+    "long_tail_volatility": [{}, {"k_window": 10, "rise_filter": 0.0}],
+}
+
+
+def _params(strategy: Strategy, override: dict) -> dict:
+    p = dict(strategy.default_params)
+    p.update(override)
+    return p
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("strategy_id", sorted(STRATEGY_REGISTRY))
+def test_precompute_entry_matches_check_entry(strategy_id, seed):
+    df = _random_ohlcv(seed=seed)
+    strat = get_strategy(strategy_id)
+    for override in _PARAM_VARIANTS[strategy_id]:
+        params = _params(strat, override)
+        pre = strat.precompute(df, params)
+        hits = 0
+        for i in range(len(df)):
+            ref = strat.check_entry(df, i, params)
+            got = pre.entry_at(i)
+            if ref is None:
+                assert got is None, (strategy_id, override, i)
+            else:
+                hits += 1
+                assert got is not None, (strategy_id, override, i)
+                assert got.price == ref.price and got.reason == ref.reason
+        assert pre.entry_at(-1) is None and pre.entry_at(len(df)) is None
+        if not override:
+            assert hits > 0, f"{strategy_id}: 테스트 데이터에 신호 없음"
+
+
+def _positions(df: pd.DataFrame, i: int) -> list[Position]:
+    close = float(df["close"].iloc[i])
+    d_today = df.index[i].date()
+    d_prev = df.index[max(i - 1, 0)].date()
+    out = []
+    for mult in (0.9, 1.0, 1.06):
+        for d in (d_today, d_prev):
+            for spike in (False, True):
+                out.append(Position("X", d, close * mult, 10, {"spike_today": True} if spike else {}))
+    return out
+
+
+@pytest.mark.parametrize("strategy_id", sorted(STRATEGY_REGISTRY))
+def test_exit_at_matches_check_exit(strategy_id):
+    df = _random_ohlcv(n=250, seed=5)
+    strat = get_strategy(strategy_id)
+    params = dict(strat.default_params)
+    pre = strat.precompute(df, params)
+    for i in list(range(len(df))) + [-1, len(df)]:
+        j = min(max(i, 0), len(df) - 1)
+        for pos in _positions(df, j):
+            pos_ref, pos_got = copy.deepcopy(pos), copy.deepcopy(pos)
+            ref = strat.check_exit(df, i, pos_ref, params)
+            got = strat.exit_at(pre, i, pos_got, params)
+            if ref is None:
+                assert got is None, (strategy_id, i)
+            else:
+                assert got is not None, (strategy_id, i)
+                assert (got.price, got.reason) == (ref.price, ref.reason), (strategy_id, i)
+            assert pos_got.extra == pos_ref.extra
+
+
+def test_base_precompute_falls_back_to_row_api():
+    """행 API만 구현한 전략도 엔진 경로에서 동작 (기본 precompute/exit_at)."""
+    from services.local_backtest.strategies._base import EntrySignal, ExitSignal
+
+    class EveryTenth(Strategy):
+        id = "every_tenth"
+
+        def check_entry(self, df, idx, params):
+            return EntrySignal(price=float(df["close"].iloc[idx]), reason="t") if idx % 10 == 0 else None
+
+        def check_exit(self, df, idx, position, params):
+            return ExitSignal(price=1.0, reason="x")
+
+    df = _random_ohlcv(n=30)
+    s = EveryTenth()
+    pre = s.precompute(df, {})
+    assert [i for i in range(30) if pre.entry_at(i)] == [0, 10, 20]
+    assert pre.entry_at(10).reason == "t"
+    assert s.exit_at(pre, 3, Position("X", date(2022, 1, 3), 1.0, 1), {}).reason == "x"
+
+
+# ── 엔진 동등성 ──────────────────────────────────────────────────────────
+
+def _run(monkeypatch, strategy_id, frames, *, row_api: bool):
+    from services.local_backtest import engine
+
+    def fake_fetch(code, start, end, market="KR"):
+        return frames[code].copy()
+
+    monkeypatch.setattr("services.local_backtest.data_loader.fetch_daily_ohlcv", fake_fetch)
+    cls = STRATEGY_REGISTRY[strategy_id]
+    if row_api:
+        monkeypatch.setattr(cls, "precompute", Strategy.precompute)
+        monkeypatch.setattr(cls, "exit_at", Strategy.exit_at)
+    try:
+        return engine.simulate(
+            symbols=list(frames),
+            strategy_id=strategy_id,
+            market="KR",
+            start=date(2022, 6, 1),
+            end=date(2023, 6, 30),
+            initial_capital=50_000_000.0,
+        )
+    finally:
+        monkeypatch.undo()
+
+
+@pytest.mark.parametrize("strategy_id", sorted(STRATEGY_REGISTRY))
+def test_simulate_vectorized_matches_row_api(monkeypatch, strategy_id):
+    frames = {f"00{k}000": _random_ohlcv(seed=10 + k) for k in range(4)}
+    fast = _run(monkeypatch, strategy_id, frames, row_api=False)
+    slow = _run(monkeypatch, strategy_id, frames, row_api=True)
+    assert fast.trades == slow.trades
+    assert fast.equity_curve == slow.equity_curve
+    assert fast.metrics == slow.metrics
@@ -0,0 +1,187 @@
+"""local_backtest/sweep.py — 파라미터 스윕 조합 생성·순위·병렬 실행 + 서비스 job 스트리밍 검증."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from services.exceptions import ServiceError
+from services.local_backtest import sweep
+from services.local_backtest.engine import simulate
+from tests.unit.conftest import FakeStrategyStore, synthetic_ohlcv
+
+
+FRAMES = {"005930": synthetic_ohlcv(1), "000660": synthetic_ohlcv(2), "035420": synthetic_ohlcv(3)}
+KW = dict(symbols=list(FRAMES), strategy_id="volatility_breakout", market="KR",
+          start=date(2023, 6, 1), end=date(2024, 3, 29), initial_capital=10_000_000.0)
+
+
+# ── 조합 생성 ─────────────────────────────────────────────────────────────
+
+def test_expand_grid_product_in_key_order():
+    combos = sweep.expand_grid({"k_window": [10, 20], "stop_loss_pct": [0.95, 0.97]})
+    assert combos == [
+        {"k_window": 10, "stop_loss_pct": 0.95}, {"k_window": 10, "stop_loss_pct": 0.97},
+        {"k_window": 20, "stop_loss_pct": 0.95}, {"k_window": 20, "stop_loss_pct": 0.97},
+    ]
+
+
+def test_build_param_sets_validates_schema():
+    with pytest.raises(ValueError, match="없는 파라미터"):
+        sweep.build_param_sets("volatility_breakout", {"channel_period": [10]})
+    with pytest.raises(ValueError, match="비어"):
+        sweep.build_param_sets("volatility_breakout", {"k_window": []})
+    with pytest.raises(ValueError, match="최대"):
+        sweep.build_param_sets("volatility_breakout", {"k_window": list(range(5, 61))}, max_runs=10)
+    with pytest.raises(ValueError, match="samples"):  # 샘플링 전에 거부
+        sweep.build_param_sets("donchian_swing", samples=200_000, max_runs=10)
+    with pytest.raises(ValueError):
+        sweep.build_param_sets("volatility_breakout")
+
+
+def test_random_samples_within_schema_and_seeded():
+    from services.local_backtest.presets import get_preset
+
+    schema = get_preset("donchian_swing")["param_schema"]
+    a = sweep.build_param_sets("donchian_swing", samples=25, seed=7)
+    b = sweep.build_param_sets("donchian_swing", samples=25, seed=7)
+    assert a == b and len(a) == 25
+    assert len({tuple(sorted(p.items())) for p in a}) == 25
+    for p in a:
+        for k, v in p.items():
+            assert schema[k]["min"] <= v <= schema[k]["max"]
+            if schema[k]["type"] == "integer":
+                assert isinstance(v, int)
+
+
+def test_grid_with_samples_picks_subset():
+    grid = {"k_window": [5, 10, 20, 40], "stop_loss_pct": [0.95, 0.97]}
+    picked = sweep.build_param_sets("volatility_breakout", grid, samples=3, seed=1)
+    assert len(picked) == 3 and all(p in sweep.expand_grid(grid) for p in picked)
+
+
+def test_rank_results_none_last_and_stable():
+    rows = [
+        {"index": 0, "metrics": {"sharpe_ratio": None, "max_drawdown": -20.0}},
+        {"index": 1, "metrics": {"sharpe_ratio": 0.5, "max_drawdown": -5.0}},
+        {"index": 2, "metrics": {"sharpe_ratio": 1.5, "max_drawdown": -12.0}},
+        {"index": 3, "metrics": {"sharpe_ratio": 0.5, "max_drawdown": -3.0}},
+    ]
+    assert [r["index"] for r in sweep.rank_results(rows)] == [2, 1, 3, 0]
+    by_mdd = sweep.rank_results(rows, "max_drawdown")
+    assert [r["index"] for r in by_mdd] == [3, 1, 2, 0]
+    assert [r["rank"] for r in by_mdd] == [1, 2, 3, 4]
+
+
+# ── 실행 ──────────────────────────────────────────────────────────────────
+
+GRID = {"k_window": [5, 10, 20], "stop_loss_pct": [0.95, 0.97]}
+
+
+def test_serial_sweep_matches_individual_simulations(fetch_calls):
+    params = sweep.expand_grid(GRID)
+    progress = []
+    res = sweep.run_sweep(param_sets=params, max_workers=1,
+                          on_progress=lambda r, d, t: progress.append((d, t, len(r))), **KW)
+    # OHLCV는 종목당 1회만 적재
+    assert sorted(fetch_calls) == sorted(FRAMES)
+    assert progress == [(i, 6, i) for i in range(1, 7)]
+    assert res.total_runs == 6 and not res.errors
+
+    for row in res.ranking:
+        ref = simulate(params=params[row["index"]], **KW)
+        assert row["metrics"] == ref.metrics
+    sharpe = [r["metrics"]["sharpe_ratio"] for r in res.ranking if r["metrics"]["sharpe_ratio"] is not None]
+    assert sharpe == sorted(sharpe, reverse=True)
+
+
+def test_process_pool_matches_serial(fetch_calls):
+    params = sweep.expand_grid(GRID)
+    serial = sweep.run_sweep(param_sets=params, max_workers=1, **KW)
+    pooled = sweep.run_sweep(param_sets=params, max_workers=2, **KW)
+    assert [(r["index"], r["metrics"]) for r in pooled.ranking] == \
+        [(r["index"], r["metrics"]) for r in serial.ranking]
+
+
+def test_pool_workers_not_forked():
+    # job 스레드에서 멀티스레드 웹 프로세스를 fork하지 않는다
+    assert sweep._mp_context().get_start_method() in ("forkserver", "spawn")
+
+
+def test_failed_run_is_reported_not_fatal(fetch_calls, monkeypatch):
+    real = sweep.simulate
+
+    def flaky(params=None, **kw):
+        if params and params.get("k_window") == 10:
+            raise RuntimeError("boom")
+        return real(params=params, **kw)
+
+    monkeypatch.setattr(sweep, "simulate", flaky)
+    res = sweep.run_sweep(param_sets=sweep.expand_grid(GRID), max_workers=1, **KW)
+    assert len(res.ranking) == 4
+    assert [e["index"] for e in res.errors] == [2, 3]
+    assert "boom" in res.errors[0]["error"]
+
+
+def test_rank_by_validated(fetch_calls):
+    with pytest.raises(ValueError, match="rank_by"):
+        sweep.run_sweep(param_sets=[{}], rank_by="alpha", **KW)
+
+
+# ── 서비스 (job 스트리밍) ─────────────────────────────────────────────────
+
+def test_service_streams_ranking_and_completes(fetch_calls, monkeypatch):
+    from services import backtest_service
+
+    store = FakeStrategyStore()
+    monkeypatch.setattr(backtest_service, "strategy_store", store)
+    monkeypatch.setattr(backtest_service, "_SWEEP_PROGRESS_INTERVAL_SEC", 0.0)
+    monkeypatch.setattr("services.local_backtest.sweep.LOCAL_BACKTEST_SWEEP_WORKERS", 1)
+
+    out = backtest_service.run_local_sweep(
+        preset="volatility_breakout", symbols=["005930", "000660", "005930"],
+        start_date="2023-06-01", end_date="2024-03-29",
+        param_grid=GRID, top_n=3, background=False,
+    )
+    assert out["status"] == "completed" and out["total_runs"] == 6
+    assert [p["completed_runs"] for p in store.progress] == [1, 2, 3, 4, 5, 6]
+    assert all(len(p["ranking"]) <= 3 for p in store.progress)
+    job = store.jobs[out["job_id"]]
+    assert job["strategy_type"] == "local_sweep"
+    assert job["symbols"] == ["005930", "000660"]
+    final = job["result_json"]
+    assert len(final["ranking"]) == 3 and final["ranking"][0]["rank"] == 1
+    assert job["metrics"] == final["ranking"][0]["metrics"]
+
+
+def test_service_rejects_unknown_param(monkeypatch):
+    from services import backtest_service
+
+    monkeypatch.setattr(backtest_service, "strategy_store", FakeStrategyStore())
+    with pytest.raises(ServiceError, match="없는 파라미터"):
+        backtest_service.run_local_sweep(
+            preset="momentum", symbols=["005930"], param_grid={"k_window": [5]},
+            background=False,
+        )
+
+
+def test_repo_update_job_progress_keeps_running():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from db.base import Base
+    from db.repositories.backtest_repo import BacktestRepository
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    repo = BacktestRepository(db)
+    repo.create_job(1, "sw-1", "momentum", "005930", "KR", "local_sweep", "2026-10-18T10:00:00+09:00")
+    assert repo.update_job_progress("sw-1", {"completed_runs": 2, "ranking": []})
+    db.commit()
+    job = repo.get_job("sw-1")
+    assert job["status"] == "running" and job["result_json"]["completed_runs"] == 2
+    assert repo.update_job_progress("nope", {}) is False
+    db.close()
+    engine.dispose()
@@ -0,0 +1,132 @@
+"""local_backtest/universe.py — 유니버스 엔진이 10종목 엔진과 동일 규칙인지 + 순위/슬롯/적재 검증."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.local_backtest import universe
+from services.local_backtest.engine import simulate
+from services.local_backtest.strategies import STRATEGY_REGISTRY
+from services.local_backtest.universe import simulate_universe
+from tests.unit.conftest import FakeStrategyStore
+
+
+def _ohlcv(seed: int, n: int = 300, start: str = "2023-01-02") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    r = rng.normal(0.001, 0.03, n)
+    r[rng.random(n) < 0.03] = 0.295
+    close = np.round(10000.0 * np.cumprod(1 + r))
+    open_ = np.round(close * (1 + rng.normal(0, 0.01, n)))
+    high = np.round(np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.02, n))))
+    low = np.round(np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.02, n))))
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close,
+         "volume": rng.integers(1_000, 100_000, n).astype(float)},
+        index=pd.bdate_range(start, periods=n),
+    )
+
+
+FRAMES = {f"{k:06d}": _ohlcv(k) for k in range(6)}
+KW = dict(market="KR", start=date(2023, 5, 1), end=date(2024, 2, 28), initial_capital=50_000_000.0)
+
+
+@pytest.mark.parametrize("strategy_id", sorted(STRATEGY_REGISTRY))
+def test_matches_engine_with_legacy_rules(fetch_calls, strategy_id):
+    """input 순서 + candidates 배분 + 슬롯=종목 수 → engine.simulate와 동일 거래/자본곡선."""
+    syms = list(FRAMES)
+    ref = simulate(symbols=syms, strategy_id=strategy_id, **KW)
+    got = simulate_universe(syms, strategy_id, max_slots=len(syms), rank_by="input",
+                            allocation="candidates", **KW)
+    assert got.trades == ref.trades
+    assert [p["date"] for p in got.equity_curve] == [p["date"] for p in ref.equity_curve]
+    np.testing.assert_allclose(
+        [p["equity"] for p in got.equity_curve], [p["equity"] for p in ref.equity_curve], rtol=1e-12,
+    )
+    assert got.per_symbol_contribution == {
+        s: v for s, v in ref.per_symbol_contribution.items() if v["trades"]
+    }
+
+
+def test_slot_cap_and_turnover_ranking():
+    data = {f"{k:06d}": _ohlcv(100 + k) for k in range(40)}
+    res = simulate_universe(list(data), "volatility_breakout", max_slots=3,
+                            rank_by="turnover", data=data, **KW)
+    open_count = 0
+    by_day: dict[str, list[dict]] = {}
+    for t in res.trades:
+        if t.get("side") == "buy":
+            by_day.setdefault(t["entry_date"], []).append(t)
+    # 동일 일자 매수는 거래대금 내림차순
+    for d, buys in by_day.items():
+        ts = pd.Timestamp(d)
+        turnover = [data[b["symbol"]].loc[ts, "close"] * data[b["symbol"]].loc[ts, "volume"] for b in buys]
+        assert turnover == sorted(turnover, reverse=True)
+    # 동시 보유 ≤ max_slots
+    events = sorted(
+        [(t["entry_date"], 1) for t in res.trades if t.get("side") == "buy"]
+        + [(t["exit_date"], -1) for t in res.trades if t.get("exit_date")],
+        key=lambda e: (e[0], e[1]),
+    )
+    for _, delta in events:
+        open_count += delta
+        assert open_count <= 3
+
+
+def test_slots_allocation_splits_cash_by_free_slots():
+    data = {"A": _ohlcv(7)}
+    res = simulate_universe(["A"], "momentum", max_slots=4, rank_by="input", data=data, **KW)
+    first = next(t for t in res.trades if t.get("side") == "buy")
+    cost = first["entry_price"] * first["qty"] * (1 + 0.0015)
+    assert cost <= KW["initial_capital"] / 4 + 1e-6
+    assert cost > KW["initial_capital"] / 4 * 0.98
+
+
+def test_loader_streams_chunks_without_caching(fetch_calls, monkeypatch):
+    seen_cache = []
+    real_load = universe.DataLoader.load
+
+    def spy(self, *a, **kw):
+        out = real_load(self, *a, **kw)
+        seen_cache.append(len(self._cache))
+        return out
+
+    monkeypatch.setattr(universe.DataLoader, "load", spy)
+    syms = list(FRAMES) + ["999999"]
+    loaded, pres, indexes, failures = universe.load_universe(
+        syms, STRATEGY_REGISTRY["donchian_swing"](), {}, "KR", KW["start"], KW["end"],
+        chunk_size=2, workers=2,
+    )
+    assert loaded == list(FRAMES) and failures == ["999999"]
+    assert set(seen_cache) == {0}
+    # 벡터 exit_at 전략은 DataFrame 참조를 남기지 않는다
+    assert all(p.df is None for p in pres)
+    assert [len(ix) for ix in indexes] == [len(df) for df in FRAMES.values()]
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="rank_by"):
+        simulate_universe(["A"], "momentum", rank_by="alpha", data={}, **KW)
+    with pytest.raises(ValueError, match="max_slots"):
+        simulate_universe(["A"], "momentum", max_slots=0, data={}, **KW)
+    empty = simulate_universe(["A"], "momentum", data={}, **KW)
+    assert empty.failures == ["A"] and empty.equity_curve == []
+
+
+def test_service_accepts_beyond_ten_symbols(fetch_calls, monkeypatch):
+    from services import backtest_service
+
+    store = FakeStrategyStore()
+    monkeypatch.setattr(backtest_service, "strategy_store", store)
+    syms = list(FRAMES) + [f"9{k:05d}" for k in range(10)]
+    out = backtest_service.run_local_universe_backtest(
+        preset="momentum", symbols=syms, start_date="2023-05-01", end_date="2024-02-28",
+        max_slots=5, background=False,
+    )
+    assert out["status"] == "completed" and out["symbols_count"] == 16
+    result = out["result"]
+    assert len(result["failures"]) == 10 and result["max_slots"] == 5
+    assert store.jobs[out["job_id"]]["strategy_type"] == "local_universe"
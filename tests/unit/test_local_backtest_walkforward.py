@@ -0,0 +1,171 @@
+"""local_backtest/walkforward.py — 창 분할·학습 최적화·검증 연결·병렬 실행 + 서비스 job 저장 검증."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from services.exceptions import ServiceError
+from services.local_backtest import sweep, walkforward
+from services.local_backtest.engine import simulate
+from services.local_backtest.walkforward import Window, split_windows, stitch_equity
+from tests.unit.conftest import FakeStrategyStore, synthetic_ohlcv
+
+
+FRAMES = {
+    "005930": synthetic_ohlcv(11, n=700, start="2022-01-03", drift=0.0008),
+    "000660": synthetic_ohlcv(12, n=700, start="2022-01-03", drift=0.0008),
+}
+GRID = {"k_window": [5, 20], "stop_loss_pct": [0.95, 0.97]}
+KW = dict(symbols=list(FRAMES), strategy_id="volatility_breakout", market="KR",
+          start=date(2022, 6, 1), end=date(2024, 6, 28), initial_capital=10_000_000.0,
+          train_days=240, test_days=120)
+
+
+# ── 창 분할 / 연결 ────────────────────────────────────────────────────────
+
+def test_split_rolling_and_anchored():
+    rolling = split_windows(date(2024, 1, 1), date(2024, 12, 31), 180, 90)
+    assert [(w.train_start, w.test_start, w.test_end) for w in rolling] == [
+        (date(2024, 1, 1), date(2024, 6, 29), date(2024, 9, 26)),
+        (date(2024, 3, 31), date(2024, 9, 27), date(2024, 12, 25)),
+        (date(2024, 6, 29), date(2024, 12, 26), date(2024, 12, 31)),
+    ]
+    # 검증 구간은 연속·비중첩, 학습은 검증 직전까지
+    for a, b in zip(rolling, rolling[1:]):
+        assert (b.test_start - a.test_end).days == 1
+    assert all((w.test_start - w.train_end).days == 1 for w in rolling)
+
+    anchored = split_windows(date(2024, 1, 1), date(2024, 12, 31), 180, 90, anchored=True)
+    assert {w.train_start for w in anchored} == {date(2024, 1, 1)}
+
+
+def test_split_validation():
+    with pytest.raises(ValueError, match="짧습니다"):
+        split_windows(date(2024, 1, 1), date(2024, 3, 1), 180, 30)
+    with pytest.raises(ValueError, match="최대"):
+        split_windows(date(2020, 1, 1), date(2024, 12, 31), 30, 10, max_windows=5)
+
+
+def test_stitch_compounds_window_returns():
+    windows = [
+        {"index": 1, "equity_curve": [{"date": "d3", "equity": 90.0}, {"date": "d4", "equity": 99.0}]},
+        {"index": 0, "equity_curve": [{"date": "d1", "equity": 100.0}, {"date": "d2", "equity": 110.0}]},
+        {"index": 2, "error": "boom"},
+    ]
+    curve = stitch_equity(windows, 100.0)
+    assert [p["date"] for p in curve] == ["d1", "d2", "d3", "d4"]
+    np.testing.assert_allclose([p["equity"] for p in curve], [100.0, 110.0, 99.0, 108.9])
+
+
+# ── 실행 ──────────────────────────────────────────────────────────────────
+
+def test_serial_walkforward_picks_train_best_and_runs_test(fetch_calls):
+    params = sweep.expand_grid(GRID)
+    progress = []
+    res = walkforward.run_walkforward(param_sets=params, max_workers=1,
+                                      on_progress=lambda w, d, t: progress.append((d, t)), **KW)
+    assert sorted(fetch_calls) == sorted(FRAMES)  # 종목당 1회 적재
+    windows = split_windows(KW["start"], KW["end"], KW["train_days"], KW["test_days"])
+    assert progress == [(i, len(windows)) for i in range(1, len(windows) + 1)]
+    assert not res.errors and len(res.windows) == len(windows)
+
+    base = dict(symbols=KW["symbols"], strategy_id=KW["strategy_id"], market="KR",
+                initial_capital=KW["initial_capital"])
+    for w, row in zip(windows, res.windows):
+        train = [simulate(params=p, start=w.train_start, end=w.train_end, **base) for p in params]
+        ranked = sweep.rank_results(
+            [{"index": i, "metrics": s.metrics} for i, s in enumerate(train)], "sharpe_ratio")
+        assert row["best_index"] == ranked[0]["index"]
+        assert row["train_metrics"] == train[row["best_index"]].metrics
+        test = simulate(params=row["best_params"], start=w.test_start, end=w.test_end, **base)
+        assert row["test_metrics"] == test.metrics
+        assert row["test_start"] == w.test_start.isoformat()
+
+    dates = [p["date"] for p in res.equity_curve]
+    assert dates == sorted(dates) and len(set(dates)) == len(dates)
+    assert dates[0] >= windows[0].test_start.isoformat()
+    assert all(t["window"] in range(len(windows)) for t in res.trades)
+    assert res.summary["rank_by"] == "sharpe_ratio"
+
+
+def test_process_pool_matches_serial(fetch_calls):
+    params = sweep.expand_grid(GRID)
+    serial = walkforward.run_walkforward(param_sets=params, max_workers=1, **KW)
+    pooled = walkforward.run_walkforward(param_sets=params, max_workers=2, **KW)
+    assert pooled.windows == serial.windows
+    assert pooled.equity_curve == serial.equity_curve
+    assert pooled.metrics == serial.metrics
+
+
+def test_failed_window_reported(fetch_calls, monkeypatch):
+    real = walkforward.simulate
+
+    def flaky(start=None, **kw):
+        if start >= date(2023, 9, 1):
+            raise RuntimeError("boom")
+        return real(start=start, **kw)
+
+    monkeypatch.setattr(walkforward, "simulate", flaky)
+    res = walkforward.run_walkforward(param_sets=sweep.expand_grid(GRID), max_workers=1, **KW)
+    assert res.errors and all("error" in w for w in res.windows if w["index"] in
+                              {e["index"] for e in res.errors})
+    assert res.equity_curve  # 성공한 창만 연결
+
+
+# ── 서비스 / 저장 ─────────────────────────────────────────────────────────
+
+def test_service_persists_per_window_metrics(fetch_calls, monkeypatch):
+    from services import backtest_service
+
+    store = FakeStrategyStore()
+    monkeypatch.setattr(backtest_service, "strategy_store", store)
+    monkeypatch.setattr("services.local_backtest.sweep.LOCAL_BACKTEST_SWEEP_WORKERS", 1)
+
+    out = backtest_service.run_local_walkforward(
+        preset="volatility_breakout", symbols=["005930", "000660"],
+        start_date="2022-06-01", end_date="2024-06-28", train_days=240, test_days=120,
+        param_grid=GRID, background=False,
+    )
+    assert out["status"] == "completed"
+    n = out["total_windows"]
+    assert [p["completed_windows"] for p in store.progress] == list(range(1, n + 1))
+    job = store.jobs[out["job_id"]]
+    assert job["strategy_type"] == "local_walkforward"
+    assert job["params"]["train_days"] == 240
+    final = job["result_json"]
+    assert len(final["windows"]) == n
+    assert all("test_metrics" in w and "equity_curve" not in w for w in final["windows"])
+    assert job["metrics"] == final["metrics"] and final["equity_curve"]
+
+
+def test_service_rejects_short_range(monkeypatch):
+    from services import backtest_service
+
+    monkeypatch.setattr(backtest_service, "strategy_store", FakeStrategyStore())
+    with pytest.raises(ServiceError, match="짧습니다"):
+        backtest_service.run_local_walkforward(
+            preset="momentum", symbols=["005930"], start_date="2024-01-01",
+            end_date="2024-03-01", train_days=180, test_days=30,
+            param_grid={"stop_loss_pct": [0.95]}, background=False,
+        )
+
+
+def test_window_to_dict():
+    w = Window(0, date(2024, 1, 1), date(2024, 6, 30), date(2024, 7, 1), date(2024, 9, 30))
+    assert w.to_dict() == {"index": 0, "train_start": "2024-01-01", "train_end": "2024-06-30",
+                           "test_start": "2024-07-01", "test_end": "2024-09-30"}
+
+
+def test_request_body_bounds_samples():
+    from pydantic import ValidationError
+
+    from config import LOCAL_BACKTEST_SWEEP_MAX_RUNS
+    from routers.backtest import LocalSweepBody, LocalWalkForwardBody
+
+    for body in (LocalSweepBody, LocalWalkForwardBody):
+        body(preset="momentum", symbols=["005930"], samples=LOCAL_BACKTEST_SWEEP_MAX_RUNS)
+        with pytest.raises(ValidationError):
+            body(preset="momentum", symbols=["005930"], samples=LOCAL_BACKTEST_SWEEP_MAX_RUNS + 1)
@@ -0,0 +1,178 @@
+"""stock/ohlcv_store.py — 영구 봉 저장소 (앞/뒤 보충 / 소급 조정 감지 / memmap 읽기 / 소비자 연결)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock import ohlcv_store
+
+
+def _source(n: int = 260) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = np.round(10000.0 * np.cumprod(1 + rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {"open": close, "high": close * 1.01, "low": close * 0.99, "close": close,
+         "adj_close": close * 0.98, "volume": rng.integers(1_000, 9_000, n).astype(float)},
+        index=pd.bdate_range("2024-01-01", periods=n),
+    )
+
+
+@pytest.fixture
+def src(monkeypatch, tmp_path):
+    """가짜 yfinance: state["df"]에서 [start, end] 구간 반환 + 호출 기록."""
+    state = {"df": _source(), "calls": [], "fail": False, "today": date(2024, 12, 31)}
+
+    def fake_fetch(symbol, market, start, end, interval):
+        state["calls"].append((start, end))
+        if state["fail"]:
+            return None
+        df = state["df"]
+        return df.loc[pd.Timestamp(start):pd.Timestamp(end)].copy()
+
+    monkeypatch.setattr(ohlcv_store, "_ROOT", tmp_path / "ohlcv")
+    monkeypatch.setattr(ohlcv_store, "_fetch_yf", fake_fetch)
+    monkeypatch.setattr(ohlcv_store, "_today", lambda: state["today"])
+    return state
+
+
+def test_first_fetch_then_served_from_store(src):
+    df = ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    pd.testing.assert_frame_equal(df, src["df"].loc["2024-02-01":"2024-06-28"], check_freq=False)
+    assert len(src["calls"]) == 1
+
+    # 확인 구간 안의 하위 구간은 네트워크 없이 응답
+    sub = ohlcv_store.get_bars("005930", date(2024, 3, 4), date(2024, 3, 8))
+    assert len(src["calls"]) == 1 and list(sub.index.day) == [4, 5, 6, 7, 8]
+
+    cols = ohlcv_store.read_bars("005930")
+    assert isinstance(cols["close"], np.memmap) and not cols["close"].flags.writeable
+    assert cols["date"].dtype == np.dtype("datetime64[D]")
+
+
+def test_tail_top_up_fetches_only_missing_dates(src):
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    stored = ohlcv_store.read_bars("005930")["date"]
+    anchor = pd.Timestamp(stored[-2]).date()
+
+    df = ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 9, 30))
+    # 끝에서 두 번째 봉(기준 봉)부터 요청 끝까지만 보충
+    assert src["calls"][-1] == (anchor, date(2024, 9, 30))
+    pd.testing.assert_frame_equal(df, src["df"].loc["2024-02-01":"2024-09-30"], check_freq=False)
+
+
+def test_head_top_up(src):
+    ohlcv_store.get_bars("005930", date(2024, 6, 3), date(2024, 6, 28))
+    df = ohlcv_store.get_bars("005930", date(2024, 3, 1), date(2024, 6, 28))
+    assert src["calls"][-1] == (date(2024, 3, 1), date(2024, 6, 2))
+    pd.testing.assert_frame_equal(df, src["df"].loc["2024-03-01":"2024-06-28"], check_freq=False)
+
+
+def test_revised_anchor_triggers_full_refetch(src):
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    # 분할/배당 소급 조정 — 과거 전 구간 가격이 바뀜
+    src["df"] = src["df"] * 0.5
+    df = ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 7, 31))
+    assert src["calls"][-1] == (date(2024, 2, 1), date(2024, 7, 31))
+    pd.testing.assert_frame_equal(df, src["df"].loc["2024-02-01":"2024-07-31"], check_freq=False)
+
+
+def test_failed_fetch_is_not_persisted(src):
+    src["fail"] = True
+    assert ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28)) is None
+    assert ohlcv_store.read_bars("005930") is None
+
+    src["fail"] = False
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    # 뒤쪽 보충 실패 → 저장분만 반환, 확인 구간 미전진 (다음 호출 재시도)
+    src["fail"] = True
+    df = ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 9, 30))
+    assert df.index[-1] == pd.Timestamp("2024-06-28")
+    src["fail"] = False
+    n = len(src["calls"])
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 9, 30))
+    assert len(src["calls"]) == n + 1
+
+
+def test_today_rechecked_after_ttl(src, monkeypatch):
+    src["today"] = date(2024, 6, 28)
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    assert len(src["calls"]) == 1
+    monkeypatch.setattr(ohlcv_store, "OHLCV_STORE_TOPUP_TTL_SEC", -1)
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    assert len(src["calls"]) == 2
+
+
+def test_end_clamped_to_today_and_interval_validated(src):
+    src["today"] = date(2024, 3, 29)
+    df = ohlcv_store.get_bars("005930", date(2024, 3, 1), date(2025, 1, 1))
+    assert src["calls"] == [(date(2024, 3, 1), date(2024, 3, 29))]
+    assert df.index[-1] == pd.Timestamp("2024-03-29")
+    with pytest.raises(ValueError, match="interval"):
+        ohlcv_store.get_bars("005930", date(2024, 3, 1), date(2024, 3, 29), interval="15m")
+
+
+def test_period_start():
+    today = date(2024, 3, 31)
+    assert ohlcv_store.period_start("60d", today) == date(2024, 1, 31)
+    assert ohlcv_store.period_start("1mo", today) == date(2024, 2, 29)
+    assert ohlcv_store.period_start("7y", today) == date(2017, 3, 31)
+    assert ohlcv_store.period_start("ytd", today) == date(2024, 1, 1)
+    assert ohlcv_store.period_start("max", today) is None
+
+
+def test_data_loader_reads_through_store(src):
+    from services.local_backtest.data_loader import fetch_daily_ohlcv
+
+    df = fetch_daily_ohlcv("005930", date(2024, 2, 1), date(2024, 6, 28))
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    fetch_daily_ohlcv("005930", date(2024, 3, 1), date(2024, 5, 31))
+    assert len(src["calls"]) == 1
+
+
+def test_advisory_intraday_bypasses_store(src):
+    from stock.advisory_fetcher import _fetch_ohlcv_store
+
+    assert _fetch_ohlcv_store("005930", "KR", "15m", "60d") is None
+    bars = _fetch_ohlcv_store("005930", "KR", "1d", "1mo")
+    assert bars[-1]["time"] == src["df"].index[-1].strftime("%Y-%m-%dT00:00:00")
+    last = src["df"].iloc[-1]
+    assert bars[-1]["close"] == pytest.approx(last["adj_close"])  # auto_adjust 기준 조정 가격
+    assert bars[-1]["open"] == pytest.approx(last["open"] * last["adj_close"] / last["close"])
+
+
+def test_adjusted_matches_yfinance_auto_adjust():
+    df = pd.DataFrame({"open": [100.0, 50.0], "high": [110.0, 55.0], "low": [90.0, 45.0],
+                       "close": [100.0, 0.0], "adj_close": [80.0, np.nan], "volume": [1.0, 2.0]})
+    adj = ohlcv_store.adjusted(df)
+    assert adj["close"].tolist() == [80.0, 0.0]
+    assert adj["high"].tolist() == [88.0, 55.0] and adj["low"].tolist() == [72.0, 45.0]
+    assert adj["volume"].tolist() == [1.0, 2.0]
+
+
+def test_empty_symbol_marked_until_ttl(src, monkeypatch):
+    src["df"] = src["df"].iloc[:0]
+    for _ in range(3):
+        assert ohlcv_store.get_bars("999999", date(2024, 2, 1), date(2024, 6, 28)) is None
+    assert len(src["calls"]) == 1
+    ohlcv_store.get_bars("999999", date(2024, 1, 1), date(2024, 6, 28))  # 표식 구간 밖 → 재조회
+    assert len(src["calls"]) == 2
+    monkeypatch.setattr(ohlcv_store, "OHLCV_STORE_EMPTY_TTL_SEC", -1)
+    ohlcv_store.get_bars("999999", date(2024, 2, 1), date(2024, 6, 28))
+    assert len(src["calls"]) == 3
+
+    src["df"] = _source()  # 신규 상장 — 표식 제거 후 저장
+    assert ohlcv_store.get_bars("999999", date(2024, 2, 1), date(2024, 6, 28)) is not None
+    assert not ohlcv_store._empty_marker(ohlcv_store._dir("999999", "KR", "1d")).exists()
+
+
+def test_writes_serialized_by_file_lock(src):
+    if ohlcv_store.fcntl is None:
+        pytest.skip("fcntl 없음")
+    ohlcv_store.get_bars("005930", date(2024, 2, 1), date(2024, 6, 28))
+    path = ohlcv_store._dir("005930", "KR", "1d")
+    assert path.with_name(".005930.lock").exists()
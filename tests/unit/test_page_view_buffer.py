@@ -0,0 +1,123 @@
+"""services/page_view_buffer.py — 배치 flush, 용량 초과 드롭, 종료 시 최종 flush, 쓰기 실패 격리."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from db.base import Base
+from db.models.page_view import PageView
+from db.repositories.page_view_repo import PageViewRepository
+from services.page_view_buffer import PageViewBuffer
+
+
+@pytest.fixture
+def sqlite_writer():
+    """인메모리 SQLite에 record_many로 기록하는 writer + 실행된 INSERT 문 수."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[PageView.__table__])
+    Session = sessionmaker(bind=engine)
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, params, context, executemany):
+        if statement.startswith("INSERT"):
+            statements.append(executemany)
+
+    def writer(rows):
+        with Session() as db:
+            PageViewRepository(db).record_many(rows)
+            db.commit()
+
+    def count():
+        with Session() as db:
+            return db.execute(select(func.count(PageView.id))).scalar()
+
+    yield writer, count, statements
+    engine.dispose()
+
+
+def _offer(buf: PageViewBuffer, n: int, path: str = "/api/balance"):
+    return [buf.offer(user_id=1, path=path, method="GET", status_code=200, duration_ms=12) for _ in range(n)]
+
+
+def test_batch_size_wakes_writer_and_uses_executemany(sqlite_writer):
+    writer, count, statements = sqlite_writer
+    buf = PageViewBuffer(capacity=1000, batch_size=50, flush_interval=60, writer=writer)
+    buf.start()
+    try:
+        _offer(buf, 120)
+        deadline = time.monotonic() + 2
+        while buf.stats()["written"] < 100 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert buf.stats()["written"] >= 100  # 간격(60초) 전에 배치 크기로 깨어남
+    finally:
+        buf.stop()
+    assert count() == 120
+    assert statements and all(statements)  # 요청당 INSERT가 아닌 executemany
+    st = buf.stats()
+    assert st["written"] == 120 and st["failed"] == 0 and st["pending"] == 0
+    assert st["batches"] >= 3 and not st["running"]
+
+
+def test_interval_flush_and_created_at(sqlite_writer):
+    writer, count, _ = sqlite_writer
+    seen = []
+    buf = PageViewBuffer(batch_size=500, flush_interval=0.05, writer=lambda rows: (seen.extend(rows), writer(rows)))
+    buf.start()
+    try:
+        _offer(buf, 3)
+        time.sleep(0.3)
+        assert buf.stats()["written"] == 3
+    finally:
+        buf.stop()
+    assert count() == 3
+    assert all(r["created_at"].endswith("+09:00") for r in seen)  # offer 시점 KST
+
+
+def test_full_buffer_drops_and_counts():
+    buf = PageViewBuffer(capacity=5, batch_size=100, writer=lambda rows: None)
+    assert _offer(buf, 7) == [True] * 5 + [False] * 2
+    st = buf.stats()
+    assert (st["pending"], st["accepted"], st["dropped"]) == (5, 5, 2)
+
+
+def test_stop_flushes_remaining_and_failed_batch_is_isolated(sqlite_writer):
+    writer, count, _ = sqlite_writer
+    calls = []
+
+    def flaky(rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise RuntimeError("db down")
+        writer(rows)
+
+    buf = PageViewBuffer(batch_size=4, flush_interval=60, writer=flaky)
+    _offer(buf, 10)
+    buf.stop()  # 스레드 미시작이어도 최종 flush
+    assert calls == [4, 4, 2]
+    assert count() == 6
+    st = buf.stats()
+    assert (st["failed"], st["written"], st["pending"]) == (4, 6, 0)
+
+
+def test_lifespan_runs_writer_in_testing_mode(monkeypatch):
+    """TESTING 모드에서도 미들웨어가 offer한 행이 lifespan 종료 시 기록된다."""
+    from fastapi.testclient import TestClient
+
+    import main
+    from services import page_view_buffer
+
+    seen = []
+    buf = PageViewBuffer(batch_size=100, flush_interval=60, writer=seen.extend)
+    monkeypatch.setenv("TESTING", "1")
+    monkeypatch.setattr(page_view_buffer, "_buffer", buf)
+    with TestClient(main.app) as c:
+        assert buf.stats()["running"]
+        c.get("/api/__page_view_probe__")
+    assert not buf.stats()["running"]
+    assert [r["path"] for r in seen] == ["/api/__page_view_probe__"]
@@ -0,0 +1,136 @@
+"""services/page_view_rollup.py + PageViewRollupRepository — 스케치 정확도, raw 쿼리와 rollup 조회 일치,
+증분 재실행 멱등, 보존기간 정리. 인메모리 SQLite."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from db.base import Base
+from db.models.page_view import PageView, PageViewDaily, PageViewHourly, PageViewUserDaily
+from db.repositories.page_view_repo import PageViewRepository
+from db.repositories.page_view_rollup_repo import PageViewRollupRepository
+from db.utils import KST
+from services import _sketches as sk
+from services.page_view_rollup import purge, rollup
+
+NOW = datetime(2026, 10, 18, 15, 30, tzinfo=KST)
+DAYS = ["2026-10-16", "2026-10-17", "2026-10-18"]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[m.__table__ for m in
+                                             (PageView, PageViewHourly, PageViewDaily, PageViewUserDaily)])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _seed(db, n: int = 600, days=DAYS, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        day = rng.choice(days)
+        hh = rng.randrange(0, 15) if day == "2026-10-18" else rng.randrange(24)
+        db.add(PageView(
+            user_id=rng.choice([None, 1, 2, 3, 4, 5, 6, 7]),
+            path=rng.choice(["/api/balance", "/api/watchlist", "/api/detail/x", "/api/quote"]),
+            method="GET",
+            status_code=rng.choice([200] * 8 + [404, 500]),
+            duration_ms=round(rng.lognormvariate(3.5, 1.0), 2),
+            created_at=f"{day}T{hh:02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}+09:00",
+        ))
+    db.commit()
+
+
+def test_hll_and_histogram_accuracy():
+    reg = sk.hll_new()
+    for i in range(37):
+        sk.hll_add(reg, i)
+    assert abs(sk.hll_count(bytes(reg)) - 37) <= 1  # 소규모 = linear counting
+    a, b = sk.hll_new(), sk.hll_new()
+    for i in range(6000):
+        sk.hll_add(a if i % 2 else b, i)
+        sk.hll_add(b, i + 3000)
+    assert abs(sk.hll_count(sk.hll_merge([bytes(a), bytes(b), None])) - 9000) < 9000 * 0.1
+    assert sk.hll_merge([None]) is None and sk.hll_count(None) == 0
+
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(4, 1, 20000)
+    hist = [0] * sk.LATENCY_BUCKETS
+    for v in values:
+        hist[sk.latency_bucket(v)] += 1
+    merged = sk.hist_merge([hist[:], [0] * sk.LATENCY_BUCKETS])
+    for q in (0.5, 0.95, 0.99):
+        est = sk.hist_percentile(merged, q, float(values.max()))
+        assert est == pytest.approx(np.percentile(values, q * 100), rel=0.13)
+    assert sk.hist_percentile([0] * sk.LATENCY_BUCKETS, 0.5) is None
+
+
+def test_rollup_queries_match_raw_queries(db):
+    _seed(db)
+    result = rollup(db, now=NOW)
+    assert result == {"days": 3, "rows": 600, "from": "2026-10-16"}
+    raw, rolled = PageViewRepository(db), PageViewRollupRepository(db)
+
+    got = {r["path"]: r for r in rolled.aggregate_by_path(DAYS[0], DAYS[-1])}
+    for exp in raw.aggregate_by_path(DAYS[0], DAYS[-1]):
+        r = got[exp["path"]]
+        assert (r["calls"], r["avg_ms"], r["max_ms"], r["unique_users"]) == \
+               (exp["calls"], exp["avg_ms"], exp["max_ms"], exp["unique_users"])
+        durations = [d for (d,) in db.query(PageView.duration_ms).filter(PageView.path == exp["path"])]
+        assert r["p95_ms"] == pytest.approx(np.percentile(durations, 95), rel=0.15)
+        errors = db.query(func.count(PageView.id)).filter(PageView.path == exp["path"],
+                                                          PageView.status_code >= 400).scalar()
+        assert r["errors"] == errors and 0 < r["server_errors"] < errors
+
+    assert sorted(rolled.daily_timeseries(DAYS[0], DAYS[-1], top=2), key=lambda r: (r["date"], r["path"])) == \
+        sorted(raw.daily_timeseries(DAYS[0], DAYS[-1], top=2), key=lambda r: (r["date"], r["path"]))
+    assert rolled.count_by_user([1, 2, 7, 99]) == raw.count_by_user([1, 2, 7, 99])
+    for uid in (1, 5):
+        assert rolled.user_daily_timeseries(uid, DAYS[0], DAYS[-1]) == raw.user_daily_timeseries(uid, DAYS[0], DAYS[-1])
+        assert rolled.user_last_seen_at(uid) == raw.user_last_seen_at(uid)
+        assert sum(p["views"] for p in rolled.user_top_paths(uid, DAYS[1], DAYS[2], top=10)) == \
+            sum(p["views"] for p in raw.user_top_paths(uid, DAYS[1], DAYS[2], top=10))
+
+
+def test_incremental_rerun_is_idempotent_and_resumes_from_last_bucket(db):
+    _seed(db)
+    rollup(db, now=NOW)
+    before = PageViewRollupRepository(db).aggregate_by_path(DAYS[0], DAYS[-1])
+    again = rollup(db, now=NOW)
+    assert again["from"] == "2026-10-18" and again["days"] == 1  # 과거 일자 재스캔 없음
+    assert PageViewRollupRepository(db).aggregate_by_path(DAYS[0], DAYS[-1]) == before
+
+    PageViewRepository(db).record(user_id=42, path="/api/new", method="GET", status_code=200, duration_ms=5)
+    db.commit()
+    rollup(db, now=NOW + timedelta(minutes=10))
+    repo = PageViewRollupRepository(db)
+    assert repo.count_by_user([42]) == {42: 1}
+    new = [r for r in repo.aggregate_by_path("2026-10-18", "2026-10-18", top=50) if r["path"] == "/api/new"]
+    assert new and new[0]["calls"] == 1
+
+
+def test_purge_keeps_rollups_and_unrolled_raw(db, monkeypatch):
+    from services import page_view_rollup
+
+    monkeypatch.setattr(page_view_rollup, "PAGE_VIEW_RAW_RETENTION_DAYS", 1)
+    monkeypatch.setattr(page_view_rollup, "PAGE_VIEW_HOURLY_RETENTION_DAYS", 1)
+    assert purge(db, now=NOW) == {"raw": 0, "hourly": 0}  # rollup 전에는 삭제 없음
+    _seed(db)
+    rollup(db, now=NOW)
+    totals = PageViewRollupRepository(db).count_by_user([1, 2, 3])
+    result = purge(db, now=NOW)
+    assert result["raw"] > 0 and result["hourly"] > 0
+    assert db.query(func.min(PageView.created_at)).scalar() >= "2026-10-17"
+    assert db.query(func.min(PageViewHourly.hour)).scalar() >= "2026-10-17T"
+    repo = PageViewRollupRepository(db)
+    assert repo.count_by_user([1, 2, 3]) == totals  # 누계는 일 rollup 기준
+    assert {r["date"] for r in repo.daily_timeseries(DAYS[0], DAYS[-1])} == set(DAYS)
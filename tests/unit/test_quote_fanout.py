@@ -0,0 +1,138 @@
+"""services/quote_fanout.py — 심볼별 병합·직렬화 1회 fan-out, 드롭 계측, KISQuoteManager 연동."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from services import quote_fanout
+from services.quote_fanout import FanoutHub, encode, put_latest
+
+WINDOW = 0.01
+
+
+def _drain(q: asyncio.Queue) -> list:
+    out = []
+    while not q.empty():
+        out.append(q.get_nowait())
+    return out
+
+
+def test_encode_matches_starlette_send_json():
+    msg = {"type": "price", "symbol": "005930", "name": "삼성전자", "price": 71000.0}
+    assert encode(msg) == json.dumps(msg, separators=(",", ":"), ensure_ascii=False)
+
+
+def test_put_latest_drops_oldest():
+    q: asyncio.Queue = asyncio.Queue(maxsize=2)
+    assert not put_latest(q, 1) and not put_latest(q, 2)
+    assert put_latest(q, 3)
+    assert _drain(q) == [2, 3]
+
+
+def test_publish_conflates_and_serializes_once(monkeypatch):
+    calls = []
+    real = quote_fanout.encode
+    monkeypatch.setattr(quote_fanout, "encode", lambda m: calls.append(m) or real(m))
+
+    async def scenario():
+        hub = FanoutHub(window=WINDOW)
+        queues = [asyncio.Queue(maxsize=100) for _ in range(5)]
+        for q in queues:
+            hub.add("005930", q)
+        for i in range(50):
+            hub.publish("005930", {"type": "price", "price": 70000 + i})
+            if i % 5 == 0:
+                hub.publish("005930", {"type": "orderbook", "seq": i})
+        timer = hub._channels["005930"].timer
+        assert timer is not None
+        await asyncio.sleep(WINDOW * 3)
+        return hub, [_drain(q) for q in queues]
+
+    hub, got = asyncio.run(scenario())
+    assert len(calls) == 2  # 구독자 5 × 메시지 60 → 인코딩 2회
+    for frames in got:
+        assert [json.loads(f) for f in frames] == [
+            {"type": "price", "price": 70049}, {"type": "orderbook", "seq": 45}]
+        assert all(a is b for a, b in zip(frames, got[0]))  # 같은 str 객체 공유
+    st = hub.stats()["005930"]
+    assert st == {"subscribers": 5, "published": 60, "conflated": 58, "flushes": 1,
+                  "frames": 2, "deliveries": 10, "drops": 0}
+    assert hub._channels["005930"].timer is None
+
+
+def test_slow_subscriber_drops_without_affecting_others():
+    async def scenario():
+        hub = FanoutHub(window=WINDOW)
+        slow, fast = asyncio.Queue(maxsize=1), asyncio.Queue(maxsize=100)
+        hub.add("005930", slow)
+        hub.add("005930", fast)
+        for i in range(3):
+            hub.publish("005930", {"type": "price", "price": i})
+            hub.publish("005930", {"type": "orderbook", "seq": i})
+            await asyncio.sleep(WINDOW * 2)
+        return hub, _drain(slow), _drain(fast)
+
+    hub, slow, fast = asyncio.run(scenario())
+    assert len(fast) == 6 and len(slow) == 1
+    assert json.loads(slow[0]) == {"type": "orderbook", "seq": 2}
+    assert hub.stats()["005930"]["drops"] == 5
+
+
+def test_last_unsubscribe_cancels_pending_flush():
+    async def scenario():
+        hub = FanoutHub(window=WINDOW)
+        q: asyncio.Queue = asyncio.Queue(maxsize=10)
+        hub.add("005930", q)
+        hub.publish("005930", {"type": "price", "price": 1})
+        hub.remove("005930", q)
+        hub.publish("005930", {"type": "price", "price": 2})  # 구독자 없음 → 무시
+        await asyncio.sleep(WINDOW * 2)
+        return hub, q
+
+    hub, q = asyncio.run(scenario())
+    assert q.empty() and hub.stats() == {}
+
+
+# ── KISQuoteManager 연동 ───────────────────────────────────────────────────
+
+def test_manager_frames_and_raw_subscribers():
+    from services import quote_kis
+
+    frame = "0|H0UNCNT0|001|" + "^".join(
+        ["005930", "093000", "71000", "2", "100", "0.15"] + ["71000"] * 5 + ["70900", "7", "1000"])
+
+    async def scenario():
+        mgr = quote_kis.KISQuoteManager()
+        mgr._fanout.window = WINDOW
+
+        async def no_initial_price(symbol, queue):
+            mgr._deliver(symbol, queue, {"type": "price", "symbol": symbol, "price": 1.0})
+
+        mgr._push_initial_price = no_initial_price
+        framed = [asyncio.Queue(maxsize=100) for _ in range(3)]
+        raw: asyncio.Queue = asyncio.Queue(maxsize=100)
+        for q in framed:
+            await mgr.subscribe_frames("005930", q)
+        await mgr.subscribe("005930", raw)
+        await asyncio.sleep(0)  # 초기 가격 태스크
+        initial = [_drain(q) for q in framed] + [_drain(raw)]
+        for _ in range(10):
+            await mgr._handle_message(frame)
+        immediate = _drain(raw)
+        assert all(q.empty() for q in framed)  # 창 만료 전
+        await asyncio.sleep(WINDOW * 3)
+        flushed = [_drain(q) for q in framed]
+        stats = mgr._fanout.stats()
+        for q in framed:
+            mgr.unsubscribe_frames("005930", q)
+        mgr.unsubscribe("005930", raw)
+        return mgr, initial, immediate, flushed, stats
+
+    mgr, initial, immediate, flushed, stats = asyncio.run(scenario())
+    assert [type(m[0]) for m in initial] == [str, str, str, dict]
+    assert len(immediate) == 10 and immediate[0]["price"] == 71000.0
+    for frames in flushed:
+        assert len(frames) == 1 and json.loads(frames[0])["price"] == 71000.0
+    assert stats["005930"]["frames"] == 3 + 1 and stats["005930"]["conflated"] == 9
+    assert "005930" not in mgr._subscribers and mgr._fanout.stats() == {}
@@ -0,0 +1,120 @@
+"""services/quote_frames.py — TR 레이아웃 파싱, 다건 프레임, 구독 종목 필터, KISQuoteManager 연동."""
+
+from __future__ import annotations
+
+import asyncio
+
+from services import quote_frames as qf
+
+
+def _exec_record(symbol: str, price: int, hhmmss: str = "093000", volume: int = 7, fields: int = 46) -> list[str]:
+    t = [symbol, hhmmss, str(price), "2", "500", "0.71", str(price), str(price - 300),
+         str(price + 200), str(price - 500), str(price + 100), str(price), str(volume)]
+    return (t + ["0"] * fields)[:fields]
+
+
+def _book_record(symbol: str, fields: int = 59) -> list[str]:
+    t = [symbol, "093000", "0"] + \
+        [str(70100 + i * 100) for i in range(10)] + [str(70000 - i * 100) for i in range(10)] + \
+        [str(1000 + i) for i in range(10)] + [str(2000 + i) for i in range(10)] + ["55555", "66666"]
+    return (t + ["0"] * fields)[:fields]
+
+
+def test_kr_execution_message():
+    (rec,) = qf.parse_records("^".join(_exec_record("005930", 71000)), "001", qf.KR_EXECUTION)
+    assert not hasattr(rec, "__dict__")
+    assert rec.message() == {
+        "type": "price", "symbol": "005930", "price": 71000.0, "sign": "2", "change": 500.0,
+        "change_rate": 0.71, "open": 70700.0, "high": 71200.0, "low": 70500.0,
+        "tick_time": "093000", "tick_volume": 7.0,
+    }
+
+
+def test_short_execution_omits_optional_fields():
+    assert qf.parse_one("005930^093000^71000^2^500^0.71", qf.KR_EXECUTION) == {
+        "symbol": "005930", "price": 71000.0, "sign": "2", "change": 500.0, "change_rate": 0.71}
+    assert qf.parse_one("005930^093000^71000", qf.KR_EXECUTION) is None
+    assert "tick_time" not in qf.parse_one("^".join(_exec_record("005930", 1, fields=10)), qf.KR_EXECUTION)
+
+
+def test_multi_record_frame_and_symbol_filter():
+    payload = "^".join(_exec_record("005930", 71000, "093000") + _exec_record("000660", 180000, "093001")
+                       + _exec_record("005930", 71100, "093002"))
+    recs = list(qf.parse_records(payload, "003", qf.KR_EXECUTION))
+    assert [(r.symbol, r.price, r.tick_time) for r in recs] == [
+        ("005930", 71000.0, "093000"), ("000660", 180000.0, "093001"), ("005930", 71100.0, "093002")]
+    only = list(qf.parse_records(payload, "003", qf.KR_EXECUTION, wanted={"005930"}))
+    assert [r.price for r in only] == [71000.0, 71100.0]
+    assert qf.parse_records(payload, "x", qf.KR_EXECUTION)[0].symbol == "005930"
+
+
+def test_kr_orderbook_and_bad_numbers():
+    t = _book_record("005930")
+    t[5] = ""  # 매도호가3 공란 → 0.0
+    msg = qf.parse_records("^".join(t), "001", qf.KR_ORDERBOOK)[0].message()
+    assert msg["asks"][0] == {"price": 70100.0, "volume": 1000.0}
+    assert msg["asks"][2]["price"] == 0.0
+    assert msg["bids"][9] == {"price": 69100.0, "volume": 2009.0}
+    assert (msg["total_ask_volume"], msg["total_bid_volume"]) == (55555.0, 66666.0)
+    assert qf.parse_one("^".join(t[:44]), qf.KR_ORDERBOOK) is None
+
+
+def test_fno_layouts():
+    t = ["101W09", "093000"] + [str(350 + i) for i in range(5)] + [str(349 - i) for i in range(5)] + \
+        ["0"] * 10 + [str(10 + i) for i in range(5)] + [str(20 + i) for i in range(5)] + ["0", "0", "77", "88"]
+    book = qf.parse_one("^".join(t), qf.FNO_ORDERBOOK_5)
+    assert len(book["asks"]) == 5 and book["asks"][4] == {"price": 354.0, "volume": 14.0}
+    assert book["bids"][0] == {"price": 349.0, "volume": 20.0} and book["total_bid_volume"] == 88.0
+    ex = qf.parse_one("101W09^093000^-1.5^5^-0.43^348.5", qf.FNO_EXECUTION)
+    assert ex == {"symbol": "101W09", "price": 348.5, "sign": "5", "change": -1.5, "change_rate": -0.43}
+    assert qf.parse_one("^".join(["111W09"] + ["1"] * 54), qf.FNO_ORDERBOOK_10) is None
+
+
+def test_manager_broadcasts_every_record_of_multi_record_frame():
+    from services import quote_kis
+
+    frame = "0|H0STCNT0|002|" + "^".join(_exec_record("005930", 71000, "093000", 3)
+                                         + _exec_record("005930", 71100, "093000", 4))
+    other = "0|H0STCNT0|001|" + "^".join(_exec_record("000660", 180000))
+
+    async def scenario():
+        mgr = quote_kis.KISQuoteManager()
+        q: asyncio.Queue = asyncio.Queue(maxsize=10)
+        mgr._subscribers["005930"].add(q)
+        mgr._indicators.track("005930", q, [1])
+        await mgr._handle_message(frame)
+        await mgr._handle_message(other)  # 미구독 종목 — 파싱 생략
+        msgs = [q.get_nowait() for _ in range(q.qsize())]
+        return mgr, msgs
+
+    mgr, msgs = asyncio.run(scenario())
+    prices = [m for m in msgs if m["type"] == "price"]
+    assert [m["price"] for m in prices] == [71000.0, 71100.0]
+    bar = mgr._indicators._series["005930"][1].forming
+    assert bar["close"] == 71100.0 and bar["volume"] == 7.0
+    assert "000660" not in mgr._subscribers
+
+
+def test_framed_subscribers_materialize_only_flushed_record(monkeypatch):
+    from services import quote_kis
+
+    built = []
+    orig = qf.Execution.message
+    monkeypatch.setattr(qf.Execution, "message", lambda self: built.append(self.price) or orig(self))
+    frame = "0|H0STCNT0|003|" + "^".join(_exec_record("005930", 71000) + _exec_record("005930", 71100)
+                                         + _exec_record("005930", 71200))
+
+    async def scenario():
+        mgr = quote_kis.KISQuoteManager()
+        q: asyncio.Queue = asyncio.Queue(maxsize=10)
+        mgr._fanout.add("005930", q)
+        mgr._subscribers["005930"].add(q)
+        await mgr._handle_message(frame)
+        assert built == []  # flush 전에는 dict 미생성
+        await asyncio.sleep(0.25)
+        mgr._fanout.close()
+        return [q.get_nowait() for _ in range(q.qsize())]
+
+    frames = asyncio.run(scenario())
+    assert built == [71200.0]
+    assert len(frames) == 1 and '"price":71200.0' in frames[0]
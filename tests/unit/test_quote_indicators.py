@@ -0,0 +1,172 @@
+"""services/quote_indicators.py — 증분 지표 = 배치 지표, 틱→분봉 집계, 허브 구독/시드, KIS 체결 연동."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from services import quote_indicators
+from services.quote_indicators import IndicatorHub, IndicatorState, bucket_start
+from stock.indicators import calc_technical_indicators
+
+
+def _bars(n: int, seed: int = 0, integer: bool = True, day: str = "2026-10-16") -> list[dict]:
+    rng = np.random.default_rng(seed)
+    c = 70000 * np.cumprod(1 + rng.normal(0, 0.004, n))
+    o = c * (1 + rng.normal(0, 0.001, n))
+    h = np.maximum(o, c) * (1 + np.abs(rng.normal(0, 0.002, n)))
+    lo = np.minimum(o, c) * (1 - np.abs(rng.normal(0, 0.002, n)))
+    conv = (lambda v: float(round(v))) if integer else (lambda v: round(float(v), 2))
+    return [
+        {"time": f"{day}T{9 + i // 60:02d}:{i % 60:02d}:00", "open": conv(a), "high": conv(b),
+         "low": conv(d), "close": conv(e), "volume": int(v)}
+        for i, (a, b, d, e, v) in enumerate(zip(o, h, lo, c, rng.integers(1, 10_000, n)))
+    ]
+
+
+def _batch_last(bars: list[dict]) -> dict:
+    r = calc_technical_indicators(bars, backend="python")
+    return {
+        "macd": {k: r["macd"][k][-1] for k in ("macd", "signal", "histogram")},
+        "rsi": r["rsi"]["values"][-1],
+        "stoch": {"k": r["stoch"]["k"][-1], "d": r["stoch"]["d"][-1]},
+        "bb": {k: r["bb"][k][-1] for k in ("upper", "mid", "lower")},
+        "ma": {k: r["ma"][k][-1] for k in ("ma5", "ma20", "ma60")},
+        "atr": r["current_signals"]["atr"],
+    }
+
+
+def _assert_close(got, want, path=""):
+    if isinstance(want, dict):
+        for k in want:
+            _assert_close(got[k], want[k], f"{path}.{k}")
+    elif want is None:
+        assert got is None, path
+    else:
+        assert got == pytest.approx(want, abs=2e-4), path
+
+
+@pytest.mark.parametrize("integer", [True, False])
+def test_snapshot_matches_batch_on_every_prefix(integer):
+    bars = _bars(200, seed=1, integer=integer)
+    state = IndicatorState()
+    for i, bar in enumerate(bars):
+        snap = state.snapshot(bar)
+        if i >= 1:  # 배치는 2봉 미만이면 빈 결과
+            _assert_close(snap, _batch_last(bars[:i + 1]), f"n={i + 1}")
+        assert state.push(bar) == snap  # 확정 값 = 직전 미확정 스냅샷
+
+
+def test_state_is_bounded():
+    state = IndicatorState()
+    for b in _bars(3000, seed=2):
+        state.push(b)
+    assert state.bars == 3000
+    assert len(state.ma60.values) == 59 and len(state.bb.values) == 19
+    assert len(state.stoch_hi.dq) <= 13 and len(state.stoch_lo.dq) <= 13
+
+
+# ── 틱 → 분봉 ─────────────────────────────────────────────────────────────
+
+def test_bucket_start():
+    ts = datetime(2026, 10, 16, 10, 44, 59)
+    assert bucket_start(ts, 1) == datetime(2026, 10, 16, 10, 44)
+    assert bucket_start(ts, 15) == datetime(2026, 10, 16, 10, 30)
+    assert bucket_start(ts, 60) == datetime(2026, 10, 16, 10, 0)
+
+
+def test_ticks_aggregate_into_bars():
+    hub = IndicatorHub()
+    q = object()
+    hub.track("005930", q, [15])
+    ticks = [((9, 0, 1), 100, 10), ((9, 7, 0), 105, 5), ((9, 14, 59), 98, 1),
+             ((9, 15, 0), 101, 2), ((9, 10, 0), 999, 100), ((9, 16, 0), 103, 3)]
+    snaps = []
+    for (h, m, s), px, vol in ticks:
+        snaps.append(hub.on_tick("005930", datetime(2026, 10, 16, h, m, s), float(px), float(vol)))
+    assert snaps[4] == []  # 지난 버킷 지연 틱 무시
+    last = snaps[-1][0]
+    assert last["interval"] == 15 and last["closed_bars"] == 1
+    assert last["bar"] == {"time": "2026-10-16T09:15:00", "open": 101.0, "high": 103.0,
+                           "low": 101.0, "close": 103.0, "volume": 5.0}
+    series = hub._series["005930"][15]
+    assert series.recent[0] == {"time": "2026-10-16T09:00:00", "open": 100.0, "high": 105.0,
+                                "low": 98.0, "close": 98.0, "volume": 16.0}
+
+
+def test_seed_then_stream_equals_batch():
+    bars = _bars(120, seed=3)
+    history, live = bars[:100], bars[100:]
+    hub = IndicatorHub()
+    q = object()
+    assert hub.track("005930", q, [1]) == [1]
+    # 이력 시드 — 현재 버킷(라이브 첫 봉) 이후 이력 봉은 무시
+    hub.seed("005930", 1, history + live[:1], now=datetime.fromisoformat(live[0]["time"]))
+    assert hub._series["005930"][1].state.bars == 100
+    for b in live:
+        ts = datetime.fromisoformat(b["time"])
+        for px in (b["open"], b["high"], b["low"], b["close"]):
+            snaps = hub.on_tick("005930", ts, px, 0.0)
+    _assert_close({k: v for k, v in snaps[0].items() if k in _batch_last(bars)},
+                  _batch_last(history + [{**b} for b in live]))
+
+
+def test_untrack_drops_state_and_unwanted_intervals():
+    hub = IndicatorHub()
+    a, b = object(), object()
+    hub.track("005930", a, [1, 15])
+    hub.track("005930", b, [15])
+    assert hub.queues_for("005930", 15) == [a, b] and hub.queues_for("005930", 1) == [a]
+    hub.untrack("005930", a)
+    assert set(hub._series["005930"]) == {15}
+    hub.untrack("005930", b)
+    assert not hub.tracking("005930") and "005930" not in hub._series
+
+
+def test_allowed_intervals_from_config(monkeypatch):
+    monkeypatch.setattr(quote_indicators, "QUOTE_INDICATOR_INTERVALS", "60, 1,7,x")
+    assert quote_indicators.allowed_intervals() == (1, 60)
+
+
+# ── KISQuoteManager 연동 ───────────────────────────────────────────────────
+
+def _exec_frame(symbol: str, hhmmss: str, price: int, volume: int) -> str:
+    t = [symbol, hhmmss, str(price), "2", "100", "0.15", str(price), str(price), str(price),
+         str(price), str(price + 100), str(price - 100), str(volume), "1000"]
+    return "0|H0UNCNT0|001|" + "^".join(t)
+
+
+def test_manager_pushes_indicator_snapshots(monkeypatch):
+    from services import quote_kis
+
+    history = _bars(80, seed=4, day="2020-01-02")  # 시드 cutoff(현재 버킷) 이전
+    monkeypatch.setattr(quote_kis, "load_history", lambda symbol, minutes: history)
+
+    async def scenario():
+        mgr = quote_kis.KISQuoteManager()
+
+        async def fake_subscribe(symbol, queue, is_fno=False, *, exchange="auto"):
+            mgr._subscribers[symbol].add(queue)
+
+        mgr.subscribe = fake_subscribe
+        q: asyncio.Queue = asyncio.Queue(maxsize=100)
+        await mgr.subscribe_indicators("005930", q, [1])
+        await asyncio.sleep(0.05)  # 시드 태스크
+        await mgr._handle_message(_exec_frame("005930", "093000", 71000, 7))
+        msgs = []
+        while not q.empty():
+            msgs.append(q.get_nowait())
+        mgr.unsubscribe_indicators("005930", q)
+        return mgr, msgs
+
+    mgr, msgs = asyncio.run(scenario())
+    price = [m for m in msgs if m["type"] == "price"]
+    ind = [m for m in msgs if m["type"] == "indicators"]
+    assert price and price[0]["tick_time"] == "093000" and price[0]["tick_volume"] == 7.0
+    assert ind and ind[-1]["interval"] == 1 and ind[-1]["closed_bars"] == 80
+    assert ind[-1]["bar"]["close"] == 71000.0 and ind[-1]["bar"]["time"].endswith("09:30:00")
+    assert ind[-1]["ma"]["ma60"] is not None
+    assert not mgr._indicators.tracking("005930") and "005930" not in mgr._subscribers
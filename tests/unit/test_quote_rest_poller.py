@@ -0,0 +1,205 @@
+"""services/quote_rest_poller.py — 토큰 버킷, 로컬 스텁 KIS 서버 대상 동시·우선순위 폴링, 매니저 폴백 루프."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from services.quote_rest_poller import RestFallbackPoller, TokenBucket
+
+
+class _StubKIS:
+    """KIS inquire-price 스텁 — 요청 기록, 동시 처리 수 측정, 종목별 응답."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: list[tuple[float, str, str]] = []  # (시각, tr_id, 종목)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                q = {k.lower(): v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                symbol = q.get("fid_input_iscd", "")
+                with stub._lock:
+                    stub.calls.append((time.monotonic(), self.headers.get("tr_id"), symbol))
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                time.sleep(stub.latency)
+                with stub._lock:
+                    stub.in_flight -= 1
+                if symbol == "UNAUTH":
+                    status, body = 401, {}
+                elif symbol == "BADFLD":
+                    status, body = 200, {"output": {"stck_prpr": "71000", "prdy_vrss": "N/A"}}
+                elif symbol == "BADOUT":
+                    status, body = 200, ["not", "a", "dict"]
+                elif "futureoption" in self.path:
+                    status, body = 200, {"output": {"last": "350.5", "base": "350.0"}}
+                else:
+                    status, body = 200, {"output": {"stck_prpr": "71000", "prdy_vrss": "500",
+                                                    "prdy_vrss_sign": "2", "prdy_ctrt": "0.71"}}
+                raw = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    s = _StubKIS(latency=0.05)
+    yield s
+    s.close()
+
+
+def _poller(url: str, **kw) -> RestFallbackPoller:
+    kw.setdefault("rate", 200)
+    kw.setdefault("concurrency", 4)
+    return RestFallbackPoller(base_url=url, app_key="k", app_secret="s",
+                              token_provider=lambda: "tok", on_unauthorized=kw.pop("on_unauth", lambda: None),
+                              **kw)
+
+
+def test_token_bucket_refills_at_rate():
+    now = [0.0]
+    bucket = TokenBucket(rate=10, clock=lambda: now[0])
+    assert bucket.try_acquire() and not bucket.try_acquire()
+    now[0] = 0.05
+    assert not bucket.try_acquire()
+    now[0] = 0.1
+    assert bucket.try_acquire()
+    now[0] = 10.0  # 오래 쉬어도 버스트 1
+    assert bucket.try_acquire() and not bucket.try_acquire()
+
+
+def test_poll_is_concurrent_and_priority_ordered(stub):
+    symbols = [f"{i:06d}" for i in range(20)]
+    got: list[dict] = []
+
+    async def publish(symbol, msg):
+        got.append(msg)
+
+    async def scenario():
+        poller = _poller(stub.url)
+        ok = await poller.poll([(s, None) for s in symbols], publish)
+        second = []
+        await poller.poll([(symbols[0], None)], lambda s, m: asyncio.sleep(0, second.append(m)))
+        await poller.aclose()
+        return poller, ok, second
+
+    poller, ok, second = asyncio.run(scenario())
+    assert ok == 20 and len(got) == 20
+    assert 2 <= stub.max_in_flight <= 4  # 동시 요청 (벽시계 비교는 부하 시 불안정해 쓰지 않음)
+    assert {c[2] for c in stub.calls[:4]} == set(symbols[:4])  # 동시 요청 첫 묶음 = 우선순위 상위
+    assert stub.calls[0][1] == "FHKST01010100"
+    msg = got[0]
+    assert msg["type"] == "price" and msg["price"] == 71000.0 and msg["sign"] == "2"
+    assert msg["source"] == "rest" and msg["as_of"].endswith("+09:00") and msg["refresh_sec"] is None
+    assert second[0]["refresh_sec"] > 0
+    st = poller.stats()
+    assert st["requests"] == 21 and st["errors"] == 0 and st["cycles"] == 2
+    assert set(st["age_sec"]) == set(symbols)
+
+
+def test_poll_respects_rate_limit():
+    stub = _StubKIS(latency=0.0)
+    try:
+        async def scenario():
+            poller = _poller(stub.url, rate=20, concurrency=8)
+            t0 = time.monotonic()
+            await poller.poll([(f"{i:06d}", None) for i in range(11)], lambda s, m: asyncio.sleep(0))
+            elapsed = time.monotonic() - t0
+            await poller.aclose()
+            return elapsed
+
+        # 클라이언트 측 하한만 검사 — 서버 수신 시각은 부하 시 몰려 도착할 수 있음
+        elapsed = asyncio.run(scenario())
+        assert len(stub.calls) == 11
+        assert elapsed >= 10 / 20 * 0.9  # 버스트 1 → 간격 1/rate
+    finally:
+        stub.close()
+
+
+def test_fno_and_unauthorized(stub):
+    cleared = []
+
+    async def scenario():
+        poller = _poller(stub.url, on_unauth=lambda: cleared.append(1))
+        got = []
+        ok = await poller.poll([("101W09", "IF"), ("UNAUTH", None)],
+                               lambda s, m: asyncio.sleep(0, got.append(m)))
+        await poller.aclose()
+        return poller, ok, got
+
+    poller, ok, got = asyncio.run(scenario())
+    assert ok == 1 and got[0]["symbol"] == "101W09" and got[0]["sign"] == "2"
+    assert got[0]["change"] == pytest.approx(0.5)
+    assert any(c[1] == "FHMIF10000000" for c in stub.calls)
+    assert cleared == [1] and poller.stats()["errors"] == 1
+
+
+def test_malformed_response_fails_only_that_symbol(stub):
+    async def scenario():
+        poller = _poller(stub.url, concurrency=2)
+        got = []
+        ok = await poller.poll([("BADFLD", None), ("BADOUT", None), ("005930", None), ("000660", None)],
+                               lambda s, m: asyncio.sleep(0, got.append(m)))
+        await poller.aclose()
+        return poller, ok, got
+
+    poller, ok, got = asyncio.run(scenario())
+    assert ok == 2 and {m["symbol"] for m in got} == {"005930", "000660"}
+    assert poller.stats()["errors"] == 2 and poller.stats()["cycles"] == 1
+
+
+def test_manager_fallback_loop_polls_busiest_symbol_first(stub, monkeypatch):
+    from services import quote_kis
+
+    monkeypatch.setattr(quote_kis, "QUOTE_FALLBACK_CYCLE_SEC", 0.05)
+
+    async def scenario():
+        mgr = quote_kis.KISQuoteManager()
+        mgr._poller = _poller(stub.url, concurrency=1)
+        quiet, busy = asyncio.Queue(maxsize=100), [asyncio.Queue(maxsize=100) for _ in range(3)]
+        mgr._subscribers["000660"].add(quiet)
+        for q in busy:
+            mgr._subscribers["005930"].add(q)
+        mgr._running = mgr._fallback_mode = True
+        task = asyncio.create_task(mgr._rest_fallback_loop())
+        for _ in range(200):  # 첫 사이클(2건) 완료까지 대기 — 고정 sleep은 부하 시 불안정
+            if quiet.qsize():
+                break
+            await asyncio.sleep(0.05)
+        mgr._fallback_mode = False
+        await asyncio.wait_for(task, 2)
+        await mgr._poller.aclose()
+        return quiet, busy
+
+    quiet, busy = asyncio.run(scenario())
+    assert [c[2] for c in stub.calls[:2]] == ["005930", "000660"]
+    msg = busy[0].get_nowait()
+    assert msg["symbol"] == "005930" and msg["source"] == "rest"
+    assert quiet.get_nowait()["symbol"] == "000660"
@@ -0,0 +1,257 @@
+"""screener/frame.py — 컬럼형 필터/정렬이 기존 리스트 루프 구현과 동일 결과인지 검증."""
+
+import random
+
+import pytest
+
+from screener import frame as frame_mod
+from screener import service
+from screener.frame import ScreenerFrame
+from services.guru_formulas import calc_seo_expected_return
+
+
+# ── 기존(루프) 구현 — 동등성 기준 ─────────────────────────────────────────
+
+def _ref_filter(stocks, *, market=None, per_min=None, per_max=None,
+                pbr_max=None, roe_min=None, include_negative=False):
+    out = []
+    for s in stocks:
+        if market and s["market"] != market.upper():
+            continue
+        per, pbr, roe = s["per"], s["pbr"], s["roe"]
+        if not include_negative and per is not None and per < 0:
+            continue
+        if per_min is not None or per_max is not None:
+            if per is None:
+                continue
+            if per_min is not None and per < per_min:
+                continue
+            if per_max is not None and per > per_max:
+                continue
+        if pbr_max is not None and (pbr is None or pbr > pbr_max):
+            continue
+        if roe_min is not None and (roe is None or roe < roe_min):
+            continue
+        out.append(s)
+    return out
+
+
+def _ref_sort(stocks, specs):
+    def key(s):
+        keys = []
+        for field, desc in specs:
+            v = s.get(field)
+            keys.append((1, 0) if v is None else (0, -v if desc else v))
+        return keys
+    return sorted(stocks, key=key)
+
+
+def _ref_greenblatt(stocks):
+    calc = [s for s in stocks
+            if s.get("guru_scores") and (s["guru_scores"].get("greenblatt") or {}).get("calculable")]
+    rest = [s for s in stocks if s not in calc]
+    calc.sort(key=lambda s: s["guru_scores"]["greenblatt"].get("roic") or -999, reverse=True)
+    for i, s in enumerate(calc):
+        s["_r"] = i + 1
+    calc.sort(key=lambda s: s["guru_scores"]["greenblatt"].get("earnings_yield") or -999, reverse=True)
+    for i, s in enumerate(calc):
+        s["_e"] = i + 1
+    for s in calc:
+        s["greenblatt_rank"] = s.pop("_r") + s.pop("_e")
+    calc.sort(key=lambda s: s["greenblatt_rank"])
+    for s in rest:
+        s["greenblatt_rank"] = None
+    return calc + rest
+
+
+def _universe(n=600, seed=7):
+    rnd = random.Random(seed)
+
+    def maybe(v, p=0.15):
+        return None if rnd.random() < p else v
+
+    return [
+        {
+            "code": f"{i:06d}",
+            "name": f"종목{i}",
+            "market": rnd.choice(["KOSPI", "KOSDAQ"]),
+            # 동률 다수 → 안정 정렬 검증
+            "per": maybe(round(rnd.uniform(-20, 60), 0)),
+            "pbr": maybe(round(rnd.uniform(0.1, 6), 1)),
+            "roe": maybe(round(rnd.uniform(-30, 40), 0)),
+            "mktcap": rnd.choice([0, 10**9, 5 * 10**11, rnd.randint(10**9, 10**14)]),
+        }
+        for i in range(n)
+    ]
+
+
+def _codes(rows):
+    return [r["code"] for r in rows]
+
+
+@pytest.fixture(autouse=True)
+def _clear_memo():
+    frame_mod.clear_memo()
+    yield
+    frame_mod.clear_memo()
+
+
+# ── 필터 ──────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"include_negative": True},
+    {"market": "kospi"},
+    {"per_min": 0, "per_max": 15},
+    {"per_max": 20, "include_negative": True},
+    {"pbr_max": 1.5},
+    {"roe_min": 5},
+    {"market": "KOSDAQ", "per_min": 3, "pbr_max": 3.0, "roe_min": 10},
+])
+def test_filter_matches_reference(kwargs):
+    stocks = _universe()
+    got = ScreenerFrame.from_records(stocks).filter(**kwargs).to_records()
+    assert _codes(got) == _codes(_ref_filter(stocks, **kwargs))
+    assert service.apply_filters(stocks, **kwargs) == _ref_filter(stocks, **kwargs)
+
+
+def test_apply_filters_returns_original_objects():
+    stocks = _universe(50)
+    out = service.apply_filters(stocks, include_negative=True)
+    assert all(a is b for a, b in zip(out, stocks))
+
+
+# ── 정렬 ──────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("specs", [
+    [("per", False)],
+    [("mktcap", True)],
+    [("roe", True), ("per", False)],
+    [("pbr", False), ("roe", True), ("mktcap", True)],
+    [("psr", False)],  # 전부 None → 입력 순서 유지
+])
+def test_sort_matches_reference_nan_last_and_stable(specs):
+    stocks = _universe()
+    got = ScreenerFrame.from_records(stocks).sort(specs).to_records()
+    assert _codes(got) == _codes(_ref_sort(stocks, specs))
+    assert _codes(service.sort_stocks(stocks, specs)) == _codes(_ref_sort(stocks, specs))
+
+
+def test_filter_sort_head_pipeline():
+    stocks = _universe()
+    got = (
+        ScreenerFrame.from_records(stocks)
+        .filter(per_min=0, per_max=30)
+        .sort([("roe", True)])
+        .head(25)
+        .to_records()
+    )
+    ref = _ref_sort(_ref_filter(stocks, per_min=0, per_max=30), [("roe", True)])[:25]
+    assert got == ref
+
+
+def test_where_codes():
+    stocks = _universe(30)
+    got = ScreenerFrame.from_records(stocks).where_codes({"000003", "000010", "999999"})
+    assert _codes(got.to_records()) == ["000003", "000010"]
+
+
+def test_to_records_does_not_mutate_shared_rows():
+    stocks = _universe(20)
+    rows = ScreenerFrame.from_records(stocks).with_seo().to_records()
+    rows[0]["name"] = "changed"
+    assert "seo_return" in rows[0]
+    assert stocks[0]["name"] == "종목0"
+    assert "seo_return" not in stocks[0]
+
+
+# ── 서준식 / Greenblatt ───────────────────────────────────────────────────
+
+def test_seo_columns_match_scalar_formula():
+    stocks = _universe()
+    stocks[0]["dividend_yield"] = 3.5
+    rows = ScreenerFrame.from_records(stocks).with_seo().to_records()
+    for s, row in zip(stocks, rows):
+        ref = calc_seo_expected_return(
+            roe=s["roe"], pbr=s["pbr"], per=s["per"], dividend_yield=s.get("dividend_yield"),
+        )
+        assert row["seo_return"] == ref["expected_return"]
+        assert row["seo_score"] == ref["seo_score"]
+
+
+def test_enrich_seo_scores_in_place():
+    stocks = _universe(40)
+    out = service.enrich_seo_scores(stocks)
+    assert out is stocks
+    for s in stocks:
+        ref = calc_seo_expected_return(roe=s["roe"], pbr=s["pbr"], per=s["per"])
+        assert s["seo_return"] == ref["expected_return"]
+        assert s["seo_score"] == ref["seo_score"]
+
+
+def test_sort_by_seo_return_desc():
+    stocks = _universe()
+    rows = ScreenerFrame.from_records(stocks).with_seo().sort([("seo_return", True)]).to_records()
+    ref = _ref_sort(service.enrich_seo_scores([dict(s) for s in stocks]), [("seo_return", True)])
+    assert _codes(rows) == _codes(ref)
+
+
+def _guru_universe(n=300, seed=3):
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        if rnd.random() < 0.2:
+            gs = None if rnd.random() < 0.5 else {"greenblatt": {"calculable": False}}
+        else:
+            gs = {"greenblatt": {
+                "calculable": True,
+                "roic": rnd.choice([None, 0, round(rnd.uniform(-10, 50), 0)]),
+                "earnings_yield": rnd.choice([None, round(rnd.uniform(-5, 20), 0)]),
+            }}
+        out.append({"code": f"{i:06d}", "guru_scores": gs})
+    return out
+
+
+def test_greenblatt_rank_matches_reference():
+    got = service.sort_by_greenblatt_rank(_guru_universe())
+    ref = _ref_greenblatt(_guru_universe())
+    assert [(s["code"], s["greenblatt_rank"]) for s in got] == \
+        [(s["code"], s["greenblatt_rank"]) for s in ref]
+
+
+def test_greenblatt_rank_empty_and_all_uncalculable():
+    assert service.sort_by_greenblatt_rank([]) == []
+    rows = [{"code": "A", "guru_scores": None}]
+    assert service.sort_by_greenblatt_rank(rows)[0]["greenblatt_rank"] is None
+
+
+# ── 거래일별 메모 ─────────────────────────────────────────────────────────
+
+def test_load_memoizes_per_trading_date(monkeypatch):
+    from screener import krx
+
+    calls = []
+
+    def fake_get_all_stocks(date_str):
+        calls.append(date_str)
+        return _universe(10), "20260306"
+
+    monkeypatch.setattr(krx, "get_all_stocks", fake_get_all_stocks)
+    f1, d1 = ScreenerFrame.load("20260308")
+    f2, d2 = ScreenerFrame.load("20260308")
+    f3, d3 = ScreenerFrame.load("20260307")  # 다른 요청일 → 같은 거래일 원본 재사용
+    assert d1 == d2 == d3 == "20260306"
+    assert calls == ["20260308", "20260307"]
+    assert f1._base is f2._base is f3._base
+    assert len(f1) == 10
+
+
+def test_load_propagates_runtime_error(monkeypatch):
+    from screener import krx
+
+    def boom(date_str):
+        raise RuntimeError("KRX 로그인 정보가 설정되지 않았습니다.")
+
+    monkeypatch.setattr(krx, "get_all_stocks", boom)
+    with pytest.raises(RuntimeError):
+        ScreenerFrame.load("20260306")
@@ -0,0 +1,91 @@
+"""screener/history.py — 거래일 파티션 컬럼 저장소 (append / memmap 읽기 / 기간 적재)."""
+
+import numpy as np
+import pytest
+
+from screener import history
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch, tmp_path):
+    root = tmp_path / "history"
+    monkeypatch.setattr(history, "_ROOT", root)
+    return root
+
+
+def _snap(codes, per, close=None):
+    cols = {"code": codes, "market": ["KOSPI"] * len(codes), "per": per}
+    if close is not None:
+        cols["close"] = close
+    return cols
+
+
+def test_append_and_load_date_memmap():
+    assert history.append_snapshot("20260305", _snap(["005930", "000660"], [12.0, np.nan]))
+    snap = history.load_date("20260305")
+    assert isinstance(snap["per"], np.memmap)
+    assert not snap["per"].flags.writeable
+    assert list(snap["code"]) == ["005930", "000660"]
+    assert snap["per"][0] == 12.0 and np.isnan(snap["per"][1])
+    # 누락 컬럼은 NaN
+    assert np.isnan(snap["div"]).all()
+
+
+def test_existing_partition_is_immutable_unless_overwrite():
+    history.append_snapshot("20260305", _snap(["005930"], [12.0]))
+    assert not history.append_snapshot("20260305", _snap(["005930"], [99.0]))
+    assert history.load_date("20260305")["per"][0] == 12.0
+    assert history.append_snapshot("20260305", _snap(["005930"], [99.0]), overwrite=True)
+    assert history.load_date("20260305")["per"][0] == 99.0
+
+
+def test_length_mismatch_rejected_without_partial_partition(store):
+    with pytest.raises(ValueError):
+        history.append_snapshot("20260305", _snap(["005930", "000660"], [1.0]))
+    assert not history.has_date("20260305")
+    assert history.available_dates() == []
+
+
+def test_available_dates_and_load_range():
+    history.append_snapshot("20251230", _snap(["005930"], [10.0], [50000]))
+    history.append_snapshot("20260102", _snap(["005930", "000660"], [11.0, 5.0], [52000, 120000]))
+    history.append_snapshot("20260105", _snap(["000660"], [4.0], [125000]))
+
+    assert history.available_dates() == ["20251230", "20260102", "20260105"]
+    assert history.available_dates("20260101", "20260104") == ["20260102"]
+
+    df = history.load_range("20251201", "20260131", ["per", "close"])
+    assert list(df.columns) == ["date", "code", "per", "close"]
+    assert len(df) == 4
+    assert df[(df.date == "20260105") & (df.code == "000660")]["per"].item() == 4.0
+
+
+def test_load_panel_wide_with_nan_for_missing():
+    history.append_snapshot("20260102", _snap(["005930", "000660"], [11.0, 5.0]))
+    history.append_snapshot("20260105", _snap(["000660"], [4.0]))
+    panel = history.load_panel("20260101", "20260131", "per")
+    assert list(panel.index) == ["20260102", "20260105"]
+    assert np.isnan(panel.loc["20260105", "005930"])
+    # 기간 질의 예: PER 변화율
+    change = panel.iloc[-1] / panel.iloc[0] - 1
+    assert change["000660"] == pytest.approx(-0.2)
+
+
+def test_append_records_from_get_all_stocks_format():
+    recs = [{"code": "005930", "name": "삼성전자", "market": "KOSPI",
+             "per": 12.5, "pbr": None, "roe": 10.0, "mktcap": 418 * 10**12}]
+    assert history.append_records("20260306", recs)
+    snap = history.load_date("20260306", ["pbr", "mktcap"])
+    assert np.isnan(snap["pbr"][0]) and snap["mktcap"][0] == 418e12
+
+
+def test_empty_range():
+    df = history.load_range("20200101", "20200131")
+    assert df.empty and "per" in df.columns
+    assert history.load_panel("20200101", "20200131", "per").empty
+
+
+def test_written_at_is_timezone_aware():
+    assert history.written_at("20260305") is None
+    history.append_snapshot("20260305", _snap(["005930"], [12.0]))
+    assert history.written_at("20260305").tzinfo is not None
@@ -0,0 +1,249 @@
+"""screener/krx.py — 전종목 일괄 수집(병렬 + 인덱스 조인) 및 거래일 메모 검증."""
+
+import json
+import threading
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from db.utils import KST
+from screener import history, krx
+
+AFTER_CLOSE = datetime(2026, 3, 6, 17, 0, tzinfo=KST)
+MID_SESSION = datetime(2026, 3, 6, 11, 0, tzinfo=KST)
+
+
+class _FakeStock:
+    """pykrx.stock 대역 — 호출 기록 + 전종목 DataFrame 반환."""
+
+    def __init__(self, *, bulk_names=True, empty_first=False):
+        self.calls = []
+        self.bulk_names = bulk_names
+        self.empty_first = empty_first
+        self._lock = threading.Lock()
+
+    def _log(self, name):
+        with self._lock:
+            self.calls.append(name)
+
+    def get_market_ticker_list(self, date, market="KOSPI"):
+        self._log(f"list:{market}")
+        if self.empty_first and self.calls.count(f"list:{market}") == 1:
+            return []
+        return {"KOSPI": ["005930", "000660", "035420"], "KOSDAQ": ["091990", "263750"]}[market]
+
+    def get_market_fundamental(self, date, market="ALL"):
+        self._log("fund")
+        return pd.DataFrame(
+            {
+                "PER": [12.5, 0.0, -3.0, 20.0],
+                "PBR": [1.2, 2.0, 0.0, 1.1],
+                "EPS": [5000.0, 100.0, -200.0, 0.0],
+                "BPS": [40000.0, 0.0, 10000.0, 3000.0],
+            },
+            index=pd.Index(["005930", "000660", "091990", "263750"], name="티커"),
+        )
+
+    def get_market_cap(self, date, market="ALL"):
+        self._log("cap")
+        return pd.DataFrame(
+            {"시가총액": [418 * 10**12, 90 * 10**12, 5 * 10**12]},
+            index=pd.Index(["005930", "000660", "091990"], name="티커"),
+        )
+
+    def get_market_price_change(self, fromdate, todate, market="ALL"):
+        self._log("names")
+        if not self.bulk_names:
+            raise RuntimeError("bulk unavailable")
+        return pd.DataFrame(
+            {"종목명": ["삼성전자", "SK하이닉스", "셀트리온헬스케어"]},
+            index=pd.Index(["005930", "000660", "091990"], name="티커"),
+        )
+
+    def get_market_ticker_name(self, ticker):
+        self._log(f"name:{ticker}")
+        return {"035420": "NAVER", "263750": "펄어비스", "005930": "삼성전자",
+                "000660": "SK하이닉스", "091990": "셀트리온헬스케어"}[ticker]
+
+
+@pytest.fixture
+def fake(monkeypatch, tmp_path):
+    f = _FakeStock()
+    monkeypatch.setattr(history, "_ROOT", tmp_path / "history")
+    monkeypatch.setattr(krx, "stock", f)
+    monkeypatch.setattr(krx, "is_krx_configured", lambda: True)
+    monkeypatch.setattr(krx, "ensure_krx_session", lambda: True)
+    monkeypatch.setattr(krx, "get_cached", lambda key: None)
+    monkeypatch.setattr(krx, "set_cached", lambda key, value: None)
+    monkeypatch.setattr(krx, "_find_latest_trading_day", lambda d: "20260306")
+    monkeypatch.setattr(krx, "now_kst", lambda: AFTER_CLOSE)
+    return f
+
+
+def _by_code(stocks):
+    return {s["code"]: s for s in stocks}
+
+
+def test_bulk_merge_matches_row_semantics(fake):
+    stocks, actual = krx.get_all_stocks("20260308")
+    assert actual == "20260306"
+    rows = _by_code(stocks)
+    assert [s["code"] for s in stocks] == sorted(rows)
+
+    assert rows["005930"] == {
+        "code": "005930", "name": "삼성전자", "market": "KOSPI",
+        "per": 12.5, "pbr": 1.2, "roe": 12.5, "mktcap": 418 * 10**12,
+    }
+    # PER 0 → None, BPS 0 → ROE None
+    assert rows["000660"]["per"] is None and rows["000660"]["roe"] is None
+    # PBR 0 → None, 음수 PER 유지
+    assert rows["091990"]["pbr"] is None and rows["091990"]["per"] == -3.0
+    assert rows["091990"]["roe"] == -2.0 and rows["091990"]["market"] == "KOSDAQ"
+    # 펀더멘털 없음 → 전부 None, 시총 없음 → 0
+    assert rows["035420"]["per"] is None and rows["035420"]["roe"] is None
+    assert rows["263750"]["mktcap"] == 0 and rows["263750"]["roe"] == 0.0
+
+
+def test_names_from_single_listing_call(fake):
+    stocks, _ = krx.get_all_stocks("20260306")
+    assert fake.calls.count("names") == 1
+    # 일괄 표에 없는 종목만 개별 조회
+    per_ticker = sorted(c for c in fake.calls if c.startswith("name:"))
+    assert per_ticker == ["name:035420", "name:263750"]
+    assert _by_code(stocks)["035420"]["name"] == "NAVER"
+
+
+def test_names_fallback_when_bulk_fails(fake):
+    fake.bulk_names = False
+    stocks, _ = krx.get_all_stocks("20260306")
+    assert len([c for c in fake.calls if c.startswith("name:")]) == 5
+    assert _by_code(stocks)["000660"]["name"] == "SK하이닉스"
+
+
+def test_empty_listing_relogins_and_refetches_bulk(fake, monkeypatch):
+    fake.empty_first = True
+    monkeypatch.setattr(krx, "force_relogin", lambda: True)
+    stocks, _ = krx.get_all_stocks("20260306")
+    assert len(stocks) == 5
+    # 재로그인 후 일괄 조회 재요청
+    assert fake.calls.count("fund") == 2 and fake.calls.count("cap") == 2
+
+
+def test_fundamental_failure_raises_runtime_error(fake, monkeypatch):
+    def boom(date, market="ALL"):
+        raise ValueError("down")
+
+    monkeypatch.setattr(fake, "get_market_fundamental", boom)
+    with pytest.raises(RuntimeError, match="펀더멘탈"):
+        krx.get_all_stocks("20260306")
+
+
+def test_trading_day_memoized_per_calendar_day(monkeypatch):
+    calls = []
+
+    class _S:
+        @staticmethod
+        def get_market_ticker_list(date, market="KOSPI"):
+            calls.append(date)
+            return ["005930"] if date == "20260306" else []
+
+    monkeypatch.setattr(krx, "stock", _S)
+    monkeypatch.setattr(krx, "_trading_day_memo", {})
+    monkeypatch.setattr(krx, "now_kst", lambda: datetime(2026, 3, 10, 9, 0, tzinfo=KST))
+    # 2026-03-09(월) 공휴일 가정 → 03-06(금)으로 소급
+    assert krx._find_latest_trading_day("20260309") == "20260306"
+    n = len(calls)
+    assert krx._find_latest_trading_day("20260309") == "20260306"
+    assert len(calls) == n
+
+
+def test_trading_day_fallback_not_memoized(monkeypatch):
+    class _S:
+        @staticmethod
+        def get_market_ticker_list(date, market="KOSPI"):
+            raise ConnectionError("down")
+
+    monkeypatch.setattr(krx, "stock", _S)
+    monkeypatch.setattr(krx, "_trading_day_memo", {})
+    assert krx._find_latest_trading_day("20260307") == "20260306"  # 토 → 금
+    assert krx._trading_day_memo == {}
+
+
+def test_trading_day_pre_open_memo_expires(monkeypatch):
+    """개장 전 '오늘' 요청은 전 거래일로 소급되지만 그날 내내 고정되지 않는다."""
+    opened = {"v": False}
+
+    class _S:
+        @staticmethod
+        def get_market_ticker_list(date, market="KOSPI"):
+            if date == "20260309":
+                return ["005930"] if opened["v"] else []
+            return ["005930"] if date == "20260306" else []
+
+    clock = {"t": 1000.0}
+    monkeypatch.setattr(krx, "stock", _S)
+    monkeypatch.setattr(krx, "_trading_day_memo", {})
+    monkeypatch.setattr(krx._time, "monotonic", lambda: clock["t"])
+    monkeypatch.setattr(krx, "now_kst", lambda: datetime(2026, 3, 9, 8, 0, tzinfo=KST))
+    assert krx._find_latest_trading_day("20260309") == "20260306"
+
+    opened["v"] = True
+    assert krx._find_latest_trading_day("20260309") == "20260306"  # 재확인 주기 전 — 메모 사용
+    clock["t"] += krx._PROVISIONAL_MEMO_SEC
+    assert krx._find_latest_trading_day("20260309") == "20260309"
+    assert krx._trading_day_memo["20260309"][2] is None  # 확정 결과는 하루 동안 유지
+
+
+def test_trading_day_memo_keyed_by_kst_date(monkeypatch):
+    calls = []
+
+    class _S:
+        @staticmethod
+        def get_market_ticker_list(date, market="KOSPI"):
+            calls.append(date)
+            return ["005930"]
+
+    now = {"v": datetime(2026, 3, 9, 23, 0, tzinfo=KST)}
+    monkeypatch.setattr(krx, "stock", _S)
+    monkeypatch.setattr(krx, "_trading_day_memo", {})
+    monkeypatch.setattr(krx, "now_kst", lambda: now["v"])
+    krx._find_latest_trading_day("20260306")
+    krx._find_latest_trading_day("20260306")
+    assert len(calls) == 1
+    now["v"] = datetime(2026, 3, 10, 0, 5, tzinfo=KST)  # KST 자정 경과 → 메모 무효
+    krx._find_latest_trading_day("20260306")
+    assert len(calls) == 2
+
+
+def test_fresh_fetch_appends_history_snapshot(fake):
+    krx.get_all_stocks("20260306")
+    snap = history.load_date("20260306")
+    assert list(snap["code"]) == ["000660", "005930", "035420", "091990", "263750"]
+    assert list(snap["market"][:3]) == ["KOSPI", "KOSPI", "KOSPI"]
+    assert snap["eps"][1] == 5000.0 and snap["roe"][1] == 12.5
+    assert pd.isna(snap["per"][0]) and pd.isna(snap["close"][1])
+
+
+def test_record_history_skips_existing_and_fills_missing(fake):
+    assert krx.record_history("20260306") == "20260306"
+    assert "names" not in fake.calls
+    assert krx.record_history("20260306") is None
+
+
+def test_mid_session_fetch_not_recorded(fake, monkeypatch):
+    monkeypatch.setattr(krx, "now_kst", lambda: MID_SESSION)
+    krx.get_all_stocks("20260306")
+    assert not history.has_date("20260306")
+    assert krx.record_history("20260306") is None  # 확정 전에는 스케줄러 잡도 기록 안 함
+
+
+def test_record_history_overwrites_partition_written_before_close(fake):
+    history.append_snapshot("20260306", {"code": ["005930"], "per": [1.0]})
+    meta_path = history._partition("20260306") / history._META
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta_path.write_text(json.dumps({**meta, "written_at": MID_SESSION.isoformat()}), encoding="utf-8")
+
+    assert krx.record_history("20260306") == "20260306"
+    assert len(history.load_date("20260306")["code"]) == 5
+    assert krx.record_history("20260306") is None  # 마감 후 기록분은 유지
@@ -0,0 +1,107 @@
+"""stock/symbol_index.py + symbol_map 상주 인덱스 단위 테스트."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from stock import symbol_map
+from stock.symbol_index import SymbolIndex, is_choseong_query, to_choseong
+
+_MAP = {
+    "005930": {"name": "삼성전자", "market": "KOSPI", "mktcap": 400_000},
+    "005935": {"name": "삼성전자우", "market": "KOSPI", "mktcap": 40_000},
+    "028260": {"name": "삼성물산", "market": "KOSPI", "mktcap": 25_000},
+    "207940": {"name": "삼성바이오로직스", "market": "KOSPI", "mktcap": 55_000},
+    "000660": {"name": "SK하이닉스", "market": "KOSPI", "mktcap": 100_000},
+    "051910": {"name": "LG화학", "market": "KOSPI", "mktcap": 30_000},
+    "009150": {"name": "삼성전기", "market": "KOSPI", "mktcap": 10_000},
+    "900001": {"name": "대한삼성", "market": "KOSDAQ"},  # 가상 — mktcap 누락(레거시 맵)
+}
+
+
+@pytest.fixture
+def index():
+    return SymbolIndex(_MAP)
+
+
+class TestChoseong:
+    def test_to_choseong(self):
+        assert to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+        assert to_choseong("lg화학") == "lgㅎㅎ"
+
+    def test_is_choseong_query(self):
+        assert is_choseong_query("ㅅㅅ")
+        assert not is_choseong_query("삼ㅅ")
+        assert not is_choseong_query("")
+
+
+class TestSymbolIndex:
+    def test_exact_then_prefix_then_infix_by_mktcap(self, index):
+        codes = [c for c, _, _ in index.rows(index.match_names("삼성전자"))]
+        assert codes == ["005930", "005935"]
+        codes = [c for c, _, _ in index.rows(index.match_names("삼성"))]
+        # 접두사 그룹 시총순 → 중간일치(대한삼성) 마지막
+        assert codes == ["005930", "207940", "005935", "028260", "009150", "900001"]
+
+    def test_case_insensitive(self, index):
+        assert index.search("sk하이")[0][0] == "000660"
+        assert index.search("Lg")[0][0] == "051910"
+
+    def test_single_char(self, index):
+        assert {c for c, _, _ in index.search("화")} == {"051910"}
+
+    def test_choseong(self, index):
+        assert [c for c, _, _ in index.search("ㅅㅅㅈㅈ")] == ["005930", "005935"]
+        assert index.search("ㅎㅇㄴ")[0][0] == "000660"
+
+    def test_code_prefix(self, index):
+        assert [c for c, _, _ in index.search("0059")] == ["005930", "005935"]
+        assert index.search("99") == []
+
+    def test_limit_and_no_match(self, index):
+        assert len(index.search("삼성", limit=2)) == 2
+        assert index.search("없는종목") == []
+        assert index.search("  ") == []
+
+    def test_sub_millisecond_on_full_universe(self):
+        big = {
+            f"{i:06d}": {"name": f"종목{i}호 {'삼성' if i % 50 == 0 else '한국'}", "market": "KOSPI", "mktcap": i}
+            for i in range(3000)
+        }
+        idx = SymbolIndex(big)
+        t0 = time.perf_counter()
+        for _ in range(100):
+            idx.search("삼성", limit=10)
+        assert (time.perf_counter() - t0) / 100 < 1e-3
+
+
+class TestResidentMap:
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        monkeypatch.setattr(symbol_map, "_resident", None)
+        yield
+
+    def test_no_cache_reads_per_keystroke(self):
+        with patch.object(symbol_map, "get_cached", return_value=dict(_MAP)) as gc, \
+             patch.object(symbol_map, "_build_map") as build:
+            for q in ("삼", "삼성", "삼성전"):
+                symbol_map.name_to_results(q)
+            assert gc.call_count == 1
+            build.assert_not_called()
+
+    def test_index_rebuilt_only_when_map_changes(self, monkeypatch):
+        with patch.object(symbol_map, "get_cached", return_value=dict(_MAP)):
+            first = symbol_map.get_index()
+            monkeypatch.setattr(symbol_map, "_resident", (*symbol_map._resident[:2], 0.0))
+            assert symbol_map.get_index() is first  # 재확인했지만 동일 내용 → 재사용
+        changed = {**_MAP, "111111": {"name": "신규종목", "market": "KOSDAQ", "mktcap": 1}}
+        monkeypatch.setattr(symbol_map, "_resident", (*symbol_map._resident[:2], 0.0))
+        with patch.object(symbol_map, "get_cached", return_value=changed):
+            assert symbol_map.get_index() is not first
+            assert symbol_map.search("신규")[0][0] == "111111"
+
+    def test_resolve_unique_match(self):
+        with patch.object(symbol_map, "get_cached", return_value=dict(_MAP)):
+            assert symbol_map.resolve("삼성바이오") == ("207940", "삼성바이오로직스")
+            assert symbol_map.resolve("삼성") is None